@@ -1,14 +1,15 @@
 from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
 import os
+import hmac
+import json
+import time
 from dotenv import load_dotenv
 import logging
 from datetime import datetime, timedelta
 from flask_session import Session
 from flask import send_from_directory
 from models.game_data import NPCS, DIALOGUE_QUESTIONS, CEFR_LEVELS, BADGES, ACHIEVEMENTS, PROGRESS_LEVELS, PHASE_2_STEPS, PHASE_2_REMEDIAL_ACTIVITIES, PHASE_2_POINTS, PHASE_2_SUCCESS_THRESHOLD
-from services.ai_service import AIService
-from services.audio_service import AudioService
-from services.assessment_service import AssessmentService
+from services import registry
 from utils.helpers import (
     determine_overall_level, 
     skill_levels_from_assessments, 
@@ -17,28 +18,43 @@ from utils.helpers import (
 )
 from routes.auth_routes import auth_bp, db_manager, user_manager, assessment_history, login_required, guest_only
 from routes.exercise_builder_routes import exercise_builder_bp
-from models.auth import admin_required
+from models.auth import admin_required, current_principal
+from utils.static_assets import StaticAssets, precompress as precompress_static_assets
+from services.chat_events import broker as chat_broker
+from services.submission_index import DUPLICATE_THRESHOLD, similar_submissions_report
+from services import model_router
+from services.llm_telemetry import telemetry as llm_telemetry
+from utils.structured_logging import configure_logging
+from utils import deadlines
 
 load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
+# Non-blocking, sampled log output (see utils/structured_logging.py)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__, static_folder='static')
 app.config['SECRET_KEY'] = str(os.getenv("SECRET_KEY", "dev-secret-key"))
 app.config['SESSION_TYPE'] = 'filesystem'
-app.config['SESSION_FILE_DIR'] = os.path.join(os.path.dirname(__file__), 'sessions')
+app.config['SESSION_FILE_DIR'] = os.getenv('SESSION_FILE_DIR', os.path.join(os.path.dirname(__file__), 'sessions'))
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_USE_SIGNER'] = False  # Disable signer to avoid bytes/string issues
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=30)  # 30 days for "remember me"
 
-os.makedirs('sessions', exist_ok=True)
+os.makedirs(app.config['SESSION_FILE_DIR'], exist_ok=True)
 Session(app)
 
-# Initialize services
-ai_service = AIService()
-audio_service = AudioService()
-assessment_service = AssessmentService()
+# Per-endpoint latency budgets shared by Sapling, Groq, TTS and DB calls
+deadlines.init_app(app)
+
+# Services are built lazily on first use and shared with the blueprints
+ai_service = registry.lazy('ai')
+audio_service = registry.lazy('audio')
+assessment_service = registry.lazy('assessment')
+assessment_memo = registry.lazy('assessment_memo')
+
+# React build, indexed on first request (see utils/static_assets.py)
+spa_assets = StaticAssets(os.path.join(os.path.dirname(__file__), '..', 'frontend', 'dist'))
 
 # Register authentication blueprint
 app.register_blueprint(auth_bp, url_prefix='/auth')
@@ -74,6 +90,10 @@ app.register_blueprint(phase4_bp)
 from routes.phase6_routes import phase6_bp
 app.register_blueprint(phase6_bp)
 
+# Register batch scoring routes
+from routes.scoring_routes import scoring_bp
+app.register_blueprint(scoring_bp)
+
 # Import Phase 4 loader
 from models.phase4_loader import get_phase4_step
 
@@ -98,16 +118,11 @@ def index():
 @login_required
 def admin_dashboard():
     """Admin dashboard with user management and analytics"""
-    user_id = session.get('user_id')
-    
     # Verify admin access
     try:
-        conn = db_manager.get_connection()
-        admin_check = conn.execute(
-            'SELECT is_admin, first_name, username FROM users WHERE id = ?', (user_id,)
-        ).fetchone()
+        admin_check = current_principal()
         
-        if not admin_check or not admin_check['is_admin']:
+        if not admin_check or not admin_check.is_admin:
             flash('Access denied. Admin privileges required.', 'error')
             return redirect('/dashboard')
         
@@ -126,8 +141,6 @@ def admin_dashboard():
         assessments_this_week = get_assessments_count('week')
         active_users_today = get_active_users_count('today')
         
-        conn.close()
-        
         return render_template('admin/dashboard.html',
                              current_user=admin_check,
                              stats=stats,
@@ -258,8 +271,8 @@ def submit_response():
     current_step = session.get('current_step', 0)
     player_response = request.form.get('response', '')
     
-    # Check for AI-generated content
-    is_ai, ai_score, ai_reasons = assessment_service.check_ai_response(player_response)
+    # Check for AI-generated content (memoized from the feedback request, if any)
+    is_ai, ai_score, ai_reasons = assessment_memo.check_ai_response(session.get('user_id'), player_response)
     
     # If AI is detected with high score, reject submission
     if is_ai and ai_score > 0.5:
@@ -286,7 +299,7 @@ def submit_response():
         session['responses'] = responses
         
         # Assess the response
-        assessment = assessment_service.assess_response(question_text, player_response, question_type)
+        assessment = assessment_memo.assess_response(session.get('user_id'), question_text, player_response, question_type)
         
         # Add metadata to assessment
         assessment["type"] = question_type
@@ -621,18 +634,11 @@ def determine_phase2_level(score):
 @login_required
 def admin_main_dashboard():
     """Admin dashboard - redirect to React admin interface"""
-    user_id = session.get('user_id')
-    
     # Check if user is admin
     try:
-        conn = db_manager.get_connection()
-        current_user = conn.execute(
-            'SELECT is_admin FROM users WHERE id = ?', 
-            (user_id,)
-        ).fetchone()
-        conn.close()
+        current_user = current_principal()
         
-        if not current_user or not current_user['is_admin']:
+        if not current_user or not current_user.is_admin:
             flash('Access denied. Admin privileges required.', 'error')
             return redirect('/app/dashboard')
 
@@ -648,19 +654,15 @@ def admin_main_dashboard():
 @login_required
 def admin_user_detail(user_id):
     """Get detailed information about a specific user for modal popup"""
-    user_id_session = session.get('user_id')
-    
     # Check if user is admin
     try:
-        conn = db_manager.get_connection()
-        admin_check = conn.execute('SELECT is_admin FROM users WHERE id = ?', (user_id_session,)).fetchone()
+        admin_check = current_principal()
         
-        if not admin_check or not admin_check['is_admin']:
+        if not admin_check or not admin_check.is_admin:
             return jsonify({'success': False, 'error': 'Access denied'}), 403
         
         # Get comprehensive user details
         user_details = assessment_history.get_user_details(user_id)
-        conn.close()
         
         if not user_details.get('user_info'):
             return jsonify({'success': False, 'error': 'User not found'}), 404
@@ -707,54 +709,34 @@ def admin_export_data():
 @app.route('/admin/export/users')
 @admin_required
 def admin_export_users():
-    """Export users data to CSV"""
+    """
+    Stream a users export with per-phase progress, remedial and AI stats
+    Query args: format=csv|jsonl, gzip=1, search, role
+    """
     try:
-        import csv
-        import io
-        from flask import make_response
+        import itertools
+        from flask import Response, stream_with_context
         from datetime import datetime
+        from services.export_service import ExportService, parse_export_format
         
+        fmt = parse_export_format(request.args.get('format'))
+        compress = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
         search = request.args.get('search', '')
         role_filter = request.args.get('role', '')
         
-        # Use our existing get_users_with_stats function to get all users
-        users, _ = get_users_with_stats(page=1, per_page=10000, search=search, role_filter=role_filter)
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Headers
-        writer.writerow([
-            'ID', 'Username', 'Email', 'First Name', 'Last Name', 
-            'Role', 'Active', 'Created At', 'Last Login',
-            'Total Assessments', 'Best Level', 'Total XP', 'Phase2 Steps Completed', 'Phase2 Steps Attempted'
-        ])
-        
-        # Write user data
-        for user in users:
-            writer.writerow([
-                user.get('id', ''),
-                user.get('username', ''),
-                user.get('email', ''),
-                user.get('first_name', ''),
-                user.get('last_name', ''),
-                'Admin' if user.get('is_admin') else 'User',
-                'Yes' if user.get('is_active') else 'No',
-                user.get('created_at', ''),
-                user.get('last_login', ''),
-                user.get('total_assessments', 0),
-                user.get('best_level', 'N/A'),
-                user.get('total_xp', 0),
-                user.get('phase2_steps_completed', 0),
-                user.get('phase2_steps_attempted', 0)
-            ])
-        
-        # Create response
-        response = make_response(output.getvalue())
-        response.headers['Content-Type'] = 'text/csv'
-        response.headers['Content-Disposition'] = f'attachment; filename=fardi_users_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        export_service = ExportService(db_manager.get_connection)
+        chunks = export_service.stream_users(fmt=fmt, search=search, role_filter=role_filter, compress=compress)
+        # Run the query now so a failure is reported before any bytes are sent
+        first_chunk = next(chunks, b'')
         
+        filename = f'fardi_users_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{fmt}'
+        mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+        if compress:
+            filename += '.gz'
+            mimetype = 'application/gzip'
+        
+        response = Response(stream_with_context(itertools.chain([first_chunk], chunks)), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}'
         return response
         
     except Exception as e:
@@ -1015,18 +997,11 @@ def get_active_users_count(period='today'):
 @login_required
 def api_admin_dashboard():
     """API endpoint for admin dashboard data"""
-    user_id = session.get('user_id')
-    
     # Check if user is admin
     try:
-        conn = db_manager.get_connection()
-        current_user = conn.execute(
-            'SELECT is_admin, first_name, last_name, username FROM users WHERE id = ?', 
-            (user_id,)
-        ).fetchone()
-        conn.close()
+        current_user = current_principal()
         
-        if not current_user or not current_user['is_admin']:
+        if not current_user or not current_user.is_admin:
             return jsonify({'error': 'Access denied. Admin privileges required.'}), 403
         
         # Get admin statistics
@@ -1041,8 +1016,8 @@ def api_admin_dashboard():
             'success': True,
             'data': {
                 'admin': {
-                    'name': f"{current_user['first_name']} {current_user['last_name']}" if current_user['first_name'] else current_user['username'],
-                    'username': current_user['username']
+                    'name': f"{current_user.first_name} {current_user.last_name}" if current_user.first_name else current_user.username,
+                    'username': current_user.username
                 },
                 'stats': stats,
                 'metrics': {
@@ -1061,17 +1036,11 @@ def api_admin_dashboard():
 @login_required
 def api_admin_users():
     """API endpoint for admin users list"""
-    user_id = session.get('user_id')
-    
     # Check if user is admin
     try:
-        conn = db_manager.get_connection()
-        admin_check = conn.execute(
-            'SELECT is_admin FROM users WHERE id = ?', (user_id,)
-        ).fetchone()
-        conn.close()
+        admin_check = current_principal()
         
-        if not admin_check or not admin_check['is_admin']:
+        if not admin_check or not admin_check.is_admin:
             return jsonify({'error': 'Access denied. Admin privileges required.'}), 403
         
         # Get query parameters
@@ -1340,23 +1309,85 @@ def api_admin_analytics():
         logger.error(f"Error getting analytics data: {e}")
         return jsonify({'error': 'Error loading analytics data'}), 500
 
+@app.route('/api/admin/similar-submissions')
+@admin_required
+def api_admin_similar_submissions():
+    """Near-duplicate answers between students (newest first), optionally for one task"""
+    try:
+        if registry.is_built('submission_index'):
+            registry.get('submission_index').flush()
+
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 200)
+        min_similarity = request.args.get('min_similarity', DUPLICATE_THRESHOLD, type=float)
+
+        conn = db_manager.get_connection()
+        try:
+            report = similar_submissions_report(
+                conn, task=request.args.get('task') or None, min_similarity=min_similarity,
+                limit=per_page, offset=(page - 1) * per_page
+            )
+        finally:
+            conn.close()
+
+        return jsonify({
+            'success': True,
+            'data': dict(report, page=page, per_page=per_page)
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting similar submissions: {e}")
+        return jsonify({'error': 'Error loading similar submissions'}), 500
+
+def _prometheus_metrics():
+    return app.response_class(llm_telemetry.prometheus(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/metrics')
+def api_metrics():
+    """Prometheus scrape of the LLM telemetry (bearer METRICS_TOKEN, or an admin session)"""
+    token = os.getenv('METRICS_TOKEN')
+    if token and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return _prometheus_metrics()
+    return admin_required(_prometheus_metrics)()
+
+@app.route('/api/admin/llm-telemetry')
+@admin_required
+def api_admin_llm_telemetry():
+    """Groq calls per endpoint (tokens, latency, failures) with the local graders that avoid them"""
+    try:
+        data = llm_telemetry.snapshot()
+
+        def counters(name, *fields):
+            if not registry.is_built(name):
+                return None
+            service = registry.get(name)
+            return {field: getattr(service, field, 0) for field in fields}
+
+        data['hedging'] = registry.get('ai').hedge_stats() if registry.is_built('ai') else None
+        data['shadow'] = model_router.shadow_stats.summary()
+        data['local'] = {
+            'feedback_bank': counters('feedback_bank', 'hits', 'misses'),
+            'cefr_classifier': counters('cefr_classifier', 'hits', 'deferred'),
+            'assessment_memo': counters('assessment_memo', 'hits', 'misses'),
+        }
+        return jsonify({'success': True, 'data': data})
+
+    except Exception as e:
+        logger.error(f"Error getting LLM telemetry: {e}")
+        return jsonify({'error': 'Error loading LLM telemetry'}), 500
+
 @app.route('/api/admin/users/<int:user_id>/details', methods=['GET'])
 @login_required
 def api_admin_user_details(user_id):
     """API endpoint for detailed user information"""
-    admin_user_id = session.get('user_id')
-    
     # Check if user is admin
     try:
-        conn = db_manager.get_connection()
-        admin_check = conn.execute(
-            'SELECT is_admin FROM users WHERE id = ?', (admin_user_id,)
-        ).fetchone()
+        admin_check = current_principal()
         
-        if not admin_check or not admin_check['is_admin']:
-            conn.close()
+        if not admin_check or not admin_check.is_admin:
             return jsonify({'error': 'Access denied. Admin privileges required.'}), 403
         
+        conn = db_manager.get_connection()
         # Get user details
         user = conn.execute('''
             SELECT id, username, email, first_name, last_name, created_at, last_login,
@@ -1460,66 +1491,47 @@ def api_admin_user_details(user_id):
 @app.route('/<path:path>')
 def serve_react(path=''):
     """Serve React SPA at root - handles all routes not matched by backend"""
-    import mimetypes
-    
     # Exclude backend routes - these should be handled by Flask before reaching here
     backend_prefixes = ['api/', 'auth/', 'admin/', 'static/', 'sessions/']
     if any(path.startswith(prefix) for prefix in backend_prefixes):
         from flask import abort
         abort(404)
     
-    build_dir = os.path.join(os.path.dirname(__file__), '..', 'frontend', 'dist')
-    index_path = os.path.join(build_dir, 'index.html')
-    
-    if not os.path.exists(index_path):
+    if not spa_assets.available():
         return ("React build not found. Run 'npm run build' in frontend/ to enable SPA.", 404)
     
-    # Handle /app/assets/ paths (from old build) - redirect to /assets/
+    # Handle /app/assets/ paths (from old build) - serve them from /assets/
     if path.startswith('app/assets/'):
-        actual_path = path.replace('app/', '', 1)
-        asset_path = os.path.join(build_dir, actual_path)
-        if os.path.exists(asset_path):
-            mimetype, _ = mimetypes.guess_type(actual_path)
-            if actual_path.endswith('.js'):
-                mimetype = 'application/javascript'
-            elif actual_path.endswith('.css'):
-                mimetype = 'text/css'
-            return send_from_directory(build_dir, actual_path, mimetype=mimetype)
+        path = path.replace('app/', '', 1)
     
-    # If path is empty, serve index.html
-    if not path:
-        return send_from_directory(build_dir, 'index.html')
-    
-    # Check if it's a static asset (JS, CSS, images, etc.)
-    asset_path = os.path.join(build_dir, path)
-    if os.path.exists(asset_path) and os.path.isfile(asset_path):
-        mimetype, _ = mimetypes.guess_type(path)
-        if path.endswith('.js'):
-            mimetype = 'application/javascript'
-        elif path.endswith('.mjs'):
-            mimetype = 'application/javascript'
-        elif path.endswith('.css'):
-            mimetype = 'text/css'
-        elif path.endswith('.json'):
-            mimetype = 'application/json'
-        elif path.endswith('.png'):
-            mimetype = 'image/png'
-        elif path.endswith('.jpg') or path.endswith('.jpeg'):
-            mimetype = 'image/jpeg'
-        elif path.endswith('.svg'):
-            mimetype = 'image/svg+xml'
-        elif path.endswith('.woff') or path.endswith('.woff2'):
-            mimetype = 'font/woff2'
-        return send_from_directory(build_dir, path, mimetype=mimetype)
-    
-    # For all other paths (SPA routes), serve index.html
-    return send_from_directory(build_dir, 'index.html')
-        
+    # Static assets come from the in-memory manifest; SPA routes get index.html
+    return spa_assets.serve(path or 'index.html')
+
+@app.cli.command('precompress-assets')
+def precompress_assets_command():
+    """Write .gz/.br siblings for the React build (run after `npm run build`)"""
+    written = precompress_static_assets(spa_assets.root)
+    spa_assets.build()
+    logger.info(f"Wrote {written} pre-compressed asset files")
+        
+@app.cli.command('streak-maintenance')
+def streak_maintenance_command():
+    """Freeze or break streaks that missed a day (schedule nightly, e.g. from cron)"""
+    from routes.gamification_routes import get_db_connection
+    from services.streak_service import StreakService
+
+    conn = get_db_connection()
+    try:
+        result = StreakService(conn).run_daily_maintenance()
+    finally:
+        conn.close()
+    logger.info(f"Streak maintenance: {result['frozen']} frozen, {len(result['broken'])} broken")
+
 ## ─── Chat System ───────────────────────────────────────────────
 
-def init_chat_tables():
+def init_chat_tables(manager=None):
     """Create chat tables if they don't exist"""
-    conn = db_manager.get_connection()
+    conn = (manager or db_manager).get_connection()
     conn.execute('''
         CREATE TABLE IF NOT EXISTS chat_messages (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1532,7 +1544,111 @@ def init_chat_tables():
             FOREIGN KEY (receiver_id) REFERENCES users(id)
         )
     ''')
+    # Since-id catch-up for the push endpoints reads by (participant, id)
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_chat_receiver ON chat_messages(receiver_id, id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_chat_sender ON chat_messages(sender_id, id)')
+    # Paginated history of one conversation
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_chat_pair ON chat_messages(sender_id, receiver_id, id)')
+
+    # One summary row per pair of users (user_a < user_b), maintained by
+    # send/read so the inbox never aggregates chat_messages
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS chat_conversations (
+            user_a INTEGER NOT NULL,
+            user_b INTEGER NOT NULL,
+            last_message_id INTEGER NOT NULL,
+            last_message_at TIMESTAMP,
+            unread_a INTEGER NOT NULL DEFAULT 0,
+            unread_b INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_a, user_b),
+            FOREIGN KEY (user_a) REFERENCES users(id),
+            FOREIGN KEY (user_b) REFERENCES users(id)
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_chat_conversations_b ON chat_conversations(user_b)')
+    rebuild_chat_conversations(conn)
     conn.commit()
+    conn.close()
+
+def rebuild_chat_conversations(conn):
+    """Recompute every chat_conversations row from chat_messages (idempotent)"""
+    conn.execute('''
+        WITH pairs AS (
+            SELECT MIN(sender_id, receiver_id) AS user_a, MAX(sender_id, receiver_id) AS user_b,
+                   MAX(id) AS last_message_id,
+                   SUM(CASE WHEN is_read = 0 AND receiver_id = MIN(sender_id, receiver_id) THEN 1 ELSE 0 END) AS unread_a,
+                   SUM(CASE WHEN is_read = 0 AND receiver_id = MAX(sender_id, receiver_id) THEN 1 ELSE 0 END) AS unread_b
+            FROM chat_messages
+            GROUP BY 1, 2
+        )
+        INSERT OR REPLACE INTO chat_conversations
+            (user_a, user_b, last_message_id, last_message_at, unread_a, unread_b)
+        SELECT p.user_a, p.user_b, p.last_message_id, m.created_at, p.unread_a, p.unread_b
+        FROM pairs p JOIN chat_messages m ON m.id = p.last_message_id
+    ''')
+
+CHAT_STREAM_HEARTBEAT = 15   # seconds between SSE keep-alive comments
+CHAT_STREAM_MAX_AGE = 300    # close the stream so the client reconnects (and re-authenticates)
+CHAT_POLL_MAX_TIMEOUT = 30
+CHAT_CATCHUP_LIMIT = 200
+CHAT_PAGE_SIZE = 50
+CHAT_MAX_PAGE_SIZE = 200
+
+def _chat_pair(user_id, other_user_id):
+    """chat_conversations key for two users, plus the unread column of user_id"""
+    user_a, user_b = sorted((user_id, other_user_id))
+    return user_a, user_b, 'unread_a' if user_id == user_a else 'unread_b'
+
+def _chat_message_dict(row, user_id):
+    """Shape a chat_messages row for the API"""
+    return {
+        'id': row['id'],
+        'sender_id': row['sender_id'],
+        'receiver_id': row['receiver_id'],
+        'message': row['message'],
+        'is_read': bool(row['is_read']),
+        'created_at': row['created_at'],
+        'is_mine': row['sender_id'] == user_id,
+    }
+
+def _chat_messages_since(user_id, since_id, limit=CHAT_CATCHUP_LIMIT):
+    """Messages sent or received by a user with id > since_id, oldest first"""
+    conn = db_manager.get_connection()
+    try:
+        rows = conn.execute('''
+            SELECT id, sender_id, receiver_id, message, is_read, created_at FROM (
+                SELECT * FROM chat_messages WHERE receiver_id = ? AND id > ?
+                UNION
+                SELECT * FROM chat_messages WHERE sender_id = ? AND id > ?
+            ) ORDER BY id ASC LIMIT ?
+        ''', (user_id, since_id, user_id, since_id, limit)).fetchall()
+        return [_chat_message_dict(row, user_id) for row in rows]
+    finally:
+        conn.close()
+
+def _chat_cursor(value, default=0):
+    """Parse a since-id cursor (query arg or Last-Event-ID)"""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return default
+
+def _chat_latest_id():
+    conn = db_manager.get_connection()
+    try:
+        return conn.execute('SELECT COALESCE(MAX(id), 0) FROM chat_messages').fetchone()[0]
+    finally:
+        conn.close()
+
+def _sse_event(message):
+    payload = json.dumps(message)
+    return f"id: {message['id']}\nevent: message\ndata: {payload}\n\n"
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create/upgrade the database schema (run once per deploy)"""
+    db_manager.init_database()
+    init_chat_tables()
 
 @app.route('/api/chat/conversations', methods=['GET'])
 @login_required
@@ -1543,46 +1659,25 @@ def chat_conversations():
         is_admin = session.get('is_admin')
         conn = db_manager.get_connection()
 
-        if is_admin:
-            # Admin sees all students they have conversations with, plus all students for starting new convos
-            conversations = conn.execute('''
-                SELECT
-                    u.id as user_id,
-                    u.username,
-                    u.first_name,
-                    u.last_name,
-                    (SELECT message FROM chat_messages
-                     WHERE (sender_id = u.id AND receiver_id = ?) OR (sender_id = ? AND receiver_id = u.id)
-                     ORDER BY created_at DESC LIMIT 1) as last_message,
-                    (SELECT created_at FROM chat_messages
-                     WHERE (sender_id = u.id AND receiver_id = ?) OR (sender_id = ? AND receiver_id = u.id)
-                     ORDER BY created_at DESC LIMIT 1) as last_message_at,
-                    (SELECT COUNT(*) FROM chat_messages
-                     WHERE sender_id = u.id AND receiver_id = ? AND is_read = 0) as unread_count
-                FROM users u
-                WHERE u.is_admin = 0
-                ORDER BY last_message_at DESC NULLS LAST, u.first_name ASC
-            ''', (user_id, user_id, user_id, user_id, user_id)).fetchall()
-        else:
-            # Student sees only admin conversations
-            conversations = conn.execute('''
-                SELECT
-                    u.id as user_id,
-                    u.username,
-                    u.first_name,
-                    u.last_name,
-                    (SELECT message FROM chat_messages
-                     WHERE (sender_id = u.id AND receiver_id = ?) OR (sender_id = ? AND receiver_id = u.id)
-                     ORDER BY created_at DESC LIMIT 1) as last_message,
-                    (SELECT created_at FROM chat_messages
-                     WHERE (sender_id = u.id AND receiver_id = ?) OR (sender_id = ? AND receiver_id = u.id)
-                     ORDER BY created_at DESC LIMIT 1) as last_message_at,
-                    (SELECT COUNT(*) FROM chat_messages
-                     WHERE sender_id = u.id AND receiver_id = ? AND is_read = 0) as unread_count
-                FROM users u
-                WHERE u.is_admin = 1
-                ORDER BY last_message_at DESC NULLS LAST
-            ''', (user_id, user_id, user_id, user_id, user_id)).fetchall()
+        # Admins list every student (so they can start new conversations),
+        # students list the admins; both read the summary by primary key
+        conversations = conn.execute('''
+            SELECT
+                u.id as user_id,
+                u.username,
+                u.first_name,
+                u.last_name,
+                m.message as last_message,
+                c.last_message_at,
+                CASE WHEN c.user_a = :me THEN c.unread_a ELSE c.unread_b END as unread_count
+            FROM users u
+            LEFT JOIN chat_conversations c
+                ON c.user_a = MIN(u.id, :me) AND c.user_b = MAX(u.id, :me)
+            LEFT JOIN chat_messages m ON m.id = c.last_message_id
+            WHERE u.is_admin = :list_admins
+            ORDER BY c.last_message_at DESC NULLS LAST, u.first_name ASC
+        ''', {'me': user_id, 'list_admins': 0 if is_admin else 1}).fetchall()
+        conn.close()
 
         return jsonify({
             'success': True,
@@ -1603,36 +1698,62 @@ def chat_conversations():
 @app.route('/api/chat/messages/<int:other_user_id>', methods=['GET'])
 @login_required
 def chat_get_messages(other_user_id):
-    """Get messages between current user and another user"""
+    """
+    Get messages between current user and another user, newest page first
+
+    Query args: limit (default 50) and before_id, the next_before_id of the
+    previous page. Messages within a page are oldest first.
+    """
     try:
         user_id = session.get('user_id')
+        limit = min(max(request.args.get('limit', CHAT_PAGE_SIZE, type=int), 1), CHAT_MAX_PAGE_SIZE)
+        before_id = request.args.get('before_id', type=int)
         conn = db_manager.get_connection()
 
+        # One bounded index range per direction; the extra row tells us whether there is more
         messages = conn.execute('''
-            SELECT id, sender_id, receiver_id, message, is_read, created_at
-            FROM chat_messages
-            WHERE (sender_id = ? AND receiver_id = ?) OR (sender_id = ? AND receiver_id = ?)
-            ORDER BY created_at ASC
-        ''', (user_id, other_user_id, other_user_id, user_id)).fetchall()
-
-        # Mark messages from the other user as read
-        conn.execute('''
-            UPDATE chat_messages SET is_read = 1
-            WHERE sender_id = ? AND receiver_id = ? AND is_read = 0
-        ''', (other_user_id, user_id))
-        conn.commit()
+            SELECT * FROM (
+                SELECT * FROM (
+                    SELECT id, sender_id, receiver_id, message, is_read, created_at FROM chat_messages
+                    WHERE sender_id = :me AND receiver_id = :other AND id < :before
+                    ORDER BY id DESC LIMIT :fetch
+                )
+                UNION
+                SELECT * FROM (
+                    SELECT id, sender_id, receiver_id, message, is_read, created_at FROM chat_messages
+                    WHERE sender_id = :other AND receiver_id = :me AND id < :before
+                    ORDER BY id DESC LIMIT :fetch
+                )
+            ) ORDER BY id DESC LIMIT :fetch
+        ''', {'me': user_id, 'other': other_user_id, 'before': before_id or 2 ** 63 - 1,
+              'fetch': limit + 1}).fetchall()
+        has_more = len(messages) > limit
+        messages = list(reversed(messages[:limit]))
+
+        # Mark messages from the other user as read (only when opening the conversation)
+        if before_id is None:
+            user_a, user_b, unread_column = _chat_pair(user_id, other_user_id)
+            summary = conn.execute(
+                f'SELECT {unread_column} FROM chat_conversations WHERE user_a = ? AND user_b = ?',
+                (user_a, user_b)
+            ).fetchone()
+            if summary and summary[0]:
+                conn.execute('''
+                    UPDATE chat_messages SET is_read = 1
+                    WHERE sender_id = ? AND receiver_id = ? AND is_read = 0
+                ''', (other_user_id, user_id))
+                conn.execute(
+                    f'UPDATE chat_conversations SET {unread_column} = 0 WHERE user_a = ? AND user_b = ?',
+                    (user_a, user_b)
+                )
+                conn.commit()
+        conn.close()
 
         return jsonify({
             'success': True,
-            'data': [{
-                'id': m['id'],
-                'sender_id': m['sender_id'],
-                'receiver_id': m['receiver_id'],
-                'message': m['message'],
-                'is_read': bool(m['is_read']),
-                'created_at': m['created_at'],
-                'is_mine': m['sender_id'] == user_id,
-            } for m in messages]
+            'data': [_chat_message_dict(m, user_id) for m in messages],
+            'has_more': has_more,
+            'next_before_id': messages[0]['id'] if has_more else None,
         })
     except Exception as e:
         logger.error(f"Error getting messages: {e}")
@@ -1661,17 +1782,114 @@ def chat_send_message():
         if not receiver:
             return jsonify({'error': 'User not found'}), 404
 
-        conn.execute('''
+        cursor = conn.execute('''
             INSERT INTO chat_messages (sender_id, receiver_id, message)
             VALUES (?, ?, ?)
-        ''', (user_id, receiver_id, message))
+        ''', (user_id, receiver['id'], message))
+        row = conn.execute('''
+            SELECT id, sender_id, receiver_id, message, is_read, created_at
+            FROM chat_messages WHERE id = ?
+        ''', (cursor.lastrowid,)).fetchone()
+
+        # Same transaction as the insert: bump the receiver's unread counter
+        user_a, user_b, receiver_column = _chat_pair(receiver['id'], user_id)
+        conn.execute(f'''
+            INSERT INTO chat_conversations (user_a, user_b, last_message_id, last_message_at, {receiver_column})
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT (user_a, user_b) DO UPDATE SET
+                last_message_id = excluded.last_message_id,
+                last_message_at = excluded.last_message_at,
+                {receiver_column} = {receiver_column} + 1
+        ''', (user_a, user_b, row['id'], row['created_at']))
         conn.commit()
+        conn.close()
+
+        sent = _chat_message_dict(row, user_id)
+        chat_broker.publish([receiver['id'], user_id], sent)
 
-        return jsonify({'success': True})
+        return jsonify({'success': True, 'data': sent})
     except Exception as e:
         logger.error(f"Error sending message: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/chat/stream', methods=['GET'])
+@login_required
+def chat_stream():
+    """
+    Server-sent events stream of the current user's chat messages
+
+    Replays anything after Last-Event-ID (or ?since_id=) from the database,
+    then pushes new messages as chat_send_message publishes them. Without a
+    cursor the stream starts at the newest message; clients load history
+    through /api/chat/messages once the stream is open.
+    """
+    from flask import Response, stream_with_context
+
+    user_id = session.get('user_id')
+    subscription = chat_broker.subscribe(user_id)
+    since_id = _chat_cursor(request.headers.get('Last-Event-ID') or request.args.get('since_id'), None)
+    if since_id is None:
+        since_id = _chat_latest_id()
+
+    def generate():
+        last_id = since_id
+        deadline = time.monotonic() + CHAT_STREAM_MAX_AGE
+        try:
+            yield "retry: 3000\n\n"
+            # Subscribed before this read, so nothing committed in between is lost
+            for message in _chat_messages_since(user_id, last_id):
+                last_id = message['id']
+                yield _sse_event(message)
+
+            while time.monotonic() < deadline:
+                event = subscription.get(timeout=CHAT_STREAM_HEARTBEAT)
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    for message in _chat_messages_since(user_id, last_id):
+                        last_id = message['id']
+                        yield _sse_event(message)
+                    continue
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event['id'] > last_id:
+                    last_id = event['id']
+                    yield _sse_event(dict(event, is_mine=event['sender_id'] == user_id))
+        finally:
+            subscription.close()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    # Also covers a client that disconnects before the generator starts
+    response.call_on_close(subscription.close)
+    return response
+
+@app.route('/api/chat/poll', methods=['GET'])
+@login_required
+def chat_poll():
+    """Long-poll for messages after ?since_id=, waiting up to ?timeout= seconds"""
+    try:
+        user_id = session.get('user_id')
+        since_id = _chat_cursor(request.args.get('since_id'))
+        timeout = min(max(request.args.get('timeout', 25, type=float), 0), CHAT_POLL_MAX_TIMEOUT)
+
+        with chat_broker.subscribe(user_id) as subscription:
+            messages = _chat_messages_since(user_id, since_id)
+            if not messages and timeout:
+                event = subscription.get(timeout=timeout)
+                if event is not None:
+                    messages = _chat_messages_since(user_id, since_id)
+
+        return jsonify({
+            'success': True,
+            'data': messages,
+            'last_id': messages[-1]['id'] if messages else since_id,
+        })
+    except Exception as e:
+        logger.error(f"Error polling chat: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/chat/unread-count', methods=['GET'])
 @login_required
 def chat_unread_count():
@@ -1679,10 +1897,12 @@ def chat_unread_count():
     try:
         user_id = session.get('user_id')
         conn = db_manager.get_connection()
-        result = conn.execute(
-            'SELECT COUNT(*) as count FROM chat_messages WHERE receiver_id = ? AND is_read = 0',
-            (user_id,)
-        ).fetchone()
+        result = conn.execute('''
+            SELECT (SELECT COALESCE(SUM(unread_a), 0) FROM chat_conversations WHERE user_a = :me)
+                 + (SELECT COALESCE(SUM(unread_b), 0) FROM chat_conversations WHERE user_b = :me AND user_a != :me)
+                 as count
+        ''', {'me': user_id}).fetchone()
+        conn.close()
         return jsonify({'success': True, 'count': result['count'] or 0})
     except Exception as e:
         logger.error(f"Error getting unread count: {e}")
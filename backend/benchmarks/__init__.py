@@ -0,0 +1,5 @@
+"""
+Load-test and latency benchmarks for the FARDI Flask API
+
+    python -m benchmarks.load_test --help
+"""
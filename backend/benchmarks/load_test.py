@@ -0,0 +1,295 @@
+"""
+Load test / latency benchmark for the FARDI Flask API
+
+Spins the app up on a local port against a throwaway SQLite database with a
+seeded synthetic population, replaces Groq/Sapling/TTS with local stubs and
+replays a weighted request mix from concurrent virtual users (students plus
+one admin). Reports p50/p95/p99 latency and throughput per endpoint and
+compares p95 against a stored baseline.
+
+    python -m benchmarks.load_test                      # run and compare
+    python -m benchmarks.load_test --save-baseline      # record a new baseline
+    python -m benchmarks.load_test --users 200 --requests 500 --clients 4
+
+Exit status is 1 when any endpoint's p95 regressed beyond --tolerance.
+Baselines are machine-specific; record one on the machine you compare on.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+EVALUATION_TEXT = ("We can find an alternative singer because the problem is urgent, "
+                   "and I think this solution keeps the festival on schedule.")
+
+# (name, method, path, json body, weight)
+STUDENT_MIX = [
+    ('me', 'GET', '/auth/api/me', None, 10),
+    ('dashboard', 'GET', '/api/dashboard', None, 20),
+    ('progression', 'GET', '/api/gamification/progression', None, 8),
+    ('phase5_evaluate', 'POST', '/api/phase5/step1/interaction2/evaluate', {'response': EVALUATION_TEXT}, 8),
+    ('phase6_evaluate', 'POST', '/api/phase6/step1/interaction2/evaluate', {'response': EVALUATION_TEXT}, 8),
+    ('ai_check', 'POST', '/api/check-ai-response', {'response': EVALUATION_TEXT}, 5),
+    ('chat_unread', 'GET', '/api/chat/unread-count', None, 25),
+    ('chat_conversations', 'GET', '/api/chat/conversations', None, 6),
+]
+
+ADMIN_MIX = [
+    ('admin_dashboard', 'GET', '/api/admin/dashboard', None, 4),
+    ('admin_users', 'GET', '/api/admin/users?page=1', None, 4),
+    ('admin_analytics', 'GET', '/api/admin/analytics', None, 2),
+    ('chat_unread', 'GET', '/api/chat/unread-count', None, 10),
+    ('chat_conversations', 'GET', '/api/chat/conversations', None, 5),
+]
+
+REQUESTS_PER_SESSION = 20  # virtual users log out and back in after this many requests
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class Recorder:
+    """Thread-safe latency samples per endpoint"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def record(self, name, elapsed_ms, ok):
+        with self.lock:
+            self.samples[name].append(elapsed_ms)
+            if not ok:
+                self.errors[name] += 1
+
+    def summary(self, wall_seconds):
+        report = {}
+        for name in sorted(self.samples):
+            values = sorted(self.samples[name])
+            report[name] = {
+                'count': len(values),
+                'errors': self.errors[name],
+                'p50_ms': round(percentile(values, 50), 2),
+                'p95_ms': round(percentile(values, 95), 2),
+                'p99_ms': round(percentile(values, 99), 2),
+                'rps': round(len(values) / wall_seconds, 2) if wall_seconds else 0.0,
+            }
+        return report
+
+
+def _timed(recorder, session, name, method, url, body=None, expect=(200,)):
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, json=body, timeout=60, allow_redirects=False)
+        ok = response.status_code in expect
+    except Exception:
+        ok = False
+    recorder.record(name, (time.perf_counter() - start) * 1000, ok)
+    return ok
+
+
+def _virtual_user(base_url, username, mix, budget, recorder, seed):
+    """One client: log in, run a session of weighted requests, log out, repeat"""
+    import requests
+    from benchmarks.seed import BENCH_PASSWORD
+
+    rng = random.Random(seed)
+    names = [entry for entry in mix]
+    weights = [entry[4] for entry in mix]
+
+    while True:
+        with budget['lock']:
+            if budget['remaining'] <= 0:
+                return
+            take = min(REQUESTS_PER_SESSION, budget['remaining'])
+            budget['remaining'] -= take
+
+        session = requests.Session()
+        _timed(recorder, session, 'login', 'POST', f"{base_url}/auth/api/login",
+               {'username_or_email': username() if callable(username) else username,
+                'password': BENCH_PASSWORD})
+        for name, method, path, body, _ in rng.choices(names, weights=weights, k=take):
+            _timed(recorder, session, name, method, f"{base_url}{path}", body)
+        session.get(f"{base_url}/auth/logout", allow_redirects=False)
+        session.close()
+
+
+def _start_app(workdir, stub):
+    """Import the app with cwd/session storage inside workdir and serve it on a free port"""
+    os.chdir(workdir)
+    stub.configure_environment()
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+
+    import app as fardi_app
+    from flask_session import Session
+    from services import registry
+    from werkzeug.serving import make_server
+    from benchmarks.stubs import StubAudioService
+
+    flask_app = fardi_app.app
+    flask_app.config['SESSION_FILE_DIR'] = os.path.join(workdir, 'sessions')
+    Session(flask_app)
+    registry.register('audio', StubAudioService)
+
+    # Request logging would dominate the measurements
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+
+    server = make_server('127.0.0.1', 0, flask_app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def run_benchmark(users=2000, requests_total=3000, clients=8, llm_latency_ms=0, seed=42):
+    """
+    Run the full benchmark and return its report
+
+    Returns:
+        Dict with 'config', 'wall_seconds', 'throughput_rps' and per-endpoint 'endpoints'
+    """
+    from benchmarks.stubs import StubProviderServer
+    from benchmarks.seed import seed_population, ADMIN_USERNAME
+
+    original_cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='fardi-bench-')
+    stub = StubProviderServer(latency_ms=llm_latency_ms).start()
+    server = None
+    try:
+        os.chdir(workdir)
+        seed_started = time.perf_counter()
+        population = seed_population(os.path.join(workdir, 'fardi.db'), users=users, seed=seed)
+        seed_seconds = time.perf_counter() - seed_started
+
+        server, base_url = _start_app(workdir, stub)
+
+        rng = random.Random(seed)
+        students = population['students']
+        recorder = Recorder()
+        # The admin gets a tenth of the traffic, students share the rest
+        admin_budget = {'remaining': requests_total // 10, 'lock': threading.Lock()}
+        student_budget = {'remaining': requests_total - admin_budget['remaining'], 'lock': threading.Lock()}
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients + 1) as pool:
+            futures = [pool.submit(_virtual_user, base_url, ADMIN_USERNAME, ADMIN_MIX,
+                                   admin_budget, recorder, seed)]
+            for i in range(clients):
+                futures.append(pool.submit(_virtual_user, base_url, lambda: rng.choice(students),
+                                           STUDENT_MIX, student_budget, recorder, seed + i + 1))
+            for future in futures:
+                future.result()
+        wall_seconds = time.perf_counter() - started
+
+        endpoints = recorder.summary(wall_seconds)
+        total = sum(entry['count'] for entry in endpoints.values())
+        return {
+            'config': {
+                'users': users, 'requests': requests_total, 'clients': clients,
+                'llm_latency_ms': llm_latency_ms, 'seed': seed,
+                'python': platform.python_version(), 'platform': platform.platform(),
+            },
+            'seed_seconds': round(seed_seconds, 2),
+            'wall_seconds': round(wall_seconds, 2),
+            'throughput_rps': round(total / wall_seconds, 2) if wall_seconds else 0.0,
+            'endpoints': endpoints,
+        }
+    finally:
+        if server is not None:
+            server.shutdown()
+        stub.stop()
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare_to_baseline(report, baseline, tolerance=0.25, min_delta_ms=2.0):
+    """
+    List endpoints whose p95 regressed against the baseline
+
+    A regression is p95 above baseline * (1 + tolerance) and at least
+    min_delta_ms slower, so sub-millisecond jitter is not flagged.
+    """
+    regressions = []
+    for name, current in report['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        limit = previous['p95_ms'] * (1 + tolerance)
+        if current['p95_ms'] > limit and current['p95_ms'] - previous['p95_ms'] >= min_delta_ms:
+            regressions.append((name, previous['p95_ms'], current['p95_ms']))
+    return regressions
+
+
+def format_report(report):
+    lines = [f"{'endpoint':<22}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>9}"]
+    for name, entry in report['endpoints'].items():
+        lines.append(f"{name:<22}{entry['count']:>7}{entry['errors']:>8}{entry['p50_ms']:>10.1f}"
+                     f"{entry['p95_ms']:>10.1f}{entry['p99_ms']:>10.1f}{entry['rps']:>9.1f}")
+    lines.append(f"total throughput: {report['throughput_rps']} req/s over {report['wall_seconds']}s "
+                 f"(seeding took {report['seed_seconds']}s)")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=2000, help='seeded student accounts')
+    parser.add_argument('--requests', type=int, default=3000, help='total requests to replay')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent student clients (plus one admin)')
+    parser.add_argument('--llm-latency-ms', type=float, default=0, help='artificial Groq/Sapling stub latency')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='write this run as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed p95 slowdown (0.25 = 25%%)')
+    parser.add_argument('--report', help='also write the JSON report here')
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(users=args.users, requests_total=args.requests, clients=args.clients,
+                           llm_latency_ms=args.llm_latency_ms, seed=args.seed)
+    print(format_report(report))
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare against (run with --save-baseline)")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('config', {}).get('users') != args.users or baseline.get('config', {}).get('clients') != args.clients:
+        print("warning: baseline was recorded with a different --users/--clients setting")
+
+    regressions = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p95 {before:.1f}ms -> {after:.1f}ms")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
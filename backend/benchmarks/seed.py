@@ -0,0 +1,152 @@
+"""
+Synthetic population for benchmarks
+
+Creates the full schema in a fresh SQLite file and fills it with users that
+have assessment results, phase 2 progress/responses, phase 3-6 completion,
+phase 5/6 step progress, XP history and chat messages with an admin.
+"""
+import json
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+from models.auth import User
+
+BENCH_PASSWORD = 'bench-password'
+ADMIN_USERNAME = 'bench_admin'
+CEFR = ['A1', 'A2', 'B1', 'B2', 'C1']
+PHASE2_STEPS = ['step_1', 'step_2', 'step_3', 'final_writing']
+
+
+def _ts(rng, now, max_days=90):
+    return (now - timedelta(days=rng.random() * max_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def create_schema(db_path):
+    """Apply every schema the request mix touches"""
+    from migrate import migrate
+    migrate(db_path)
+
+
+def seed_population(db_path, users=2000, seed=42):
+    """
+    Create the schema and seed a synthetic population
+
+    Args:
+        db_path: SQLite file to create/fill
+        users: Number of student accounts
+        seed: RNG seed so runs are comparable
+
+    Returns:
+        Dict with the admin id and the list of student usernames
+    """
+    create_schema(db_path)
+    rng = random.Random(seed)
+    now = datetime.now()
+    # One salted hash shared by every account keeps seeding fast
+    password_hash = User.hash_password(BENCH_PASSWORD)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            'INSERT INTO users (username, email, password_hash, first_name, last_name, role, is_admin) '
+            'VALUES (?, ?, ?, ?, ?, ?, 1)',
+            (ADMIN_USERNAME, 'admin@bench.local', password_hash, 'Bench', 'Admin', 'admin')
+        )
+        admin_id = conn.execute('SELECT id FROM users WHERE username = ?', (ADMIN_USERNAME,)).fetchone()[0]
+
+        conn.executemany(
+            'INSERT INTO users (username, email, password_hash, first_name, last_name, created_at, last_login) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(f'student{i}', f'student{i}@bench.local', password_hash, f'Student{i}', 'Bench',
+              _ts(rng, now, 365), _ts(rng, now, 30)) for i in range(users)]
+        )
+        student_ids = [row[0] for row in conn.execute('SELECT id FROM users WHERE is_admin = 0 ORDER BY id')]
+
+        assessments, p2_progress, p2_responses, completions = [], [], [], []
+        p5_progress, p6_progress, progression, xp_history, chat = [], [], [], [], []
+
+        for user_id in student_ids:
+            level = rng.choice(CEFR)
+            phases_done = rng.randint(1, 6)
+
+            for _ in range(rng.randint(1, 3)):
+                assessments.append((
+                    user_id, f'bench-{user_id}-{rng.random():.6f}', rng.choice(CEFR), rng.randint(50, 400),
+                    rng.randint(300, 3000), _ts(rng, now),
+                    json.dumps({'speaking': level, 'writing': rng.choice(CEFR)}), json.dumps([]),
+                    json.dumps([]), json.dumps([]), rng.random() * 20
+                ))
+
+            for position, step_id in enumerate(PHASE2_STEPS):
+                done = phases_done >= 2 or position < rng.randint(0, 3)
+                p2_progress.append((user_id, f'p2-{user_id}', step_id, 5 if done else rng.randint(0, 4),
+                                    rng.randint(0, 15), int(done), _ts(rng, now)))
+                for item in range(rng.randint(1, 5) if done else 1):
+                    p2_responses.append((user_id, f'p2-{user_id}', step_id, f'item_{item + 1}',
+                                         'We can find an alternative because it is urgent.',
+                                         json.dumps({'level': level}), rng.randint(1, 3), level, _ts(rng, now)))
+
+            for phase in range(1, phases_done + 1):
+                completions.append((user_id, phase, 1, _ts(rng, now), rng.randint(40, 100), level))
+
+            for table, start_phase in ((p5_progress, 5), (p6_progress, 6)):
+                if phases_done >= start_phase - 1:
+                    for subphase in (1, 2):
+                        for step_id in range(1, 6):
+                            scores = {f'interaction{i}': rng.randint(1, 5) for i in range(1, 4)}
+                            table.append((user_id, subphase, step_id, json.dumps(scores), sum(scores.values()),
+                                          int(rng.random() < 0.8), rng.choice(CEFR)))
+
+            total_xp = 0
+            for _ in range(rng.randint(5, 20)):
+                amount = rng.choice([10, 25, 50, 100])
+                total_xp += amount
+                xp_history.append((user_id, amount, 'activity_complete', f'act_{rng.randint(1, 60)}',
+                                   'evaluation', _ts(rng, now)))
+            progression.append((user_id, total_xp, 1 + total_xp // 500, 500 - total_xp % 500))
+
+            for _ in range(rng.randint(0, 4)):
+                chat.append((user_id, admin_id, 'Hello, I have a question about phase 5.',
+                             int(rng.random() < 0.5), _ts(rng, now, 14)))
+                chat.append((admin_id, user_id, 'Sure, what do you need?',
+                             int(rng.random() < 0.5), _ts(rng, now, 14)))
+
+        conn.executemany(
+            'INSERT INTO assessment_results (user_id, session_id, overall_level, xp_earned, time_taken, completed_at, '
+            'skill_levels, achievements, responses, assessments, ai_usage_percentage) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', assessments)
+        conn.executemany(
+            'INSERT INTO phase2_progress (user_id, session_id, step_id, current_item, step_score, step_completed, '
+            'last_activity) VALUES (?, ?, ?, ?, ?, ?, ?)', p2_progress)
+        conn.executemany(
+            'INSERT INTO phase2_responses (user_id, session_id, step_id, action_item_id, response_text, '
+            'assessment_data, points_earned, cefr_level, submitted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            p2_responses)
+        conn.executemany(
+            'INSERT INTO user_phase_completion (user_id, phase_number, completed, completion_date, overall_score, '
+            'final_level) VALUES (?, ?, ?, ?, ?, ?)', completions)
+        for table, rows in (('phase5_progress', p5_progress), ('phase6_progress', p6_progress)):
+            conn.executemany(
+                f'INSERT INTO {table} (user_id, subphase, step_id, interaction_scores, total_score, completed, '
+                f'remedial_level) VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        conn.executemany(
+            'INSERT INTO user_progression (user_id, total_xp, current_level, xp_to_next_level) VALUES (?, ?, ?, ?)',
+            progression)
+        conn.executemany(
+            'INSERT INTO xp_history (user_id, xp_amount, reason, activity_id, activity_type, timestamp) '
+            'VALUES (?, ?, ?, ?, ?, ?)', xp_history)
+        conn.executemany(
+            'INSERT INTO chat_messages (sender_id, receiver_id, message, is_read, created_at) VALUES (?, ?, ?, ?, ?)',
+            chat)
+        # Inserted directly, so rebuild the inbox summary the send endpoint maintains
+        from app import rebuild_chat_conversations
+        rebuild_chat_conversations(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+    return {
+        'admin_id': admin_id,
+        'students': [f'student{i}' for i in range(users)],
+    }
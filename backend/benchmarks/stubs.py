@@ -0,0 +1,114 @@
+"""
+Stand-ins for the external providers used during benchmarks
+
+- Groq: an OpenAI-compatible /openai/v1/chat/completions endpoint
+  (the Groq SDK honours GROQ_BASE_URL)
+- Sapling: the /api/v1/aidetect endpoint (AIService honours SAPLING_API_URL)
+- Edge TTS speaks a websocket protocol, so the audio service is swapped
+  through the service registry instead of a network stub
+"""
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_EVALUATION = {
+    "score": 3,
+    "level": "B1",
+    "feedback": "Clear answer with some target vocabulary.",
+    "vocabulary_used": ["solution", "urgent"],
+    "strengths": ["Clear idea"],
+    "improvements": ["Add a reason"],
+}
+
+
+class _ProviderHandler(BaseHTTPRequestHandler):
+    """Answers Groq chat completions and Sapling detection requests"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if self.path.endswith('/chat/completions'):
+            prompt_tokens = sum(len(m.get('content', '')) for m in request.get('messages', [])) // 4
+            self._reply({
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get('model', 'stub'),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": json.dumps(STUB_EVALUATION)},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": 60,
+                          "total_tokens": prompt_tokens + 60},
+            })
+        elif self.path.endswith('/aidetect'):
+            self._reply({"score": 0.12, "sentence_scores": []})
+        else:
+            self._reply({"error": f"unknown stub path {self.path}"}, status=404)
+
+
+class StubProviderServer:
+    """Threaded HTTP server standing in for Groq and Sapling"""
+
+    def __init__(self, latency_ms: float = 0):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ProviderHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency_ms / 1000.0
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def configure_environment(self):
+        """Point AIService (built lazily on first use) at this server"""
+        os.environ['GROQ_API_KEY'] = 'stub-key'
+        os.environ['GROQ_BASE_URL'] = self.url
+        os.environ['SAPLING_API_KEY'] = 'stub-key'
+        os.environ['SAPLING_API_URL'] = f"{self.url}/api/v1/aidetect"
+
+
+class StubAudioService:
+    """AudioService replacement that writes a tiny placeholder file"""
+
+    def generate_audio_sync(self, text, output_path, voice="en-US-ChristopherNeural"):
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with open(output_path, 'wb') as f:
+            f.write(b'ID3stub')
+        return True
+
+    def generate_custom_audio(self, text, filename, voice="en-US-ChristopherNeural"):
+        return self.generate_audio_sync(text, os.path.join('static', 'audio', filename), voice)
+
+    def __getattr__(self, name):
+        # Anything else (verify/initialize helpers) is a no-op
+        return lambda *args, **kwargs: True
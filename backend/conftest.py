@@ -0,0 +1,60 @@
+"""
+Shared pytest fixtures
+"""
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from benchmarks.seed import seed_population
+
+# app.py opens its Flask-Session store on import; keep the suite's sessions out of the tree
+os.environ.setdefault('SESSION_FILE_DIR', tempfile.mkdtemp(prefix='fardi-test-sessions-'))
+
+
+class AppClient:
+    """The Flask app on a freshly seeded database (see the app_client fixture)"""
+
+    def __init__(self, flask_app, db_path: str, population: dict):
+        self.app = flask_app
+        self.db_path = db_path
+        self.admin_id = population['admin_id']
+        conn = sqlite3.connect(db_path)
+        self.student_id = conn.execute("SELECT id FROM users WHERE username = 'student0'").fetchone()[0]
+        conn.close()
+
+    def login(self, user_id=None, is_admin=None):
+        """A test client whose session belongs to user_id (the admin by default)"""
+        client = self.app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = self.admin_id if user_id is None else user_id
+            if is_admin is not None:
+                sess['is_admin'] = is_admin
+        return client
+
+
+@pytest.fixture
+def app_client(tmp_path, monkeypatch):
+    """
+    The app on a seeded database with an admin and two students
+
+    Sessions go to a per-test directory; the app's session interface is
+    restored afterwards, since Flask-Session fixes the directory when it
+    is initialised.
+    """
+    import app as fardi_app
+    from flask_session import Session
+
+    db_path = str(tmp_path / 'fardi.db')
+    population = seed_population(db_path, users=2)
+    monkeypatch.setattr(fardi_app.db_manager, 'db_path', db_path)
+
+    flask_app = fardi_app.app
+    original = flask_app.session_interface
+    monkeypatch.setitem(flask_app.config, 'SESSION_FILE_DIR', str(tmp_path / 'sessions'))
+    Session(flask_app)
+    try:
+        yield AppClient(flask_app, db_path, population)
+    finally:
+        flask_app.session_interface = original
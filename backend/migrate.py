@@ -0,0 +1,42 @@
+"""
+Apply the FARDI database schema
+Run this once per deploy (or after pulling schema changes) instead of relying
+on the app to create tables at import time:
+
+    python migrate.py            # uses fardi.db in the current directory
+    python migrate.py path/to.db
+"""
+import os
+import sys
+import sqlite3
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+GAMIFICATION_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations', 'add_gamification_tables.sql')
+
+
+def migrate(db_path='fardi.db'):
+    """Create/upgrade every table and index the app depends on"""
+    from models.auth import DatabaseManager
+    from app import init_chat_tables
+
+    db_manager = DatabaseManager(db_path)
+    db_manager.init_database()
+    init_chat_tables(db_manager)
+
+    # Gamification tables, indexes and leaderboard triggers (all IF NOT EXISTS)
+    conn = sqlite3.connect(db_path)
+    try:
+        with open(GAMIFICATION_SQL) as f:
+            conn.executescript(f.read())
+    finally:
+        conn.close()
+
+    logger.info(f"Schema is up to date: {db_path}")
+    return True
+
+
+if __name__ == "__main__":
+    migrate(sys.argv[1] if len(sys.argv) > 1 else 'fardi.db')
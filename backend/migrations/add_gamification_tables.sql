@@ -64,6 +64,79 @@ CREATE TABLE IF NOT EXISTS user_streaks (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- Nightly streak maintenance only looks at active streaks
+CREATE INDEX IF NOT EXISTS idx_user_streaks_active
+    ON user_streaks(last_activity_date) WHERE current_streak > 0;
+
+-- ============================================================
+-- STREAK LEADERBOARD SNAPSHOT
+-- ============================================================
+-- One row per active streak (top-N reads walk the index), plus one row per
+-- (current_streak, longest_streak) pair counting its users, so a user's rank
+-- is a sum over the few distinct streak values above theirs.
+-- Both are kept in step with user_streaks by the triggers below.
+CREATE TABLE IF NOT EXISTS streak_leaderboard (
+    user_id INTEGER PRIMARY KEY,
+    current_streak INTEGER NOT NULL,
+    longest_streak INTEGER NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_streak_leaderboard_order
+    ON streak_leaderboard(current_streak DESC, longest_streak DESC, user_id);
+
+CREATE TABLE IF NOT EXISTS streak_rank_buckets (
+    current_streak INTEGER NOT NULL,
+    longest_streak INTEGER NOT NULL,
+    users INTEGER NOT NULL,
+    PRIMARY KEY (current_streak, longest_streak)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_streak_leaderboard_insert
+AFTER INSERT ON user_streaks WHEN NEW.current_streak > 0
+BEGIN
+    INSERT OR REPLACE INTO streak_leaderboard (user_id, current_streak, longest_streak)
+    VALUES (NEW.user_id, NEW.current_streak, NEW.longest_streak);
+    INSERT INTO streak_rank_buckets (current_streak, longest_streak, users)
+    VALUES (NEW.current_streak, NEW.longest_streak, 1)
+    ON CONFLICT (current_streak, longest_streak) DO UPDATE SET users = users + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_streak_leaderboard_update
+AFTER UPDATE OF current_streak, longest_streak ON user_streaks
+WHEN OLD.current_streak IS NOT NEW.current_streak OR OLD.longest_streak IS NOT NEW.longest_streak
+BEGIN
+    UPDATE streak_rank_buckets SET users = users - 1
+    WHERE OLD.current_streak > 0
+      AND current_streak = OLD.current_streak AND longest_streak = OLD.longest_streak;
+    DELETE FROM streak_rank_buckets
+    WHERE current_streak = OLD.current_streak AND longest_streak = OLD.longest_streak AND users <= 0;
+    DELETE FROM streak_leaderboard WHERE user_id = OLD.user_id AND NEW.current_streak <= 0;
+    INSERT OR REPLACE INTO streak_leaderboard (user_id, current_streak, longest_streak)
+    SELECT NEW.user_id, NEW.current_streak, NEW.longest_streak WHERE NEW.current_streak > 0;
+    INSERT INTO streak_rank_buckets (current_streak, longest_streak, users)
+    SELECT NEW.current_streak, NEW.longest_streak, 1 WHERE NEW.current_streak > 0
+    ON CONFLICT (current_streak, longest_streak) DO UPDATE SET users = users + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_streak_leaderboard_delete
+AFTER DELETE ON user_streaks WHEN OLD.current_streak > 0
+BEGIN
+    DELETE FROM streak_leaderboard WHERE user_id = OLD.user_id;
+    UPDATE streak_rank_buckets SET users = users - 1
+    WHERE current_streak = OLD.current_streak AND longest_streak = OLD.longest_streak;
+    DELETE FROM streak_rank_buckets
+    WHERE current_streak = OLD.current_streak AND longest_streak = OLD.longest_streak AND users <= 0;
+END;
+
+-- Backfill for databases that had streaks before the snapshot existed
+INSERT OR IGNORE INTO streak_leaderboard (user_id, current_streak, longest_streak)
+SELECT user_id, current_streak, longest_streak FROM user_streaks WHERE current_streak > 0;
+
+INSERT OR IGNORE INTO streak_rank_buckets (current_streak, longest_streak, users)
+SELECT current_streak, longest_streak, COUNT(*) FROM streak_leaderboard
+GROUP BY current_streak, longest_streak;
+
 -- ============================================================
 -- LEADERBOARD ENTRIES (Phase 3, but creating table now)
 -- ============================================================
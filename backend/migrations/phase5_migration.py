@@ -133,11 +133,45 @@ def migrate_phase5(db_path='instance/fardi.db'):
             )
         ''')
         
+        # Rolling (exponentially weighted) performance per user and activity type
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS performance_aggregates (
+                user_id INTEGER NOT NULL,
+                activity_type VARCHAR(50) NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                ewma_success FLOAT NOT NULL DEFAULT 0.0,
+                ewma_mastery FLOAT NOT NULL DEFAULT 0.0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (user_id, activity_type),
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+        ''')
+        # Seed from existing history (no-op once the aggregates exist)
+        cursor.execute('''
+            INSERT OR IGNORE INTO performance_aggregates
+                (user_id, activity_type, attempts, ewma_success, ewma_mastery)
+            SELECT user_id, COALESCE(activity_type, 'remedial'), SUM(attempts),
+                   AVG(success_rate), AVG(mastery_level)
+            FROM performance_tracking
+            GROUP BY user_id, COALESCE(activity_type, 'remedial')
+        ''')
+        
         # Create indexes for performance
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_powerups_user ON user_powerups(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_collectibles_user ON user_collectibles(user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_performance_user ON performance_tracking(user_id)')
+        # track_performance upserts on (user_id, activity_id); keep the newest row of any duplicates
+        cursor.execute('''
+            DELETE FROM performance_tracking WHERE id NOT IN (
+                SELECT MAX(id) FROM performance_tracking GROUP BY user_id, activity_id
+            )
+        ''')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_performance_user_activity ON performance_tracking(user_id, activity_id)')
+        # Due queues: per user, and for everybody on a given date
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_spaced_repetition_user_due ON spaced_repetition(user_id, next_review_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_spaced_repetition_due ON spaced_repetition(next_review_date, user_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_powerup_usage_user ON powerup_usage(user_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_powerup_usage_user_time ON powerup_usage(user_id, used_at)')
         
         conn.commit()
         print("✅ Phase 5 database migration completed successfully")
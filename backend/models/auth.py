@@ -4,26 +4,35 @@ User authentication models and database operations
 import sqlite3
 import hashlib
 import secrets
+import threading
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
 from functools import wraps
-from flask import session, redirect, url_for, flash
+from flask import session, redirect, url_for, flash, g
 import logging
+from utils import deadlines
 
 logger = logging.getLogger(__name__)
 
+# sqlite3's own busy-wait default; inside a request it shrinks to the time left
+DB_BUSY_TIMEOUT = 5.0
+
+
 class DatabaseManager:
     def __init__(self, db_path='fardi.db'):
         self.db_path = db_path
-        self.init_database()
+        # Schema setup is an explicit step (see migrate.py / `flask init-db`),
+        # so constructing a manager never runs DDL.
     
     def get_connection(self):
         """Get database connection with row factory"""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=deadlines.timeout(DB_BUSY_TIMEOUT, floor=0.1))
         conn.row_factory = sqlite3.Row
         return conn
     
     def init_database(self):
-        """Initialize database tables"""
+        """Initialize database tables (idempotent - run via migrate.py)"""
         conn = self.get_connection()
         try:
             # Users table
@@ -493,6 +502,82 @@ class DatabaseManager:
                 )
             ''')
 
+            # LLM-graded evaluator answers - source data for the feedback bank
+            # (services/feedback_bank.py)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS graded_answers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    template_name TEXT NOT NULL,
+                    answer_text TEXT NOT NULL,
+                    evaluation TEXT NOT NULL, -- JSON string
+                    score REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_graded_answers_template
+                ON graded_answers (template_name, id)
+            ''')
+
+            # MinHash fingerprints of graded answers and the near-duplicate
+            # pairs found among them (services/submission_index.py)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS submission_fingerprints (
+                    id TEXT PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    user_id INTEGER,
+                    answer_text TEXT NOT NULL,
+                    signature BLOB NOT NULL,
+                    evaluation TEXT, -- JSON string
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_submission_fingerprints_task
+                ON submission_fingerprints (task)
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS similar_submissions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task TEXT NOT NULL,
+                    submission_id TEXT NOT NULL,
+                    user_id INTEGER,
+                    matched_submission_id TEXT NOT NULL,
+                    matched_user_id INTEGER,
+                    similarity REAL NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_similar_submissions_task
+                ON similar_submissions (task, id)
+            ''')
+
+            # Resume points of bulk re-grading jobs (services/regrader.py)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS regrade_checkpoints (
+                    job TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    grader TEXT NOT NULL,
+                    last_id INTEGER DEFAULT 0,
+                    processed INTEGER DEFAULT 0,
+                    changed INTEGER DEFAULT 0,
+                    failed INTEGER DEFAULT 0,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            # Rows a re-grading job could not grade, for --retry-failed
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS regrade_failures (
+                    job TEXT NOT NULL,
+                    row_id INTEGER NOT NULL,
+                    error TEXT,
+                    failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (job, row_id)
+                )
+            ''')
+
             # Database migrations - Add missing columns to existing tables
             try:
                 # Check if role and is_admin columns exist, add them if not
@@ -668,6 +753,8 @@ class User:
             conn.execute(query, values)
             conn.commit()
             
+            if {'role', 'is_admin', 'is_active'} & set(kwargs):
+                principal_cache.invalidate(user_id)
             return True
             
         except Exception as e:
@@ -817,6 +904,7 @@ class User:
                 (user_id,)
             )
             conn.commit()
+            principal_cache.invalidate(user_id)
             return True
             
         except Exception as e:
@@ -1478,15 +1566,110 @@ class AssessmentHistory:
             conn.close()
 
 # Authentication decorators
+# How long an authorization lookup is reused before re-reading the users row
+PRINCIPAL_CACHE_TTL = 60
+PRINCIPAL_CACHE_MAX_ENTRIES = 10000
+
+Principal = namedtuple('Principal', 'user_id username first_name last_name role is_admin is_active version')
+
+
+class PrincipalCache:
+    """
+    TTL cache of the users columns that authorization needs
+
+    Entries are dropped by invalidate() whenever a user's role, admin flag
+    or active flag changes; version counts those changes so a request can
+    tell its principal is stale.
+    """
+
+    def __init__(self, db_manager=None, ttl=PRINCIPAL_CACHE_TTL, max_entries=PRINCIPAL_CACHE_MAX_ENTRIES):
+        self.db_manager = db_manager
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def bind(self, db_manager):
+        """Use the application's database manager (called once at startup)"""
+        self.db_manager = db_manager
+        self.invalidate()
+
+    def get(self, user_id):
+        """Principal for a user id (None if the user does not exist)"""
+        db_manager = self.db_manager or DatabaseManager()
+        key = (db_manager.db_path, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            version = self._versions.get(user_id, 0)
+
+        principal = self._load(db_manager, user_id, version)
+        with self._lock:
+            if self._versions.get(user_id, 0) == version:
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                self._entries[key] = (now + self.ttl, principal)
+        return principal
+
+    def invalidate(self, user_id=None):
+        """Forget one user's principal (or everyone's)"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+                for key in self._versions:
+                    self._versions[key] += 1
+            else:
+                for key in [key for key in self._entries if key[1] == user_id]:
+                    del self._entries[key]
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+
+    def _load(self, db_manager, user_id, version):
+        conn = db_manager.get_connection()
+        try:
+            row = conn.execute('''
+                SELECT id, username, first_name, last_name, role, is_admin, is_active
+                FROM users WHERE id = ?
+            ''', (user_id,)).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        return Principal(row['id'], row['username'], row['first_name'], row['last_name'],
+                         row['role'] or 'user', bool(row['is_admin']), bool(row['is_active']), version)
+
+
+principal_cache = PrincipalCache()
+
+
+def current_principal():
+    """The logged-in user's principal, loaded at most once per request"""
+    if 'principal' not in g:
+        user_id = session.get('user_id')
+        g.principal = principal_cache.get(user_id) if user_id is not None else None
+    return g.principal
+
+
+def _wants_json():
+    from flask import request
+    return request.path.startswith('/api/') or request.headers.get('Content-Type') == 'application/json'
+
+
 def login_required(f):
     """Decorator to require login for routes"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from flask import request, jsonify
+        from flask import jsonify
 
-        if 'user_id' not in session:
+        principal = current_principal() if 'user_id' in session else None
+        if principal is None or not principal.is_active:
+            if 'user_id' in session:
+                # Deleted or deactivated since logging in
+                session.clear()
             # Check if this is an API request
-            if request.path.startswith('/api/') or request.headers.get('Content-Type') == 'application/json':
+            if _wants_json():
                 return jsonify({'success': False, 'error': 'Authentication required. Please log in.'}), 401
             flash('Please log in to access this page.', 'warning')
             return redirect(url_for('auth.login'))
@@ -1506,35 +1689,25 @@ def admin_required(f):
     """Decorator to require admin privileges"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from flask import request, jsonify
+        from flask import jsonify
         
-        if 'user_id' not in session:
-            # Check if this is an API request
-            if request.path.startswith('/api/') or request.headers.get('Content-Type') == 'application/json':
+        principal = current_principal() if 'user_id' in session else None
+        if principal is None or not principal.is_active:
+            if _wants_json():
                 return jsonify({'error': 'Authentication required'}), 401
             flash('Please log in to access this page.', 'warning')
             return redirect(url_for('auth.login'))
         
-        # Check if user is admin
-        user_id = session.get('user_id')
-        is_admin = session.get('is_admin', False)
+        if not principal.is_admin:
+            if _wants_json():
+                return jsonify({'error': 'Admin privileges required'}), 403
+            flash('Access denied. Admin privileges required.', 'error')
+            return redirect('/dashboard')
         
-        if not is_admin:
-            # Double-check from database
-            db_manager = DatabaseManager()
-            user_manager_instance = User(db_manager)
-            user_data = user_manager_instance.get_user_by_id(user_id)
-            
-            if not user_data or not user_data.get('is_admin'):
-                # Check if this is an API request
-                if request.path.startswith('/api/') or request.headers.get('Content-Type') == 'application/json':
-                    return jsonify({'error': 'Admin privileges required'}), 403
-                flash('Access denied. Admin privileges required.', 'error')
-                return redirect('/dashboard')
-            
-            # Update session with admin status
+        # Keep the session flags the frontend reads in step with the database
+        if not session.get('is_admin'):
             session['is_admin'] = True
-            session['role'] = user_data.get('role', 'user')
+            session['role'] = principal.role
         
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
@@ -0,0 +1,192 @@
+"""
+Content Registry
+Precomputed lookup indexes over the phase content so request handlers never
+scan lists to navigate it:
+
+- Phase 1: DIALOGUE_QUESTIONS (models/game_data.py)
+- Phase 2: phase2.json (via models/phase2_loader.py)
+- Phase 4: phase4.json (via models/phase4_loader.py)
+
+Phases 3, 5 and 6 have no backend content files (their activities ship with
+the frontend), so there is nothing to index for them here.
+
+Indexes are built once and rebuilt when the backing JSON file's mtime
+changes. The mtime is checked at most every RELOAD_CHECK_INTERVAL seconds.
+"""
+import os
+import time
+import threading
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RELOAD_CHECK_INTERVAL = 2.0  # seconds between mtime checks per source
+
+
+class ContentIndex:
+    """O(1) navigation over one phase's steps, items, remedial activities and questions"""
+
+    def __init__(self, steps: Dict[Any, Any], items_key: str = 'action_items',
+                 remedial: Optional[Dict[Any, Dict[str, list]]] = None,
+                 questions: Optional[List[Dict]] = None):
+        self.steps = steps
+        self._items: Dict[Any, List[Dict]] = {}
+        self._positions: Dict[tuple, int] = {}
+        self._remedial: Dict[tuple, List[Dict]] = {}
+        self._questions_by_type: Dict[str, Dict] = {}
+        self._questions_by_step: Dict[Any, Dict] = {}
+
+        for step_id, step in steps.items():
+            items = step.get(items_key, []) if isinstance(step, dict) else []
+            self._items[step_id] = items
+            for position, item in enumerate(items):
+                item_id = item.get('id') if isinstance(item, dict) else None
+                if item_id is not None:
+                    # First occurrence wins, matching the old linear scans
+                    self._positions.setdefault((step_id, item_id), position)
+
+        for step_id, levels in (remedial or {}).items():
+            for level, activities in levels.items():
+                self._remedial[(step_id, level)] = activities
+
+        for question in questions or []:
+            self._questions_by_type.setdefault(question.get('type'), question)
+            self._questions_by_step.setdefault(question.get('step'), question)
+
+    def step(self, step_id) -> Optional[Any]:
+        """Get a step by id"""
+        return self.steps.get(step_id)
+
+    def items(self, step_id) -> List[Dict]:
+        """Get the ordered items of a step"""
+        return self._items.get(step_id, [])
+
+    def index_of(self, step_id, item_id, default: Optional[int] = None) -> Optional[int]:
+        """Get the position of an item within its step"""
+        return self._positions.get((step_id, item_id), default)
+
+    def item(self, step_id, item_id) -> Optional[Dict]:
+        """Get an item by step and item id"""
+        position = self._positions.get((step_id, item_id))
+        return None if position is None else self._items[step_id][position]
+
+    def next_item(self, step_id, item_id) -> Optional[Dict]:
+        """Get the item that follows item_id in its step (None if last or unknown)"""
+        position = self._positions.get((step_id, item_id))
+        if position is None:
+            return None
+        items = self._items[step_id]
+        return items[position + 1] if position + 1 < len(items) else None
+
+    def remedial_activities(self, step_id, level) -> List[Dict]:
+        """Get the remedial activities for a step at a CEFR level"""
+        return self._remedial.get((step_id, level), [])
+
+    def question_for_type(self, question_type) -> Optional[Dict]:
+        """Get the first question of a given type"""
+        return self._questions_by_type.get(question_type)
+
+    def question_for_step(self, step) -> Optional[Dict]:
+        """Get the question asked at a given step"""
+        return self._questions_by_step.get(step)
+
+
+class _Source:
+    """One phase's index plus the file it was built from"""
+
+    def __init__(self, builder: Callable[[bool], ContentIndex], path: Optional[str]):
+        self.builder = builder
+        self.path = path
+        self.mtime = None
+        self.checked_at = 0.0
+        self.index: Optional[ContentIndex] = None
+
+    def current_mtime(self):
+        if not self.path:
+            return None
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+
+def _build_phase1(reload: bool) -> ContentIndex:
+    from models.game_data import DIALOGUE_QUESTIONS
+    steps = {q.get('step'): q for q in DIALOGUE_QUESTIONS}
+    return ContentIndex(steps, questions=DIALOGUE_QUESTIONS)
+
+
+def _build_phase2(reload: bool) -> ContentIndex:
+    from models import phase2_loader
+    if reload:
+        phase2_loader.reload_phase2_data()
+    return ContentIndex(phase2_loader.PHASE_2_STEPS,
+                        remedial=phase2_loader.PHASE_2_REMEDIAL_ACTIVITIES)
+
+
+def _build_phase4(reload: bool) -> ContentIndex:
+    from models.phase4_loader import load_phase4_json
+    data = load_phase4_json(force=reload)
+    # phase4.json currently describes step 1 only
+    return ContentIndex({1: data} if data else {})
+
+
+def _phase2_path():
+    from models.phase2_loader import PHASE2_JSON_PATH
+    return str(PHASE2_JSON_PATH)
+
+
+def _phase4_path():
+    from models.phase4_loader import PHASE4_JSON_PATH
+    return str(PHASE4_JSON_PATH)
+
+
+_builders = {
+    1: (_build_phase1, None),
+    2: (_build_phase2, _phase2_path),
+    4: (_build_phase4, _phase4_path),
+}
+_sources: Dict[int, _Source] = {}
+_lock = threading.Lock()
+
+
+def get_index(phase: int) -> ContentIndex:
+    """Get the content index for a phase, rebuilding it if its file changed"""
+    source = _sources.get(phase)
+    now = time.monotonic()
+
+    if source is not None and (source.path is None or now - source.checked_at < RELOAD_CHECK_INTERVAL):
+        return source.index
+
+    with _lock:
+        source = _sources.get(phase)
+        if source is None:
+            if phase not in _builders:
+                raise KeyError(f"No content registered for phase {phase}")
+            builder, path_fn = _builders[phase]
+            source = _Source(builder, path_fn() if path_fn else None)
+            source.mtime = source.current_mtime()
+            source.index = builder(False)
+            source.checked_at = now
+            _sources[phase] = source
+            return source.index
+
+        if now - source.checked_at >= RELOAD_CHECK_INTERVAL:
+            source.checked_at = now
+            mtime = source.current_mtime()
+            if mtime != source.mtime:
+                logger.info(f"Phase {phase} content changed on disk, rebuilding index")
+                try:
+                    source.index = source.builder(True)
+                    source.mtime = mtime
+                except Exception as e:
+                    # Keep serving the last good index if the new file is broken
+                    logger.error(f"Error reloading phase {phase} content: {e}")
+        return source.index
+
+
+def reset():
+    """Drop all built indexes (used by tests)"""
+    with _lock:
+        _sources.clear()
@@ -9,6 +9,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# phase2.json lives in the project root, one level up from backend
+PHASE2_JSON_PATH = Path(__file__).parent.parent.parent / 'phase2.json'
+
 # Cache for loaded data
 _phase2_data = None
 _phase2_steps = None
@@ -21,9 +24,7 @@ def load_phase2_json():
     if _phase2_data is not None:
         return _phase2_data
     
-    # Find phase2.json (in project root, one level up from backend)
-    current_dir = Path(__file__).parent.parent.parent
-    json_path = current_dir / 'phase2.json'
+    json_path = PHASE2_JSON_PATH
     
     if not json_path.exists():
         raise FileNotFoundError(f"phase2.json not found at {json_path}")
@@ -158,3 +159,30 @@ except Exception as e:
     PHASE_2_REMEDIAL_ACTIVITIES = {}
     PHASE_2_POINTS = {'A1': 1, 'A2': 2, 'B1': 3, 'B2': 4}
     PHASE_2_SUCCESS_THRESHOLD = 20
+
+
+def reload_phase2_data():
+    """
+    Re-read phase2.json and refresh PHASE_2_STEPS / PHASE_2_REMEDIAL_ACTIVITIES
+    in place, so modules that imported the dicts see the new content
+    """
+    global _phase2_data, _phase2_steps, _phase2_remedial
+
+    _phase2_data = None
+    _phase2_steps = None
+    _phase2_remedial = None
+
+    steps = convert_steps_to_old_format()
+    remedial = convert_remedial_to_old_format()
+
+    if steps is not PHASE_2_STEPS:
+        PHASE_2_STEPS.clear()
+        PHASE_2_STEPS.update(steps)
+    if remedial is not PHASE_2_REMEDIAL_ACTIVITIES:
+        PHASE_2_REMEDIAL_ACTIVITIES.clear()
+        PHASE_2_REMEDIAL_ACTIVITIES.update(remedial)
+
+    # Keep the module caches pointing at the shared dicts
+    _phase2_steps = PHASE_2_STEPS
+    _phase2_remedial = PHASE_2_REMEDIAL_ACTIVITIES
+    return PHASE_2_STEPS
@@ -9,22 +9,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# phase4.json lives in the project root, one level up from backend
+PHASE4_JSON_PATH = Path(__file__).parent.parent.parent / 'phase4.json'
+
 # Cache for loaded data
 _phase4_data = None
 
-def load_phase4_json():
+def load_phase4_json(force=False):
     """Load Phase 4 data from JSON file"""
     global _phase4_data
     
-    if _phase4_data is not None:
+    if _phase4_data is not None and not force:
         return _phase4_data
     
-    # Find phase4.json (in project root, one level up from backend)
-    current_dir = Path(__file__).parent.parent.parent
-    json_path = current_dir / 'phase4.json'
+    json_path = PHASE4_JSON_PATH
     
     if not json_path.exists():
         logger.warning(f"phase4.json not found at {json_path}")
+        _phase4_data = None
         return None
     
     logger.info(f"Loading Phase 4 data from {json_path}")
@@ -35,14 +37,7 @@ def load_phase4_json():
     return _phase4_data
 
 def get_phase4_step(step_id):
-    """Get Phase 4 step data by step_id"""
-    data = load_phase4_json()
-    if not data:
-        return None
-    
-    # For now, we only have step 1
-    if step_id == 1:
-        return data
-    
-    return None
+    """Get Phase 4 step data by step_id (served from the content registry)"""
+    from models.content_registry import get_index
+    return get_index(4).step(step_id)
 
@@ -4,7 +4,7 @@ Authentication routes for login, signup, and user management - FIXED VERSION
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash, jsonify
 import re
 import logging
-from models.auth import DatabaseManager, User, AssessmentHistory, login_required, guest_only
+from models.auth import DatabaseManager, User, AssessmentHistory, login_required, guest_only, principal_cache
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +13,7 @@ auth_bp = Blueprint('auth', __name__)
 
 # Initialize database and user management
 db_manager = DatabaseManager()
+principal_cache.bind(db_manager)
 user_manager = User(db_manager)
 assessment_history = AssessmentHistory(db_manager)
 
@@ -4,15 +4,15 @@ Provides endpoints for evaluating student writing responses using AI
 """
 import logging
 from flask import Blueprint, request, jsonify, session
-from services.ai_service import AIService
+from services import registry
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 evaluation_bp = Blueprint('evaluation', __name__)
 
-# Initialize AI service
-ai_service = AIService()
+# Shared AI service (built lazily on first use)
+ai_service = registry.lazy('ai')
 
 
 def normalize_text(text):
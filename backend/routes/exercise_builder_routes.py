@@ -11,6 +11,7 @@ import logging
 
 from routes.auth_routes import login_required, db_manager
 from models.auth import admin_required
+from utils.structured_logging import log_event
 from models.exercise_builder import (
     ExerciseTypeTemplate, WorkflowNode, ExerciseWorkflow, 
     ExerciseInstance, ConditionEvaluator, CharacterManager, 
@@ -127,11 +128,9 @@ def get_workflows():
 def create_workflow():
     """Create a new workflow"""
     try:
-        logger.info(f"Creating workflow - Session: {session}")
         data = request.get_json()
-        logger.info(f"Request data: {data}")
         user_id = session.get('user_id')
-        logger.info(f"User ID from session: {user_id}")
+        log_event(logger, 'request.payload', path=request.path, user_id=user_id, payload=data)
         
         # Create workflow object
         workflow = ExerciseWorkflow(
@@ -289,7 +289,10 @@ def get_streak_leaderboard():
     try:
         streak_service = StreakService(conn)
         leaderboard = streak_service.get_streak_leaderboard(limit)
-        return jsonify({"leaderboard": leaderboard}), 200
+        result = {"leaderboard": leaderboard}
+        if 'user_id' in session:
+            result["user_rank"] = streak_service.get_streak_rank(session['user_id'])
+        return jsonify(result), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     finally:
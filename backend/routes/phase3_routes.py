@@ -4,6 +4,7 @@ Sponsorship & Budgeting phase endpoints
 """
 from flask import Blueprint, request, jsonify, session
 from routes.auth_routes import login_required
+from utils.structured_logging import banner
 import logging
 
 logger = logging.getLogger(__name__)
@@ -181,18 +182,6 @@ def calculate_step_score(step_id):
         # Route to remedial
         next_url = f"/app/phase3/step/{step_id}/remedial/{remedial_level.lower()}/task/a"
 
-        # TERMINAL OUTPUT (Scores NOT shown to user)
-        print("\n" + "="*70)
-        print(f"🎯 PHASE 3 STEP {step_id} - SCORING RESULTS (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1 ({i1_desc}): {interaction1_score}/{i1_max}")
-        print(f"Interaction 2 ({i2_desc}): {interaction2_score}/{i2_max}")
-        print(f"Interaction 3 ({i3_desc}): {interaction3_score}/{i3_max}")
-        print(f"TOTAL SCORE: {total_score}/{total_max}")
-        print(f"ROUTING TO: Remedial {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 3 Step {step_id} - User {user_id}: I1={interaction1_score}/{i1_max}, I2={interaction2_score}/{i2_max}, I3={interaction3_score}/{i3_max}, Total={total_score}/{total_max}, Remedial={remedial_level}")
 
         return jsonify({
@@ -368,27 +357,29 @@ def evaluate_remedial():
             # Stay in remedial or retry
             next_url = f"/app/phase3/step/{step_id}/remedial/{level.lower()}/retry"
 
-        # TERMINAL OUTPUT (Scores NOT shown to user)
-        print("\n" + "="*70)
-        print(f"🔸 PHASE 3 STEP {step_id} REMEDIAL {level} - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Remedial Score: {remedial_score}/{max_score}")
+        # DEBUG BANNER (Scores NOT shown to user)
+        banner(
+            logger,
+            "\n" + "="*70,
+            f"🔸 PHASE 3 STEP {step_id} REMEDIAL {level} - EVALUATION (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            f"Remedial Score: {remedial_score}/{max_score}",
+        )
 
         if step_id == 1 and level == 'A2':
             actual_percent = (remedial_score / max_score * 100) if max_score > 0 else 0
-            print(f"Success Rate: {actual_percent:.1f}% (Required: 80%)")
+            banner(logger, f"Success Rate: {actual_percent:.1f}% (Required: 80%)")
         else:
-            print(f"Threshold: {threshold}")
+            banner(logger, f"Threshold: {threshold}")
 
         if can_proceed:
             if next_step == 'phase4':
-                print(f"CAN PROCEED: ✓ YES - Moving to Phase 4")
+                banner(logger, f"CAN PROCEED: ✓ YES - Moving to Phase 4")
             else:
-                print(f"CAN PROCEED: ✓ YES - Moving to Step {next_step}")
+                banner(logger, f"CAN PROCEED: ✓ YES - Moving to Step {next_step}")
         else:
-            print(f"CAN PROCEED: ✗ NO - Remedial required")
-        print("="*70 + "\n")
+            banner(logger, f"CAN PROCEED: ✗ NO - Remedial required")
 
         logger.info(f"Phase 3 Step {step_id} Remedial {level} - User {user_id}: Score={remedial_score}/{max_score}, CanProceed={can_proceed}, NextStep={next_step if can_proceed else 'Retry'}")
 
@@ -422,16 +413,6 @@ def log_remedial_task():
         max_score = data.get('max_score', 0)
         time_taken = data.get('time_taken', 0)
 
-        # TERMINAL OUTPUT - Detailed logging (Scores NOT shown to user)
-        print("\n" + "="*70)
-        print(f"📝 PHASE 3 REMEDIAL - LEVEL {level} - TASK {task} (INTERNAL)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Score: {score}/{max_score} points")
-        print(f"Time Taken: {time_taken} seconds")
-        print(f"Success Rate: {(score/max_score)*100:.1f}%" if max_score > 0 else "N/A")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 3 Remedial {level} Task {task} - User {user_id}: Score={score}/{max_score}, Time={time_taken}s")
 
         return jsonify({
@@ -464,17 +445,6 @@ def log_interaction():
         time_taken = data.get('time_taken', 0)
         completed = data.get('completed', False)
 
-        # TERMINAL OUTPUT - Detailed logging (Scores NOT shown to user)
-        print("\n" + "="*70)
-        print(f"📊 PHASE 3 STEP {step} - INTERACTION {interaction} (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Score: {score}/{max_score} points")
-        print(f"Time Taken: {time_taken} seconds")
-        print(f"Completed: {completed}")
-        print(f"Success Rate: {(score/max_score)*100:.1f}%" if max_score > 0 else "N/A")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 3 Step {step} Interaction {interaction} - User {user_id}: Score={score}/{max_score}, Time={time_taken}s")
 
         return jsonify({
@@ -531,7 +501,7 @@ def evaluate_remedial_answers():
     Returns individual feedback and scores for each answer
     """
     try:
-        from services.ai_service import AIService
+        from services import registry
 
         user_id = session.get('user_id')
         data = request.json
@@ -543,8 +513,8 @@ def evaluate_remedial_answers():
 
         logger.info(f"Evaluating Phase 3 Remedial {level} Task {task} for user {user_id}")
 
-        # Initialize AI service
-        ai_service = AIService()
+        # Shared AI service
+        ai_service = registry.get('ai')
 
         # Evaluation results
         evaluations = []
@@ -629,16 +599,22 @@ Respond ONLY with a JSON object in this exact format:
                     'evaluation': 'Evaluation completed.'
                 })
 
-        # TERMINAL OUTPUT (Scores NOT shown to user)
-        print("\n" + "="*70)
-        print(f"📝 PHASE 3 REMEDIAL EVALUATION - LEVEL {level} - TASK {task} (INTERNAL)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Total Score: {total_score}/{len(answers)}")
+        # DEBUG BANNER (Scores NOT shown to user)
+        banner(
+            logger,
+            "\n" + "="*70,
+            f"📝 PHASE 3 REMEDIAL EVALUATION - LEVEL {level} - TASK {task} (INTERNAL)",
+            "="*70,
+            f"User ID: {user_id}",
+            f"Total Score: {total_score}/{len(answers)}",
+        )
         for eval_result in evaluations:
-            print(f"\nAnswer {eval_result['id']}: {eval_result['score']}/1")
-            print(f"  Feedback: {eval_result['feedback']}")
-        print("="*70 + "\n")
+            banner(
+                logger,
+                f"\nAnswer {eval_result['id']}: {eval_result['score']}/1",
+                f"  Feedback: {eval_result['feedback']}",
+            )
+        banner(logger, "="*70 + "\n")
 
         return jsonify({
             'success': True,
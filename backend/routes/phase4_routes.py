@@ -5,7 +5,8 @@ Marketing & Promotion phase endpoints
 from flask import Blueprint, request, jsonify, session
 from routes.auth_routes import login_required
 from models.phase4_loader import get_phase4_step
-from services.ai_service import AIService
+from services import registry, prompt_templates
+from utils.structured_logging import log_event, banner
 import logging
 import json
 
@@ -14,8 +15,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 phase4_bp = Blueprint('phase4', __name__, url_prefix='/api/phase4')
 
-# Initialize AI service
-ai_service = AIService()
+# Shared AI service (built lazily on first use)
+ai_service = registry.lazy('ai')
 
 @phase4_bp.route('/step/<int:step_id>', methods=['GET'])
 @login_required
@@ -79,16 +80,6 @@ def log_remedial_task():
         max_score = data.get('max_score', 0)
         time_taken = data.get('time_taken', 0)
 
-        # TERMINAL OUTPUT - Detailed logging
-        print("\n" + "="*60)
-        print(f"REMEDIAL PHASE - LEVEL {level} - TASK {task}")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Score: {score}/{max_score} points")
-        print(f"Time Taken: {time_taken} seconds")
-        print(f"Success Rate: {(score/max_score)*100:.1f}%")
-        print("="*60 + "\n")
-
         logger.info(f"Remedial {level} Task {task} - User {user_id}: Score={score}/{max_score}, Time={time_taken}s")
 
         return jsonify({
@@ -188,19 +179,6 @@ def calculate_step1_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 4 STEP 1 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1 (Matching): {interaction1_score}/8 → Level: {interaction1_level}")
-        print(f"Interaction 2 (Wordshake): {interaction2_score}/8 → Level: {interaction2_level}")
-        print(f"Interaction 3 (Sentence): {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/21")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -265,19 +243,6 @@ def calculate_a1_final_score():
         else:
             next_url = "/app/phase4/step/1/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🔸 PHASE 4 STEP 1 REMEDIAL A1 - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Task A (Drag-Drop Matching): {task_a_score}/8")
-        print(f"Task B (Wordle Game): {task_b_score}/8")
-        print(f"📊 Remedial Score: {total_score}/{max_score}")
-        print(f"Threshold: {threshold}")
-        print(f"CAN PROCEED: {'✓ YES - Moving to Step 2' if passed else '✗ NO - Remedial required'}")
-        print(f"Next URL: {next_url}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 Remedial A1 - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -322,19 +287,6 @@ def calculate_a2_final_score():
         else:
             next_url = "/app/phase4/step/1/remedial/a2/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🔸 PHASE 4 STEP 1 REMEDIAL A2 - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Task A (Chat Challenge): {task_a_score}/8")
-        print(f"Task B (Expand Quest): {task_b_score}/8")
-        print(f"📊 Remedial Score: {total_score}/{max_score}")
-        print(f"Threshold: {threshold}")
-        print(f"CAN PROCEED: {'✓ YES - Moving to Step 2' if passed else '✗ NO - Remedial required'}")
-        print(f"Next URL: {next_url}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 Remedial A2 - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -381,21 +333,6 @@ def calculate_b1_final_score():
         else:
             next_url = "/app/phase4/step/1/remedial/b1/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🔸 PHASE 4 STEP 1 REMEDIAL B1 - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Task A (Dialogue): {task_a_score}/5")
-        print(f"Task B (Proposals): {task_b_score}/8")
-        print(f"Task C (Quiz): {task_c_score}/6")
-        print(f"Task D (Matching): {task_d_score}/8")
-        print(f"📊 Remedial Score: {total_score}/{max_score}")
-        print(f"Threshold: {threshold}")
-        print(f"CAN PROCEED: {'✓ YES - Moving to Step 2' if passed else '✗ NO - Remedial required'}")
-        print(f"Next URL: {next_url}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 Remedial B1 - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -442,21 +379,6 @@ def calculate_b2_final_score():
         else:
             next_url = "/app/phase4/step/1/remedial/b2/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🔸 PHASE 4 STEP 1 REMEDIAL B2 - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Task A (Role-Play RPG): {task_a_score}/8")
-        print(f"Task B (Compare Quest): {task_b_score}/8")
-        print(f"Task C (Sushi Spell): {task_c_score}/8")
-        print(f"Task D (Kahoot Quiz): {task_d_score}/6")
-        print(f"📊 Remedial Score: {total_score}/{max_score}")
-        print(f"Threshold: {threshold}")
-        print(f"CAN PROCEED: {'✓ YES - Moving to Step 2' if passed else '✗ NO - Remedial required'}")
-        print(f"Next URL: {next_url}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 Remedial B2 - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -503,21 +425,6 @@ def calculate_c1_final_score():
         else:
             next_url = "/app/phase4/step/1/remedial/c1/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🔸 PHASE 4 STEP 1 REMEDIAL C1 - EVALUATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Task A (Debate Duel): {task_a_score}/4")
-        print(f"Task B (Critique Challenge): {task_b_score}/8")
-        print(f"Task C (Wordshake): {task_c_score}/6")
-        print(f"Task D (Live Debate): {task_d_score}/1")
-        print(f"📊 Remedial Score: {total_score}/{max_score}")
-        print(f"Threshold: {threshold}")
-        print(f"CAN PROCEED: {'✓ YES - Moving to Step 2' if passed else '✗ NO - Remedial required'}")
-        print(f"Next URL: {next_url}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 1 Remedial C1 - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -611,19 +518,6 @@ def calculate_step3_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 4 STEP 3 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1 (Define 'Persuasive'): {interaction1_score}/5 → Level: {interaction1_level}")
-        print(f"Interaction 2 (Explain 'Dramatisation'): {interaction2_score}/5 → Level: {interaction2_level}")
-        print(f"Interaction 3 (Game Connection): {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/15")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 3 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -836,24 +730,6 @@ def calculate_step3_a1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/4" if passed else "/app/phase4/step/3/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging for professor
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 3 - REMEDIAL A1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Term Treasure Hunt):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Fill Quest):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Sentence Builder):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 3 Remedial A1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -900,24 +776,6 @@ def calculate_step3_a2_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/4" if passed else "/app/phase4/step/3/remedial/a2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging for professor
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 3 - REMEDIAL A2 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Dialogue Adventure):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Expand Empire):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Connector Quest):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 3 Remedial A2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -1390,24 +1248,6 @@ def calculate_step3_b2_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/4" if passed else "/app/phase4/step/3/remedial/b2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging for professor
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 3 - REMEDIAL B2 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Role-Play Saga):         {task_a_score}/10 points")
-        print(f"Task B (Explain Expedition):     {task_b_score}/8 points")
-        print(f"Task C:                          {task_c_score}/8 points")
-        print(f"Task D:                          {task_d_score}/6 points")
-        print(f"Task E:                          {task_e_score}/6 points")
-        print(f"Task F:                          {task_f_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/44 points")
-        print(f"PASS THRESHOLD: 35/44 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 3 Remedial B2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -1471,29 +1311,6 @@ def calculate_step3_b1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/4" if passed else "/app/phase4/step/3/remedial/b1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging for professor
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 3 - REMEDIAL B1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nREQUIRED TASKS:")
-        print(f"  Task A (Negotiation Battle):    {task_a_score}/5 points")
-        print(f"  Task B (Definition Duel):        {task_b_score}/8 points")
-        print(f"  Task C (Wordshake Quiz):         {task_c_score}/6 points")
-        print(f"  Task D (Flashcard Game):         {task_d_score}/8 points")
-        print(f"  Required Tasks Subtotal:         {required_total}/27 points")
-        print(f"\nBONUS TASKS:")
-        print(f"  Task E (Tense Time Travel):      {task_e_score}/6 points")
-        print(f"  Task F (Grammar Kahoot):         {task_f_score}/6 points")
-        print(f"  Bonus Tasks Subtotal:            {bonus_total}/12 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE (Required + Bonus):  {total_score}/39 points")
-        print(f"REQUIRED TASKS SCORE:             {required_total}/27 points")
-        print(f"PASS THRESHOLD:                   22/27 points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 3 Remedial B1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Required={required_total}, Bonus={bonus_total}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -1554,26 +1371,6 @@ def calculate_step3_c1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/4" if passed else "/app/phase4/step/3/remedial/c1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging for professor
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 3 - REMEDIAL C1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A:                          {task_a_score}/10 points")
-        print(f"Task B:                          {task_b_score}/8 points")
-        print(f"Task C:                          {task_c_score}/6 points")
-        print(f"Task D:                          {task_d_score}/6 points")
-        print(f"Task E:                          {task_e_score}/6 points")
-        print(f"Task F:                          {task_f_score}/6 points")
-        print(f"Task G:                          {task_g_score}/6 points")
-        print(f"Task H:                          {task_h_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/54 points")
-        print(f"PASS THRESHOLD: 43/54 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 3 Remedial C1 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, D={task_d_score}, E={task_e_score}, F={task_f_score}, G={task_g_score}, H={task_h_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -1634,7 +1431,7 @@ def evaluate_b1_definitions():
     logger.info(f"=== B1 Definition Evaluation - User {session.get('user_id')} ===")
     try:
         data = request.get_json()
-        logger.info(f"Received request data: {data}")
+        log_event(logger, 'request.payload', path=request.path, payload=data)
         definitions = data.get('definitions', [])
         logger.info(f"Processing {len(definitions)} definitions")
 
@@ -1806,7 +1603,7 @@ def evaluate_b2_explanations():
     logger.info(f"=== B2 Explanation Evaluation - User {session.get('user_id')} ===")
     try:
         data = request.get_json()
-        logger.info(f"Received request data: {data}")
+        log_event(logger, 'request.payload', path=request.path, payload=data)
         explanations = data.get('explanations', [])
         logger.info(f"Processing {len(explanations)} explanations")
 
@@ -2362,7 +2159,7 @@ def evaluate_c1_analyses():
     logger.info(f"=== C1 Analysis Evaluation - User {session.get('user_id')} ===")
     try:
         data = request.get_json()
-        logger.info(f"Received request data: {data}")
+        log_event(logger, 'request.payload', path=request.path, payload=data)
         analyses = data.get('analyses', [])
         logger.info(f"Processing {len(analyses)} analyses")
 
@@ -4052,19 +3849,6 @@ def calculate_step4_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 4 STEP 4 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}")
-        print(f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}")
-        print(f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/15")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 4 Step 4 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -4122,16 +3906,17 @@ def log_step4_remedial_task():
         max_score = data.get('max_score', 0)
         time_taken = data.get('time_taken', 0)
 
-        # TERMINAL OUTPUT - Detailed logging
-        print("\n" + "="*60)
-        print(f"PHASE 4 STEP 4 - REMEDIAL {level} - TASK {task}")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Score: {score}/{max_score} points")
+        # DEBUG BANNER - Detailed logging
+        banner(
+            logger,
+            "\n" + "="*60,
+            f"PHASE 4 STEP 4 - REMEDIAL {level} - TASK {task}",
+            "="*60,
+            f"User ID: {user_id}",
+            f"Score: {score}/{max_score} points",
+        )
         if time_taken > 0:
-            print(f"Time Taken: {time_taken} seconds")
-        print(f"Success Rate: {(score/max_score)*100:.1f}%")
-        print("="*60 + "\n")
+            banner(logger, f"Time Taken: {time_taken} seconds")
 
         logger.info(f"Phase 4 Step 4 - Remedial {level} Task {task} - User {user_id}: Score={score}/{max_score}, Time={time_taken}s")
 
@@ -4173,21 +3958,6 @@ def calculate_step4_a1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/5" if passed else "/app/phase4/step/4/remedial/a1/retry"
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 4 - REMEDIAL A1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Term Treasure Hunt):  {task_a_score}/8 points")
-        print(f"Task B (Fill Quest):          {task_b_score}/8 points")
-        print(f"Task C (Sentence Builder):    {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 4 Remedial A1 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -4237,21 +4007,6 @@ def calculate_step4_a2_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/5" if passed else "/app/phase4/step/4/remedial/a2/retry"
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 4 - REMEDIAL A2 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Dialogue Adventure):  {task_a_score}/8 points")
-        print(f"Task B (Expand Empire):       {task_b_score}/7 points")
-        print(f"Task C (Connector Quest):     {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} points (~86%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 4 Remedial A2 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -4311,7 +4066,7 @@ def evaluate_step4_b1_definitions():
     logger.info(f"=== Step 4 B1 Definition Evaluation - User {session.get('user_id')} ===")
     try:
         data = request.get_json()
-        logger.info(f"Received request data: {data}")
+        log_event(logger, 'request.payload', path=request.path, payload=data)
         definitions = data.get('definitions', [])
         logger.info(f"Processing {len(definitions)} definitions")
 
@@ -4500,24 +4255,6 @@ def calculate_step4_b1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/5" if passed else "/app/phase4/step/4/remedial/b1/retry"
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 4 - REMEDIAL B1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Negotiation Battle):  {task_a_score}/4 points")
-        print(f"Task B (Definition Duel):     {task_b_score}/8 points")
-        print(f"Task C (Quiz Game):           {task_c_score}/6 points")
-        print(f"Task D (Flashcard Game):      {task_d_score}/8 points")
-        print(f"Task E (Tense Travel):        {task_e_score}/6 points")
-        print(f"Task F (Grammar Kahoot):      {task_f_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} points (~58%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 4 Remedial B1 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, D={task_d_score}, E={task_e_score}, F={task_f_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -4571,22 +4308,6 @@ def calculate_step4_b2_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/5" if passed else "/app/phase4/step/4/remedial/b2/retry"
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 4 - REMEDIAL B2 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A:  {task_a_score}/8 points")
-        print(f"Task B:  {task_b_score}/8 points")
-        print(f"Task C:  {task_c_score}/8 points")
-        print(f"Task D:  {task_d_score}/8 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 4 Remedial B2 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, D={task_d_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -4638,22 +4359,6 @@ def calculate_step4_c1_final_score():
         # Determine next URL
         next_url = "/app/phase4/step/5" if passed else "/app/phase4/step/4/remedial/c1/retry"
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 4 STEP 4 - REMEDIAL C1 - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A:  {task_a_score}/6 points")
-        print(f"Task B:  {task_b_score}/8 points")
-        print(f"Task C:  {task_c_score}/6 points")
-        print(f"Task D:  {task_d_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4 Step 4 Remedial C1 Final - User {user_id}: A={task_a_score}, B={task_b_score}, C={task_c_score}, D={task_d_score}, Total={total_score}, Passed={passed}")
 
         return jsonify({
@@ -5489,17 +5194,6 @@ def log_phase4_2_interaction():
         time_taken = data.get('time_taken', 0)
         game_type = data.get('game_type', 'unknown')
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 4.2 STEP {step} - INTERACTION {interaction}")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Game Type: {game_type}")
-        print(f"Score: {score}/{max_score}")
-        print(f"Time Taken: {time_taken} seconds")
-        print(f"Completed: {completed}")
-        print("="*60 + "\n")
-
         logger.info(f"Phase 4.2 Step {step} Interaction {interaction} - User {user_id}: {game_type} - Score={score}/{max_score}, Time={time_taken}s")
 
         return jsonify({
@@ -5534,13 +5228,16 @@ def evaluate_phase4_2_step1_response():
                 'error': 'Response cannot be empty'
             }), 400
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 4.2 STEP 1 - INTERACTION {interaction} EVALUATION")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Response: {response[:100]}...")
-        print("="*60)
+        # DEBUG BANNER
+        banner(
+            logger,
+            "\n" + "="*60,
+            f"PHASE 4.2 STEP 1 - INTERACTION {interaction} EVALUATION",
+            "="*60,
+            f"User ID: {user_id}",
+            f"Response: {response[:100]}...",
+            "="*60,
+        )
 
         # Use AI service to evaluate
         try:
@@ -5593,10 +5290,6 @@ Return a JSON object with:
             feedback = result.get('feedback', 'Good work!')
             details = result.get('details', {})
 
-            print(f"AI Evaluation: Level={level}, Score={score}/5")
-            print(f"Feedback: {feedback}")
-            print("="*60 + "\n")
-
             logger.info(f"Phase 4.2 Step 1 Int 2 - User {user_id}: Level={level}, Score={score}/5")
 
             return jsonify({
@@ -5659,13 +5352,16 @@ def evaluate_phase4_2_step2_explanation():
                 'error': 'Explanation cannot be empty'
             }), 400
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 4.2 STEP 2 - INTERACTION {interaction} EVALUATION")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Explanation: {explanation[:100]}...")
-        print("="*60)
+        # DEBUG BANNER
+        banner(
+            logger,
+            "\n" + "="*60,
+            f"PHASE 4.2 STEP 2 - INTERACTION {interaction} EVALUATION",
+            "="*60,
+            f"User ID: {user_id}",
+            f"Explanation: {explanation[:100]}...",
+            "="*60,
+        )
 
         # Use AI service to evaluate
         try:
@@ -5723,10 +5419,6 @@ Return a JSON object with:
             feedback = result.get('feedback', 'Good work!')
             details = result.get('details', {})
 
-            print(f"AI Evaluation: Level={level}, Score={score}/5")
-            print(f"Feedback: {feedback}")
-            print("="*60 + "\n")
-
             logger.info(f"Phase 4.2 Step 2 Int 2 - User {user_id}: Level={level}, Score={score}/5")
 
             return jsonify({
@@ -5790,13 +5482,16 @@ def evaluate_phase4_2_step2_revision():
                 'error': 'Revision cannot be empty'
             }), 400
 
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 4.2 STEP 2 - INTERACTION {interaction} EVALUATION")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Revision: {revision[:100]}...")
-        print("="*60)
+        # DEBUG BANNER
+        banner(
+            logger,
+            "\n" + "="*60,
+            f"PHASE 4.2 STEP 2 - INTERACTION {interaction} EVALUATION",
+            "="*60,
+            f"User ID: {user_id}",
+            f"Revision: {revision[:100]}...",
+            "="*60,
+        )
 
         # Use AI service to evaluate
         try:
@@ -5854,10 +5549,6 @@ Return a JSON object with:
             feedback = result.get('feedback', 'Good work!')
             details = result.get('details', {})
 
-            print(f"AI Evaluation: Level={level}, Score={score}/5")
-            print(f"Feedback: {feedback}")
-            print("="*60 + "\n")
-
             logger.info(f"Phase 4.2 Step 2 Int 3 - User {user_id}: Level={level}, Score={score}/5")
 
             return jsonify({
@@ -5901,6 +5592,30 @@ Return a JSON object with:
 
 # ==================== PHASE 4.2 STEP 3 ROUTES ====================
 
+PHASE4_2_STEP3_CAPTION_DEFINITION_PROMPT = prompt_templates.register(
+    'phase4.4_2_step3_caption_definition',
+    system="""
+Evaluate this student's definition of "caption" in social media posts.
+
+Scoring criteria (CEFR-aligned):
+- A2 (1 point): Basic definition like "words under photo"
+- B1 (2 points): Simple explanation with examples, mentions text under photo/video to explain or attract
+- B2 (3-4 points): Describes caption as descriptive/persuasive text providing context, engaging viewers, including CTAs
+- C1 (5 points): Analyzes caption as narrative hook contextualizing visuals, driving engagement through storytelling, strategically incorporating hashtags/CTAs
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "level": "<A2/B1/B2/C1>",
+  "feedback": "<specific feedback on their definition>"
+}
+""",
+    user="""
+Student's definition: "{definition}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step3/evaluate-caption-definition', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step3_caption_definition():
@@ -5918,27 +5633,9 @@ def evaluate_phase4_2_step3_caption_definition():
         # Log interaction
         logger.info(f"Phase 4.2 Step 3 - Caption definition: {definition[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's definition of "caption" in social media posts.
-
-Student's definition: "{definition}"
-
-Scoring criteria (CEFR-aligned):
-- A2 (1 point): Basic definition like "words under photo"
-- B1 (2 points): Simple explanation with examples, mentions text under photo/video to explain or attract
-- B2 (3-4 points): Describes caption as descriptive/persuasive text providing context, engaging viewers, including CTAs
-- C1 (5 points): Analyzes caption as narrative hook contextualizing visuals, driving engagement through storytelling, strategically incorporating hashtags/CTAs
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "level": "<A2/B1/B2/C1>",
-  "feedback": "<specific feedback on their definition>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP3_CAPTION_DEFINITION_PROMPT, max_tokens=300, definition=definition)
             # Parse JSON from response
             result = json.loads(ai_response)
 
@@ -6008,6 +5705,30 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
+PHASE4_2_STEP3_CTA_EXPLANATION_PROMPT = prompt_templates.register(
+    'phase4.4_2_step3_cta_explanation',
+    system="""
+Evaluate this student's explanation of "call-to-action" (CTA) in social media posts.
+
+Scoring criteria (CEFR-aligned):
+- A2 (1 point): Very basic like "CTA is do something. Like 'come'"
+- B1 (2 points): Explains CTA as post saying "do this" with example, mentions interaction
+- B2 (3-4 points): Defines CTA as direct instruction prompting specific action, mentions engagement/conversions with examples
+- C1 (5 points): Analyzes CTA as strategic conversion trigger directing behavior to amplify reach through network effects with nuanced examples
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "level": "<A2/B1/B2/C1>",
+  "feedback": "<specific feedback on their explanation>"
+}
+""",
+    user="""
+Student's explanation: "{explanation}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step3/evaluate-cta-explanation', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step3_cta_explanation():
@@ -6025,27 +5746,9 @@ def evaluate_phase4_2_step3_cta_explanation():
         # Log interaction
         logger.info(f"Phase 4.2 Step 3 - CTA explanation: {explanation[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's explanation of "call-to-action" (CTA) in social media posts.
-
-Student's explanation: "{explanation}"
-
-Scoring criteria (CEFR-aligned):
-- A2 (1 point): Very basic like "CTA is do something. Like 'come'"
-- B1 (2 points): Explains CTA as post saying "do this" with example, mentions interaction
-- B2 (3-4 points): Defines CTA as direct instruction prompting specific action, mentions engagement/conversions with examples
-- C1 (5 points): Analyzes CTA as strategic conversion trigger directing behavior to amplify reach through network effects with nuanced examples
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "level": "<A2/B1/B2/C1>",
-  "feedback": "<specific feedback on their explanation>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP3_CTA_EXPLANATION_PROMPT, max_tokens=300, explanation=explanation)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}, Level: {result.get('level')}")
@@ -6114,6 +5817,32 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
+PHASE4_2_STEP3_TERM_EXPLANATION_PROMPT = prompt_templates.register(
+    'phase4.4_2_step3_term_explanation',
+    system="""
+Evaluate this student's explanation of a social media term after playing Sushi Spell.
+
+They should explain one term (hashtag, caption, emoji, call-to-action, engagement, viral, thread, reach) and relate it to the videos watched.
+
+Scoring criteria (CEFR-aligned):
+- A2 (1 point): Minimal like "Game for hashtag"
+- B1 (2 points): Uses game for term with simple reasoning from video
+- B2 (3-4 points): Incorporates game for rapid spelling with video example showing strategic use
+- C1 (5 points): Leverages game to master term through competitive spelling, relates to strategic metrics/effects from video examples
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "level": "<A2/B1/B2/C1>",
+  "feedback": "<specific feedback on their explanation>"
+}
+""",
+    user="""
+Student's explanation: "{explanation}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step3/evaluate-term-explanation', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step3_term_explanation():
@@ -6131,29 +5860,9 @@ def evaluate_phase4_2_step3_term_explanation():
         # Log interaction
         logger.info(f"Phase 4.2 Step 3 - Term explanation: {explanation[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's explanation of a social media term after playing Sushi Spell.
-
-Student's explanation: "{explanation}"
-
-They should explain one term (hashtag, caption, emoji, call-to-action, engagement, viral, thread, reach) and relate it to the videos watched.
-
-Scoring criteria (CEFR-aligned):
-- A2 (1 point): Minimal like "Game for hashtag"
-- B1 (2 points): Uses game for term with simple reasoning from video
-- B2 (3-4 points): Incorporates game for rapid spelling with video example showing strategic use
-- C1 (5 points): Leverages game to master term through competitive spelling, relates to strategic metrics/effects from video examples
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "level": "<A2/B1/B2/C1>",
-  "feedback": "<specific feedback on their explanation>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP3_TERM_EXPLANATION_PROMPT, max_tokens=300, explanation=explanation)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}, Level: {result.get('level')}")
@@ -6225,29 +5934,10 @@ Return ONLY a JSON object:
 
 # ==================== PHASE 4.2 STEP 4 ROUTES ====================
 
-@phase4_bp.route('/4_2/step4/evaluate-instagram-post', methods=['POST'])
-@login_required
-def evaluate_phase4_2_step4_instagram_post():
-    """Evaluate Instagram post in Phase 4.2 Step 4 Interaction 1"""
-    try:
-        data = request.json
-        caption = data.get('caption', '').strip()
-        hashtags = data.get('hashtags', '').strip()
-
-        if not caption or not hashtags:
-            return jsonify({
-                'success': False,
-                'error': 'Both caption and hashtags are required'
-            }), 400
-
-        # Log interaction
-        logger.info(f"Phase 4.2 Step 4 - Instagram post: Caption length={len(caption)}, Hashtags={hashtags[:50]}")
-
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's Instagram post for the Global Cultures Festival.
-
-Caption: "{caption}"
-Hashtags: "{hashtags}"
+PHASE4_2_STEP4_INSTAGRAM_POST_PROMPT = prompt_templates.register(
+    'phase4.4_2_step4_instagram_post',
+    system="""
+Evaluate this student's Instagram post for the Global Cultures Festival.
 
 Scoring criteria (CEFR-aligned):
 - A2 (1-2 points): Simple guided post with basic words (e.g., "Festival is fun. Come March 8. #Festival #Fun")
@@ -6264,15 +5954,40 @@ Evaluate for:
 6. Hashtag quality (5-10 relevant hashtags)
 
 Return ONLY a JSON object:
-{{
+{
   "score": <1-5>,
   "level": "<A2/B1/B2/C1>",
   "feedback": "<specific feedback on their Instagram post>"
-}}"""
+}
+""",
+    user="""
+Caption: "{caption}"
+Hashtags: "{hashtags}"
+"""
+)
+
+
+@phase4_bp.route('/4_2/step4/evaluate-instagram-post', methods=['POST'])
+@login_required
+def evaluate_phase4_2_step4_instagram_post():
+    """Evaluate Instagram post in Phase 4.2 Step 4 Interaction 1"""
+    try:
+        data = request.json
+        caption = data.get('caption', '').strip()
+        hashtags = data.get('hashtags', '').strip()
+
+        if not caption or not hashtags:
+            return jsonify({
+                'success': False,
+                'error': 'Both caption and hashtags are required'
+            }), 400
+
+        # Log interaction
+        logger.info(f"Phase 4.2 Step 4 - Instagram post: Caption length={len(caption)}, Hashtags={hashtags[:50]}")
 
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP4_INSTAGRAM_POST_PROMPT, max_tokens=300, caption=caption, hashtags=hashtags)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}, Level: {result.get('level')}")
@@ -6347,28 +6062,10 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
-@phase4_bp.route('/4_2/step4/evaluate-twitter-thread', methods=['POST'])
-@login_required
-def evaluate_phase4_2_step4_twitter_thread():
-    """Evaluate Twitter/X thread in Phase 4.2 Step 4 Interaction 2"""
-    try:
-        data = request.json
-        tweets = data.get('tweets', [])
-
-        if not tweets or len(tweets) < 2:
-            return jsonify({
-                'success': False,
-                'error': 'At least 2 tweets are required'
-            }), 400
-
-        # Log interaction
-        logger.info(f"Phase 4.2 Step 4 - Twitter thread: {len(tweets)} tweets")
-
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's Twitter/X thread for the Global Cultures Festival.
-
-Tweets:
-{chr(10).join([f"Tweet {i+1}: {tweet}" for i, tweet in enumerate(tweets)])}
+PHASE4_2_STEP4_TWITTER_THREAD_PROMPT = prompt_templates.register(
+    'phase4.4_2_step4_twitter_thread',
+    system="""
+Evaluate this student's Twitter/X thread for the Global Cultures Festival.
 
 Scoring criteria (CEFR-aligned):
 - A2 (1-2 points): Very simple thread (e.g., "1/2 Festival March 8. Come! 2/2 #Festival")
@@ -6385,15 +6082,41 @@ Evaluate for:
 6. Hashtag and CTA inclusion
 
 Return ONLY a JSON object:
-{{
+{
   "score": <1-5>,
   "level": "<A2/B1/B2/C1>",
   "feedback": "<specific feedback on their Twitter thread>"
-}}"""
+}
+""",
+    user="""
+Tweets:
+{tweets_text}
+"""
+)
+
+
+@phase4_bp.route('/4_2/step4/evaluate-twitter-thread', methods=['POST'])
+@login_required
+def evaluate_phase4_2_step4_twitter_thread():
+    """Evaluate Twitter/X thread in Phase 4.2 Step 4 Interaction 2"""
+    try:
+        data = request.json
+        tweets = data.get('tweets', [])
+
+        if not tweets or len(tweets) < 2:
+            return jsonify({
+                'success': False,
+                'error': 'At least 2 tweets are required'
+            }), 400
+
+        # Log interaction
+        logger.info(f"Phase 4.2 Step 4 - Twitter thread: {len(tweets)} tweets")
+
+        tweets_text = '\n'.join(f"Tweet {i+1}: {tweet}" for i, tweet in enumerate(tweets))
 
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP4_TWITTER_THREAD_PROMPT, max_tokens=300, tweets_text=tweets_text)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}, Level: {result.get('level')}")
@@ -6471,29 +6194,10 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
-@phase4_bp.route('/4_2/step4/evaluate-vocabulary-revision', methods=['POST'])
-@login_required
-def evaluate_phase4_2_step4_vocabulary_revision():
-    """Evaluate vocabulary revision in Phase 4.2 Step 4 Interaction 3"""
-    try:
-        data = request.json
-        spelled_term = data.get('spelled_term', '').strip()
-        revised_sentence = data.get('revised_sentence', '').strip()
-
-        if not spelled_term or not revised_sentence:
-            return jsonify({
-                'success': False,
-                'error': 'Both spelled term and revised sentence are required'
-            }), 400
-
-        # Log interaction
-        logger.info(f"Phase 4.2 Step 4 - Vocabulary revision: Term={spelled_term}, Sentence length={len(revised_sentence)}")
-
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's vocabulary integration and sentence revision after playing Sushi Spell.
-
-Spelled Term: "{spelled_term}"
-Revised Sentence: "{revised_sentence}"
+PHASE4_2_STEP4_VOCABULARY_REVISION_PROMPT = prompt_templates.register(
+    'phase4.4_2_step4_vocabulary_revision',
+    system="""
+Evaluate this student's vocabulary integration and sentence revision after playing Sushi Spell.
 
 Scoring criteria (CEFR-aligned):
 - A2 (1-2 points): Basic term use (e.g., "Spell hashtag. Add #Festival")
@@ -6509,15 +6213,40 @@ Evaluate for:
 5. Quality of revision explanation
 
 Return ONLY a JSON object:
-{{
+{
   "score": <1-5>,
   "level": "<A2/B1/B2/C1>",
   "feedback": "<specific feedback on their revision>"
-}}"""
+}
+""",
+    user="""
+Spelled Term: "{spelled_term}"
+Revised Sentence: "{revised_sentence}"
+"""
+)
+
+
+@phase4_bp.route('/4_2/step4/evaluate-vocabulary-revision', methods=['POST'])
+@login_required
+def evaluate_phase4_2_step4_vocabulary_revision():
+    """Evaluate vocabulary revision in Phase 4.2 Step 4 Interaction 3"""
+    try:
+        data = request.json
+        spelled_term = data.get('spelled_term', '').strip()
+        revised_sentence = data.get('revised_sentence', '').strip()
+
+        if not spelled_term or not revised_sentence:
+            return jsonify({
+                'success': False,
+                'error': 'Both spelled term and revised sentence are required'
+            }), 400
+
+        # Log interaction
+        logger.info(f"Phase 4.2 Step 4 - Vocabulary revision: Term={spelled_term}, Sentence length={len(revised_sentence)}")
 
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP4_VOCABULARY_REVISION_PROMPT, max_tokens=300, spelled_term=spelled_term, revised_sentence=revised_sentence)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}, Level: {result.get('level')}")
@@ -6599,6 +6328,40 @@ Return ONLY a JSON object:
 
 # ==================== PHASE 4.2 STEP 5 ROUTES ====================
 
+PHASE4_2_STEP5_SPELLING_PROMPT = prompt_templates.register(
+    'phase4.4_2_step5_spelling',
+    complexity='simple',
+    source_field='original_post',
+    system="""
+Evaluate this student's spelling corrections for a social media post at the student's CEFR level.
+
+Key spelling corrections expected by level:
+- A2: "Global" (not Globol), "Festival" (not Festivel)
+- B1: "Global" (not Globel), "friend" (not frend)
+- B2: "Global" (not Globel), "friends" (not freinds), "Events" (not Evnts)
+- C1: "global" (not globel), "fellow" (not felllow)
+
+Scoring criteria (CEFR-aligned):
+- 5 points: All spelling errors corrected perfectly
+- 4 points: Most spelling errors corrected (1-2 minor errors remain)
+- 3 points: Several spelling corrections made but some errors remain
+- 2 points: Few corrections made, multiple errors remain
+- 1 point: Minimal corrections, most errors remain
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "feedback": "<specific feedback on spelling corrections>"
+}
+""",
+    user="""
+Student CEFR level: {level}
+Original faulty post: "{original_post}"
+Student's corrected post: "{corrected_post}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step5/evaluate-spelling', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step5_spelling():
@@ -6618,34 +6381,9 @@ def evaluate_phase4_2_step5_spelling():
         # Log interaction
         logger.info(f"Phase 4.2 Step 5 - Spelling correction ({level}): {corrected_post[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's spelling corrections for a social media post at {level} CEFR level.
-
-Original faulty post: "{original_post}"
-Student's corrected post: "{corrected_post}"
-
-Key spelling corrections expected by level:
-- A2: "Global" (not Globol), "Festival" (not Festivel)
-- B1: "Global" (not Globel), "friend" (not frend)
-- B2: "Global" (not Globel), "friends" (not freinds), "Events" (not Evnts)
-- C1: "global" (not globel), "fellow" (not felllow)
-
-Scoring criteria (CEFR-aligned):
-- 5 points: All spelling errors corrected perfectly
-- 4 points: Most spelling errors corrected (1-2 minor errors remain)
-- 3 points: Several spelling corrections made but some errors remain
-- 2 points: Few corrections made, multiple errors remain
-- 1 point: Minimal corrections, most errors remain
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "feedback": "<specific feedback on spelling corrections>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP5_SPELLING_PROMPT, max_tokens=300, level=level, original_post=original_post, corrected_post=corrected_post)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}")
@@ -6703,6 +6441,39 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
+PHASE4_2_STEP5_GRAMMAR_PROMPT = prompt_templates.register(
+    'phase4.4_2_step5_grammar',
+    source_field='spelling_corrected',
+    system="""
+Evaluate this student's grammar corrections for a social media post at the student's CEFR level.
+
+Key grammar corrections expected by level:
+- A2: Add "the" before Festival, add "on" before date
+- B1: Add articles (the, a), use "There is", fix subject-verb agreement
+- B2: Add articles, add "is on" for date, use proper prepositions
+- C1: Add sophisticated phrasing ("a celebration of", "returns on"), use articles correctly
+
+Scoring criteria (CEFR-aligned):
+- 5 points: All grammar errors corrected perfectly (articles, prepositions, verb agreement)
+- 4 points: Most grammar errors corrected (1-2 minor errors remain)
+- 3 points: Several grammar corrections made but some errors remain
+- 2 points: Few corrections made, multiple errors remain
+- 1 point: Minimal corrections, most errors remain
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "feedback": "<specific feedback on grammar corrections>"
+}
+""",
+    user="""
+Student CEFR level: {level}
+Spelling-corrected post: "{spelling_corrected}"
+Student's grammar-corrected post: "{grammar_corrected}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step5/evaluate-grammar', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step5_grammar():
@@ -6722,34 +6493,9 @@ def evaluate_phase4_2_step5_grammar():
         # Log interaction
         logger.info(f"Phase 4.2 Step 5 - Grammar correction ({level}): {grammar_corrected[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's grammar corrections for a social media post at {level} CEFR level.
-
-Spelling-corrected post: "{spelling_corrected}"
-Student's grammar-corrected post: "{grammar_corrected}"
-
-Key grammar corrections expected by level:
-- A2: Add "the" before Festival, add "on" before date
-- B1: Add articles (the, a), use "There is", fix subject-verb agreement
-- B2: Add articles, add "is on" for date, use proper prepositions
-- C1: Add sophisticated phrasing ("a celebration of", "returns on"), use articles correctly
-
-Scoring criteria (CEFR-aligned):
-- 5 points: All grammar errors corrected perfectly (articles, prepositions, verb agreement)
-- 4 points: Most grammar errors corrected (1-2 minor errors remain)
-- 3 points: Several grammar corrections made but some errors remain
-- 2 points: Few corrections made, multiple errors remain
-- 1 point: Minimal corrections, most errors remain
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "feedback": "<specific feedback on grammar corrections>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP5_GRAMMAR_PROMPT, max_tokens=300, level=level, spelling_corrected=spelling_corrected, grammar_corrected=grammar_corrected)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}")
@@ -6812,6 +6558,40 @@ Return ONLY a JSON object:
             'error': str(e)
         }), 500
 
+PHASE4_2_STEP5_ENHANCEMENT_PROMPT = prompt_templates.register(
+    'phase4.4_2_step5_enhancement',
+    complexity='complex',
+    source_field='grammar_corrected',
+    system="""
+Evaluate this student's enhancement of a social media post at the student's CEFR level.
+
+Key enhancements expected by level:
+- A2: Add emojis (😊), exclamation marks for energy
+- B1: Add emojis (😍), connectors ("and", "come with us!"), hashtags (#JoinUs)
+- B2: Add emojis (🌍), expand details (live music, global food), stronger CTA ("Don't miss out!"), more hashtags
+- C1: Add emojis (🌏), sophisticated vocabulary (immersive, authentic, catalyst, interconnected), compelling narrative, strategic hashtags
+
+Scoring criteria (CEFR-aligned):
+- 5 points: Excellent enhancements - emojis, connectors, rich vocabulary, strong CTA, strategic hashtags, engaging tone
+- 4 points: Good enhancements - most elements present (emojis, some connectors, improved vocabulary, CTA)
+- 3 points: Moderate enhancements - some improvements (emojis or connectors, basic CTA)
+- 2 points: Minor enhancements - minimal improvements
+- 1 point: Very few or no enhancements
+
+Return ONLY a JSON object:
+{
+  "score": <1-5>,
+  "feedback": "<specific feedback on enhancements>"
+}
+""",
+    user="""
+Student CEFR level: {level}
+Grammar-corrected post: "{grammar_corrected}"
+Student's enhanced post: "{enhanced_post}"
+"""
+)
+
+
 @phase4_bp.route('/4_2/step5/evaluate-enhancement', methods=['POST'])
 @login_required
 def evaluate_phase4_2_step5_enhancement():
@@ -6831,34 +6611,9 @@ def evaluate_phase4_2_step5_enhancement():
         # Log interaction
         logger.info(f"Phase 4.2 Step 5 - Enhancement ({level}): {enhanced_post[:100]}")
 
-        # AI Evaluation Prompt
-        ai_prompt = f"""Evaluate this student's enhancement of a social media post at {level} CEFR level.
-
-Grammar-corrected post: "{grammar_corrected}"
-Student's enhanced post: "{enhanced_post}"
-
-Key enhancements expected by level:
-- A2: Add emojis (😊), exclamation marks for energy
-- B1: Add emojis (😍), connectors ("and", "come with us!"), hashtags (#JoinUs)
-- B2: Add emojis (🌍), expand details (live music, global food), stronger CTA ("Don't miss out!"), more hashtags
-- C1: Add emojis (🌏), sophisticated vocabulary (immersive, authentic, catalyst, interconnected), compelling narrative, strategic hashtags
-
-Scoring criteria (CEFR-aligned):
-- 5 points: Excellent enhancements - emojis, connectors, rich vocabulary, strong CTA, strategic hashtags, engaging tone
-- 4 points: Good enhancements - most elements present (emojis, some connectors, improved vocabulary, CTA)
-- 3 points: Moderate enhancements - some improvements (emojis or connectors, basic CTA)
-- 2 points: Minor enhancements - minimal improvements
-- 1 point: Very few or no enhancements
-
-Return ONLY a JSON object:
-{{
-  "score": <1-5>,
-  "feedback": "<specific feedback on enhancements>"
-}}"""
-
         # Try AI evaluation
         try:
-            ai_response = ai_service.evaluate_response(ai_prompt, max_tokens=300)
+            ai_response = ai_service.complete_template(PHASE4_2_STEP5_ENHANCEMENT_PROMPT, max_tokens=300, level=level, grammar_corrected=grammar_corrected, enhanced_post=enhanced_post)
             result = json.loads(ai_response)
 
             logger.info(f"AI Evaluation - Score: {result.get('score')}")
@@ -6980,20 +6735,23 @@ def calculate_step5_score():
             remedial_level = 'Remedial C1'
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - SCORE CALCULATION & ROUTING (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nInteraction Scores (AI-Scored CEFR 1-5):")
-        print(f"  Interaction 1 (Poster Description):           {interaction1_score}/5")
-        print(f"  Interaction 2 (Video Script):                 {interaction2_score}/5")
-        print(f"  Interaction 3 (Vocabulary - Sushi Spell):     {interaction3_score}/5")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/15")
-        print("-"*80)
-        print(f"ROUTING DECISION: {remedial_level}")
-        print("  (Based on thresholds: <4=A1, <7=A2, <10=B1, <13=B2, ≥13=C1)")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - SCORE CALCULATION & ROUTING (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nInteraction Scores (AI-Scored CEFR 1-5):",
+            f"  Interaction 1 (Poster Description):           {interaction1_score}/5",
+            f"  Interaction 2 (Video Script):                 {interaction2_score}/5",
+            f"  Interaction 3 (Vocabulary - Sushi Spell):     {interaction3_score}/5",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/15",
+            "-"*80,
+            f"ROUTING DECISION: {remedial_level}",
+            "  (Based on thresholds: <4=A1, <7=A2, <10=B1, <13=B2, ≥13=C1)",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -7055,21 +6813,24 @@ def calculate_step5_a1_final_score():
         next_url = "/app/phase4_2" if passed else "/app/phase4/step/5/remedial/a1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - REMEDIAL A1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/8")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/22")
-        print(f"PASS THRESHOLD: 17/22 (~77%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - REMEDIAL A1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/8",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/22",
+            f"PASS THRESHOLD: 17/22 (~77%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -7121,21 +6882,24 @@ def calculate_step5_a2_final_score():
         next_url = "/app/phase4_2" if passed else "/app/phase4/step/5/remedial/a2/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - REMEDIAL A2 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/8")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/22")
-        print(f"PASS THRESHOLD: 18/22 (~82%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - REMEDIAL A2 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/8",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/22",
+            f"PASS THRESHOLD: 18/22 (~82%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -7193,27 +6957,30 @@ def calculate_step5_b1_final_score():
         next_url = "/app/phase4_2" if passed else "/app/phase4/step/5/remedial/b1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - REMEDIAL B1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nRequired Tasks:")
-        print(f"  Task A: {task_a_score}/5")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print(f"  Task D: {task_d_score}/8")
-        print(f"  Required Subtotal: {required_score}/27")
-        print("\nBonus Tasks:")
-        print(f"  Task E (Bonus): {task_e_score}/6")
-        print(f"  Task F (Bonus): {task_f_score}/6")
-        print(f"  Bonus Subtotal: {bonus_score}/12")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/39 (required: {required_score}/27, bonus: {bonus_score}/12)")
-        print(f"PASS THRESHOLD: 22/27 required (~81%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'} (based on required tasks only)")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - REMEDIAL B1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nRequired Tasks:",
+            f"  Task A: {task_a_score}/5",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            f"  Task D: {task_d_score}/8",
+            f"  Required Subtotal: {required_score}/27",
+            "\nBonus Tasks:",
+            f"  Task E (Bonus): {task_e_score}/6",
+            f"  Task F (Bonus): {task_f_score}/6",
+            f"  Bonus Subtotal: {bonus_score}/12",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/39 (required: {required_score}/27, bonus: {bonus_score}/12)",
+            f"PASS THRESHOLD: 22/27 required (~81%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'} (based on required tasks only)",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -7274,24 +7041,27 @@ def calculate_step5_b2_final_score():
         next_url = "/app/phase4_2" if passed else "/app/phase4/step/5/remedial/b2/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - REMEDIAL B2 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/10")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/8")
-        print(f"  Task D: {task_d_score}/6")
-        print(f"  Task E: {task_e_score}/6")
-        print(f"  Task F: {task_f_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/44")
-        print(f"PASS THRESHOLD: 35/44 (~80%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - REMEDIAL B2 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/10",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/8",
+            f"  Task D: {task_d_score}/6",
+            f"  Task E: {task_e_score}/6",
+            f"  Task F: {task_f_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/44",
+            f"PASS THRESHOLD: 35/44 (~80%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -7352,26 +7122,29 @@ def calculate_step5_c1_final_score():
         next_url = "/app/phase4_2" if passed else "/app/phase4/step/5/remedial/c1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 4 STEP 5 - REMEDIAL C1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/10")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print(f"  Task D: {task_d_score}/6")
-        print(f"  Task E: {task_e_score}/6")
-        print(f"  Task F: {task_f_score}/6")
-        print(f"  Task G: {task_g_score}/6")
-        print(f"  Task H: {task_h_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/54")
-        print(f"PASS THRESHOLD: 43/54 (~80%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 4 STEP 5 - REMEDIAL C1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/10",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            f"  Task D: {task_d_score}/6",
+            f"  Task E: {task_e_score}/6",
+            f"  Task F: {task_f_score}/6",
+            f"  Task G: {task_g_score}/6",
+            f"  Task H: {task_h_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/54",
+            f"PASS THRESHOLD: 43/54 (~80%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -6,23 +6,21 @@ Plus Phase 5: Execution & Problem-Solving endpoints
 
 from flask import Blueprint, request, jsonify, session
 from routes.auth_routes import login_required
-from services.powerup_service import PowerUpService
-from services.collectible_service import CollectibleService
-from services.avatar_service import AvatarService
-from services.adaptive_service import AdaptiveService
+from models.auth import admin_required
+from services import registry, prompt_templates, scoring_engine
+from utils.structured_logging import log_event, banner
 import json
 import logging
-import math
 import sqlite3
 
 # Create blueprint
 phase5_bp = Blueprint('phase5', __name__, url_prefix='/api/phase5')
 
-# Initialize services
-powerup_service = PowerUpService()
-collectible_service = CollectibleService()
-avatar_service = AvatarService()
-adaptive_service = AdaptiveService()
+# Shared services (built lazily on first use)
+powerup_service = registry.lazy('powerup')
+collectible_service = registry.lazy('collectible')
+avatar_service = registry.lazy('avatar')
+adaptive_service = registry.lazy('adaptive')
 
 
 # ============================================================
@@ -167,6 +165,28 @@ def drop_collectible():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@phase5_bp.route('/collectibles/drop-many', methods=['POST'])
+@admin_required
+def drop_collectibles_for_users():
+    """Roll a collectible drop for a list of users (classroom-wide reward events)"""
+    try:
+        data = request.get_json() or {}
+        user_ids = data.get('user_ids') or []
+        if not isinstance(user_ids, list) or not all(isinstance(uid, int) for uid in user_ids):
+            return jsonify({"success": False, "error": "user_ids must be a list of integers"}), 400
+
+        results = collectible_service.drop_many(user_ids, data.get('source', 'event'))
+        drops = [{"user_id": user_id, "collectible": item} for user_id, item in results.items() if item]
+        return jsonify({
+            "success": True,
+            "rolled": len(results),
+            "dropped": len(drops),
+            "drops": drops
+        })
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 # ============================================================
 # AVATAR ENDPOINTS
 # ============================================================
@@ -275,12 +295,22 @@ def track_performance():
         
         activity_id = data.get('activity_id')
         success = data.get('success', False)
-        score = data.get('score', 0.0)
+        score = data.get('score')
+        # Scores are sent with their scale (max_score 5 for rubric points, 100 for percentages)
+        max_score = data.get('max_score', 1)
         activity_type = data.get('activity_type', 'remedial')
         
         if not activity_id:
             return jsonify({"success": False, "message": "Activity ID required"}), 400
         
+        if score is not None:
+            try:
+                score = float(score) / float(max_score)
+            except (TypeError, ValueError, ZeroDivisionError):
+                return jsonify({"success": False, "message": "score and max_score must be numbers"}), 400
+            if not 0 <= score <= 1:
+                return jsonify({"success": False, "message": "score must be between 0 and max_score"}), 400
+        
         result = adaptive_service.track_performance(user_id, activity_id, success, score, activity_type)
         
         return jsonify({"success": True, **result})
@@ -307,14 +337,28 @@ def get_review_activities():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@phase5_bp.route('/adaptive/recommendations', methods=['GET'])
+@login_required
+def get_recommendations():
+    """Get difficulty recommendations for several activity types (?types=a,b)"""
+    try:
+        from flask import session
+        user_id = session.get('user_id')
+
+        types = [t.strip() for t in request.args.get('types', '').split(',') if t.strip()]
+        recommendations = adaptive_service.get_recommendations(user_id, types or None)
+
+        return jsonify({"success": True, "recommendations": recommendations})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 # ============================================================
 # PHASE 5: EXECUTION & PROBLEM-SOLVING ENDPOINTS
 # ============================================================
 
-from services.ai_service import AIService
-
 logger = logging.getLogger(__name__)
-ai_service = AIService()
+ai_service = registry.lazy('ai')
 
 
 def get_db_connection():
@@ -368,6 +412,41 @@ def track_step1_interaction1():
         }), 500
 
 
+STEP1_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase5.step1_interaction2',
+    system="""
+Evaluate this student's solution suggestion for handling a last-minute festival cancellation.
+
+Context: The main singer canceled due to illness. The student must suggest a solution using problem-solving vocabulary.
+
+Expected vocabulary terms: problem, cancel, change, solution, sorry, alternative, fix, urgent
+
+Evaluation Criteria:
+- A1 (1 point): Basic solution mention (e.g., "Find new singer")
+- A2 (2 points): Simple solution with one vocabulary term (e.g., "Find alternative singer because urgent")
+- B1 (3 points): Clear solution with multiple terms and reasoning (e.g., "We can find another singer as an alternative because it is urgent and keeps the program")
+- B2 (4 points): Detailed solution with multiple terms and logical flow (e.g., "I suggest finding a backup performer or local talent as a quick alternative, since this solution is urgent and maintains the event quality")
+- C1 (5 points): Sophisticated solution with advanced vocabulary and strategic thinking (e.g., "A feasible solution would be to secure a substitute artist immediately while sending an apologetic update to attendees, ensuring minimal disruption and preserving trust")
+
+Requirements:
+1. Must include a solution
+2. Must include at least one vocabulary term (alternative, urgent, solution, etc.)
+3. Must show logical reasoning (use of "because", "since", etc.)
+
+Return JSON with:
+{
+    "score": 1-5,
+    "level": "A1" | "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback on the response",
+    "vocabulary_used": ["list", "of", "terms", "found"],
+    "strengths": ["strength1", "strength2"],
+    "improvements": ["improvement1", "improvement2"]
+}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase5_bp.route('/step1/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_step1_interaction2():
@@ -390,41 +469,8 @@ def evaluate_step1_interaction2():
                 'error': 'Response is required'
             }), 400
         
-        # AI Evaluation with CEFR-specific prompts
-        evaluation_prompt = f"""
-        Evaluate this student's solution suggestion for handling a last-minute festival cancellation.
-        
-        Student Response: "{response}"
-        
-        Context: The main singer canceled due to illness. The student must suggest a solution using problem-solving vocabulary.
-        
-        Expected vocabulary terms: problem, cancel, change, solution, sorry, alternative, fix, urgent
-        
-        Evaluation Criteria:
-        - A1 (1 point): Basic solution mention (e.g., "Find new singer")
-        - A2 (2 points): Simple solution with one vocabulary term (e.g., "Find alternative singer because urgent")
-        - B1 (3 points): Clear solution with multiple terms and reasoning (e.g., "We can find another singer as an alternative because it is urgent and keeps the program")
-        - B2 (4 points): Detailed solution with multiple terms and logical flow (e.g., "I suggest finding a backup performer or local talent as a quick alternative, since this solution is urgent and maintains the event quality")
-        - C1 (5 points): Sophisticated solution with advanced vocabulary and strategic thinking (e.g., "A feasible solution would be to secure a substitute artist immediately while sending an apologetic update to attendees, ensuring minimal disruption and preserving trust")
-        
-        Requirements:
-        1. Must include a solution
-        2. Must include at least one vocabulary term (alternative, urgent, solution, etc.)
-        3. Must show logical reasoning (use of "because", "since", etc.)
-        
-        Return JSON with:
-        {{
-            "score": 1-5,
-            "level": "A1" | "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback on the response",
-            "vocabulary_used": ["list", "of", "terms", "found"],
-            "strengths": ["strength1", "strength2"],
-            "improvements": ["improvement1", "improvement2"]
-        }}
-        """
-        
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP1_INTERACTION2_PROMPT, response=response)
             
             # Try to parse JSON from AI response
             import re
@@ -561,85 +607,40 @@ def calculate_step1_score():
         user_id = session.get('user_id')
         data = request.get_json()
         
-        interaction1_score = data.get('interaction1_score', 0)  # 0-1 (completion)
-        interaction2_score = data.get('interaction2_score', 0)  # 1-5 (CEFR)
-        interaction3_score = data.get('interaction3_score', 0)  # 0-1 (completion)
-        
-        # Validate scores
-        if not (0 <= interaction1_score <= 1):
-            return jsonify({
-                'success': False,
-                'error': 'Interaction 1 score must be 0 or 1'
-            }), 400
-        
-        if not (1 <= interaction2_score <= 5):
-            return jsonify({
-                'success': False,
-                'error': 'Interaction 2 score must be between 1 and 5'
-            }), 400
-        
-        if not (0 <= interaction3_score <= 1):
-            return jsonify({
-                'success': False,
-                'error': 'Interaction 3 score must be 0 or 1'
-            }), 400
-        
-        # Calculate total (Interaction 2 is the main scorer, 1-5 points)
-        # Add bonus points for game completions
-        total_score = interaction2_score + interaction1_score + interaction3_score
-        max_score = 7  # 5 (I2) + 1 (I1) + 1 (I3)
+        try:
+            result = scoring_engine.score_step(5, 1, data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        # Determine remedial level based on Interaction 2 score (main assessment)
-        if interaction2_score == 1:
-            remedial_level = 'A1'
-        elif interaction2_score == 2:
-            remedial_level = 'A2'
-        elif interaction2_score == 3:
-            remedial_level = 'B1'
-        elif interaction2_score == 4:
-            remedial_level = 'B2'
-        else:  # interaction2_score == 5
-            remedial_level = 'C1'
+        scores = result['interaction_scores']
+        interaction1_score = scores['interaction1_score']
+        interaction2_score = scores['interaction2_score']
+        interaction3_score = scores['interaction3_score']
+        total_score = result['total_score']
+        max_score = result['max_score']
+        remedial_level = result['remedial_level']
+        should_proceed = result['should_proceed']
         
-        # Determine if should proceed (threshold: B1 level = 3 points)
-        should_proceed = interaction2_score >= 3
-        
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 1 - SCORING RESULTS")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nInteraction 1 (Wordshake Game):")
-        print(f"  Score: {interaction1_score}/1 (completion)")
-        print(f"\nInteraction 2 (Solution Suggestion):")
-        print(f"  Score: {interaction2_score}/5 points")
-        print(f"  Level: {remedial_level}")
-        print(f"\nInteraction 3 (Sushi Spell Game):")
-        print(f"  Score: {interaction3_score}/1 (completion)")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/{max_score} points")
-        print(f"REMEDIAL LEVEL: {remedial_level}")
-        print(f"PROCEED TO STEP 2: {'✅ YES' if should_proceed else '❌ NO - Remedial Required'}")
-        print("="*60 + "\n")
-        
-        logger.info(f"Phase 5 Step 1 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}, Proceed={should_proceed}")
+        log_event(logger, 'phase5.step_score', user_id=user_id, step=1,
+                  i1=interaction1_score, i2=interaction2_score, i3=interaction3_score,
+                  total=total_score, max_score=max_score, level=remedial_level, proceed=should_proceed)
         
         return jsonify({
             'success': True,
             'data': {
                 'interaction1': {
                     'score': interaction1_score,
-                    'max_score': 1,
+                    'max_score': result['max_scores']['interaction1_score'],
                     'type': 'completion'
                 },
                 'interaction2': {
                     'score': interaction2_score,
-                    'max_score': 5,
+                    'max_score': result['max_scores']['interaction2_score'],
                     'level': remedial_level
                 },
                 'interaction3': {
                     'score': interaction3_score,
-                    'max_score': 1,
+                    'max_score': result['max_scores']['interaction3_score'],
                     'type': 'completion'
                 },
                 'total': {
@@ -700,6 +701,41 @@ def track_step2_interaction1():
         }), 500
 
 
+STEP2_INTERACTION1_ANNOUNCEMENT_PROMPT = prompt_templates.register(
+    'phase5.step2_interaction1_announcement',
+    system="""
+Evaluate this student's crisis announcement for a festival lighting failure.
+
+Context: One hour before the Global Cultures Festival opens, the main stage lights fail. The student must write an announcement (3-6 sentences) announcing the issue and solution.
+
+Expected vocabulary terms: emergency, backup, announce, update, communicate
+
+Evaluation Criteria:
+- A2 (2 points): 2-3 sentence announcement with basic vocabulary (e.g., "Lights problem. Use backup. Come festival.")
+- B1 (3 points): 4-6 sentence update with reasons (e.g., "Dear guests, there is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you for understanding.")
+- B2 (4 points): Structured announcement with polite language (e.g., "Urgent update: Due to a technical issue, the main stage lighting has temporarily failed. Our team is implementing the backup lighting system and expects resolution within 20 minutes. The event will proceed as scheduled. We appreciate your patience and understanding.")
+- C1 (5 points): Multi-channel crisis response with strategic tone (e.g., "Immediate notice to all attendees: An unexpected technical failure has affected the main stage lighting system just one hour before opening. Our contingency team is actively deploying the pre-tested backup lighting array, with full restoration anticipated within the next 20-25 minutes. The festival schedule remains unchanged, and we are committed to delivering the full cultural experience you expect. We sincerely thank you for your patience and understanding during this brief disruption.")
+
+Requirements:
+1. Must announce the issue
+2. Must mention solution (backup lights)
+3. Must use appropriate tone (calm, professional)
+4. Must include next steps or reassurance
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback on the announcement",
+    "vocabulary_used": ["list", "of", "terms", "found"],
+    "strengths": ["strength1", "strength2"],
+    "improvements": ["improvement1", "improvement2"]
+}
+""",
+    user='Student Announcement: "{announcement}"'
+)
+
+
 @phase5_bp.route('/step2/interaction1/evaluate-announcement', methods=['POST'])
 @login_required
 def evaluate_step2_interaction1_announcement():
@@ -721,40 +757,9 @@ def evaluate_step2_interaction1_announcement():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's crisis announcement for a festival lighting failure.
-        
-        Student Announcement: "{announcement}"
-        
-        Context: One hour before the Global Cultures Festival opens, the main stage lights fail. The student must write an announcement (3-6 sentences) announcing the issue and solution.
-        
-        Expected vocabulary terms: emergency, backup, announce, update, communicate
-        
-        Evaluation Criteria:
-        - A2 (2 points): 2-3 sentence announcement with basic vocabulary (e.g., "Lights problem. Use backup. Come festival.")
-        - B1 (3 points): 4-6 sentence update with reasons (e.g., "Dear guests, there is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you for understanding.")
-        - B2 (4 points): Structured announcement with polite language (e.g., "Urgent update: Due to a technical issue, the main stage lighting has temporarily failed. Our team is implementing the backup lighting system and expects resolution within 20 minutes. The event will proceed as scheduled. We appreciate your patience and understanding.")
-        - C1 (5 points): Multi-channel crisis response with strategic tone (e.g., "Immediate notice to all attendees: An unexpected technical failure has affected the main stage lighting system just one hour before opening. Our contingency team is actively deploying the pre-tested backup lighting array, with full restoration anticipated within the next 20-25 minutes. The festival schedule remains unchanged, and we are committed to delivering the full cultural experience you expect. We sincerely thank you for your patience and understanding during this brief disruption.")
-        
-        Requirements:
-        1. Must announce the issue
-        2. Must mention solution (backup lights)
-        3. Must use appropriate tone (calm, professional)
-        4. Must include next steps or reassurance
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback on the announcement",
-            "vocabulary_used": ["list", "of", "terms", "found"],
-            "strengths": ["strength1", "strength2"],
-            "improvements": ["improvement1", "improvement2"]
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP2_INTERACTION1_ANNOUNCEMENT_PROMPT, announcement=announcement)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -826,6 +831,32 @@ def _evaluate_announcement_fallback(announcement):
     }
 
 
+STEP2_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase5.step2_interaction2',
+    system="""
+Evaluate this student's explanation for why they chose a solution (backup lights) for the crisis.
+
+Context: The student must explain why backup lights are a good solution for the lighting failure.
+
+Expected Response Examples:
+- A2 (2 points): "Backup good because fix."
+- B1 (3 points): "Backup lights work because it is emergency and fast."
+- B2 (4 points): "Using backup lights is the best immediate solution because it ensures the event continues without major delay and maintains audience safety."
+- C1 (5 points): "Deploying the backup lighting system is the optimal crisis response because it minimizes downtime, preserves the event's integrity, and demonstrates proactive risk management, thereby reinforcing stakeholder confidence."
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "strengths": ["strength1"],
+    "improvements": ["improvement1"]
+}
+""",
+    user='Student Explanation: "{explanation}"'
+)
+
+
 @phase5_bp.route('/step2/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_step2_interaction2():
@@ -848,31 +879,9 @@ def evaluate_step2_interaction2():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's explanation for why they chose a solution (backup lights) for the crisis.
-        
-        Student Explanation: "{explanation}"
-        
-        Context: The student must explain why backup lights are a good solution for the lighting failure.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Backup good because fix."
-        - B1 (3 points): "Backup lights work because it is emergency and fast."
-        - B2 (4 points): "Using backup lights is the best immediate solution because it ensures the event continues without major delay and maintains audience safety."
-        - C1 (5 points): "Deploying the backup lighting system is the optimal crisis response because it minimizes downtime, preserves the event's integrity, and demonstrates proactive risk management, thereby reinforcing stakeholder confidence."
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "strengths": ["strength1"],
-            "improvements": ["improvement1"]
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP2_INTERACTION2_PROMPT, explanation=explanation)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -972,6 +981,36 @@ def track_step2_interaction3():
         }), 500
 
 
+STEP2_INTERACTION3_REVISION_PROMPT = prompt_templates.register(
+    'phase5.step2_interaction3_revision',
+    source_field='original_sentence',
+    system="""
+Evaluate this student's revision of an announcement sentence.
+
+Expected vocabulary terms: communicate, contingency, update, emergency, backup
+
+Evaluation Criteria:
+- A2 (2 points): Simple addition of term (e.g., "Add communicate.")
+- B1 (3 points): Basic sentence with term (e.g., "We communicate to everyone.")
+- B2 (4 points): Improved sentence with term (e.g., "We are communicating transparently with all stakeholders.")
+- C1 (5 points): Sophisticated revision with advanced vocabulary (e.g., "We are communicating transparently and proactively to all stakeholders to maintain trust during this contingency.")
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "improvement_detected": true/false
+}
+""",
+    user="""
+Original Sentence: "{original_sentence}"
+Revised Sentence: "{revised_sentence}"
+New Term Used: "{new_term}"
+"""
+)
+
+
 @phase5_bp.route('/step2/interaction3/evaluate-revision', methods=['POST'])
 @login_required
 def evaluate_step2_interaction3_revision():
@@ -996,32 +1035,9 @@ def evaluate_step2_interaction3_revision():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's revision of an announcement sentence.
-        
-        Original Sentence: "{original_sentence}"
-        Revised Sentence: "{revised_sentence}"
-        New Term Used: "{new_term}"
-        
-        Expected vocabulary terms: communicate, contingency, update, emergency, backup
-        
-        Evaluation Criteria:
-        - A2 (2 points): Simple addition of term (e.g., "Add communicate.")
-        - B1 (3 points): Basic sentence with term (e.g., "We communicate to everyone.")
-        - B2 (4 points): Improved sentence with term (e.g., "We are communicating transparently with all stakeholders.")
-        - C1 (5 points): Sophisticated revision with advanced vocabulary (e.g., "We are communicating transparently and proactively to all stakeholders to maintain trust during this contingency.")
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "improvement_detected": true/false
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP2_INTERACTION3_REVISION_PROMPT, original_sentence=original_sentence, revised_sentence=revised_sentence, new_term=new_term)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -1097,28 +1113,21 @@ def calculate_step2_score():
         user_id = session.get('user_id')
         data = request.get_json()
         
-        interaction1_score = data.get('interaction1_score', 0)  # 0-1 (game) + 2-5 (writing)
-        interaction1_writing_score = data.get('interaction1_writing_score', 0)  # 2-5 (CEFR)
-        interaction2_score = data.get('interaction2_score', 0)  # 2-5 (CEFR)
-        interaction3_score = data.get('interaction3_score', 0)  # 0-1 (game) + 2-5 (revision)
-        interaction3_revision_score = data.get('interaction3_revision_score', 0)  # 2-5 (CEFR)
-        
-        # Main scorer is Interaction 1 writing (2-5 points)
-        main_score = interaction1_writing_score
-        total_score = interaction1_score + interaction1_writing_score + interaction2_score + interaction3_score + interaction3_revision_score
-        max_score = 1 + 5 + 5 + 1 + 5  # 17 total
-        
-        # Determine remedial level based on main score
-        if main_score == 2:
-            remedial_level = 'A2'
-        elif main_score == 3:
-            remedial_level = 'B1'
-        elif main_score == 4:
-            remedial_level = 'B2'
-        else:  # main_score == 5
-            remedial_level = 'C1'
-        
-        should_proceed = main_score >= 3  # B1 level or higher
+        try:
+            result = scoring_engine.score_step(5, 2, data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        scores = result['interaction_scores']
+        interaction1_score = scores['interaction1_score']
+        interaction1_writing_score = scores['interaction1_writing_score']
+        interaction2_score = scores['interaction2_score']
+        interaction3_score = scores['interaction3_score']
+        interaction3_revision_score = scores['interaction3_revision_score']
+        total_score = result['total_score']
+        max_score = result['max_score']
+        remedial_level = result['remedial_level']
+        should_proceed = result['should_proceed']
         
         logger.info(f"Phase 5 Step 2 scoring - User {user_id}: I1={interaction1_score}+{interaction1_writing_score}, I2={interaction2_score}, I3={interaction3_score}+{interaction3_revision_score}, Total={total_score}, Level={remedial_level}, Proceed={should_proceed}")
         
@@ -1236,6 +1245,38 @@ def track_step3_interaction1():
         }), 500
 
 
+STEP3_INTERACTION1_DEFINITION_PROMPT = prompt_templates.register(
+    'phase5.step3_interaction1_definition',
+    system="""
+Evaluate this student's definition of 'contingency' after watching crisis communication videos.
+
+Context: The student watched videos on crisis communication and must define 'contingency' in their own words, referencing the video.
+
+Expected Response Examples:
+- A2 (2 points): "Contingency is extra plan."
+- B1 (3 points): "A contingency is an extra plan for problems, like backup lights in the video when main lights fail."
+- B2 (4 points): "A contingency plan is a prepared alternative action or resource (such as backup lighting) that is activated when the primary plan fails, as shown in the video's event management example."
+- C1 (5 points): "In event crisis management, a contingency plan constitutes a pre-established protocol or resource (e.g., backup systems) designed to mitigate disruption, maintain operational continuity, and preserve stakeholder confidence, as exemplified in the video through rapid activation of alternative lighting solutions."
+
+Requirements:
+1. Must define 'contingency' accurately
+2. Should reference video content (backup lights, alternative plan, etc.)
+3. Must show understanding of the concept
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "video_reference_detected": true/false,
+    "strengths": ["strength1"],
+    "improvements": ["improvement1"]
+}
+""",
+    user='Student Definition: "{definition}"'
+)
+
+
 @phase5_bp.route('/step3/interaction1/evaluate-definition', methods=['POST'])
 @login_required
 def evaluate_step3_interaction1_definition():
@@ -1257,37 +1298,9 @@ def evaluate_step3_interaction1_definition():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's definition of 'contingency' after watching crisis communication videos.
-        
-        Student Definition: "{definition}"
-        
-        Context: The student watched videos on crisis communication and must define 'contingency' in their own words, referencing the video.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Contingency is extra plan."
-        - B1 (3 points): "A contingency is an extra plan for problems, like backup lights in the video when main lights fail."
-        - B2 (4 points): "A contingency plan is a prepared alternative action or resource (such as backup lighting) that is activated when the primary plan fails, as shown in the video's event management example."
-        - C1 (5 points): "In event crisis management, a contingency plan constitutes a pre-established protocol or resource (e.g., backup systems) designed to mitigate disruption, maintain operational continuity, and preserve stakeholder confidence, as exemplified in the video through rapid activation of alternative lighting solutions."
-        
-        Requirements:
-        1. Must define 'contingency' accurately
-        2. Should reference video content (backup lights, alternative plan, etc.)
-        3. Must show understanding of the concept
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "video_reference_detected": true/false,
-            "strengths": ["strength1"],
-            "improvements": ["improvement1"]
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP3_INTERACTION1_DEFINITION_PROMPT, definition=definition)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -1353,6 +1366,37 @@ def _evaluate_definition_fallback(definition):
     }
 
 
+STEP3_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase5.step3_interaction2',
+    system="""
+Evaluate this student's explanation of 'transparent' communication after reading crisis communication examples.
+
+Context: The student read examples of crisis communication and must explain 'transparent' communication and its purpose, using examples from the texts.
+
+Expected Response Examples:
+- A2 (2 points): "Transparent is tell truth."
+- B1 (3 points): "Transparent communication means telling people the truth about the problem and what we are doing, like the Twitter post said 'lights broken but we fix soon' because it makes people not worried."
+- B2 (4 points): "Transparent communication involves openly sharing accurate information about the crisis (problem + actions being taken), as seen in the Twitter update that clearly stated the issue and resolution timeline, because it builds trust and reduces anxiety."
+- C1 (5 points): "Transparent communication in crisis situations entails full, timely, and honest disclosure of the issue, response measures, and expected outcomes (e.g., 'technical failure - backup lighting activated - event proceeds in 25 minutes'), as both examples demonstrate, thereby mitigating misinformation, preserving stakeholder trust, and transforming potential disruption into an opportunity for demonstrating reliability and accountability."
+
+Requirements:
+1. Must explain 'transparent' communication
+2. Should reference examples from texts (Twitter, email, etc.)
+3. Must explain purpose (build trust, reduce panic)
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "example_reference_detected": true/false,
+    "purpose_explained": true/false
+}
+""",
+    user='Student Explanation: "{explanation}"'
+)
+
+
 @phase5_bp.route('/step3/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_step3_interaction2():
@@ -1375,36 +1419,9 @@ def evaluate_step3_interaction2():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's explanation of 'transparent' communication after reading crisis communication examples.
-        
-        Student Explanation: "{explanation}"
-        
-        Context: The student read examples of crisis communication and must explain 'transparent' communication and its purpose, using examples from the texts.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Transparent is tell truth."
-        - B1 (3 points): "Transparent communication means telling people the truth about the problem and what we are doing, like the Twitter post said 'lights broken but we fix soon' because it makes people not worried."
-        - B2 (4 points): "Transparent communication involves openly sharing accurate information about the crisis (problem + actions being taken), as seen in the Twitter update that clearly stated the issue and resolution timeline, because it builds trust and reduces anxiety."
-        - C1 (5 points): "Transparent communication in crisis situations entails full, timely, and honest disclosure of the issue, response measures, and expected outcomes (e.g., 'technical failure - backup lighting activated - event proceeds in 25 minutes'), as both examples demonstrate, thereby mitigating misinformation, preserving stakeholder trust, and transforming potential disruption into an opportunity for demonstrating reliability and accountability."
-        
-        Requirements:
-        1. Must explain 'transparent' communication
-        2. Should reference examples from texts (Twitter, email, etc.)
-        3. Must explain purpose (build trust, reduce panic)
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "example_reference_detected": true/false,
-            "purpose_explained": true/false
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP3_INTERACTION2_PROMPT, explanation=explanation)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -1506,6 +1523,40 @@ def track_step3_interaction3():
         }), 500
 
 
+STEP3_INTERACTION3_TERM_EXPLANATION_PROMPT = prompt_templates.register(
+    'phase5.step3_interaction3_term_explanation',
+    system="""
+Evaluate this student's explanation of a term after playing Sushi Spell game.
+
+Context: The student played Sushi Spell to spell crisis communication terms, then must explain one spelled term relating to the videos.
+
+Expected Response Examples:
+- A2 (2 points): "Game for backup."
+- B1 (3 points): "Use Sushi Spell for 'backup' because the video showed extra lights for emergency."
+- B2 (4 points): "Incorporate Sushi Spell for rapid spelling of 'transparent' to make vocabulary engaging, as the email example used open communication to reassure people."
+- C1 (5 points): "Leverage Sushi Spell to master 'contingency' through competitive spelling, relating to the Twitter update's reference to pre-planned alternative measures that ensured minimal disruption."
+
+Requirements:
+1. Must mention the game (Sushi Spell)
+2. Must mention the spelled term
+3. Should link to video/text examples
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "game_reference_detected": true/false,
+    "video_reference_detected": true/false
+}
+""",
+    user="""
+Term: "{term}"
+Student Explanation: "{explanation}"
+"""
+)
+
+
 @phase5_bp.route('/step3/interaction3/evaluate-term-explanation', methods=['POST'])
 @login_required
 def evaluate_step3_interaction3_term_explanation():
@@ -1529,37 +1580,9 @@ def evaluate_step3_interaction3_term_explanation():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's explanation of a term after playing Sushi Spell game.
-        
-        Term: "{term}"
-        Student Explanation: "{explanation}"
-        
-        Context: The student played Sushi Spell to spell crisis communication terms, then must explain one spelled term relating to the videos.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Game for backup."
-        - B1 (3 points): "Use Sushi Spell for 'backup' because the video showed extra lights for emergency."
-        - B2 (4 points): "Incorporate Sushi Spell for rapid spelling of 'transparent' to make vocabulary engaging, as the email example used open communication to reassure people."
-        - C1 (5 points): "Leverage Sushi Spell to master 'contingency' through competitive spelling, relating to the Twitter update's reference to pre-planned alternative measures that ensured minimal disruption."
-        
-        Requirements:
-        1. Must mention the game (Sushi Spell)
-        2. Must mention the spelled term
-        3. Should link to video/text examples
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "game_reference_detected": true/false,
-            "video_reference_detected": true/false
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP3_INTERACTION3_TERM_EXPLANATION_PROMPT, term=term, explanation=explanation)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -1637,28 +1660,21 @@ def calculate_step3_score():
         user_id = session.get('user_id')
         data = request.get_json()
         
-        interaction1_score = data.get('interaction1_score', 0)  # 0-1 (game) + 2-5 (definition)
-        interaction1_definition_score = data.get('interaction1_definition_score', 0)  # 2-5 (CEFR)
-        interaction2_score = data.get('interaction2_score', 0)  # 2-5 (CEFR)
-        interaction3_score = data.get('interaction3_score', 0)  # 0-1 (game) + 2-5 (term explanation)
-        interaction3_term_score = data.get('interaction3_term_score', 0)  # 2-5 (CEFR)
-        
-        # Main scorer is Interaction 1 definition (2-5 points)
-        main_score = interaction1_definition_score
-        total_score = interaction1_score + interaction1_definition_score + interaction2_score + interaction3_score + interaction3_term_score
-        max_score = 1 + 5 + 5 + 1 + 5  # 17 total
-        
-        # Determine remedial level based on main score
-        if main_score == 2:
-            remedial_level = 'A2'
-        elif main_score == 3:
-            remedial_level = 'B1'
-        elif main_score == 4:
-            remedial_level = 'B2'
-        else:  # main_score == 5
-            remedial_level = 'C1'
-        
-        should_proceed = main_score >= 3  # B1 level or higher
+        try:
+            result = scoring_engine.score_step(5, 3, data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        scores = result['interaction_scores']
+        interaction1_score = scores['interaction1_score']
+        interaction1_definition_score = scores['interaction1_definition_score']
+        interaction2_score = scores['interaction2_score']
+        interaction3_score = scores['interaction3_score']
+        interaction3_term_score = scores['interaction3_term_score']
+        total_score = result['total_score']
+        max_score = result['max_score']
+        remedial_level = result['remedial_level']
+        should_proceed = result['should_proceed']
         
         logger.info(f"Phase 5 Step 3 scoring - User {user_id}: I1={interaction1_score}+{interaction1_definition_score}, I2={interaction2_score}, I3={interaction3_score}+{interaction3_term_score}, Total={total_score}, Level={remedial_level}, Proceed={should_proceed}")
         
@@ -1738,6 +1754,43 @@ def log_step3_remedial():
 # STEP 4: ELABORATE - Complete Crisis Communication Texts
 # ============================================================
 
+STEP4_INTERACTION1_SOCIAL_MEDIA_PROMPT = prompt_templates.register(
+    'phase5.step4_interaction1_social_media',
+    system="""
+Evaluate this student's social media announcement for a festival lighting failure.
+
+Context: The student must write a 4-8 sentence social media post announcing the issue and solution, following a template with examples.
+
+Expected vocabulary terms: emergency, backup, announce, transparent, update, fix
+
+Evaluation Criteria:
+- A2 (2 points): Simple guided announcement (e.g., "Lighting problem. We use backup. Festival start soon. Thank you. #Festival")
+- B1 (3 points): Structured message with reasons (e.g., "Hello everyone! There is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you for your patience. See you soon! #GlobalFestival #Update")
+- B2 (4 points): Detailed, polite crisis text with logical flow (e.g., "Dear festival community, a technical issue has temporarily affected the main stage lighting. Our team is actively deploying the backup system and anticipates full restoration within 20-30 minutes. The event schedule remains unchanged-performances and activities will proceed as planned. We sincerely appreciate your understanding and patience during this brief interruption. Thank you for being part of this celebration! #GlobalCulturesFestival #FestivalUpdate #WeAreOnIt")
+- C1 (5 points): Autonomous, nuanced crisis communication with strategic tone (e.g., "Immediate update to all attendees: An unforeseen technical malfunction has impacted the main stage lighting just one hour before doors open. Our dedicated response team has already initiated the pre-tested contingency protocol, deploying the full backup lighting array with restoration expected within the next 20-25 minutes. The festival program remains intact, and we remain fully committed to delivering the rich cultural experience you have been anticipating. We sincerely thank you for your patience and understanding during this short disruption-your continued support means everything. See you very soon for an unforgettable celebration of global unity. #GlobalCulturesFestival #LiveUpdate #ContingencyInAction #FestivalContinues")
+
+Requirements:
+1. Must announce the issue
+2. Must mention solution (backup lights)
+3. Must use calm, professional tone
+4. Should include hashtags
+5. Must check for grammar/spelling/structure mistakes
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "vocabulary_used": ["list", "of", "terms"],
+    "mistakes_detected": ["mistake1", "mistake2"],
+    "strengths": ["strength1"],
+    "improvements": ["improvement1"]
+}
+""",
+    user='Student Announcement: "{announcement}"'
+)
+
+
 @phase5_bp.route('/step4/interaction1/evaluate-social-media', methods=['POST'])
 @login_required
 def evaluate_step4_interaction1_social_media():
@@ -1759,42 +1812,9 @@ def evaluate_step4_interaction1_social_media():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's social media announcement for a festival lighting failure.
-        
-        Student Announcement: "{announcement}"
-        
-        Context: The student must write a 4-8 sentence social media post announcing the issue and solution, following a template with examples.
-        
-        Expected vocabulary terms: emergency, backup, announce, transparent, update, fix
-        
-        Evaluation Criteria:
-        - A2 (2 points): Simple guided announcement (e.g., "Lighting problem. We use backup. Festival start soon. Thank you. #Festival")
-        - B1 (3 points): Structured message with reasons (e.g., "Hello everyone! There is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you for your patience. See you soon! #GlobalFestival #Update")
-        - B2 (4 points): Detailed, polite crisis text with logical flow (e.g., "Dear festival community, a technical issue has temporarily affected the main stage lighting. Our team is actively deploying the backup system and anticipates full restoration within 20-30 minutes. The event schedule remains unchanged-performances and activities will proceed as planned. We sincerely appreciate your understanding and patience during this brief interruption. Thank you for being part of this celebration! #GlobalCulturesFestival #FestivalUpdate #WeAreOnIt")
-        - C1 (5 points): Autonomous, nuanced crisis communication with strategic tone (e.g., "Immediate update to all attendees: An unforeseen technical malfunction has impacted the main stage lighting just one hour before doors open. Our dedicated response team has already initiated the pre-tested contingency protocol, deploying the full backup lighting array with restoration expected within the next 20-25 minutes. The festival program remains intact, and we remain fully committed to delivering the rich cultural experience you have been anticipating. We sincerely thank you for your patience and understanding during this short disruption-your continued support means everything. See you very soon for an unforgettable celebration of global unity. #GlobalCulturesFestival #LiveUpdate #ContingencyInAction #FestivalContinues")
-        
-        Requirements:
-        1. Must announce the issue
-        2. Must mention solution (backup lights)
-        3. Must use calm, professional tone
-        4. Should include hashtags
-        5. Must check for grammar/spelling/structure mistakes
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "vocabulary_used": ["list", "of", "terms"],
-            "mistakes_detected": ["mistake1", "mistake2"],
-            "strengths": ["strength1"],
-            "improvements": ["improvement1"]
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP4_INTERACTION1_SOCIAL_MEDIA_PROMPT, announcement=announcement)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -1871,6 +1891,47 @@ def _evaluate_social_media_fallback(announcement):
     }
 
 
+STEP4_INTERACTION2_EMAIL_PROMPT = prompt_templates.register(
+    'phase5.step4_interaction2_email',
+    complexity='complex',
+    system="""
+Evaluate this student's email to sponsors/team about a festival lighting failure.
+
+Context: The student must write a 5-10 sentence email following a template with examples.
+
+Expected vocabulary terms: emergency, backup, announce, transparent, update, fix
+
+Evaluation Criteria:
+- A2 (2 points): Simple email (e.g., "Subject: Problem lights. Dear team, lights problem. We fix. Festival ok. Thank you.")
+- B1 (3 points): Structured email with reasons (e.g., "Subject: Lighting Update - Festival. Dear sponsors, there is a lighting problem. We use backup lights now. Festival starts on time. Thank you for support.")
+- B2 (4 points): Detailed, polite email with logical flow (e.g., "Subject: Urgent Update: Stage Lighting - Global Cultures Festival. Dear valued sponsors, we are currently addressing a brief technical issue with the main stage lighting. Our team has activated the backup system and anticipates full restoration within the next 20-30 minutes. The event schedule remains unchanged, and we are fully prepared to deliver the planned program. We sincerely appreciate your understanding and continued partnership. Best regards, [Name], Festival Committee.")
+- C1 (5 points): Autonomous, nuanced email with strategic tone (e.g., "Subject: Immediate Operational Update: Stage Lighting Contingency - Global Cultures Festival. Dear esteemed sponsors and team, an unexpected technical malfunction has temporarily affected the main stage lighting system one hour prior to opening. Our response protocol has been immediately engaged, with the pre-tested backup lighting array now being deployed-full resolution is projected within 20-25 minutes. The festival program remains fully intact, and we remain steadfast in our commitment to delivering an exceptional experience. We deeply value your trust and support during this brief disruption. Thank you for your continued partnership. Warm regards, [Name], Festival Director.")
+
+Requirements:
+1. Must have clear subject line
+2. Must have polite greeting
+3. Must explain the issue
+4. Must mention solution and timeline
+5. Must include polite closing
+6. Must check for grammar/spelling/structure mistakes
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "vocabulary_used": ["list", "of", "terms"],
+    "mistakes_detected": ["mistake1"],
+    "structure_score": 0-1 (has greeting, body, closing)
+}
+""",
+    user="""
+Subject: "{subject}"
+Email Body: "{email_body}"
+"""
+)
+
+
 @phase5_bp.route('/step4/interaction2/evaluate-email', methods=['POST'])
 @login_required
 def evaluate_step4_interaction2_email():
@@ -1893,43 +1954,9 @@ def evaluate_step4_interaction2_email():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's email to sponsors/team about a festival lighting failure.
-        
-        Subject: "{subject}"
-        Email Body: "{email_body}"
-        
-        Context: The student must write a 5-10 sentence email following a template with examples.
-        
-        Expected vocabulary terms: emergency, backup, announce, transparent, update, fix
-        
-        Evaluation Criteria:
-        - A2 (2 points): Simple email (e.g., "Subject: Problem lights. Dear team, lights problem. We fix. Festival ok. Thank you.")
-        - B1 (3 points): Structured email with reasons (e.g., "Subject: Lighting Update - Festival. Dear sponsors, there is a lighting problem. We use backup lights now. Festival starts on time. Thank you for support.")
-        - B2 (4 points): Detailed, polite email with logical flow (e.g., "Subject: Urgent Update: Stage Lighting - Global Cultures Festival. Dear valued sponsors, we are currently addressing a brief technical issue with the main stage lighting. Our team has activated the backup system and anticipates full restoration within the next 20-30 minutes. The event schedule remains unchanged, and we are fully prepared to deliver the planned program. We sincerely appreciate your understanding and continued partnership. Best regards, [Name], Festival Committee.")
-        - C1 (5 points): Autonomous, nuanced email with strategic tone (e.g., "Subject: Immediate Operational Update: Stage Lighting Contingency - Global Cultures Festival. Dear esteemed sponsors and team, an unexpected technical malfunction has temporarily affected the main stage lighting system one hour prior to opening. Our response protocol has been immediately engaged, with the pre-tested backup lighting array now being deployed-full resolution is projected within 20-25 minutes. The festival program remains fully intact, and we remain steadfast in our commitment to delivering an exceptional experience. We deeply value your trust and support during this brief disruption. Thank you for your continued partnership. Warm regards, [Name], Festival Director.")
-        
-        Requirements:
-        1. Must have clear subject line
-        2. Must have polite greeting
-        3. Must explain the issue
-        4. Must mention solution and timeline
-        5. Must include polite closing
-        6. Must check for grammar/spelling/structure mistakes
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "vocabulary_used": ["list", "of", "terms"],
-            "mistakes_detected": ["mistake1"],
-            "structure_score": 0-1 (has greeting, body, closing)
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP4_INTERACTION2_EMAIL_PROMPT, subject=subject, email_body=email_body)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -2044,6 +2071,44 @@ def track_step4_interaction3():
         }), 500
 
 
+STEP4_INTERACTION3_REVISION_PROMPT = prompt_templates.register(
+    'phase5.step4_interaction3_revision',
+    source_field='original_sentence',
+    system="""
+Evaluate this student's sentence revision after playing Sushi Spell.
+
+Context: The student played Sushi Spell to spell terms, then must revise one sentence using a spelled term and fix any mistakes.
+
+Expected Response Examples:
+- A2 (2 points): "Spell backup. Add backup light."
+- B1 (3 points): "Use Sushi Spell for 'announce' - revised: 'We announce to everyone' fixed to 'We are announcing to all guests'."
+- B2 (4 points): "Incorporate Sushi Spell for 'transparent' - revised announcement: 'We tell problem' fixed to 'We are communicating transparently about the issue'."
+- C1 (5 points): "Leverage Sushi Spell for 'contingency' - revised email: Detected passive error in 'Backup is use' to 'The contingency plan, which includes the backup system, has been activated'."
+
+Requirements:
+1. Must mention the game (Sushi Spell)
+2. Must use the spelled term in revised sentence
+3. Must show error detection and correction
+4. Must improve the sentence
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "term_used_correctly": true/false,
+    "error_detected": true/false,
+    "improvement_detected": true/false
+}
+""",
+    user="""
+Original Sentence: "{original_sentence}"
+Revised Sentence: "{revised_sentence}"
+Term Used: "{term_used}"
+"""
+)
+
+
 @phase5_bp.route('/step4/interaction3/evaluate-revision', methods=['POST'])
 @login_required
 def evaluate_step4_interaction3_revision():
@@ -2068,40 +2133,9 @@ def evaluate_step4_interaction3_revision():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's sentence revision after playing Sushi Spell.
-        
-        Original Sentence: "{original_sentence}"
-        Revised Sentence: "{revised_sentence}"
-        Term Used: "{term_used}"
-        
-        Context: The student played Sushi Spell to spell terms, then must revise one sentence using a spelled term and fix any mistakes.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Spell backup. Add backup light."
-        - B1 (3 points): "Use Sushi Spell for 'announce' - revised: 'We announce to everyone' fixed to 'We are announcing to all guests'."
-        - B2 (4 points): "Incorporate Sushi Spell for 'transparent' - revised announcement: 'We tell problem' fixed to 'We are communicating transparently about the issue'."
-        - C1 (5 points): "Leverage Sushi Spell for 'contingency' - revised email: Detected passive error in 'Backup is use' to 'The contingency plan, which includes the backup system, has been activated'."
-        
-        Requirements:
-        1. Must mention the game (Sushi Spell)
-        2. Must use the spelled term in revised sentence
-        3. Must show error detection and correction
-        4. Must improve the sentence
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "term_used_correctly": true/false,
-            "error_detected": true/false,
-            "improvement_detected": true/false
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP4_INTERACTION3_REVISION_PROMPT, original_sentence=original_sentence, revised_sentence=revised_sentence, term_used=term_used)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -2182,27 +2216,20 @@ def calculate_step4_score():
         user_id = session.get('user_id')
         data = request.get_json()
         
-        interaction1_score = data.get('interaction1_score', 0)  # 2-5 (CEFR)
-        interaction2_score = data.get('interaction2_score', 0)  # 2-5 (CEFR)
-        interaction3_score = data.get('interaction3_score', 0)  # 0-1 (game) + 2-5 (revision)
-        interaction3_revision_score = data.get('interaction3_revision_score', 0)  # 2-5 (CEFR)
-        
-        # Main scorer is Interaction 1 (2-5 points)
-        main_score = interaction1_score
-        total_score = interaction1_score + interaction2_score + interaction3_score + interaction3_revision_score
-        max_score = 5 + 5 + 1 + 5  # 16 total
-        
-        # Determine remedial level based on main score
-        if main_score == 2:
-            remedial_level = 'A2'
-        elif main_score == 3:
-            remedial_level = 'B1'
-        elif main_score == 4:
-            remedial_level = 'B2'
-        else:  # main_score == 5
-            remedial_level = 'C1'
-        
-        should_proceed = main_score >= 3  # B1 level or higher
+        try:
+            result = scoring_engine.score_step(5, 4, data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        scores = result['interaction_scores']
+        interaction1_score = scores['interaction1_score']
+        interaction2_score = scores['interaction2_score']
+        interaction3_score = scores['interaction3_score']
+        interaction3_revision_score = scores['interaction3_revision_score']
+        total_score = result['total_score']
+        max_score = result['max_score']
+        remedial_level = result['remedial_level']
+        should_proceed = result['should_proceed']
         
         logger.info(f"Phase 5 Step 4 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}+{interaction3_revision_score}, Total={total_score}, Level={remedial_level}, Proceed={should_proceed}")
         
@@ -2281,6 +2308,44 @@ def log_step4_remedial():
 # STEP 5: EVALUATE - Progressive Error Correction
 # ============================================================
 
+STEP5_INTERACTION1_SPELLING_PROMPT = prompt_templates.register(
+    'phase5.step5_interaction1_spelling',
+    complexity='simple',
+    source_field='original_text',
+    system="""
+Evaluate this student's spelling corrections for a faulty crisis communication text.
+
+Context: The student must correct ONLY spelling errors (e.g., "emergancy" → "emergency", "back-up" → "backup", "anounce" → "announce", "up-date" → "update", "resolv" → "resolve", "transperent" → "transparent").
+
+Expected Response Examples:
+- A2 (2 points): "Lites problem. We fix soon. Come festivl." → "Lights problem. We fix soon. Come festival."
+- B1 (3 points): "Dear gests, lighting probelm. We use bakup. Festival ok. Thank you." → "Dear guests, lighting problem. We use backup. Festival ok. Thank you."
+- B2 (4 points): "Urgent up-date: Stage lighing fail. Team activat bakup. Event continue. Appreciate patience." → "Urgent update: Stage lighting failure. Team activating backup. Event continues. Appreciate patience."
+- C1 (5 points): "Imediate notice: Unforseen technicle malfuntion afected stage lighing. Contingincy protocol iniciated. Full restorasion expected shortly. Thank for understanding." → "Immediate notice: Unforeseen technical malfunction affected stage lighting. Contingency protocol initiated. Full restoration expected shortly. Thank you for understanding."
+
+Requirements:
+1. Must correct spelling errors only (not grammar)
+2. Must identify common misspellings (emergancy, back-up, anounce, up-date, resolv, transperent, probelm, fixs, lites, festivl, gests, bakup, lighing, activat, continue, imediate, unforseen, technicle, malfuntion, afected, contingincy, iniciated, restorasion)
+3. Score based on accuracy and completeness of spelling corrections
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "spelling_errors_found": ["error1", "error2"],
+    "spelling_errors_corrected": ["correction1", "correction2"],
+    "missed_errors": ["missed1"],
+    "accuracy_percentage": 0-100
+}
+""",
+    user="""
+Original (Faulty) Text: "{original_text}"
+Student's Corrected Text: "{corrected_text}"
+"""
+)
+
+
 @phase5_bp.route('/step5/interaction1/evaluate-spelling', methods=['POST'])
 @login_required
 def evaluate_step5_interaction1_spelling():
@@ -2303,39 +2368,9 @@ def evaluate_step5_interaction1_spelling():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's spelling corrections for a faulty crisis communication text.
-        
-        Original (Faulty) Text: "{original_text}"
-        Student's Corrected Text: "{corrected_text}"
-        
-        Context: The student must correct ONLY spelling errors (e.g., "emergancy" → "emergency", "back-up" → "backup", "anounce" → "announce", "up-date" → "update", "resolv" → "resolve", "transperent" → "transparent").
-        
-        Expected Response Examples:
-        - A2 (2 points): "Lites problem. We fix soon. Come festivl." → "Lights problem. We fix soon. Come festival."
-        - B1 (3 points): "Dear gests, lighting probelm. We use bakup. Festival ok. Thank you." → "Dear guests, lighting problem. We use backup. Festival ok. Thank you."
-        - B2 (4 points): "Urgent up-date: Stage lighing fail. Team activat bakup. Event continue. Appreciate patience." → "Urgent update: Stage lighting failure. Team activating backup. Event continues. Appreciate patience."
-        - C1 (5 points): "Imediate notice: Unforseen technicle malfuntion afected stage lighing. Contingincy protocol iniciated. Full restorasion expected shortly. Thank for understanding." → "Immediate notice: Unforeseen technical malfunction affected stage lighting. Contingency protocol initiated. Full restoration expected shortly. Thank you for understanding."
-        
-        Requirements:
-        1. Must correct spelling errors only (not grammar)
-        2. Must identify common misspellings (emergancy, back-up, anounce, up-date, resolv, transperent, probelm, fixs, lites, festivl, gests, bakup, lighing, activat, continue, imediate, unforseen, technicle, malfuntion, afected, contingincy, iniciated, restorasion)
-        3. Score based on accuracy and completeness of spelling corrections
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "spelling_errors_found": ["error1", "error2"],
-            "spelling_errors_corrected": ["correction1", "correction2"],
-            "missed_errors": ["missed1"],
-            "accuracy_percentage": 0-100
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP5_INTERACTION1_SPELLING_PROMPT, original_text=original_text, corrected_text=corrected_text)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -2425,6 +2460,43 @@ def _evaluate_spelling_fallback(original, corrected):
     }
 
 
+STEP5_INTERACTION2_GRAMMAR_PROMPT = prompt_templates.register(
+    'phase5.step5_interaction2_grammar',
+    source_field='spelling_corrected_text',
+    system="""
+Evaluate this student's grammar corrections for a crisis communication text.
+
+Context: The student must correct ONLY grammar errors (subject-verb agreement, articles, prepositions, tense consistency, sentence fragments).
+
+Expected Response Examples:
+- A2 (2 points): "Lights problem. We fix soon. Come festival." → "The lights problem. We fix soon. Come to festival."
+- B1 (3 points): "Dear guests, lighting problem. We use backup. Festival ok. Thank you." → "Dear guests, there is a lighting problem. We are using backup lights. The festival is ok. Thank you."
+- B2 (4 points): "Urgent update: Stage lighting failure. Team activating backup. Event continues. Appreciate patience." → "Urgent update: The stage lighting has failed. Our team is activating the backup system. The event will continue. We appreciate your patience."
+- C1 (5 points): "Immediate notice: Unforeseen technical malfunction affected stage lighting. Contingency protocol initiated. Full restoration expected shortly. Thank for understanding." → "Immediate notice: An unforeseen technical malfunction has affected the stage lighting. The contingency protocol has been initiated. Full restoration is expected shortly. Thank you for your understanding."
+
+Requirements:
+1. Must correct grammar errors only (not spelling - already done)
+2. Must fix: subject-verb agreement, articles (a/an/the), prepositions, tense consistency, sentence fragments
+3. Score based on accuracy and completeness of grammar corrections
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "grammar_errors_found": ["error1", "error2"],
+    "grammar_errors_corrected": ["correction1", "correction2"],
+    "missed_errors": ["missed1"],
+    "accuracy_percentage": 0-100
+}
+""",
+    user="""
+Spelling-Corrected Text: "{spelling_corrected_text}"
+Student's Grammar-Corrected Text: "{grammar_corrected_text}"
+"""
+)
+
+
 @phase5_bp.route('/step5/interaction2/evaluate-grammar', methods=['POST'])
 @login_required
 def evaluate_step5_interaction2_grammar():
@@ -2447,39 +2519,9 @@ def evaluate_step5_interaction2_grammar():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's grammar corrections for a crisis communication text.
-        
-        Spelling-Corrected Text: "{spelling_corrected_text}"
-        Student's Grammar-Corrected Text: "{grammar_corrected_text}"
-        
-        Context: The student must correct ONLY grammar errors (subject-verb agreement, articles, prepositions, tense consistency, sentence fragments).
-        
-        Expected Response Examples:
-        - A2 (2 points): "Lights problem. We fix soon. Come festival." → "The lights problem. We fix soon. Come to festival."
-        - B1 (3 points): "Dear guests, lighting problem. We use backup. Festival ok. Thank you." → "Dear guests, there is a lighting problem. We are using backup lights. The festival is ok. Thank you."
-        - B2 (4 points): "Urgent update: Stage lighting failure. Team activating backup. Event continues. Appreciate patience." → "Urgent update: The stage lighting has failed. Our team is activating the backup system. The event will continue. We appreciate your patience."
-        - C1 (5 points): "Immediate notice: Unforeseen technical malfunction affected stage lighting. Contingency protocol initiated. Full restoration expected shortly. Thank for understanding." → "Immediate notice: An unforeseen technical malfunction has affected the stage lighting. The contingency protocol has been initiated. Full restoration is expected shortly. Thank you for your understanding."
-        
-        Requirements:
-        1. Must correct grammar errors only (not spelling - already done)
-        2. Must fix: subject-verb agreement, articles (a/an/the), prepositions, tense consistency, sentence fragments
-        3. Score based on accuracy and completeness of grammar corrections
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "grammar_errors_found": ["error1", "error2"],
-            "grammar_errors_corrected": ["correction1", "correction2"],
-            "missed_errors": ["missed1"],
-            "accuracy_percentage": 0-100
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP5_INTERACTION2_GRAMMAR_PROMPT, spelling_corrected_text=spelling_corrected_text, grammar_corrected_text=grammar_corrected_text)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -2588,6 +2630,50 @@ def track_step5_interaction3():
         }), 500
 
 
+STEP5_INTERACTION3_ENHANCEMENT_PROMPT = prompt_templates.register(
+    'phase5.step5_interaction3_enhancement',
+    complexity='complex',
+    source_field='grammar_corrected_text',
+    system="""
+Evaluate this student's overall enhancement of a crisis communication text.
+
+Context: The student must enhance: coherence/cohesion (connectors), tone (calm, reassuring), vocabulary (upgrade terms), politeness, and overall crisis effectiveness.
+
+Expected Response Examples:
+- A2 (2 points): "Lights problem. We use backup. Festival start soon. Thank you." → "Lights problem. We use backup. Festival start soon. Thank you 😊."
+- B1 (3 points): "Dear guests, there is a lighting problem. We are using backup lights. The festival will start on time. Thank you." → "Dear guests, there is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you very much for your patience."
+- B2 (4 points): "Urgent update: The stage lighting has failed. Our team is activating the backup system. The event will continue. We appreciate your patience." → "Dear festival community, a temporary technical issue has affected the main stage lighting. Our team is swiftly activating the backup system and expects full resolution within 20-30 minutes. The event will proceed as scheduled. We sincerely appreciate your understanding and patience during this short interruption. Thank you - see you soon!"
+- C1 (5 points): "Immediate notice: An unforeseen technical malfunction has affected the stage lighting. The contingency protocol has been initiated. Full restoration is expected shortly. Thank you for your understanding." → "Immediate stakeholder update: An unforeseen technical malfunction has temporarily compromised the main stage lighting system one hour prior to opening. Our response team has promptly engaged the pre-tested contingency protocol, with the backup lighting array now fully deployed-restoration is projected within 20-25 minutes. The festival program remains entirely unchanged, and we remain fully committed to delivering the exceptional experience you expect. We deeply value your patience and continued trust during this brief disruption. Thank you for being part of this celebration of global unity."
+
+Requirements:
+1. Must improve coherence/cohesion (add connectors: "however", "therefore", "meanwhile")
+2. Must improve tone (calm, reassuring, professional vs panic)
+3. Must upgrade vocabulary ("problem" → "technical issue", "fix" → "resolve")
+4. Must add politeness ("We sincerely appreciate...", "Thank you for your patience")
+5. Must improve crisis effectiveness (clear solution, timeline, CTA)
+
+Return JSON with:
+{
+    "score": 2-5,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback",
+    "improvements": {
+        "coherence": true/false,
+        "tone": true/false,
+        "vocabulary": true/false,
+        "politeness": true/false,
+        "effectiveness": true/false
+    },
+    "enhancement_percentage": 0-100
+}
+""",
+    user="""
+Grammar-Corrected Text: "{grammar_corrected_text}"
+Student's Enhanced Text: "{enhanced_text}"
+"""
+)
+
+
 @phase5_bp.route('/step5/interaction3/evaluate-enhancement', methods=['POST'])
 @login_required
 def evaluate_step5_interaction3_enhancement():
@@ -2610,45 +2696,9 @@ def evaluate_step5_interaction3_enhancement():
             }), 400
         
         # AI Evaluation
-        evaluation_prompt = f"""
-        Evaluate this student's overall enhancement of a crisis communication text.
-        
-        Grammar-Corrected Text: "{grammar_corrected_text}"
-        Student's Enhanced Text: "{enhanced_text}"
-        
-        Context: The student must enhance: coherence/cohesion (connectors), tone (calm, reassuring), vocabulary (upgrade terms), politeness, and overall crisis effectiveness.
-        
-        Expected Response Examples:
-        - A2 (2 points): "Lights problem. We use backup. Festival start soon. Thank you." → "Lights problem. We use backup. Festival start soon. Thank you 😊."
-        - B1 (3 points): "Dear guests, there is a lighting problem. We are using backup lights. The festival will start on time. Thank you." → "Dear guests, there is a lighting problem on stage. We are using backup lights now. The festival will start on time. Thank you very much for your patience."
-        - B2 (4 points): "Urgent update: The stage lighting has failed. Our team is activating the backup system. The event will continue. We appreciate your patience." → "Dear festival community, a temporary technical issue has affected the main stage lighting. Our team is swiftly activating the backup system and expects full resolution within 20-30 minutes. The event will proceed as scheduled. We sincerely appreciate your understanding and patience during this short interruption. Thank you - see you soon!"
-        - C1 (5 points): "Immediate notice: An unforeseen technical malfunction has affected the stage lighting. The contingency protocol has been initiated. Full restoration is expected shortly. Thank you for your understanding." → "Immediate stakeholder update: An unforeseen technical malfunction has temporarily compromised the main stage lighting system one hour prior to opening. Our response team has promptly engaged the pre-tested contingency protocol, with the backup lighting array now fully deployed-restoration is projected within 20-25 minutes. The festival program remains entirely unchanged, and we remain fully committed to delivering the exceptional experience you expect. We deeply value your patience and continued trust during this brief disruption. Thank you for being part of this celebration of global unity."
-        
-        Requirements:
-        1. Must improve coherence/cohesion (add connectors: "however", "therefore", "meanwhile")
-        2. Must improve tone (calm, reassuring, professional vs panic)
-        3. Must upgrade vocabulary ("problem" → "technical issue", "fix" → "resolve")
-        4. Must add politeness ("We sincerely appreciate...", "Thank you for your patience")
-        5. Must improve crisis effectiveness (clear solution, timeline, CTA)
-        
-        Return JSON with:
-        {{
-            "score": 2-5,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback",
-            "improvements": {{
-                "coherence": true/false,
-                "tone": true/false,
-                "vocabulary": true/false,
-                "politeness": true/false,
-                "effectiveness": true/false
-            }},
-            "enhancement_percentage": 0-100
-        }}
-        """
         
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(STEP5_INTERACTION3_ENHANCEMENT_PROMPT, grammar_corrected_text=grammar_corrected_text, enhanced_text=enhanced_text)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -2739,27 +2789,20 @@ def calculate_step5_score():
         user_id = session.get('user_id')
         data = request.get_json()
         
-        interaction1_score = data.get('interaction1_score', 0)  # 2-5 (CEFR)
-        interaction2_score = data.get('interaction2_score', 0)  # 2-5 (CEFR)
-        interaction3_score = data.get('interaction3_score', 0)  # 0-1 (game)
-        interaction3_enhancement_score = data.get('interaction3_enhancement_score', 0)  # 2-5 (CEFR)
-        
-        # Main scorer is Interaction 3 enhancement (2-5 points)
-        main_score = interaction3_enhancement_score
-        total_score = interaction1_score + interaction2_score + interaction3_score + interaction3_enhancement_score
-        max_score = 5 + 5 + 1 + 5  # 16 total
-        
-        # Determine remedial level based on main score
-        if main_score == 2:
-            remedial_level = 'A2'
-        elif main_score == 3:
-            remedial_level = 'B1'
-        elif main_score == 4:
-            remedial_level = 'B2'
-        else:  # main_score == 5
-            remedial_level = 'C1'
-        
-        should_proceed = main_score >= 3  # B1 level or higher
+        try:
+            result = scoring_engine.score_step(5, 5, data)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        scores = result['interaction_scores']
+        interaction1_score = scores['interaction1_score']
+        interaction2_score = scores['interaction2_score']
+        interaction3_score = scores['interaction3_score']
+        interaction3_enhancement_score = scores['interaction3_enhancement_score']
+        total_score = result['total_score']
+        max_score = result['max_score']
+        remedial_level = result['remedial_level']
+        should_proceed = result['should_proceed']
         
         logger.info(f"Phase 5 Step 5 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}+{interaction3_enhancement_score}, Total={total_score}, Level={remedial_level}, Proceed={should_proceed}")
         
@@ -2847,16 +2890,9 @@ def calculate_step5_remedial_final_score(level):
         task_scores = data.get('task_scores', {})
         total_score = sum(task_scores.values())
         
-        # Determine max score based on level
-        max_scores = {
-            'A2': 22,  # 8+8+6
-            'B1': 19,  # 4+8+7
-            'B2': 24,  # 4+8+8
-            'C1': 25   # 4+8+6+7
-        }
-        max_score = max_scores.get(level.upper(), 20)
-        threshold = math.ceil(max_score * 0.8)
-        passed = total_score >= threshold
+        # Pass marks come from the scoring rules table
+        result = scoring_engine.score_remedial(5, 5, level, task_scores)
+        max_score, threshold, passed = result['max_score'], result['threshold'], result['passed']
         
         # Update database
         conn = get_db_connection()
@@ -2901,16 +2937,9 @@ def calculate_step4_remedial_final_score(level):
         task_scores = data.get('task_scores', {})
         total_score = sum(task_scores.values())
         
-        # Determine max score based on level
-        max_scores = {
-            'A2': 22,  # 8+8+6
-            'B1': 19,  # 4+8+7
-            'B2': 28,  # 5+8+8+7
-            'C1': 28   # 5+8+6+9
-        }
-        max_score = max_scores.get(level.upper(), 20)
-        threshold = math.ceil(max_score * 0.8)
-        passed = total_score >= threshold
+        # Pass marks come from the scoring rules table
+        result = scoring_engine.score_remedial(5, 4, level, task_scores)
+        max_score, threshold, passed = result['max_score'], result['threshold'], result['passed']
         
         # Update database
         conn = get_db_connection()
@@ -2955,16 +2984,9 @@ def calculate_step3_remedial_final_score(level):
         task_scores = data.get('task_scores', {})
         total_score = sum(task_scores.values())
         
-        # Determine max score based on level
-        max_scores = {
-            'A2': 22,  # 8+8+6
-            'B1': 22,  # 4+8+10
-            'B2': 28,  # 5+8+8+7
-            'C1': 28   # 5+8+6+9
-        }
-        max_score = max_scores.get(level.upper(), 20)
-        threshold = math.ceil(max_score * 0.8)
-        passed = total_score >= threshold
+        # Pass marks come from the scoring rules table
+        result = scoring_engine.score_remedial(5, 3, level, task_scores)
+        max_score, threshold, passed = result['max_score'], result['threshold'], result['passed']
         
         # Update database
         conn = get_db_connection()
@@ -3009,16 +3031,9 @@ def calculate_step2_remedial_final_score(level):
         task_scores = data.get('task_scores', {})
         total_score = sum(task_scores.values())
         
-        # Determine max score based on level
-        max_scores = {
-            'A2': 18,  # 6+6+6
-            'B1': 18,  # 4+6+8
-            'B2': 28,  # 5+8+8+7
-            'C1': 28   # 5+8+6+9
-        }
-        max_score = max_scores.get(level.upper(), 20)
-        threshold = math.ceil(max_score * 0.8)
-        passed = total_score >= threshold
+        # Pass marks come from the scoring rules table
+        result = scoring_engine.score_remedial(5, 2, level, task_scores)
+        max_score, threshold, passed = result['max_score'], result['threshold'], result['passed']
         
         # Update database
         conn = get_db_connection()
@@ -3068,15 +3083,6 @@ def log_step1_remedial():
         max_score = data.get('max_score', 0)
         completed = data.get('completed', False)
         
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 5 STEP {step} - REMEDIAL {level.upper()} - TASK {task}")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Score: {score}/{max_score} points")
-        print(f"Success Rate: {(score/max_score)*100:.1f}%" if max_score > 0 else "N/A")
-        print("="*60 + "\n")
-        
         logger.info(f"Phase 5 Step {step} Remedial {level} Task {task} - User {user_id}: Score={score}/{max_score}, Completed={completed}")
         
         return jsonify({
@@ -3158,16 +3164,6 @@ def calculate_step1_remedial_final_score(level):
         
         passed = total_score >= pass_threshold
         
-        # TERMINAL OUTPUT
-        print("\n" + "="*60)
-        print(f"PHASE 5 STEP 1 - REMEDIAL {level.upper()} - FINAL ASSESSMENT")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"Total Score: {total_score}/{max_score} points")
-        print(f"Pass Threshold: {pass_threshold}/{max_score} (80%)")
-        print(f"Result: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print("="*60 + "\n")
-        
         logger.info(f"Phase 5 Step 1 Remedial {level} Final - User {user_id}: Total={total_score}/{max_score}, Passed={passed}")
         
         return jsonify({
@@ -3229,6 +3225,38 @@ def track_subphase2_step1_interaction1():
         }), 500
 
 
+SUBPHASE2_STEP1_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase5.subphase2_step1_interaction2',
+    system="""
+Evaluate this student's volunteer instructions for welcoming guests at a festival entrance.
+
+Expected vocabulary: please, thank you, first, then, after, careful, help, guide, welcome, queue, safety
+
+Evaluation Criteria:
+- A2 (1 point): Basic instructions with simple polite words (e.g., "Please welcome. Say hello. Thank you.")
+- B1 (2 points): Clear instructions with sequencing and polite language
+- B2 (3 points): Detailed instructions with sequencing, politeness, and clarity
+- C1 (4 points): Sophisticated, professional instructions with advanced sequencing, empathy, and cultural sensitivity
+
+Requirements:
+1. Must include polite language ("please", "thank you")
+2. Must include sequencing words ("first", "then", "next", "after that")
+3. Must be clear and actionable
+
+Return JSON with:
+{
+    "score": 1-4,
+    "level": "A2" | "B1" | "B2" | "C1",
+    "feedback": "Specific feedback on the response",
+    "vocabulary_used": ["list", "of", "terms", "found"],
+    "strengths": ["strength1", "strength2"],
+    "improvements": ["improvement1", "improvement2"]
+}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase5_bp.route('/subphase2/step1/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_subphase2_step1_interaction2():
@@ -3250,37 +3278,8 @@ def evaluate_subphase2_step1_interaction2():
                 'error': 'Response is required'
             }), 400
         
-        evaluation_prompt = f"""
-        Evaluate this student's volunteer instructions for welcoming guests at a festival entrance.
-        
-        Student Response: "{response}"
-        
-        Expected vocabulary: please, thank you, first, then, after, careful, help, guide, welcome, queue, safety
-        
-        Evaluation Criteria:
-        - A2 (1 point): Basic instructions with simple polite words (e.g., "Please welcome. Say hello. Thank you.")
-        - B1 (2 points): Clear instructions with sequencing and polite language
-        - B2 (3 points): Detailed instructions with sequencing, politeness, and clarity
-        - C1 (4 points): Sophisticated, professional instructions with advanced sequencing, empathy, and cultural sensitivity
-        
-        Requirements:
-        1. Must include polite language ("please", "thank you")
-        2. Must include sequencing words ("first", "then", "next", "after that")
-        3. Must be clear and actionable
-        
-        Return JSON with:
-        {{
-            "score": 1-4,
-            "level": "A2" | "B1" | "B2" | "C1",
-            "feedback": "Specific feedback on the response",
-            "vocabulary_used": ["list", "of", "terms", "found"],
-            "strengths": ["strength1", "strength2"],
-            "improvements": ["improvement1", "improvement2"]
-        }}
-        """
-        
         try:
-            ai_response = ai_service.get_ai_response(evaluation_prompt)
+            ai_response = ai_service.complete_template(SUBPHASE2_STEP1_INTERACTION2_PROMPT, response=response)
             import re
             json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
             if json_match:
@@ -4876,7 +4875,7 @@ def check_subphase2_completion():
 # PHASE 5 STEP 1 - SCORE CALCULATION & ROUTING
 # ===================================
 
-@phase5_bp.route('/step/1/calculate-score', methods=['POST'])
+@phase5_bp.route('/step/1/calculate-score', methods=['POST'], endpoint='calculate_step1_total_score')
 @login_required
 def calculate_step1_score():
     """
@@ -4912,19 +4911,25 @@ def calculate_step1_score():
             remedial_level = 'Remedial C1'
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - SCORE CALCULATION & ROUTING (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nInteraction Scores:")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - SCORE CALCULATION & ROUTING (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nInteraction Scores:",
+        )
         for i, score in enumerate(interaction_scores, 1):
-            print(f"  Interaction {i}: {score}")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/21")
-        print("-"*80)
-        print(f"ROUTING DECISION: {remedial_level}")
-        print("  (Based on thresholds: <7=A1, <12=A2, <16=B1, <19=B2, ≥19=C1)")
-        print("="*80 + "\n")
+            banner(logger, f"  Interaction {i}: {score}")
+        banner(
+            logger,
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/21",
+            "-"*80,
+            f"ROUTING DECISION: {remedial_level}",
+            "  (Based on thresholds: <7=A1, <12=A2, <16=B1, <19=B2, ≥19=C1)",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -4972,21 +4977,24 @@ def calculate_step1_a1_final_score():
         next_url = "/app/phase5/step/3" if passed else "/app/phase5/step/1/remedial/a1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - REMEDIAL A1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/8")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/22")
-        print(f"PASS THRESHOLD: 18/22 (~82%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - REMEDIAL A1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/8",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/22",
+            f"PASS THRESHOLD: 18/22 (~82%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -5038,21 +5046,24 @@ def calculate_step1_a2_final_score():
         next_url = "/app/phase5/step/3" if passed else "/app/phase5/step/1/remedial/a2/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - REMEDIAL A2 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/8")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/22")
-        print(f"PASS THRESHOLD: 18/22 (~82%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - REMEDIAL A2 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/8",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/22",
+            f"PASS THRESHOLD: 18/22 (~82%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -5110,27 +5121,30 @@ def calculate_step1_b1_final_score():
         next_url = "/app/phase5/step/3" if passed else "/app/phase5/step/1/remedial/b1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - REMEDIAL B1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nRequired Tasks:")
-        print(f"  Task A: {task_a_score}/5")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print(f"  Task D: {task_d_score}/8")
-        print(f"  Required Subtotal: {required_score}/27")
-        print("\nBonus Tasks:")
-        print(f"  Task E (Bonus): {task_e_score}/6")
-        print(f"  Task F (Bonus): {task_f_score}/6")
-        print(f"  Bonus Subtotal: {bonus_score}/12")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/39 (required: {required_score}/27, bonus: {bonus_score}/12)")
-        print(f"PASS THRESHOLD: 22/27 required (~81%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'} (based on required tasks only)")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - REMEDIAL B1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nRequired Tasks:",
+            f"  Task A: {task_a_score}/5",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            f"  Task D: {task_d_score}/8",
+            f"  Required Subtotal: {required_score}/27",
+            "\nBonus Tasks:",
+            f"  Task E (Bonus): {task_e_score}/6",
+            f"  Task F (Bonus): {task_f_score}/6",
+            f"  Bonus Subtotal: {bonus_score}/12",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/39 (required: {required_score}/27, bonus: {bonus_score}/12)",
+            f"PASS THRESHOLD: 22/27 required (~81%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'} (based on required tasks only)",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -5191,24 +5205,27 @@ def calculate_step1_b2_final_score():
         next_url = "/app/phase5/step/3" if passed else "/app/phase5/step/1/remedial/b2/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - REMEDIAL B2 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/10")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/8")
-        print(f"  Task D: {task_d_score}/6")
-        print(f"  Task E: {task_e_score}/6")
-        print(f"  Task F: {task_f_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/44")
-        print(f"PASS THRESHOLD: 35/44 (~80%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - REMEDIAL B2 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/10",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/8",
+            f"  Task D: {task_d_score}/6",
+            f"  Task E: {task_e_score}/6",
+            f"  Task F: {task_f_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/44",
+            f"PASS THRESHOLD: 35/44 (~80%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -5269,26 +5286,29 @@ def calculate_step1_c1_final_score():
         next_url = "/app/phase5/step/3" if passed else "/app/phase5/step/1/remedial/c1/retry"
 
         # Print detailed terminal output (INTERNAL USE ONLY)
-        print("\n" + "="*80)
-        print("PHASE 5 STEP 1 - REMEDIAL C1 FINAL SCORE (INTERNAL USE ONLY)")
-        print("="*80)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
-        print(f"  Task A: {task_a_score}/10")
-        print(f"  Task B: {task_b_score}/8")
-        print(f"  Task C: {task_c_score}/6")
-        print(f"  Task D: {task_d_score}/6")
-        print(f"  Task E: {task_e_score}/6")
-        print(f"  Task F: {task_f_score}/6")
-        print(f"  Task G: {task_g_score}/6")
-        print(f"  Task H: {task_h_score}/6")
-        print("-"*80)
-        print(f"TOTAL SCORE: {total_score}/54")
-        print(f"PASS THRESHOLD: 43/54 (~80%)")
-        print(f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}")
-        print("-"*80)
-        print(f"ROUTING: {next_url}")
-        print("="*80 + "\n")
+        banner(
+            logger,
+            "\n" + "="*80,
+            "PHASE 5 STEP 1 - REMEDIAL C1 FINAL SCORE (INTERNAL USE ONLY)",
+            "="*80,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+            f"  Task A: {task_a_score}/10",
+            f"  Task B: {task_b_score}/8",
+            f"  Task C: {task_c_score}/6",
+            f"  Task D: {task_d_score}/6",
+            f"  Task E: {task_e_score}/6",
+            f"  Task F: {task_f_score}/6",
+            f"  Task G: {task_g_score}/6",
+            f"  Task H: {task_h_score}/6",
+            "-"*80,
+            f"TOTAL SCORE: {total_score}/54",
+            f"PASS THRESHOLD: 43/54 (~80%)",
+            f"STATUS: {'PASSED ✓' if passed else 'FAILED ✗'}",
+            "-"*80,
+            f"ROUTING: {next_url}",
+            "="*80 + "\n",
+        )
 
         return jsonify({
             'success': True,
@@ -5318,7 +5338,7 @@ def calculate_step1_c1_final_score():
 # PHASE 5 STEP 3 - SCORE CALCULATION & REMEDIAL ENDPOINTS
 # ============================================================
 
-@phase5_bp.route('/step/3/calculate-score', methods=['POST'])
+@phase5_bp.route('/step/3/calculate-score', methods=['POST'], endpoint='calculate_step3_total_score')
 @login_required
 def calculate_step3_score():
     """
@@ -5387,18 +5407,21 @@ def calculate_step3_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 5 STEP 3 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}")
-        print(f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}")
-        print(f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/15")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
+        # DEBUG BANNER - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "🎯 PHASE 5 STEP 3 - SCORE CALCULATION (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}",
+            f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}",
+            f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}",
+            f"📊 Total Score: {total_score}/15",
+            f"📍 Remedial Level: {remedial_level}",
+            f"Route: User must complete {remedial_level}",
+            "="*70 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
@@ -5458,23 +5481,26 @@ def calculate_step3_a1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/4" if passed else "/app/phase5/step/3/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 3 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Term Treasure Hunt):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Fill Quest):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Sentence Builder):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 3 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Term Treasure Hunt):",
+            f"  Score: {task_a_score}/8 points",
+            f"\nTask B (Fill Quest):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Sentence Builder):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/22 points",
+            f"PASS THRESHOLD: 18/22 points (~82%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 Remedial A1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -5523,23 +5549,26 @@ def calculate_step3_a2_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/4" if passed else "/app/phase5/step/3/remedial/a2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 3 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Dialogue Adventure):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Expand Empire):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Connector Quest):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 3 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Dialogue Adventure):",
+            f"  Score: {task_a_score}/8 points",
+            f"\nTask B (Expand Empire):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Connector Quest):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/22 points",
+            f"PASS THRESHOLD: 18/22 points (~82%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 Remedial A2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -5602,28 +5631,31 @@ def calculate_step3_b1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/4" if passed else "/app/phase5/step/3/remedial/b1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 3 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nREQUIRED TASKS:")
-        print(f"  Task A (Negotiation Battle):    {task_a_score}/5 points")
-        print(f"  Task B (Definition Duel):        {task_b_score}/8 points")
-        print(f"  Task C (Wordshake Quiz):         {task_c_score}/6 points")
-        print(f"  Task D (Flashcard Game):         {task_d_score}/8 points")
-        print(f"  Required Tasks Subtotal:         {required_total}/27 points")
-        print(f"\nBONUS TASKS:")
-        print(f"  Task E (Tense Time Travel):      {task_e_score}/6 points")
-        print(f"  Task F (Grammar Kahoot):         {task_f_score}/6 points")
-        print(f"  Bonus Tasks Subtotal:            {bonus_total}/12 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE (Required + Bonus):  {total_score}/39 points")
-        print(f"REQUIRED TASKS SCORE:             {required_total}/27 points")
-        print(f"PASS THRESHOLD:                   22/27 points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 3 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nREQUIRED TASKS:",
+            f"  Task A (Negotiation Battle):    {task_a_score}/5 points",
+            f"  Task B (Definition Duel):        {task_b_score}/8 points",
+            f"  Task C (Wordshake Quiz):         {task_c_score}/6 points",
+            f"  Task D (Flashcard Game):         {task_d_score}/8 points",
+            f"  Required Tasks Subtotal:         {required_total}/27 points",
+            f"\nBONUS TASKS:",
+            f"  Task E (Tense Time Travel):      {task_e_score}/6 points",
+            f"  Task F (Grammar Kahoot):         {task_f_score}/6 points",
+            f"  Bonus Tasks Subtotal:            {bonus_total}/12 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE (Required + Bonus):  {total_score}/39 points",
+            f"REQUIRED TASKS SCORE:             {required_total}/27 points",
+            f"PASS THRESHOLD:                   22/27 points (~81%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 Remedial B1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Required={required_total}, Bonus={bonus_total}, Total={total_score}, Passed={passed}")
 
@@ -5684,23 +5716,26 @@ def calculate_step3_b2_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/4" if passed else "/app/phase5/step/3/remedial/b2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 3 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/10 points")
-        print(f"Task B: {task_b_score}/8 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/6 points")
-        print(f"Task E: {task_e_score}/6 points")
-        print(f"Task F: {task_f_score}/8 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/44 points")
-        print(f"PASS THRESHOLD: 35/44 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 3 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/10 points",
+            f"Task B: {task_b_score}/8 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/6 points",
+            f"Task E: {task_e_score}/6 points",
+            f"Task F: {task_f_score}/8 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/44 points",
+            f"PASS THRESHOLD: 35/44 points (~80%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 Remedial B2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Total={total_score}, Passed={passed}")
 
@@ -5759,25 +5794,28 @@ def calculate_step3_c1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/4" if passed else "/app/phase5/step/3/remedial/c1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 3 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/10 points")
-        print(f"Task B: {task_b_score}/8 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/6 points")
-        print(f"Task E: {task_e_score}/6 points")
-        print(f"Task F: {task_f_score}/6 points")
-        print(f"Task G: {task_g_score}/6 points")
-        print(f"Task H: {task_h_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/54 points")
-        print(f"PASS THRESHOLD: 43/54 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 3 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/10 points",
+            f"Task B: {task_b_score}/8 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/6 points",
+            f"Task E: {task_e_score}/6 points",
+            f"Task F: {task_f_score}/6 points",
+            f"Task G: {task_g_score}/6 points",
+            f"Task H: {task_h_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/54 points",
+            f"PASS THRESHOLD: 43/54 points (~80%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 3 Remedial C1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, TaskG={task_g_score}, TaskH={task_h_score}, Total={total_score}, Passed={passed}")
 
@@ -5812,7 +5850,7 @@ def calculate_step3_c1_final_score():
 # PHASE 5 STEP 4 - SCORE CALCULATION & REMEDIAL ENDPOINTS
 # ============================================================
 
-@phase5_bp.route('/step/4/calculate-score', methods=['POST'])
+@phase5_bp.route('/step/4/calculate-score', methods=['POST'], endpoint='calculate_step4_total_score')
 @login_required
 def calculate_step4_score():
     """
@@ -5881,18 +5919,21 @@ def calculate_step4_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 5 STEP 4 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}")
-        print(f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}")
-        print(f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/15")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
+        # DEBUG BANNER - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "🎯 PHASE 5 STEP 4 - SCORE CALCULATION (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}",
+            f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}",
+            f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}",
+            f"📊 Total Score: {total_score}/15",
+            f"📍 Remedial Level: {remedial_level}",
+            f"Route: User must complete {remedial_level}",
+            "="*70 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
@@ -5952,23 +5993,26 @@ def calculate_step4_a1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/5" if passed else "/app/phase5/step/4/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 4 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Term Treasure Hunt):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Fill Quest):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Sentence Builder):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 4 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Term Treasure Hunt):",
+            f"  Score: {task_a_score}/8 points",
+            f"\nTask B (Fill Quest):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Sentence Builder):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/22 points",
+            f"PASS THRESHOLD: 18/22 points (~82%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 Remedial A1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -6017,23 +6061,26 @@ def calculate_step4_a2_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/5" if passed else "/app/phase5/step/4/remedial/a2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 4 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Dialogue Adventure):")
-        print(f"  Score: {task_a_score}/7 points")
-        print(f"\nTask B (Expand Empire):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Connector Quest):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/21 points")
-        print(f"PASS THRESHOLD: 18/21 points (~86%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 4 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Dialogue Adventure):",
+            f"  Score: {task_a_score}/7 points",
+            f"\nTask B (Expand Empire):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Connector Quest):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/21 points",
+            f"PASS THRESHOLD: 18/21 points (~86%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 Remedial A2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -6096,28 +6143,31 @@ def calculate_step4_b1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/5" if passed else "/app/phase5/step/4/remedial/b1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 4 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nREQUIRED TASKS:")
-        print(f"  Task A (Negotiation Battle):    {task_a_score}/5 points")
-        print(f"  Task B (Definition Duel):        {task_b_score}/7 points")
-        print(f"  Task C (Wordshake Quiz):         {task_c_score}/6 points")
-        print(f"  Task D (Flashcard Game):         {task_d_score}/8 points")
-        print(f"  Required Tasks Subtotal:         {required_total}/26 points")
-        print(f"\nBONUS TASKS:")
-        print(f"  Task E (Tense Time Travel):      {task_e_score}/6 points")
-        print(f"  Task F (Grammar Kahoot):         {task_f_score}/6 points")
-        print(f"  Bonus Tasks Subtotal:            {bonus_total}/12 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE (Required + Bonus):  {total_score}/38 points")
-        print(f"REQUIRED TASKS SCORE:             {required_total}/26 points")
-        print(f"PASS THRESHOLD:                   22/26 points (~85%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 4 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nREQUIRED TASKS:",
+            f"  Task A (Negotiation Battle):    {task_a_score}/5 points",
+            f"  Task B (Definition Duel):        {task_b_score}/7 points",
+            f"  Task C (Wordshake Quiz):         {task_c_score}/6 points",
+            f"  Task D (Flashcard Game):         {task_d_score}/8 points",
+            f"  Required Tasks Subtotal:         {required_total}/26 points",
+            f"\nBONUS TASKS:",
+            f"  Task E (Tense Time Travel):      {task_e_score}/6 points",
+            f"  Task F (Grammar Kahoot):         {task_f_score}/6 points",
+            f"  Bonus Tasks Subtotal:            {bonus_total}/12 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE (Required + Bonus):  {total_score}/38 points",
+            f"REQUIRED TASKS SCORE:             {required_total}/26 points",
+            f"PASS THRESHOLD:                   22/26 points (~85%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 Remedial B1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Required={required_total}, Bonus={bonus_total}, Total={total_score}, Passed={passed}")
 
@@ -6176,22 +6226,25 @@ def calculate_step4_b2_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/5" if passed else "/app/phase5/step/4/remedial/b2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 4 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/8 points")
-        print(f"Task B: {task_b_score}/6 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/6 points")
-        print(f"Task E: {task_e_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/32 points")
-        print(f"PASS THRESHOLD: 26/32 points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 4 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/8 points",
+            f"Task B: {task_b_score}/6 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/6 points",
+            f"Task E: {task_e_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/32 points",
+            f"PASS THRESHOLD: 26/32 points (~81%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 Remedial B2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, Total={total_score}, Passed={passed}")
 
@@ -6244,21 +6297,24 @@ def calculate_step4_c1_final_score():
         # Determine next URL
         next_url = "/app/phase5/step/5" if passed else "/app/phase5/step/4/remedial/c1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 4 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/6 points")
-        print(f"Task B: {task_b_score}/6 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/8 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/26 points")
-        print(f"PASS THRESHOLD: 21/26 points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 4 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/6 points",
+            f"Task B: {task_b_score}/6 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/8 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/26 points",
+            f"PASS THRESHOLD: 21/26 points (~81%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 4 Remedial C1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, Total={total_score}, Passed={passed}")
 
@@ -6289,7 +6345,7 @@ def calculate_step4_c1_final_score():
 # PHASE 5 STEP 5 - SCORE CALCULATION & REMEDIAL ENDPOINTS
 # ============================================================
 
-@phase5_bp.route('/step/5/calculate-score', methods=['POST'])
+@phase5_bp.route('/step/5/calculate-score', methods=['POST'], endpoint='calculate_step5_total_score')
 @login_required
 def calculate_step5_score():
     """
@@ -6358,18 +6414,21 @@ def calculate_step5_score():
         # All users must complete remedial (no direct proceed)
         should_proceed = False
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("🎯 PHASE 5 STEP 5 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}")
-        print(f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}")
-        print(f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}")
-        print(f"📊 Total Score: {total_score}/15")
-        print(f"📍 Remedial Level: {remedial_level}")
-        print(f"Route: User must complete {remedial_level}")
-        print("="*70 + "\n")
+        # DEBUG BANNER - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "🎯 PHASE 5 STEP 5 - SCORE CALCULATION (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            f"Interaction 1: {interaction1_score}/5 → Level: {interaction1_level}",
+            f"Interaction 2: {interaction2_score}/5 → Level: {interaction2_level}",
+            f"Interaction 3: {interaction3_score}/5 → Level: {interaction3_level}",
+            f"📊 Total Score: {total_score}/15",
+            f"📍 Remedial Level: {remedial_level}",
+            f"Route: User must complete {remedial_level}",
+            "="*70 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 scoring - User {user_id}: I1={interaction1_score}, I2={interaction2_score}, I3={interaction3_score}, Total={total_score}, Level={remedial_level}")
 
@@ -6429,23 +6488,26 @@ def calculate_step5_a1_final_score():
         # Determine next URL
         next_url = "/app/phase5_2" if passed else "/app/phase5/step/5/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 5 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Term Treasure Hunt):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Fill Quest):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Sentence Builder):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 17/22 points (~77%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 5 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Term Treasure Hunt):",
+            f"  Score: {task_a_score}/8 points",
+            f"\nTask B (Fill Quest):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Sentence Builder):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/22 points",
+            f"PASS THRESHOLD: 17/22 points (~77%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 Remedial A1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -6494,23 +6556,26 @@ def calculate_step5_a2_final_score():
         # Determine next URL
         next_url = "/app/phase5_2" if passed else "/app/phase5/step/5/remedial/a2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 5 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A (Dialogue Adventure):")
-        print(f"  Score: {task_a_score}/8 points")
-        print(f"\nTask B (Expand Empire):")
-        print(f"  Score: {task_b_score}/8 points")
-        print(f"\nTask C (Connector Quest):")
-        print(f"  Score: {task_c_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/22 points")
-        print(f"PASS THRESHOLD: 18/22 points (~82%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 5 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A (Dialogue Adventure):",
+            f"  Score: {task_a_score}/8 points",
+            f"\nTask B (Expand Empire):",
+            f"  Score: {task_b_score}/8 points",
+            f"\nTask C (Connector Quest):",
+            f"  Score: {task_c_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/22 points",
+            f"PASS THRESHOLD: 18/22 points (~82%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 Remedial A2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, Total={total_score}, Passed={passed}")
 
@@ -6573,28 +6638,31 @@ def calculate_step5_b1_final_score():
         # Determine next URL
         next_url = "/app/phase5_2" if passed else "/app/phase5/step/5/remedial/b1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 5 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nREQUIRED TASKS:")
-        print(f"  Task A (Negotiation Battle):    {task_a_score}/5 points")
-        print(f"  Task B (Definition Duel):        {task_b_score}/8 points")
-        print(f"  Task C (Wordshake Quiz):         {task_c_score}/6 points")
-        print(f"  Task D (Flashcard Game):         {task_d_score}/8 points")
-        print(f"  Required Tasks Subtotal:         {required_total}/27 points")
-        print(f"\nBONUS TASKS:")
-        print(f"  Task E (Tense Time Travel):      {task_e_score}/6 points")
-        print(f"  Task F (Grammar Kahoot):         {task_f_score}/6 points")
-        print(f"  Bonus Tasks Subtotal:            {bonus_total}/12 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE (Required + Bonus):  {total_score}/39 points")
-        print(f"REQUIRED TASKS SCORE:             {required_total}/27 points")
-        print(f"PASS THRESHOLD:                   22/27 points (~81%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 5 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nREQUIRED TASKS:",
+            f"  Task A (Negotiation Battle):    {task_a_score}/5 points",
+            f"  Task B (Definition Duel):        {task_b_score}/8 points",
+            f"  Task C (Wordshake Quiz):         {task_c_score}/6 points",
+            f"  Task D (Flashcard Game):         {task_d_score}/8 points",
+            f"  Required Tasks Subtotal:         {required_total}/27 points",
+            f"\nBONUS TASKS:",
+            f"  Task E (Tense Time Travel):      {task_e_score}/6 points",
+            f"  Task F (Grammar Kahoot):         {task_f_score}/6 points",
+            f"  Bonus Tasks Subtotal:            {bonus_total}/12 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE (Required + Bonus):  {total_score}/39 points",
+            f"REQUIRED TASKS SCORE:             {required_total}/27 points",
+            f"PASS THRESHOLD:                   22/27 points (~81%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 Remedial B1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Required={required_total}, Bonus={bonus_total}, Total={total_score}, Passed={passed}")
 
@@ -6655,23 +6723,26 @@ def calculate_step5_b2_final_score():
         # Determine next URL
         next_url = "/app/phase5_2" if passed else "/app/phase5/step/5/remedial/b2/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 5 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/10 points")
-        print(f"Task B: {task_b_score}/8 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/6 points")
-        print(f"Task E: {task_e_score}/6 points")
-        print(f"Task F: {task_f_score}/8 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/44 points")
-        print(f"PASS THRESHOLD: 35/44 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 5 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/10 points",
+            f"Task B: {task_b_score}/8 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/6 points",
+            f"Task E: {task_e_score}/6 points",
+            f"Task F: {task_f_score}/8 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/44 points",
+            f"PASS THRESHOLD: 35/44 points (~80%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 Remedial B2 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, Total={total_score}, Passed={passed}")
 
@@ -6730,25 +6801,28 @@ def calculate_step5_c1_final_score():
         # Determine next URL
         next_url = "/app/phase5_2" if passed else "/app/phase5/step/5/remedial/c1/retry"
 
-        # TERMINAL OUTPUT - Detailed logging (INTERNAL USE ONLY)
-        print("\n" + "="*60)
-        print("PHASE 5 STEP 5 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*60)
-        print(f"User ID: {user_id}")
-        print(f"\nTask A: {task_a_score}/10 points")
-        print(f"Task B: {task_b_score}/8 points")
-        print(f"Task C: {task_c_score}/6 points")
-        print(f"Task D: {task_d_score}/6 points")
-        print(f"Task E: {task_e_score}/6 points")
-        print(f"Task F: {task_f_score}/6 points")
-        print(f"Task G: {task_g_score}/6 points")
-        print(f"Task H: {task_h_score}/6 points")
-        print(f"\n" + "-"*60)
-        print(f"TOTAL SCORE: {total_score}/54 points")
-        print(f"PASS THRESHOLD: 43/54 points (~80%)")
-        print(f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*60 + "\n")
+        # DEBUG BANNER - Detailed logging (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*60,
+            "PHASE 5 STEP 5 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*60,
+            f"User ID: {user_id}",
+            f"\nTask A: {task_a_score}/10 points",
+            f"Task B: {task_b_score}/8 points",
+            f"Task C: {task_c_score}/6 points",
+            f"Task D: {task_d_score}/6 points",
+            f"Task E: {task_e_score}/6 points",
+            f"Task F: {task_f_score}/6 points",
+            f"Task G: {task_g_score}/6 points",
+            f"Task H: {task_h_score}/6 points",
+            f"\n" + "-"*60,
+            f"TOTAL SCORE: {total_score}/54 points",
+            f"PASS THRESHOLD: 43/54 points (~80%)",
+            f"RESULT: {'✅ PASSED' if passed else '❌ FAILED - RETRY REQUIRED'}",
+            f"NEXT URL: {next_url}",
+            "="*60 + "\n",
+        )
 
         logging.info(f"Phase 5 Step 5 Remedial C1 Final - User {user_id}: TaskA={task_a_score}, TaskB={task_b_score}, TaskC={task_c_score}, TaskD={task_d_score}, TaskE={task_e_score}, TaskF={task_f_score}, TaskG={task_g_score}, TaskH={task_h_score}, Total={total_score}, Passed={passed}")
 
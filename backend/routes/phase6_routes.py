@@ -6,18 +6,18 @@ Sub-phase 6.2: Peer Feedback Discussion
 
 from flask import Blueprint, request, jsonify, session
 from routes.auth_routes import login_required
-from services.ai_service import AIService
+from services import registry, prompt_templates, scoring_engine
+from utils.structured_logging import banner
 import json
 import logging
 import sqlite3
 import re
-import math
 
 # Create blueprint
 phase6_bp = Blueprint('phase6', __name__, url_prefix='/api/phase6')
 
 logger = logging.getLogger(__name__)
-ai_service = AIService()
+ai_service = registry.lazy('ai')
 
 # Phase 6 vocabulary
 VOCAB_61 = ['success', 'challenge', 'feedback', 'improve', 'achievement',
@@ -93,26 +93,33 @@ def _build_game_track_response(user_id, step, interaction, subphase, data, min_t
 
 def _build_score_response(user_id, step, subphase, interaction1_score, interaction2_score, interaction3_score):
     """Build standard calculate-score response"""
-    total_score = interaction1_score + interaction2_score + interaction3_score
-    level_map = {1: 'A1', 2: 'A2', 3: 'B1', 4: 'B2', 5: 'C1'}
-    remedial_level = level_map.get(interaction2_score, 'A2')
-    should_proceed = interaction2_score >= 3
-
-    print(f"\n{'='*60}")
-    print(f"PHASE 6 SP{subphase} STEP {step} - SCORING")
-    print(f"User: {user_id}  I1={interaction1_score} I2={interaction2_score} I3={interaction3_score}")
-    print(f"Total={total_score}/7  Level={remedial_level}  Proceed={should_proceed}")
-    print(f"{'='*60}\n")
+    try:
+        result = scoring_engine.score_step(6, step, {
+            'interaction1_score': interaction1_score,
+            'interaction2_score': interaction2_score,
+            'interaction3_score': interaction3_score
+        }, subphase=subphase)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    remedial_level = result['remedial_level']
+    max_scores = result['max_scores']
+    logger.info(f"Phase 6 SP{subphase} Step {step} scoring - User {user_id}: "
+                f"I1={interaction1_score} I2={interaction2_score} I3={interaction3_score} "
+                f"Total={result['total_score']}/{result['max_score']} Level={remedial_level} "
+                f"Proceed={result['should_proceed']}")
 
     return jsonify({'success': True, 'data': {
-        'interaction1': {'score': interaction1_score, 'max_score': 1, 'type': 'completion'},
-        'interaction2': {'score': interaction2_score, 'max_score': 5, 'level': remedial_level},
-        'interaction3': {'score': interaction3_score, 'max_score': 1, 'type': 'completion'},
+        'interaction1': {'score': interaction1_score, 'max_score': max_scores['interaction1_score'],
+                         'type': 'completion' if max_scores['interaction1_score'] == 1 else 'rubric'},
+        'interaction2': {'score': interaction2_score, 'max_score': max_scores['interaction2_score'], 'level': remedial_level},
+        'interaction3': {'score': interaction3_score, 'max_score': max_scores['interaction3_score'],
+                         'type': 'completion' if max_scores['interaction3_score'] == 1 else 'rubric'},
         'total': {
-            'score': total_score,
-            'max_score': 7,
+            'score': result['total_score'],
+            'max_score': result['max_score'],
             'remedial_level': remedial_level,
-            'should_proceed': should_proceed
+            'should_proceed': result['should_proceed']
         }
     }})
 
@@ -128,28 +135,27 @@ def _build_remedial_log_response(data):
     }})
 
 
-def _build_final_score_response(level, task_scores):
+def _build_final_score_response(level, task_scores, step=1, subphase=1):
     """Build standard remedial final score response"""
-    total = sum(task_scores.values())
-    level_max = {'A2': 24, 'B1': 24, 'B2': 32, 'C1': 32}
-    max_score = level_max.get(level.upper(), 24)
-    pass_threshold = math.ceil(max_score * 0.8)
-    passed = total >= pass_threshold
+    try:
+        result = scoring_engine.score_remedial(6, step, level, task_scores, subphase=subphase)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
 
     return jsonify({'success': True, 'data': {
         'level': level,
-        'total_score': total,
-        'max_score': max_score,
-        'pass_threshold': pass_threshold,
-        'passed': passed,
+        'total_score': result['total_score'],
+        'max_score': result['max_score'],
+        'pass_threshold': result['threshold'],
+        'passed': result['passed'],
         'task_scores': task_scores
     }})
 
 
-def _ai_evaluate(prompt, fallback_fn, response_text):
-    """Run AI evaluation with fallback"""
+def _ai_evaluate(template, fallback_fn, response_text, **fields):
+    """Run AI evaluation of a compiled prompt template with fallback"""
     try:
-        ai_resp = ai_service.get_ai_response(prompt)
+        ai_resp = ai_service.complete_template(template, **fields)
         match = re.search(r'\{.*\}', ai_resp, re.DOTALL)
         if match:
             return json.loads(match.group())
@@ -175,6 +181,27 @@ def track_61_step1_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP1_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.61_step1_interaction2',
+    system="""
+Evaluate this student's festival reflection for CEFR level.
+
+Context: Student reflects on the Global Cultures Festival: a success and a challenge (past tense).
+Target vocabulary: success, challenge, feedback, improve, achievement, strength, weakness
+
+Scoring:
+- A2 (2 pts): Very simple past tense sentences, 1+ vocabulary term
+- B1 (3 pts): 3-5 sentences with past tense, basic connectors, 1-2 vocabulary terms
+- B2 (4 pts): Detailed reflection with reasons ("because/however"), 2+ vocabulary terms
+- C1 (5 pts): Sophisticated reflection with advanced analysis, 3+ vocabulary terms
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/step1/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_61_step1_interaction2():
@@ -190,27 +217,10 @@ def evaluate_61_step1_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's festival reflection for CEFR level.
-
-Student Response: "{response}"
-
-Context: Student reflects on the Global Cultures Festival: a success and a challenge (past tense).
-Target vocabulary: success, challenge, feedback, improve, achievement, strength, weakness
-
-Scoring:
-- A2 (2 pts): Very simple past tense sentences, 1+ vocabulary term
-- B1 (3 pts): 3-5 sentences with past tense, basic connectors, 1-2 vocabulary terms
-- B2 (4 pts): Detailed reflection with reasons ("because/however"), 2+ vocabulary terms
-- C1 (5 pts): Sophisticated reflection with advanced analysis, 3+ vocabulary terms
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_61)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP1_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 1 I2 - User {user_id}: Score={score}, Level={level}")
@@ -272,7 +282,7 @@ def final_score_61_step1(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=1)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -293,6 +303,27 @@ def track_61_step2_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP2_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.61_step2_interaction2',
+    system="""
+Evaluate this student's explanation of their writing choices for a post-event report summary.
+
+Context: Student explains why they organised their summary a certain way (successes first/challenges/recommendations).
+Target vocabulary: success, challenge, feedback, positive, recommend, evidence, summary
+
+Scoring:
+- A2 (2 pts): Very simple reason ("because good")
+- B1 (3 pts): Simple reason with connector ("I wrote successes first because helpful")
+- B2 (4 pts): Clear reasoning with report purpose ("balance/credibility/honest")
+- C1 (5 pts): Sophisticated meta-reasoning about professional reporting standards
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/step2/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_61_step2_interaction2():
@@ -307,27 +338,10 @@ def evaluate_61_step2_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's explanation of their writing choices for a post-event report summary.
-
-Student Response: "{response}"
-
-Context: Student explains why they organised their summary a certain way (successes first/challenges/recommendations).
-Target vocabulary: success, challenge, feedback, positive, recommend, evidence, summary
-
-Scoring:
-- A2 (2 pts): Very simple reason ("because good")
-- B1 (3 pts): Simple reason with connector ("I wrote successes first because helpful")
-- B2 (4 pts): Clear reasoning with report purpose ("balance/credibility/honest")
-- C1 (5 pts): Sophisticated meta-reasoning about professional reporting standards
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_61)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP2_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 2 I2 - User {user_id}: Score={score}, Level={level}")
@@ -389,7 +403,7 @@ def final_score_61_step2(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -410,6 +424,27 @@ def track_61_step3_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP3_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.61_step3_interaction2',
+    system="""
+Evaluate this student's explanation of why a balanced post-event report includes both strengths and weaknesses.
+
+Context: Student explains why including both successes and challenges builds credibility/trust.
+Target vocabulary: strength, weakness, honest, credibility, trust, improve, balance, transparency
+
+Scoring:
+- A2 (2 pts): Simple reason ("honest good")
+- B1 (3 pts): Basic reason with connector ("because it shows honesty")
+- B2 (4 pts): Clear explanation referencing credibility/trust/improvement
+- C1 (5 pts): Sophisticated analysis of transparency, accountability, stakeholder trust
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/step3/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_61_step3_interaction2():
@@ -424,27 +459,10 @@ def evaluate_61_step3_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's explanation of why a balanced post-event report includes both strengths and weaknesses.
-
-Student Response: "{response}"
-
-Context: Student explains why including both successes and challenges builds credibility/trust.
-Target vocabulary: strength, weakness, honest, credibility, trust, improve, balance, transparency
-
-Scoring:
-- A2 (2 pts): Simple reason ("honest good")
-- B1 (3 pts): Basic reason with connector ("because it shows honesty")
-- B2 (4 pts): Clear explanation referencing credibility/trust/improvement
-- C1 (5 pts): Sophisticated analysis of transparency, accountability, stakeholder trust
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_61)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP3_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 3 I2 - User {user_id}: Score={score}, Level={level}")
@@ -506,7 +524,7 @@ def final_score_61_step3(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=3)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -527,6 +545,28 @@ def track_61_step4_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP4_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.61_step4_interaction2',
+    complexity='complex', band='C1',
+    system="""
+Evaluate this student's 'Successes & Challenges' section of a post-event report.
+
+Context: Student writes a structured report section describing 3 successes and 2-3 challenges
+from the Global Cultures Festival, with how challenges were handled.
+
+Scoring:
+- A2 (2 pts): Very simple list of successes/challenges, basic past tense
+- B1 (3 pts): 4-6 sentences covering successes, at least 1 challenge with solution
+- B2 (4 pts): 6-10 structured sentences, balanced evaluation, past tense, basic connectors
+- C1 (5 pts): Sophisticated section with evidence (numbers/quotes), advanced connectors, formal tone
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/step4/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_61_step4_interaction2():
@@ -541,27 +581,10 @@ def evaluate_61_step4_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's 'Successes & Challenges' section of a post-event report.
-
-Student Response: "{response}"
-
-Context: Student writes a structured report section describing 3 successes and 2-3 challenges
-from the Global Cultures Festival, with how challenges were handled.
-
-Scoring:
-- A2 (2 pts): Very simple list of successes/challenges, basic past tense
-- B1 (3 pts): 4-6 sentences covering successes, at least 1 challenge with solution
-- B2 (4 pts): 6-10 structured sentences, balanced evaluation, past tense, basic connectors
-- C1 (5 pts): Sophisticated section with evidence (numbers/quotes), advanced connectors, formal tone
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_61)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP4_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 4 I2 - User {user_id}: Score={score}, Level={level}")
@@ -623,7 +646,7 @@ def final_score_61_step4(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=4)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -632,6 +655,32 @@ def final_score_61_step4(level):
 # SUBPHASE 6.1 - STEP 5: EVALUATE
 # ============================================================
 
+SUBPHASE_61_STEP5_INTERACTION1_PROMPT = prompt_templates.register(
+    'phase6.61_step5_interaction1',
+    complexity='simple',
+    source_field='original_text',
+    system="""
+Evaluate this student's spelling corrections in a post-event report excerpt.
+
+Scoring based on accuracy of spelling fixes:
+- A2 (2 pts): Fixed 1-2 basic spelling errors
+- B1 (3 pts): Fixed 3-4 spelling errors correctly
+- B2 (4 pts): Fixed 5-6 spelling errors with attention to detail
+- C1 (5 pts): Fixed all spelling errors perfectly, no over-corrections
+
+Common errors to look for: succes→success, challange→challenge, feedbak→feedback,
+recomend→recommend, sumary→summary, achievment→achievement, evidance→evidence
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"corrections_found": [...], "strengths": [...], "improvements": [...]}
+""",
+    user="""
+Original (with errors): "{original_text}"
+Student Corrections: "{corrected_text}"
+"""
+)
+
+
 @phase6_bp.route('/step5/interaction1/evaluate-spelling', methods=['POST'])
 @login_required
 def evaluate_61_step5_interaction1():
@@ -647,24 +696,6 @@ def evaluate_61_step5_interaction1():
         if not corrected_text:
             return jsonify({'success': False, 'error': 'Corrected text is required'}), 400
 
-        prompt = f"""
-Evaluate this student's spelling corrections in a post-event report excerpt.
-
-Original (with errors): "{original_text}"
-Student Corrections: "{corrected_text}"
-
-Scoring based on accuracy of spelling fixes:
-- A2 (2 pts): Fixed 1-2 basic spelling errors
-- B1 (3 pts): Fixed 3-4 spelling errors correctly
-- B2 (4 pts): Fixed 5-6 spelling errors with attention to detail
-- C1 (5 pts): Fixed all spelling errors perfectly, no over-corrections
-
-Common errors to look for: succes→success, challange→challenge, feedbak→feedback,
-recomend→recommend, sumary→summary, achievment→achievement, evidance→evidence
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"corrections_found": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             # Simple heuristic: count fixed errors
             import re as re_mod
@@ -678,7 +709,7 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
                     'feedback': f'You fixed {fixed} spelling errors — {level} level.',
                     'corrections_found': [], 'strengths': [], 'improvements': []}
 
-        evaluation = _ai_evaluate(prompt, fallback, corrected_text)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP5_INTERACTION1_PROMPT, fallback, corrected_text, original_text=original_text, corrected_text=corrected_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 5 I1 - User {user_id}: Score={score}, Level={level}")
@@ -695,6 +726,28 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP5_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.61_step5_interaction2',
+    source_field='original_text',
+    system="""
+Evaluate this student's grammar/tense corrections in a post-event report.
+
+Scoring based on grammar fix accuracy:
+- A2 (2 pts): Fixed basic article/subject-verb errors
+- B1 (3 pts): Correct past tense, fixed fragments
+- B2 (4 pts): Consistent past tense, correct articles, proper sentence structure
+- C1 (5 pts): Perfect grammar, formal register, all tense issues resolved
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"strengths": [...], "improvements": [...]}
+""",
+    user="""
+Original (with grammar errors): "{original_text}"
+Student Grammar Corrections: "{corrected_text}"
+"""
+)
+
+
 @phase6_bp.route('/step5/interaction2/evaluate-grammar', methods=['POST'])
 @login_required
 def evaluate_61_step5_interaction2():
@@ -710,21 +763,6 @@ def evaluate_61_step5_interaction2():
         if not corrected_text:
             return jsonify({'success': False, 'error': 'Corrected text is required'}), 400
 
-        prompt = f"""
-Evaluate this student's grammar/tense corrections in a post-event report.
-
-Original (with grammar errors): "{original_text}"
-Student Grammar Corrections: "{corrected_text}"
-
-Scoring based on grammar fix accuracy:
-- A2 (2 pts): Fixed basic article/subject-verb errors
-- B1 (3 pts): Correct past tense, fixed fragments
-- B2 (4 pts): Consistent past tense, correct articles, proper sentence structure
-- C1 (5 pts): Perfect grammar, formal register, all tense issues resolved
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             word_count = len(r.split())
             has_past = any(w in r.lower() for w in ['was', 'were', 'came', 'had', 'took', 'fixed'])
@@ -736,7 +774,7 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
                     'feedback': f'Grammar correction at {level} level.',
                     'strengths': [], 'improvements': []}
 
-        evaluation = _ai_evaluate(prompt, fallback, corrected_text)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP5_INTERACTION2_PROMPT, fallback, corrected_text, original_text=original_text, corrected_text=corrected_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 5 I2 - User {user_id}: Score={score}, Level={level}")
@@ -752,6 +790,32 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_61_STEP5_INTERACTION3_PROMPT = prompt_templates.register(
+    'phase6.61_step5_interaction3',
+    complexity='complex', band='C1',
+    source_field='grammar_corrected_text',
+    system="""
+Evaluate the quality of this enhanced post-event report compared to its grammar-corrected version.
+
+Assess improvements in: coherence, tone/formality, balance (positive+negative), evidence (numbers/quotes),
+vocabulary precision, recommendations quality.
+
+Scoring:
+- A2 (2 pts): Minor improvement, mostly same content
+- B1 (3 pts): Improved formality/vocabulary, added one new element
+- B2 (4 pts): Balanced, formal, added connectors and some evidence
+- C1 (5 pts): Sophisticated enhancement with evidence, formal tone, specific actionable recommendations
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"improvements_made": [...], "strengths": [...], "suggestions": [...]}
+""",
+    user="""
+Grammar-corrected: "{grammar_corrected_text}"
+Enhanced version: "{enhanced_text}"
+"""
+)
+
+
 @phase6_bp.route('/step5/interaction3/evaluate-enhancement', methods=['POST'])
 @login_required
 def evaluate_61_step5_interaction3():
@@ -767,28 +831,10 @@ def evaluate_61_step5_interaction3():
         if not enhanced_text:
             return jsonify({'success': False, 'error': 'Enhanced text is required'}), 400
 
-        prompt = f"""
-Evaluate the quality of this enhanced post-event report compared to its grammar-corrected version.
-
-Grammar-corrected: "{grammar_corrected_text}"
-Enhanced version: "{enhanced_text}"
-
-Assess improvements in: coherence, tone/formality, balance (positive+negative), evidence (numbers/quotes),
-vocabulary precision, recommendations quality.
-
-Scoring:
-- A2 (2 pts): Minor improvement, mostly same content
-- B1 (3 pts): Improved formality/vocabulary, added one new element
-- B2 (4 pts): Balanced, formal, added connectors and some evidence
-- C1 (5 pts): Sophisticated enhancement with evidence, formal tone, specific actionable recommendations
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"improvements_made": [...], "strengths": [...], "suggestions": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_61)
 
-        evaluation = _ai_evaluate(prompt, fallback, enhanced_text)
+        evaluation = _ai_evaluate(SUBPHASE_61_STEP5_INTERACTION3_PROMPT, fallback, enhanced_text, grammar_corrected_text=grammar_corrected_text, enhanced_text=enhanced_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.1 Step 5 I3 - User {user_id}: Score={score}, Level={level}")
@@ -838,7 +884,7 @@ def final_score_61_step5(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=5)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -935,6 +981,27 @@ def track_62_step1_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP1_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.62_step1_interaction2',
+    system="""
+Evaluate this student's personal experience with receiving or giving feedback.
+
+Context: Student shares a past experience with feedback (school/project/life).
+Target vocabulary: feedback, positive, suggestion, improve, helpful, polite, listen
+
+Scoring:
+- A2 (2 pts): Very simple past sentences ("Teacher say better. I happy.")
+- B1 (3 pts): 3-4 sentences with past tense, basic reasons ("because helpful")
+- B2 (4 pts): Detailed experience with feelings and impact, connectors
+- C1 (5 pts): Sophisticated reflection on feedback quality, critical analysis
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/subphase2/step1/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step1_interaction2():
@@ -949,27 +1016,10 @@ def evaluate_62_step1_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's personal experience with receiving or giving feedback.
-
-Student Response: "{response}"
-
-Context: Student shares a past experience with feedback (school/project/life).
-Target vocabulary: feedback, positive, suggestion, improve, helpful, polite, listen
-
-Scoring:
-- A2 (2 pts): Very simple past sentences ("Teacher say better. I happy.")
-- B1 (3 pts): 3-4 sentences with past tense, basic reasons ("because helpful")
-- B2 (4 pts): Detailed experience with feelings and impact, connectors
-- C1 (5 pts): Sophisticated reflection on feedback quality, critical analysis
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_62)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP1_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 1 I2 - User {user_id}: Score={score}, Level={level}")
@@ -1031,7 +1081,7 @@ def final_score_62_step1(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=1, subphase=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1052,6 +1102,27 @@ def track_62_step2_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP2_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.62_step2_interaction2',
+    system="""
+Evaluate this student's explanation of why they wrote feedback a certain way.
+
+Context: Student explains feedback writing choices (starting positive, using suggestions, etc.)
+Target vocabulary: positive, suggestion, constructive, feedback, improve, polite, helpful, because
+
+Scoring:
+- A2 (2 pts): Very simple reason ("I say good first because happy")
+- B1 (3 pts): Simple reason with connector and basic explanation
+- B2 (4 pts): Clear reasoning referencing feedback principles (sandwich technique)
+- C1 (5 pts): Sophisticated meta-reasoning about psychological impact of feedback structure
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/subphase2/step2/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step2_interaction2():
@@ -1066,27 +1137,10 @@ def evaluate_62_step2_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's explanation of why they wrote feedback a certain way.
-
-Student Response: "{response}"
-
-Context: Student explains feedback writing choices (starting positive, using suggestions, etc.)
-Target vocabulary: positive, suggestion, constructive, feedback, improve, polite, helpful, because
-
-Scoring:
-- A2 (2 pts): Very simple reason ("I say good first because happy")
-- B1 (3 pts): Simple reason with connector and basic explanation
-- B2 (4 pts): Clear reasoning referencing feedback principles (sandwich technique)
-- C1 (5 pts): Sophisticated meta-reasoning about psychological impact of feedback structure
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_62)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP2_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 2 I2 - User {user_id}: Score={score}, Level={level}")
@@ -1148,7 +1202,7 @@ def final_score_62_step2(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=2, subphase=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1169,6 +1223,27 @@ def track_62_step3_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP3_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.62_step3_interaction2',
+    system="""
+Evaluate this student's explanation of why feedback should be specific rather than general.
+
+Context: Student explains the importance of specific vs general feedback with an example.
+Target vocabulary: specific, actionable, clear, improve, helpful, suggest, example, because
+
+Scoring:
+- A2 (2 pts): Simple statement ("specific is better because help")
+- B1 (3 pts): Reason with connector and basic example
+- B2 (4 pts): Clear explanation referencing "clear action" and providing example
+- C1 (5 pts): Sophisticated analysis linking specificity to actionability and evidence-based learning
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/subphase2/step3/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step3_interaction2():
@@ -1183,27 +1258,10 @@ def evaluate_62_step3_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's explanation of why feedback should be specific rather than general.
-
-Student Response: "{response}"
-
-Context: Student explains the importance of specific vs general feedback with an example.
-Target vocabulary: specific, actionable, clear, improve, helpful, suggest, example, because
-
-Scoring:
-- A2 (2 pts): Simple statement ("specific is better because help")
-- B1 (3 pts): Reason with connector and basic example
-- B2 (4 pts): Clear explanation referencing "clear action" and providing example
-- C1 (5 pts): Sophisticated analysis linking specificity to actionability and evidence-based learning
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_62)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP3_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 3 I2 - User {user_id}: Score={score}, Level={level}")
@@ -1265,7 +1323,7 @@ def final_score_62_step3(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=3, subphase=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1286,6 +1344,28 @@ def track_62_step4_interaction1():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP4_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.62_step4_interaction2',
+    system="""
+Evaluate this student's response to peer feedback they received.
+
+Context: Student responds to feedback received from a classmate about their report,
+explaining what they agree with and what they will change.
+Target vocabulary: thank, agree, improve, feedback, suggestion, polite, helpful, change
+
+Scoring:
+- A2 (2 pts): Very simple ("Thank you. I add words.")
+- B1 (3 pts): Polite acknowledgement + one specific change stated
+- B2 (4 pts): Reflective response agreeing with reasoning, specific improvement plan
+- C1 (5 pts): Sophisticated growth-oriented response with specific actionable revisions
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"vocabulary_used": [...], "strengths": [...], "improvements": [...]}
+""",
+    user='Student Response: "{response}"'
+)
+
+
 @phase6_bp.route('/subphase2/step4/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step4_interaction2():
@@ -1300,28 +1380,10 @@ def evaluate_62_step4_interaction2():
         if not response:
             return jsonify({'success': False, 'error': 'Response is required'}), 400
 
-        prompt = f"""
-Evaluate this student's response to peer feedback they received.
-
-Student Response: "{response}"
-
-Context: Student responds to feedback received from a classmate about their report,
-explaining what they agree with and what they will change.
-Target vocabulary: thank, agree, improve, feedback, suggestion, polite, helpful, change
-
-Scoring:
-- A2 (2 pts): Very simple ("Thank you. I add words.")
-- B1 (3 pts): Polite acknowledgement + one specific change stated
-- B2 (4 pts): Reflective response agreeing with reasoning, specific improvement plan
-- C1 (5 pts): Sophisticated growth-oriented response with specific actionable revisions
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"vocabulary_used": [...], "strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_62)
 
-        evaluation = _ai_evaluate(prompt, fallback, response)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP4_INTERACTION2_PROMPT, fallback, response, response=response)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 4 I2 - User {user_id}: Score={score}, Level={level}")
@@ -1383,7 +1445,7 @@ def final_score_62_step4(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=4, subphase=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1392,6 +1454,32 @@ def final_score_62_step4(level):
 # SUBPHASE 6.2 - STEP 5: EVALUATE
 # ============================================================
 
+SUBPHASE_62_STEP5_INTERACTION1_PROMPT = prompt_templates.register(
+    'phase6.62_step5_interaction1',
+    complexity='simple',
+    source_field='faulty_text',
+    system="""
+Evaluate spelling corrections in this feedback text.
+
+Common feedback spelling errors: feedbak→feedback, sugestion→suggestion,
+improv→improve, strenght→strength, weknes→weakness, polight→polite
+
+Scoring by number of correct fixes:
+- A2 (2 pts): 1-2 correct fixes
+- B1 (3 pts): 3-4 correct fixes
+- B2 (4 pts): 5-6 correct fixes
+- C1 (5 pts): All errors fixed perfectly
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"strengths": [...], "improvements": [...]}
+""",
+    user="""
+Original (faulty): "{faulty_text}"
+Student Corrections: "{corrected_text}"
+"""
+)
+
+
 @phase6_bp.route('/subphase2/step5/interaction1/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step5_interaction1():
@@ -1406,24 +1494,6 @@ def evaluate_62_step5_interaction1():
         if not corrected_text:
             return jsonify({'success': False, 'error': 'Corrected text is required'}), 400
 
-        prompt = f"""
-Evaluate spelling corrections in this feedback text.
-
-Original (faulty): "{faulty_text}"
-Student Corrections: "{corrected_text}"
-
-Common feedback spelling errors: feedbak→feedback, sugestion→suggestion,
-improv→improve, strenght→strength, weknes→weakness, polight→polite
-
-Scoring by number of correct fixes:
-- A2 (2 pts): 1-2 correct fixes
-- B1 (3 pts): 3-4 correct fixes
-- B2 (4 pts): 5-6 correct fixes
-- C1 (5 pts): All errors fixed perfectly
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             errors = ['feedbak', 'sugestion', 'improv', 'strenght', 'weknes', 'polight']
             fixed = sum(1 for e in errors if e not in r.lower())
@@ -1435,7 +1505,7 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
                     'feedback': f'Fixed {fixed} spelling errors — {level} level.',
                     'strengths': [], 'improvements': []}
 
-        evaluation = _ai_evaluate(prompt, fallback, corrected_text)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP5_INTERACTION1_PROMPT, fallback, corrected_text, faulty_text=faulty_text, corrected_text=corrected_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 5 I1 - User {user_id}: Score={score}, Level={level}")
@@ -1451,6 +1521,31 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP5_INTERACTION2_PROMPT = prompt_templates.register(
+    'phase6.62_step5_interaction2',
+    source_field='original_text',
+    system="""
+Evaluate the tone/politeness improvement in this peer feedback.
+
+Assess: politeness (please/thank you), softened language (could→could be stronger),
+empathy (I think/perhaps/well done), encouraging tone.
+
+Scoring:
+- A2 (2 pts): Added "please" or "thank you", minor change
+- B1 (3 pts): Softened one harsh phrase, added polite opening/closing
+- B2 (4 pts): Overall tone shift from negative to constructive, multiple polite elements
+- C1 (5 pts): Sophisticated empathetic tone with encouraging language throughout
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"strengths": [...], "improvements": [...]}
+""",
+    user="""
+Original (harsh/impolite): "{original_text}"
+Student Improved Version: "{corrected_text}"
+"""
+)
+
+
 @phase6_bp.route('/subphase2/step5/interaction2/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step5_interaction2():
@@ -1466,24 +1561,6 @@ def evaluate_62_step5_interaction2():
         if not corrected_text:
             return jsonify({'success': False, 'error': 'Corrected text is required'}), 400
 
-        prompt = f"""
-Evaluate the tone/politeness improvement in this peer feedback.
-
-Original (harsh/impolite): "{original_text}"
-Student Improved Version: "{corrected_text}"
-
-Assess: politeness (please/thank you), softened language (could→could be stronger),
-empathy (I think/perhaps/well done), encouraging tone.
-
-Scoring:
-- A2 (2 pts): Added "please" or "thank you", minor change
-- B1 (3 pts): Softened one harsh phrase, added polite opening/closing
-- B2 (4 pts): Overall tone shift from negative to constructive, multiple polite elements
-- C1 (5 pts): Sophisticated empathetic tone with encouraging language throughout
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"strengths": [...], "improvements": [...]}}
-"""
         def fallback(r):
             polite = ['please', 'thank', 'well done', 'good', 'could', 'perhaps', 'i think']
             polite_count = sum(1 for p in polite if p in r.lower())
@@ -1495,7 +1572,7 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
                     'feedback': f'Tone improvement at {level} level.',
                     'strengths': [], 'improvements': []}
 
-        evaluation = _ai_evaluate(prompt, fallback, corrected_text)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP5_INTERACTION2_PROMPT, fallback, corrected_text, original_text=original_text, corrected_text=corrected_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 5 I2 - User {user_id}: Score={score}, Level={level}")
@@ -1511,6 +1588,32 @@ Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+SUBPHASE_62_STEP5_INTERACTION3_PROMPT = prompt_templates.register(
+    'phase6.62_step5_interaction3',
+    complexity='complex', band='C1',
+    source_field='original_text',
+    system="""
+Evaluate the quality of this restructured peer feedback.
+
+Assess: positive sandwich structure (positive→suggestion→positive), specificity of suggestion,
+actionability, politeness, empathy, overall helpfulness.
+
+Scoring:
+- A2 (2 pts): Added simple positive and basic suggestion
+- B1 (3 pts): Positive + suggestion + closing positive, somewhat polite
+- B2 (4 pts): Full sandwich structure, specific suggestion, balanced and polite
+- C1 (5 pts): Sophisticated empathetic feedback with actionable specific suggestions, growth-oriented
+
+Return JSON: {"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
+"improvements_made": [...], "strengths": [...], "suggestions": [...]}
+""",
+    user="""
+Original (weak/problematic): "{original_text}"
+Student Restructured Version: "{improved_text}"
+"""
+)
+
+
 @phase6_bp.route('/subphase2/step5/interaction3/evaluate', methods=['POST'])
 @login_required
 def evaluate_62_step5_interaction3():
@@ -1526,28 +1629,10 @@ def evaluate_62_step5_interaction3():
         if not improved_text:
             return jsonify({'success': False, 'error': 'Improved text is required'}), 400
 
-        prompt = f"""
-Evaluate the quality of this restructured peer feedback.
-
-Original (weak/problematic): "{original_text}"
-Student Restructured Version: "{improved_text}"
-
-Assess: positive sandwich structure (positive→suggestion→positive), specificity of suggestion,
-actionability, politeness, empathy, overall helpfulness.
-
-Scoring:
-- A2 (2 pts): Added simple positive and basic suggestion
-- B1 (3 pts): Positive + suggestion + closing positive, somewhat polite
-- B2 (4 pts): Full sandwich structure, specific suggestion, balanced and polite
-- C1 (5 pts): Sophisticated empathetic feedback with actionable specific suggestions, growth-oriented
-
-Return JSON: {{"score": 2-5, "level": "A2"|"B1"|"B2"|"C1", "feedback": "...",
-"improvements_made": [...], "strengths": [...], "suggestions": [...]}}
-"""
         def fallback(r):
             return _generic_fallback(r, VOCAB_62)
 
-        evaluation = _ai_evaluate(prompt, fallback, improved_text)
+        evaluation = _ai_evaluate(SUBPHASE_62_STEP5_INTERACTION3_PROMPT, fallback, improved_text, original_text=original_text, improved_text=improved_text)
         score = max(2, min(5, evaluation.get('score', 2)))
         level = evaluation.get('level', 'A2')
         logger.info(f"Phase 6.2 Step 5 I3 - User {user_id}: Score={score}, Level={level}")
@@ -1597,7 +1682,7 @@ def final_score_62_step5(level):
     try:
         data = request.get_json()
         task_scores = {k: v for k, v in data.items() if k.startswith('task_')}
-        return _build_final_score_response(level, task_scores)
+        return _build_final_score_response(level, task_scores, step=5, subphase=2)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1687,17 +1772,16 @@ def calculate_phase6_step1_score():
         else:
             remedial_level = 'C1'
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
+        # DEBUG BANNER - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - SCORE CALCULATION (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+        )
         for i, score in enumerate(interaction_scores, 1):
-            print(f"Interaction {i}: {score} points")
-        print(f"Total Score: {total_score}/21")
-        print(f"Remedial Level: {remedial_level}")
-        print(f"Route: User must complete Remedial {remedial_level}")
-        print("="*70 + "\n")
+            banner(logger, f"Interaction {i}: {score} points")
 
         logger.info(f"Phase 6 Step 1 scoring - User {user_id}: Total={total_score}, Level={remedial_level}")
 
@@ -1753,20 +1837,17 @@ def calculate_step1_a1_final_score():
         # Determine next URL
         next_url = "/app/phase6/step/3" if passed else "/app/phase6/step/1/remedial/a1/retry"
 
-        # TERMINAL OUTPUT - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER - SCORES NEVER SHOWN TO USER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 1 Remedial A1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -1821,20 +1902,17 @@ def calculate_step1_a2_final_score():
 
         next_url = "/app/phase6/step/3" if passed else "/app/phase6/step/1/remedial/a2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 1 Remedial A2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -1889,20 +1967,17 @@ def calculate_step1_b1_final_score():
 
         next_url = "/app/phase6/step/3" if passed else "/app/phase6/step/1/remedial/b1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (required tasks only)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 1 Remedial B1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -1957,20 +2032,17 @@ def calculate_step1_b2_final_score():
 
         next_url = "/app/phase6/step/3" if passed else "/app/phase6/step/1/remedial/b2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 1 Remedial B2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2025,20 +2097,17 @@ def calculate_step1_c1_final_score():
 
         next_url = "/app/phase6/step/3" if passed else "/app/phase6/step/1/remedial/c1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 1 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 1 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 1 Remedial C1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2102,19 +2171,6 @@ def calculate_phase6_step3_score():
         else:
             remedial_level = 'C1'
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 points")
-        print(f"Interaction 2: {interaction2_score}/5 points")
-        print(f"Interaction 3: {interaction3_score}/5 points")
-        print(f"Total Score: {total_score}/15")
-        print(f"Remedial Level: {remedial_level}")
-        print(f"Route: User must complete Remedial {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 6 Step 3 scoring - User {user_id}: Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -2170,20 +2226,17 @@ def calculate_step3_a1_final_score():
 
         next_url = "/app/phase6/step/4" if passed else "/app/phase6/step/3/remedial/a1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 3 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 3 Remedial A1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2238,20 +2291,17 @@ def calculate_step3_a2_final_score():
 
         next_url = "/app/phase6/step/4" if passed else "/app/phase6/step/3/remedial/a2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 3 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 3 Remedial A2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2306,20 +2356,17 @@ def calculate_step3_b1_final_score():
 
         next_url = "/app/phase6/step/4" if passed else "/app/phase6/step/3/remedial/b1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 3 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (required tasks only)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 3 Remedial B1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2374,20 +2421,17 @@ def calculate_step3_b2_final_score():
 
         next_url = "/app/phase6/step/4" if passed else "/app/phase6/step/3/remedial/b2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 3 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 3 Remedial B2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2442,20 +2486,17 @@ def calculate_step3_c1_final_score():
 
         next_url = "/app/phase6/step/4" if passed else "/app/phase6/step/3/remedial/c1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 3 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 3 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 3 Remedial C1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2519,19 +2560,6 @@ def calculate_phase6_step4_score():
         else:
             remedial_level = 'C1'
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1: {interaction1_score}/5 points")
-        print(f"Interaction 2: {interaction2_score}/5 points")
-        print(f"Interaction 3: {interaction3_score}/5 points")
-        print(f"Total Score: {total_score}/15")
-        print(f"Remedial Level: {remedial_level}")
-        print(f"Route: User must complete Remedial {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 6 Step 4 scoring - User {user_id}: Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -2587,20 +2615,17 @@ def calculate_step4_a1_final_score():
 
         next_url = "/app/phase6/step/5" if passed else "/app/phase6/step/4/remedial/a1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 4 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 4 Remedial A1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2655,20 +2680,17 @@ def calculate_step4_a2_final_score():
 
         next_url = "/app/phase6/step/5" if passed else "/app/phase6/step/4/remedial/a2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 4 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~86%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 4 Remedial A2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2723,20 +2745,17 @@ def calculate_step4_b1_final_score():
 
         next_url = "/app/phase6/step/5" if passed else "/app/phase6/step/4/remedial/b1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 4 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (required tasks only)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 4 Remedial B1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2791,20 +2810,17 @@ def calculate_step4_b2_final_score():
 
         next_url = "/app/phase6/step/5" if passed else "/app/phase6/step/4/remedial/b2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 4 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~81%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 4 Remedial B2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2859,20 +2875,17 @@ def calculate_step4_c1_final_score():
 
         next_url = "/app/phase6/step/5" if passed else "/app/phase6/step/4/remedial/c1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 4 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 4 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~81%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 4 Remedial C1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -2936,19 +2949,6 @@ def calculate_phase6_step5_score():
         else:
             remedial_level = 'C1'
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - SCORE CALCULATION (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print(f"Interaction 1 (AI-scored): {interaction1_score}/5 points")
-        print(f"Interaction 2 (AI-scored): {interaction2_score}/5 points")
-        print(f"Interaction 3 (AI-scored): {interaction3_score}/5 points")
-        print(f"Total Score: {total_score}/15")
-        print(f"Remedial Level: {remedial_level}")
-        print(f"Route: User must complete Remedial {remedial_level}")
-        print("="*70 + "\n")
-
         logger.info(f"Phase 6 Step 5 scoring - User {user_id}: Total={total_score}, Level={remedial_level}")
 
         return jsonify({
@@ -3004,20 +3004,17 @@ def calculate_step5_a1_final_score():
 
         next_url = "/app/phase6_2" if passed else "/app/phase6/step/5/remedial/a1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 5 - REMEDIAL A1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~77%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 5 Remedial A1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -3072,20 +3069,17 @@ def calculate_step5_a2_final_score():
 
         next_url = "/app/phase6_2" if passed else "/app/phase6/step/5/remedial/a2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 5 - REMEDIAL A2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~82%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 5 Remedial A2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -3140,20 +3134,17 @@ def calculate_step5_b1_final_score():
 
         next_url = "/app/phase6_2" if passed else "/app/phase6/step/5/remedial/b1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 5 - REMEDIAL B1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (required tasks only)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 5 Remedial B1 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -3208,20 +3199,17 @@ def calculate_step5_b2_final_score():
 
         next_url = "/app/phase6_2" if passed else "/app/phase6/step/5/remedial/b2/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 5 - REMEDIAL B2 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 5 Remedial B2 - User {user_id}: Total={total_score}, Passed={passed}")
 
@@ -3276,20 +3264,17 @@ def calculate_step5_c1_final_score():
 
         next_url = "/app/phase6_2" if passed else "/app/phase6/step/5/remedial/c1/retry"
 
-        # TERMINAL OUTPUT (INTERNAL USE ONLY)
-        print("\n" + "="*70)
-        print("PHASE 6 STEP 5 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)")
-        print("="*70)
-        print(f"User ID: {user_id}")
-        print("\nTask Breakdown:")
+        # DEBUG BANNER (INTERNAL USE ONLY)
+        banner(
+            logger,
+            "\n" + "="*70,
+            "PHASE 6 STEP 5 - REMEDIAL C1 - FINAL ASSESSMENT (INTERNAL USE ONLY)",
+            "="*70,
+            f"User ID: {user_id}",
+            "\nTask Breakdown:",
+        )
         for task_name, score in task_scores.items():
-            print(f"  {task_name}: {score} points")
-        print("-"*70)
-        print(f"TOTAL SCORE: {total_score}/{max_score}")
-        print(f"PASS THRESHOLD: {threshold}/{max_score} (~80%)")
-        print(f"RESULT: {'PASSED ✓' if passed else 'FAILED ✗ - RETRY REQUIRED'}")
-        print(f"NEXT URL: {next_url}")
-        print("="*70 + "\n")
+            banner(logger, f"  {task_name}: {score} points")
 
         logger.info(f"Phase 6 Step 5 Remedial C1 - User {user_id}: Total={total_score}, Passed={passed}")
 
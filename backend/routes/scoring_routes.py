@@ -0,0 +1,52 @@
+"""
+Scoring API Routes
+Batch scoring for step transitions (rules in services/scoring_engine.py)
+"""
+from flask import Blueprint, request, jsonify, session
+from routes.auth_routes import login_required, db_manager
+from services import scoring_engine
+import logging
+
+scoring_bp = Blueprint('scoring', __name__, url_prefix='/api/scoring')
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on items per request (a full phase is 5 steps plus remedials)
+MAX_BATCH_ITEMS = 20
+
+
+@scoring_bp.route('/batch', methods=['POST'])
+@login_required
+def score_batch():
+    """
+    Score and persist several steps in one request and one transaction
+
+    Body: {"items": [
+        {"phase": 5, "step": 2, "scores": {"interaction1_score": 1, ...}},
+        {"phase": 5, "step": 2, "level": "B1", "task_scores": {"task_a": 6, ...}}
+    ]}
+    Items with a level are remedial final scores; "subphase" defaults to 1.
+    """
+    try:
+        user_id = session.get('user_id')
+        items = (request.get_json(silent=True) or {}).get('items')
+
+        if not isinstance(items, list) or not items:
+            return jsonify({'success': False, 'error': 'items must be a non-empty list'}), 400
+        if len(items) > MAX_BATCH_ITEMS:
+            return jsonify({'success': False, 'error': f'At most {MAX_BATCH_ITEMS} items per batch'}), 400
+
+        conn = db_manager.get_connection()
+        try:
+            results = scoring_engine.score_batch(conn, user_id, items)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        finally:
+            conn.close()
+
+        logger.info(f"Batch scoring - User {user_id}: {len(results)} items persisted")
+
+        return jsonify({'success': True, 'data': results})
+    except Exception as e:
+        logger.error(f"Error in batch scoring: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
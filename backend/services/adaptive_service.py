@@ -5,17 +5,14 @@ Tracks performance and adjusts difficulty dynamically
 
 import sqlite3
 from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-from collections import deque
+from services.spaced_repetition import ReviewScheduler, quality_from_result, MASTERY_THRESHOLD
 
 # Performance thresholds
 SUCCESS_THRESHOLD = 0.8  # 80% success rate = too easy
 FAILURE_THRESHOLD = 0.4  # 40% success rate = too hard
-WINDOW_SIZE = 5  # Track last 5 activities
-
-# Spaced repetition intervals (in days)
-REVIEW_INTERVALS = [1, 3, 7, 14, 30]
-MASTERY_THRESHOLD = 0.95
+WINDOW_SIZE = 5  # Effective memory of the rolling averages, in attempts
+EWMA_ALPHA = 2 / (WINDOW_SIZE + 1)  # Same centre of mass as a 5-attempt window
+MIN_ATTEMPTS = 3  # Attempts needed before recommending a change
 
 
 class AdaptiveService:
@@ -31,61 +28,46 @@ class AdaptiveService:
         return conn
     
     def track_performance(self, user_id: int, activity_id: str, 
-                         success: bool, score: float, activity_type: str = "remedial") -> Dict:
+                         success: bool, score: Optional[float] = None,
+                         activity_type: str = "remedial") -> Dict:
         """
         Track user performance on an activity
         Returns: performance analysis and recommendations
         """
+        outcome = 1.0 if success else 0.0
         conn = self.get_connection()
-        cursor = conn.cursor()
         
         try:
-            # Get existing performance data
-            cursor.execute('''
-                SELECT attempts, success_rate, mastery_level
-                FROM performance_tracking
-                WHERE user_id = ? AND activity_id = ?
-            ''', (user_id, activity_id))
-            
-            existing = cursor.fetchone()
-            
-            if existing:
-                attempts = existing['attempts'] + 1
-                # Update success rate (weighted average)
-                old_success_rate = existing['success_rate']
-                new_success_rate = (old_success_rate * existing['attempts'] + (1.0 if success else 0.0)) / attempts
-                
-                # Update mastery level
-                mastery_level = min(1.0, new_success_rate * (1 + (attempts * 0.1)))
-                
-                cursor.execute('''
-                    UPDATE performance_tracking
-                    SET attempts = ?, success_rate = ?, mastery_level = ?, last_attempt = CURRENT_TIMESTAMP
-                    WHERE user_id = ? AND activity_id = ?
-                ''', (attempts, new_success_rate, mastery_level, user_id, activity_id))
-            else:
-                attempts = 1
-                new_success_rate = 1.0 if success else 0.0
-                mastery_level = new_success_rate
-                
-                cursor.execute('''
-                    INSERT INTO performance_tracking 
-                    (user_id, activity_id, activity_type, success_rate, attempts, mastery_level)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (user_id, activity_id, activity_type, new_success_rate, attempts, mastery_level))
+            # Running success rate and mastery, updated in place
+            performance = conn.execute('''
+                INSERT INTO performance_tracking
+                (user_id, activity_id, activity_type, success_rate, attempts, mastery_level)
+                VALUES (:user_id, :activity_id, :activity_type, :outcome, 1, :outcome)
+                ON CONFLICT(user_id, activity_id) DO UPDATE SET
+                    attempts = attempts + 1,
+                    success_rate = (success_rate * attempts + :outcome) / (attempts + 1),
+                    mastery_level = MIN(1.0, (success_rate * attempts + :outcome) / (attempts + 1)
+                                             * (1 + (attempts + 1) * 0.1)),
+                    last_attempt = CURRENT_TIMESTAMP
+                RETURNING attempts, success_rate, mastery_level
+            ''', {"user_id": user_id, "activity_id": activity_id, "activity_type": activity_type,
+                  "outcome": outcome}).fetchone()
             
             # Update spaced repetition schedule
-            self._update_spaced_repetition(cursor, user_id, activity_id, success, attempts)
+            review = ReviewScheduler(conn).record_review(user_id, activity_id, quality_from_result(success, score))
+            
+            # Rolling per-type aggregates drive the recommendation (no history re-scan)
+            aggregate = self._update_aggregates(conn, user_id, activity_type, outcome, performance['mastery_level'])
             
             conn.commit()
             
-            # Get recommendations
-            recommendations = self._get_recommendations(user_id, activity_type)
+            recommendations = self._recommendation(aggregate)
             
             return {
-                "success_rate": round(new_success_rate, 2),
-                "attempts": attempts,
-                "mastery_level": round(mastery_level, 2),
+                "success_rate": round(performance['success_rate'], 2),
+                "attempts": performance['attempts'],
+                "mastery_level": round(performance['mastery_level'], 2),
+                "next_review_date": review["next_review_date"],
                 "recommendations": recommendations
             }
             
@@ -95,135 +77,109 @@ class AdaptiveService:
         finally:
             conn.close()
     
-    def _update_spaced_repetition(self, cursor, user_id: int, activity_id: str, 
-                                  success: bool, attempts: int):
-        """Update spaced repetition schedule"""
-        cursor.execute('''
-            SELECT review_count, ease_factor, interval_days
-            FROM spaced_repetition
-            WHERE user_id = ? AND activity_id = ?
-        ''', (user_id, activity_id))
-        
-        existing = cursor.fetchone()
-        
-        if existing:
-            review_count = existing['review_count'] + 1
-            ease_factor = existing['ease_factor']
-            interval_days = existing['interval_days']
-            
-            # Adjust ease factor based on performance
-            if success:
-                ease_factor = min(3.0, ease_factor + 0.1)
-                # Move to next interval
-                interval_index = min(review_count, len(REVIEW_INTERVALS) - 1)
-                interval_days = REVIEW_INTERVALS[interval_index]
-            else:
-                ease_factor = max(1.3, ease_factor - 0.2)
-                # Reset to first interval
-                interval_days = REVIEW_INTERVALS[0]
-                review_count = 0
-            
-            next_review = datetime.now() + timedelta(days=interval_days)
-            
-            cursor.execute('''
-                UPDATE spaced_repetition
-                SET review_count = ?, ease_factor = ?, interval_days = ?, next_review_date = ?
-                WHERE user_id = ? AND activity_id = ?
-            ''', (review_count, ease_factor, interval_days, next_review.date(), user_id, activity_id))
-        else:
-            # First review
-            next_review = datetime.now() + timedelta(days=REVIEW_INTERVALS[0])
-            
-            cursor.execute('''
-                INSERT INTO spaced_repetition 
-                (user_id, activity_id, review_count, ease_factor, interval_days, next_review_date)
-                VALUES (?, ?, 0, 2.5, ?, ?)
-            ''', (user_id, activity_id, REVIEW_INTERVALS[0], next_review.date()))
-    
-    def _get_recommendations(self, user_id: int, activity_type: str) -> Dict:
-        """Get difficulty recommendations based on recent performance"""
+    def _update_aggregates(self, conn, user_id: int, activity_type: str,
+                           outcome: float, mastery_level: float):
+        """
+        Fold one attempt into the user's rolling aggregates for the activity type
+
+        Returns: the updated (attempts, ewma_success, ewma_mastery) row
+        """
+        return conn.execute('''
+            INSERT INTO performance_aggregates
+            (user_id, activity_type, attempts, ewma_success, ewma_mastery)
+            VALUES (:user_id, :activity_type, 1, :outcome, :mastery)
+            ON CONFLICT(user_id, activity_type) DO UPDATE SET
+                attempts = attempts + 1,
+                ewma_success = ewma_success + :alpha * (:outcome - ewma_success),
+                ewma_mastery = ewma_mastery + :alpha * (:mastery - ewma_mastery),
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING attempts, ewma_success, ewma_mastery
+        ''', {"user_id": user_id, "activity_type": activity_type, "outcome": outcome,
+              "mastery": mastery_level, "alpha": EWMA_ALPHA}).fetchone()
+
+    def get_recommendations(self, user_id: int, activity_types: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        Difficulty recommendations for several activity types in one query
+
+        Args:
+            user_id: User ID
+            activity_types: Types to report (default: every type the user has attempted)
+
+        Returns:
+            Dict of activity type to recommendation
+        """
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get last 5 activities
-        cursor.execute('''
-            SELECT success_rate, mastery_level
-            FROM performance_tracking
-            WHERE user_id = ? AND activity_type = ?
-            ORDER BY last_attempt DESC
-            LIMIT ?
-        ''', (user_id, activity_type, WINDOW_SIZE))
-        
-        recent_performance = cursor.fetchall()
-        conn.close()
-        
-        if len(recent_performance) < 3:
+        try:
+            query = '''
+                SELECT activity_type, attempts, ewma_success, ewma_mastery
+                FROM performance_aggregates WHERE user_id = ?
+            '''
+            params: list = [user_id]
+            if activity_types:
+                query += f" AND activity_type IN ({','.join('?' * len(activity_types))})"
+                params.extend(activity_types)
+            rows = {row['activity_type']: row for row in conn.execute(query, params).fetchall()}
+        finally:
+            conn.close()
+
+        return {
+            activity_type: self._recommendation(rows.get(activity_type))
+            for activity_type in (activity_types or sorted(rows))
+        }
+
+    @staticmethod
+    def _recommendation(aggregate) -> Dict:
+        """Difficulty recommendation from a performance_aggregates row (or None)"""
+        if aggregate is None or aggregate['attempts'] < MIN_ATTEMPTS:
             return {
                 "adjustment": "maintain",
                 "reason": "Insufficient data",
                 "confidence": "low"
             }
         
-        # Calculate average success rate
-        avg_success_rate = sum(row['success_rate'] for row in recent_performance) / len(recent_performance)
-        avg_mastery = sum(row['mastery_level'] for row in recent_performance) / len(recent_performance)
+        success_rate = aggregate['ewma_success']
+        mastery = round(aggregate['ewma_mastery'], 2)
         
-        if avg_success_rate >= SUCCESS_THRESHOLD:
+        if success_rate >= SUCCESS_THRESHOLD:
             return {
                 "adjustment": "increase_difficulty",
-                "reason": f"High success rate ({avg_success_rate:.0%})",
+                "reason": f"High success rate ({success_rate:.0%})",
                 "confidence": "high",
-                "suggestion": "Skip easier remedials or advance to next level"
+                "suggestion": "Skip easier remedials or advance to next level",
+                "mastery": mastery
             }
-        elif avg_success_rate <= FAILURE_THRESHOLD:
+        elif success_rate <= FAILURE_THRESHOLD:
             return {
                 "adjustment": "decrease_difficulty",
-                "reason": f"Low success rate ({avg_success_rate:.0%})",
+                "reason": f"Low success rate ({success_rate:.0%})",
                 "confidence": "high",
-                "suggestion": "Provide additional support materials or easier activities"
+                "suggestion": "Provide additional support materials or easier activities",
+                "mastery": mastery
             }
         else:
             return {
                 "adjustment": "maintain",
-                "reason": f"Appropriate difficulty ({avg_success_rate:.0%})",
+                "reason": f"Appropriate difficulty ({success_rate:.0%})",
                 "confidence": "medium",
-                "suggestion": "Continue current difficulty level"
+                "suggestion": "Continue current difficulty level",
+                "mastery": mastery
             }
     
     def get_activities_for_review(self, user_id: int) -> List[Dict]:
         """Get activities that are due for review (spaced repetition)"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        today = datetime.now().date()
-        
-        cursor.execute('''
-            SELECT 
-                sr.activity_id,
-                sr.next_review_date,
-                sr.review_count,
-                sr.interval_days,
-                pt.mastery_level
-            FROM spaced_repetition sr
-            JOIN performance_tracking pt ON sr.user_id = pt.user_id AND sr.activity_id = pt.activity_id
-            WHERE sr.user_id = ? AND sr.next_review_date <= ?
-            AND pt.mastery_level < ?
-            ORDER BY sr.next_review_date ASC
-            LIMIT 10
-        ''', (user_id, today, MASTERY_THRESHOLD))
-        
-        activities = []
-        for row in cursor.fetchall():
-            activities.append({
-                "activity_id": row['activity_id'],
-                "next_review_date": row['next_review_date'],
-                "review_count": row['review_count'],
-                "interval_days": row['interval_days'],
-                "mastery_level": round(row['mastery_level'], 2)
-            })
-        
-        conn.close()
-        return activities
+        try:
+            return ReviewScheduler(conn).due_for_user(user_id)
+        finally:
+            conn.close()
+
+    def get_due_reviews_for_all(self) -> List[Dict]:
+        """Per-user counts of reviews due today (for nightly reminders)"""
+        conn = self.get_connection()
+        try:
+            return ReviewScheduler(conn).due_for_all()
+        finally:
+            conn.close()
     
     def get_performance_summary(self, user_id: int) -> Dict:
         """Get overall performance summary"""
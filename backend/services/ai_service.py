@@ -4,24 +4,58 @@ AI Service for handling Groq API interactions and AI-generated content detection
 import os
 import json
 import logging
+import re
+import threading
 import requests
-import groq
 from models.game_data import NPCS
+from services import model_router
+from services.feedback_bank import answer_text, single_answer
+from services.llm_hedging import HedgedClient, hedging_enabled
+from services.llm_telemetry import InstrumentedClient, http_event_hooks, telemetry
+from utils import deadlines
+from utils.structured_logging import log_event
 
 logger = logging.getLogger(__name__)
 
+# Seconds allowed for a Sapling AI-detection call, and the least worth starting one with
+SAPLING_TIMEOUT = float(os.getenv('SAPLING_TIMEOUT', '10'))
+SAPLING_MIN_SECONDS = 1.0
+
+
+def _request_user_id():
+    """Logged-in user of the current request (None outside one)"""
+    from flask import has_request_context, session
+    return session.get('user_id') if has_request_context() else None
+
+
 class AIService:
+    # Set by the service registry; answers close to a known graded answer skip Groq
+    feedback_bank = None
+    submission_index = None
+    cefr_classifier = None
+
     def __init__(self):
         self.groq_api_key = os.getenv("GROQ_API_KEY")
         self.sapling_api_key = os.getenv("SAPLING_API_KEY")
-        self.sapling_api_url = "https://api.sapling.ai/api/v1/aidetect"
+        self.sapling_api_url = os.getenv("SAPLING_API_URL", "https://api.sapling.ai/api/v1/aidetect")
         self.model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
         self.max_tokens = 10000
         self.temperature = 0.7
+        self._hedged = None
         
         if self.groq_api_key:
             try:
-                self.client = groq.Groq(api_key=self.groq_api_key)
+                # Imported here so that importing the app does not pay for the SDK
+                import groq
+                # HTTP hooks count the SDK's retries and 429s (services/llm_telemetry.py)
+                self.client = groq.Groq(api_key=self.groq_api_key,
+                                        http_client=groq.DefaultHttpxClient(event_hooks=http_event_hooks()))
+                attempts = getattr(self.client, 'max_retries', 0) + 1
+                if hedging_enabled():
+                    self.client = self._hedged = HedgedClient(self.client)
+                # Completions inside a request share its deadline (utils/deadlines.py)
+                self.client = deadlines.DeadlineClient(self.client, attempts=attempts)
+                self.client = InstrumentedClient(self.client)
             except Exception as e:
                 logger.error(f"Error initializing Groq client: {str(e)}")
                 logger.warning("Groq client unavailable. AI responses will be disabled.")
@@ -30,6 +64,10 @@ class AIService:
             self.client = None
             logger.warning("Groq API key not found. AI responses will be disabled.")
 
+    def hedge_stats(self):
+        """Hedging counters for the Groq client (None when hedging is off)"""
+        return self._hedged.stats() if self._hedged is not None else None
+
     def get_ai_response(self, prompt, character=None):
         """Get a responsive, in-character response from Groq"""
         if not self.client:
@@ -63,19 +101,123 @@ class AIService:
             logger.error(f"Error getting AI response: {str(e)}")
             return "I'm sorry, I couldn't process that response."
 
+    def complete_template(self, template, max_tokens=None, **fields):
+        """
+        Get a completion for a compiled PromptTemplate (services/prompt_templates.py)
+
+        The template's static system message is sent unchanged on every call so
+        the provider can serve it from its prompt cache; only the rendered
+        per-student suffix differs between requests. The model and output token
+        budget come from the template's tier (services/model_router.py); an
+        explicit max_tokens can only lower the tier budget.
+
+        Before calling Groq the answer is tried against the feedback bank
+        (single-answer templates only), a graded near-identical submission
+        (not for corrections of a given text, see PromptTemplate.source_field)
+        and the local CEFR classifier (when it is confident); the classifier
+        also answers when Groq is unavailable.
+        """
+        answer = answer_text(template, fields)
+        submission = None
+        # Edits of a given text share most of its words, so they are not fingerprinted
+        if self.submission_index is not None and template.source_field is None:
+            submission = self.submission_index.add(template.name, _request_user_id(), answer)
+
+        bank = self.feedback_bank if single_answer(template) else None
+        cached = bank.lookup(template.name, answer) if bank is not None else None
+        if cached is None and submission is not None and submission.reusable is not None:
+            cached = dict(submission.reusable, feedback_source='similar_submission')
+        local = None
+        if cached is None and self.cefr_classifier is not None:
+            local = self.cefr_classifier.grade(template, answer)
+            if local is not None and local['confident']:
+                cached = local
+        if cached is not None:
+            if submission is not None:
+                self.submission_index.set_grade(template.name, submission.id, cached)
+            return json.dumps(cached)
+
+        if not self.client:
+            telemetry.record_local_answer()
+            return json.dumps(local) if local is not None else "I'm sorry, I couldn't process that response."
+
+        try:
+            route = model_router.route(template, fields, self.model)
+            messages = template.messages(**fields)
+            response = self.client.chat.completions.create(
+                model=route.model,
+                messages=messages,
+                max_tokens=min(max_tokens or route.max_tokens, route.max_tokens),
+                temperature=self.temperature
+            )
+
+            usage = getattr(response, 'usage', None)
+            details = getattr(usage, 'prompt_tokens_details', None)
+            cached_tokens = getattr(details, 'cached_tokens', None)
+            if cached_tokens is not None:
+                logger.debug(f"Prompt '{template.name}': {cached_tokens}/{usage.prompt_tokens} input tokens served from cache")
+
+            content = response.choices[0].message.content
+            if bank is not None:
+                bank.record(template.name, answer, content)
+            if submission is not None:
+                evaluation = model_router.parse_evaluation(content)
+                if evaluation is not None:
+                    self.submission_index.set_grade(template.name, submission.id, evaluation)
+            if model_router.should_shadow(route, self.model):
+                threading.Thread(target=self._shadow_evaluate, args=(template, route, messages, content),
+                                 name='llm-shadow', daemon=True).start()
+            return content
+
+        except Exception as e:
+            logger.error(f"Error getting AI response for prompt '{template.name}': {str(e)}")
+            if local is not None:
+                return json.dumps(local)
+            return "I'm sorry, I couldn't process that response."
+
+    def _shadow_evaluate(self, template, route, messages, content):
+        """Re-run an evaluation on the strong tier and record score agreement"""
+        score = model_router.extract_score(content)
+        if score is None:
+            return
+        strong = model_router.tier_route('strong', self.model)
+        try:
+            response = self.client.chat.completions.create(
+                model=strong.model,
+                messages=messages,
+                max_tokens=strong.max_tokens,
+                temperature=self.temperature
+            )
+        except Exception as e:
+            logger.debug(f"Shadow evaluation for prompt '{template.name}' failed: {str(e)}")
+            return
+        shadow_score = model_router.extract_score(response.choices[0].message.content)
+        if shadow_score is not None:
+            model_router.shadow_stats.record(template.name, route.tier, score, shadow_score)
+
     def check_with_sapling_api(self, text):
         """
         Check if text is AI-generated using Sapling's AI Detector API
         Returns tuple of (is_ai_generated, score, reasons)
         """
+        return self.detect_ai_generated(text)[0]
+
+    def detect_ai_generated(self, text):
+        """
+        check_with_sapling_api, also telling whether the local heuristics stood in for Sapling
+        Returns tuple of ((is_ai_generated, score, reasons), fallback)
+        """
         # Skip API call for very short texts
         if len(text) < 50:
-            return (False, 0, ["Text too short for reliable detection"])
+            return (False, 0, ["Text too short for reliable detection"]), False
         
         try:
             if not self.sapling_api_key:
                 logger.info("Sapling API key not found. Falling back to local detection.")
-                return self._is_ai_generated_local(text)
+                return self._is_ai_generated_local(text), True
+            if not deadlines.has_budget(SAPLING_MIN_SECONDS):
+                log_event(logger, 'deadline.skip', stage='sapling', remaining=round(deadlines.remaining(), 3))
+                return self._is_ai_generated_local(text), True
                 
             # Prepare the request
             payload = {
@@ -87,7 +229,8 @@ class AIService:
             }
             
             # Make the API call
-            response = requests.post(self.sapling_api_url, json=payload)
+            response = requests.post(self.sapling_api_url, json=payload,
+                                     timeout=deadlines.timeout(SAPLING_TIMEOUT, floor=SAPLING_MIN_SECONDS))
             
             if response.status_code == 200:
                 result = response.json()
@@ -117,7 +260,7 @@ class AIService:
                 elif score > 0.5:
                     reasons.append("Moderate confidence of AI-generated content")
                 
-                return (is_ai, score, reasons)
+                return (is_ai, score, reasons), False
                 
             else:
                 # Handle API error
@@ -125,12 +268,12 @@ class AIService:
                 logger.error(f"Response: {response.text}")
                 
                 # Fall back to local detection
-                return self._is_ai_generated_local(text)
+                return self._is_ai_generated_local(text), True
                 
         except Exception as e:
             logger.error(f"Error with Sapling API: {str(e)}")
             # Fall back to local detection
-            return self._is_ai_generated_local(text)
+            return self._is_ai_generated_local(text), True
 
     def _is_ai_generated_local(self, text):
         """
@@ -0,0 +1,91 @@
+"""
+Assessment Memo - Reuse a student's grading between feedback and submission
+
+Phase 1 grades the same text twice: /api/get-ai-feedback runs AI detection
+and assess_response, then /api/game/submit (or /submit-response) runs both
+again on the text the student just saw feedback for. The memo keeps each
+user's recent results keyed by (question, question type, normalized answer)
+for a few minutes, so the submit path reuses them instead of calling the
+LLM and Sapling again. Fallback results (the word-count assessment after a
+Groq error, local detection in place of Sapling) are not kept, so the
+submit retries the real grade.
+"""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Feedback and submission normally happen within a minute or two
+MEMO_TTL_SECONDS = 600
+MEMO_MAX_ENTRIES = 5000
+
+
+def normalize_answer(text: str) -> str:
+    """Whitespace-insensitive form of an answer (grading is case-sensitive, so case is kept)"""
+    return ' '.join((text or '').split())
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+class AssessmentMemo:
+    """
+    Per-user TTL memo in front of AssessmentService
+
+    Args:
+        assessment: The AssessmentService (or a lazy proxy to it)
+        ttl: Seconds a result stays reusable
+        max_entries: Oldest entries are evicted beyond this
+    """
+
+    def __init__(self, assessment, ttl: float = MEMO_TTL_SECONDS, max_entries: int = MEMO_MAX_ENTRIES):
+        self.assessment = assessment
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def check_ai_response(self, user_id: Optional[int], text: str):
+        """Memoized AssessmentService.check_ai_response -> (is_ai, score, reasons)"""
+        key = ('detect', user_id, _digest(normalize_answer(text)))
+        return self._get_or_compute(key, lambda: self.assessment.detect_ai_response(text))
+
+    def assess_response(self, user_id: Optional[int], question: str, answer: str,
+                        question_type: Optional[str] = None) -> Dict:
+        """Memoized AssessmentService.assess_response (returns a copy the caller may modify)"""
+        key = ('assess', user_id, _digest(question or '', question_type or '', normalize_answer(answer)))
+        def compute():
+            assessment = self.assessment.assess_response(question, answer, question_type)
+            return assessment, assessment.get('assessment_source') == 'fallback'
+        return self._get_or_compute(key, compute)
+
+    def invalidate_user(self, user_id: int):
+        """Drop everything memoized for a user"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == user_id]:
+                del self._entries[key]
+
+    def _get_or_compute(self, key: Tuple, compute: Callable[[], Tuple[Any, bool]]):
+        """compute returns (value, fallback); fallback values are returned but not kept"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        value, fallback = compute()
+        if fallback:
+            return copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return copy.deepcopy(value)
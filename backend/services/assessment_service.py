@@ -5,13 +5,18 @@ import json
 import logging
 from difflib import SequenceMatcher
 from services.ai_service import AIService
-from models.game_data import DIALOGUE_QUESTIONS
+from models.content_registry import get_index as get_content_index
 
 logger = logging.getLogger(__name__)
 
+
+class AssessmentUnavailable(RuntimeError):
+    """Raised instead of a fallback assessment when the caller asked for a real grade"""
+
+
 class AssessmentService:
-    def __init__(self):
-        self.ai_service = AIService()
+    def __init__(self, ai_service=None):
+        self.ai_service = ai_service or AIService()
 
     def assess_response(self, question, answer, question_type=None):
         """Use Groq or local model to assess the CEFR level of a response"""
@@ -20,10 +25,9 @@ class AssessmentService:
             if question_type == "listening":
                 # Get the expected sentence from DIALOGUE_QUESTIONS
                 expected_sentence = ""
-                for q in DIALOGUE_QUESTIONS:
-                    if q["type"] == "listening":
-                        expected_sentence = q.get("expected_sentence", "We could have a dance show or a food tasting.")
-                        break
+                listening_question = get_content_index(1).question_for_type("listening")
+                if listening_question:
+                    expected_sentence = listening_question.get("expected_sentence", "We could have a dance show or a food tasting.")
 
                 # Use specialized assessment for listening
                 return self.assess_listening_response(expected_sentence, answer)
@@ -177,6 +181,10 @@ class AssessmentService:
         """Check if response is AI-generated using the AI service"""
         return self.ai_service.check_with_sapling_api(text)
 
+    def detect_ai_response(self, text):
+        """check_ai_response plus whether it fell back to local detection -> (result, fallback)"""
+        return self.ai_service.detect_ai_generated(text)
+
     def _get_keyword_analysis(self, text):
         """Analyze keywords in text to help determine vocabulary level"""
         # Advanced vocabulary (C1-B2)
@@ -232,11 +240,9 @@ class AssessmentService:
         """Create a detailed prompt for the AI to assess the CEFR level of a response"""
         # Get the example responses for this question type if available
         example_responses = {}
-        if question_type:
-            for q in DIALOGUE_QUESTIONS:
-                if q["type"] == question_type and "example_responses" in q:
-                    example_responses = q["example_responses"]
-                    break
+        type_question = get_content_index(1).question_for_type(question_type) if question_type else None
+        if type_question and "example_responses" in type_question:
+            example_responses = type_question["example_responses"]
 
         # Generate examples section if we have examples
         examples_section = ""
@@ -247,14 +253,11 @@ class AssessmentService:
 
         # Get assessment criteria for this question type
         assessment_criteria_section = ""
-        if question_type:
-            for q in DIALOGUE_QUESTIONS:
-                if q["type"] == question_type and "assessment_criteria" in q:
-                    criteria = q["assessment_criteria"]
-                    assessment_criteria_section = "Assessment criteria for this question type:\n\n"
-                    for criterion, weight in criteria.items():
-                        assessment_criteria_section += f"- {criterion.replace('_', ' ').title()}: {weight*100}% of the assessment\n"
-                    break
+        if type_question and "assessment_criteria" in type_question:
+            criteria = type_question["assessment_criteria"]
+            assessment_criteria_section = "Assessment criteria for this question type:\n\n"
+            for criterion, weight in criteria.items():
+                assessment_criteria_section += f"- {criterion.replace('_', ' ').title()}: {weight*100}% of the assessment\n"
 
         # Perform preliminary analysis to help guide the AI for non-listening questions
         keyword_analysis = self._get_keyword_analysis(answer)
@@ -375,6 +378,7 @@ class AssessmentService:
 
         return {
             "level": level,
+            "assessment_source": "fallback",
             "justification": f"Assessment based on word count: {word_count}, advanced terms: {keyword_analysis['advanced_count']}, complex structures: {'yes' if grammar_analysis['has_complex_sentences'] else 'no'}",
             "vocabulary_assessment": f"Basic: {keyword_analysis['basic_count']}, Intermediate: {keyword_analysis['intermediate_count']}, Advanced: {keyword_analysis['advanced_count']}",
             "grammar_assessment": f"Average sentence length: {grammar_analysis['average_sentence_length']:.1f}",
@@ -386,23 +390,22 @@ class AssessmentService:
             "tips_for_improvement": "Continue practicing with more complex sentences and vocabulary"
         }
         
-    def assess_phase2_response(self, step_id, action_item_id, response):
-        """Assess Phase 2 responses with specific cultural event planning criteria"""
+    def assess_phase2_response(self, step_id, action_item_id, response, strict=False):
+        """
+        Assess Phase 2 responses with specific cultural event planning criteria
+
+        With strict=True, AssessmentUnavailable is raised wherever the
+        rule-based fallback would otherwise be returned (no action item, no
+        client, a Groq error or an unparseable reply).
+        """
         try:
-            from models.game_data import PHASE_2_STEPS, PHASE_2_POINTS
+            from models.game_data import PHASE_2_POINTS
             
             # Get action item data
-            step_data = PHASE_2_STEPS.get(step_id, {})
-            action_items = step_data.get('action_items', [])
-            
-            action_item = None
-            for item in action_items:
-                if item['id'] == action_item_id:
-                    action_item = item
-                    break
+            action_item = get_content_index(2).item(step_id, action_item_id)
             
             if not action_item:
-                return self._fallback_phase2_assessment(response)
+                return self._fallback_phase2_assessment(response, strict)
             
             # Analyze response
             keyword_analysis = self._get_keyword_analysis(response)
@@ -458,13 +461,15 @@ class AssessmentService:
                     
                 except json.JSONDecodeError:
                     logger.error(f"Failed to parse Phase 2 assessment JSON: {result}")
-                    return self._fallback_phase2_assessment(response)
+                    return self._fallback_phase2_assessment(response, strict)
             else:
-                return self._fallback_phase2_assessment(response)
+                return self._fallback_phase2_assessment(response, strict)
                     
+        except AssessmentUnavailable:
+            raise
         except Exception as e:
             logger.error(f"Error in Phase 2 assessment: {str(e)}")
-            return self._fallback_phase2_assessment(response)
+            return self._fallback_phase2_assessment(response, strict)
     
     def _get_phase2_assessment_prompt(self, action_item, response, step_id):
         """Create assessment prompt for Phase 2 activities"""
@@ -526,8 +531,10 @@ class AssessmentService:
         }}
         """
 
-    def _fallback_phase2_assessment(self, response):
+    def _fallback_phase2_assessment(self, response, strict=False):
         """Fallback assessment for Phase 2 when AI is unavailable"""
+        if strict:
+            raise AssessmentUnavailable("Phase 2 assessment fell back to the rule-based rubric")
         from models.game_data import PHASE_2_POINTS
         
         word_count = len(response.split())
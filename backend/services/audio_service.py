@@ -3,12 +3,15 @@ Audio Service for generating speech using Edge TTS
 """
 import os
 import asyncio
-import edge_tts
 import logging
 from models.game_data import DIALOGUE_QUESTIONS
+from utils import deadlines
 
 logger = logging.getLogger(__name__)
 
+# Seconds allowed for one Edge TTS synthesis (less when the request's deadline is closer)
+TTS_TIMEOUT = float(os.getenv('TTS_TIMEOUT', '30'))
+
 class AudioService:
     def __init__(self):
         self.audio_dir = os.path.join('static', 'audio')
@@ -17,6 +20,7 @@ class AudioService:
     async def generate_audio(self, text, output_path, voice="en-US-ChristopherNeural"):
         """Generate audio file using Edge TTS"""
         try:
+            import edge_tts  # heavy (aiohttp); only needed when generating audio
             communicate = edge_tts.Communicate(text, voice)
             await communicate.save(output_path)
             logger.info(f"Generated audio file: {output_path}")
@@ -25,12 +29,17 @@ class AudioService:
             raise
 
     def generate_audio_sync(self, text, output_path, voice="en-US-ChristopherNeural"):
-        """Synchronous wrapper for generate_audio"""
+        """Synchronous wrapper for generate_audio, bounded by TTS_TIMEOUT and the request deadline"""
         try:
-            asyncio.run(self.generate_audio(text, output_path, voice))
+            deadlines.check('tts')
+            asyncio.run(asyncio.wait_for(self.generate_audio(text, output_path, voice),
+                                         timeout=deadlines.timeout(TTS_TIMEOUT)))
             return True
         except Exception as e:
-            logger.error(f"Error in synchronous audio generation: {str(e)}")
+            logger.error(f"Error in synchronous audio generation: {type(e).__name__}: {str(e)}")
+            # A timed-out synthesis leaves a truncated file behind
+            if isinstance(e, asyncio.TimeoutError) and os.path.exists(output_path):
+                os.remove(output_path)
             return False
 
     def verify_audio_files(self):
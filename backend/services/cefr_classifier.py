@@ -0,0 +1,313 @@
+"""
+CEFR Classifier - A local grader distilled from stored LLM grades
+
+Thousands of answers already carry an LLM-assigned CEFR level
+(phase2_responses, and graded_answers for the Phase 4-6 evaluators). The
+training pipeline turns each answer into a handful of lexical and syntactic
+features (length, sentence length, type-token ratio, connectors, tenses,
+glossary hits, ...) and fits a multinomial logistic regression on them. The
+model is a few dozen weights stored as JSON, so it loads instantly and
+predicts in microseconds on the CPU, without NumPy.
+
+AIService.complete_template uses it for single-answer evaluator templates:
+a prediction at or above CONFIDENCE_THRESHOLD is returned directly, anything
+less confident goes to the LLM. When Groq is unavailable every prediction
+is used, which replaces the word-count fallbacks with a trained grader.
+
+    python -m services.cefr_classifier train [--db fardi.db] [--out instance/cefr_classifier.json]
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import re
+import sqlite3
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.feedback_bank import level_evaluation, rubric_levels
+
+logger = logging.getLogger(__name__)
+
+MODEL_PATH = os.getenv('CEFR_CLASSIFIER_PATH', os.path.join('instance', 'cefr_classifier.json'))
+CONFIDENCE_THRESHOLD = float(os.getenv('CEFR_CLASSIFIER_CONFIDENCE', '0.8'))
+
+CEFR_LEVELS = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2')
+
+# Training settings
+EPOCHS = 40
+LEARNING_RATE = 0.05
+L2 = 1e-4
+HOLDOUT = 0.2
+MIN_TRAINING_ROWS = 50
+
+BASIC_CONNECTORS = {'and', 'but', 'because', 'so', 'or', 'then', 'also'}
+ADVANCED_CONNECTORS = {'however', 'although', 'therefore', 'moreover', 'furthermore', 'whereas',
+                       'while', 'since', 'thus', 'consequently', 'nevertheless', 'despite', 'unless',
+                       'ensuring', 'thereby', 'meanwhile', 'instead'}
+IRREGULAR_PAST = {'was', 'were', 'had', 'did', 'went', 'said', 'made', 'took', 'came', 'saw', 'got',
+                  'gave', 'found', 'thought', 'told', 'felt', 'became', 'left', 'began', 'wrote', 'met'}
+MODALS = {'will', 'would', 'could', 'should', 'might', 'may', 'must', 'can', 'shall'}
+BE_FORMS = {'is', 'are', 'was', 'were', 'be', 'been', 'being'}
+
+FEATURES = ('log_words', 'sentence_length', 'word_length', 'type_token', 'long_words',
+            'basic_connectors', 'advanced_connectors', 'past_tense', 'modals', 'passive',
+            'progressive', 'commas', 'glossary_hits', 'glossary_ratio')
+
+_WORD_RE = re.compile(r"[A-Za-z']+")
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_GLOSSARY_RE = re.compile(r'^(?:Expected vocabulary(?: terms)?|Target vocabulary)\s*:\s*(.+)$', re.MULTILINE)
+
+
+def glossary_terms(template) -> Tuple[str, ...]:
+    """Vocabulary a rubric expects (its "Expected/Target vocabulary:" line)"""
+    match = _GLOSSARY_RE.search(getattr(template, 'system', '') or '')
+    if not match:
+        return ()
+    return tuple(term.strip().lower() for term in match.group(1).split(',') if term.strip())
+
+
+def extract_features(text: str, glossary: Sequence[str] = ()) -> List[float]:
+    """Feature vector for an answer, in FEATURES order"""
+    words = [w.lower() for w in _WORD_RE.findall(text or '')]
+    n = len(words) or 1
+    sentences = [s for s in _SENTENCE_RE.split(text or '') if s.strip()] or ['']
+    lowered = (text or '').lower()
+    hits = sum(1 for term in glossary if term in lowered)
+    pairs = list(zip(words, words[1:]))
+
+    return [
+        math.log1p(len(words)),
+        len(words) / len(sentences),
+        sum(len(w) for w in words) / n,
+        len(set(words)) / n,
+        sum(len(w) >= 7 for w in words) / n,
+        sum(w in BASIC_CONNECTORS for w in words) / len(sentences),
+        sum(w in ADVANCED_CONNECTORS for w in words) / len(sentences),
+        sum(w in IRREGULAR_PAST or (w.endswith('ed') and len(w) > 4) for w in words) / n,
+        sum(w in MODALS for w in words) / n,
+        sum(a in BE_FORMS and b.endswith('ed') for a, b in pairs) / len(sentences),
+        sum(a in BE_FORMS and b.endswith('ing') for a, b in pairs) / len(sentences),
+        (text or '').count(',') / len(sentences),
+        float(hits),
+        hits / len(glossary) if glossary else 0.0,
+    ]
+
+
+def _softmax(scores: List[float]) -> List[float]:
+    top = max(scores)
+    exps = [math.exp(s - top) for s in scores]
+    total = sum(exps)
+    return [e / total for e in exps]
+
+
+class CefrClassifier:
+    """
+    Multinomial logistic regression over answer features
+
+    Args:
+        model: Trained parameters (see train()); None for an untrained classifier
+    """
+
+    def __init__(self, model: Optional[Dict] = None, threshold: float = CONFIDENCE_THRESHOLD):
+        self.model = model
+        self.threshold = threshold
+        self.hits = 0
+        self.deferred = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.model is not None
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> 'CefrClassifier':
+        """Load a trained model (an untrained classifier if the file is missing or unreadable)"""
+        if not path or not os.path.exists(path):
+            return cls()
+        try:
+            with open(path) as f:
+                return cls(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading CEFR classifier {path}: {str(e)}")
+            return cls()
+
+    def predict(self, text: str, glossary: Sequence[str] = ()) -> Optional[Tuple[str, float, Dict[str, float]]]:
+        """
+        Predict an answer's CEFR level
+
+        Returns:
+            (level, confidence, probability per level), or None when untrained
+        """
+        if not self.ready:
+            return None
+        x = [(value - mean) / std for value, mean, std in
+             zip(extract_features(text, glossary), self.model['mean'], self.model['std'])]
+        scores = [bias + sum(w * v for w, v in zip(weights, x))
+                  for weights, bias in zip(self.model['weights'], self.model['bias'])]
+        probabilities = _softmax(scores)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return (self.model['levels'][best], probabilities[best],
+                {level: round(p, 4) for level, p in zip(self.model['levels'], probabilities)})
+
+    def grade(self, template, text: str) -> Optional[Dict]:
+        """
+        Evaluator-style reply for a single-answer template, graded locally
+
+        The predicted level is mapped to the points and description of the
+        rubric's line for that level (the nearest level the rubric has).
+
+        Returns:
+            Evaluation dict with 'confidence' and 'confident' (at or above
+            the threshold), or None when the template or model cannot be used
+        """
+        if not self.ready or len(template.fields) != 1:
+            return None
+        levels = rubric_levels(template)
+        if not levels:
+            return None
+
+        level, confidence, probabilities = self.predict(text, glossary_terms(template))
+        if level not in levels:
+            level = min(levels, key=lambda known: abs(CEFR_LEVELS.index(known) - CEFR_LEVELS.index(level)))
+        points, description, _ = levels[level]
+
+        confident = confidence >= self.threshold
+        if confident:
+            self.hits += 1
+        else:
+            self.deferred += 1
+        return dict(level_evaluation(level, points, description, source='typical'),
+                    confidence=round(confidence, 3), confident=confident,
+                    feedback_source='classifier')
+
+
+def train(rows: List[Tuple[str, Sequence[str], str]], seed: int = 7) -> Dict:
+    """
+    Fit the classifier with stochastic gradient descent
+
+    Args:
+        rows: (answer text, glossary terms, CEFR level) triples
+
+    Returns:
+        Model dict (levels, mean, std, weights, bias, and held-out metrics)
+    """
+    rng = random.Random(seed)
+    rows = [row for row in rows if row[2] in CEFR_LEVELS and row[0].strip()]
+    rng.shuffle(rows)
+    levels = [level for level in CEFR_LEVELS if any(row[2] == level for row in rows)]
+    if len(rows) < MIN_TRAINING_ROWS or len(levels) < 2:
+        raise ValueError(f'Need at least {MIN_TRAINING_ROWS} graded answers across two levels '
+                         f'(have {len(rows)} in {len(levels)})')
+
+    data = [(extract_features(text, glossary), levels.index(level)) for text, glossary, level in rows]
+    split = int(len(data) * (1 - HOLDOUT))
+    training, holdout = data[:split], data[split:]
+
+    dims = len(FEATURES)
+    mean = [sum(x[i] for x, _ in training) / len(training) for i in range(dims)]
+    std = [math.sqrt(sum((x[i] - mean[i]) ** 2 for x, _ in training) / len(training)) or 1.0
+           for i in range(dims)]
+    weights = [[0.0] * dims for _ in levels]
+    bias = [0.0] * len(levels)
+
+    def standardize(x):
+        return [(v - m) / s for v, m, s in zip(x, mean, std)]
+
+    training = [(standardize(x), y) for x, y in training]
+    for epoch in range(EPOCHS):
+        rng.shuffle(training)
+        rate = LEARNING_RATE / (1 + epoch * 0.1)
+        for x, y in training:
+            probabilities = _softmax([b + sum(w * v for w, v in zip(ws, x)) for ws, b in zip(weights, bias)])
+            for k, p in enumerate(probabilities):
+                gradient = p - (k == y)
+                ws = weights[k]
+                for i in range(dims):
+                    ws[i] -= rate * (gradient * x[i] + L2 * ws[i])
+                bias[k] -= rate * gradient
+
+    model = {'levels': levels, 'features': list(FEATURES), 'mean': mean, 'std': std,
+             'weights': weights, 'bias': bias, 'trained_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+             'training_rows': len(training)}
+
+    # Held-out accuracy overall and on the predictions that would skip the LLM
+    correct = confident = confident_correct = 0
+    for x, y in holdout:
+        scores = [b + sum(w * v for w, v in zip(ws, standardize(x))) for ws, b in zip(weights, bias)]
+        probabilities = _softmax(scores)
+        best = max(range(len(levels)), key=probabilities.__getitem__)
+        correct += best == y
+        if probabilities[best] >= CONFIDENCE_THRESHOLD:
+            confident += 1
+            confident_correct += best == y
+    model['holdout'] = {
+        'rows': len(holdout),
+        'accuracy': round(correct / len(holdout), 3) if holdout else None,
+        'confident_share': round(confident / len(holdout), 3) if holdout else None,
+        'confident_accuracy': round(confident_correct / confident, 3) if confident else None,
+    }
+    return model
+
+
+def load_training_rows(db_path: str, templates=()) -> List[Tuple[str, Tuple[str, ...], str]]:
+    """
+    Graded answers with their LLM-assigned level
+
+    phase2_responses gives Phase 2 answers with their CEFR level; graded_answers
+    (filled by the evaluator gateway) gives Phase 4-6 answers, whose template
+    supplies the glossary. phase5_progress/phase6_progress keep only scores,
+    not answer text, so they cannot be used.
+    """
+    glossaries = {template.name: glossary_terms(template) for template in templates}
+    single_field = {template.name for template in templates if len(template.fields) == 1}
+    rows = []
+    conn = sqlite3.connect(db_path)
+    try:
+        for text, level in conn.execute('''
+            SELECT response_text, cefr_level FROM phase2_responses
+            WHERE response_text IS NOT NULL AND cefr_level IS NOT NULL
+        '''):
+            rows.append((text, (), level.upper()))
+
+        try:
+            graded = conn.execute('SELECT template_name, answer_text, evaluation FROM graded_answers').fetchall()
+        except sqlite3.OperationalError:
+            graded = []
+        for name, text, evaluation in graded:
+            if name not in single_field:
+                continue
+            try:
+                level = json.loads(evaluation).get('level')
+            except ValueError:
+                continue
+            if isinstance(level, str):
+                rows.append((text, glossaries.get(name, ()), level.upper()[:2]))
+    finally:
+        conn.close()
+    return rows
+
+
+def _main():
+    parser = argparse.ArgumentParser(description='Train the local CEFR classifier from stored LLM grades')
+    parser.add_argument('command', choices=['train'])
+    parser.add_argument('--db', default='fardi.db', help='database with phase2_responses/graded_answers')
+    parser.add_argument('--out', default=MODEL_PATH, help='model file to write')
+    args = parser.parse_args()
+
+    # Importing the route modules registers every evaluator template
+    import routes.phase4_routes  # noqa: F401
+    import routes.phase5_routes  # noqa: F401
+    import routes.phase6_routes  # noqa: F401
+    from services import prompt_templates
+
+    model = train(load_training_rows(args.db, prompt_templates.all_templates()))
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(model, f)
+    print(f"Wrote {args.out}: {model['training_rows']} training rows, held-out {model['holdout']}")
+
+
+if __name__ == '__main__':
+    _main()
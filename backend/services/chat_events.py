@@ -0,0 +1,99 @@
+"""
+Chat Events - In-process pub/sub for real-time chat delivery
+
+chat_send_message publishes each new message to the sender's and the
+receiver's channels. The SSE stream (/api/chat/stream) and the long-poll
+endpoint (/api/chat/poll) subscribe per user, so idle clients block on a
+queue instead of hitting the database every few seconds.
+
+Delivery is per process: a client connected to another worker only learns
+about the message through the since-id catch-up query its stream or poll
+runs on (re)connect. The event ids are chat_messages ids, which makes that
+catch-up exact.
+"""
+import queue
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set
+
+DEFAULT_QUEUE_SIZE = 100
+
+
+class Subscription:
+    """One connected client's queue of chat events"""
+
+    def __init__(self, broker: 'ChatBroker', user_id: int, maxsize: int = DEFAULT_QUEUE_SIZE):
+        self.broker = broker
+        self.user_id = user_id
+        self.queue: 'queue.Queue[Dict[str, Any]]' = queue.Queue(maxsize)
+        # Set when events were dropped because the client fell behind;
+        # the consumer should re-read from the database
+        self.overflowed = False
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.overflowed = True
+            return False
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next event (None on timeout)"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ChatBroker:
+    """Fan-out of chat events to every subscription of a user"""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> Subscription:
+        """Start receiving events addressed to a user"""
+        subscription = Subscription(self, user_id, self.queue_size)
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def publish(self, user_ids: Iterable[int], event: Dict[str, Any]) -> int:
+        """
+        Deliver an event to every subscription of the given users
+
+        Returns:
+            Number of subscriptions the event was queued for
+        """
+        with self._lock:
+            targets = [sub for user_id in set(user_ids) for sub in self._subscribers.get(user_id, ())]
+        return sum(1 for subscription in targets if subscription.offer(event))
+
+    def subscriber_count(self, user_id: Optional[int] = None) -> int:
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscribers.get(user_id, ()))
+            return sum(len(subs) for subs in self._subscribers.values())
+
+
+broker = ChatBroker()
@@ -5,8 +5,7 @@ Handles collectible drops, user collections, and rarity system
 
 import random
 import sqlite3
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Rarity drop rates
 DROP_RATES = {
@@ -17,6 +16,11 @@ DROP_RATES = {
     "legendary": 0.02
 }
 
+# Chance that an activity drops anything at all
+DROP_CHANCE = 0.8
+
+RARITY_ORDER = ["legendary", "epic", "rare", "uncommon", "common"]
+
 # Rarity colors for UI
 RARITY_COLORS = {
     "common": "#95A5A6",
@@ -27,40 +31,75 @@ RARITY_COLORS = {
 }
 
 
+class AliasSampler:
+    """
+    Walker/Vose alias table: O(1) weighted choice after O(n) setup
+
+    Args:
+        weights: Mapping of outcome to (not necessarily normalised) weight
+    """
+
+    def __init__(self, weights: Dict[str, float]):
+        self.outcomes = list(weights)
+        n = len(self.outcomes)
+        total = float(sum(weights.values()))
+        scaled = [weights[o] * n / total for o in self.outcomes]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, rng=random) -> str:
+        column = rng.randrange(len(self.outcomes))
+        return self.outcomes[column if rng.random() < self.prob[column] else self.alias[column]]
+
+
+RARITY_SAMPLER = AliasSampler(DROP_RATES)
+
+
 class CollectibleService:
     """Service for managing collectibles"""
-    
-    def __init__(self, db_path='instance/fardi.db'):
+
+    def __init__(self, db_path='instance/fardi.db', rng=None):
         self.db_path = db_path
-    
+        self.rng = rng or random.Random()
+        self._catalog = None
+
     def get_connection(self):
         """Get database connection"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
     
-    def get_all_collectibles(self) -> List[Dict]:
-        """Get all available collectibles"""
+    @property
+    def catalog(self) -> Dict[str, Tuple[Dict, ...]]:
+        """Static collectible catalog grouped by rarity, loaded once per process"""
+        if self._catalog is None:
+            self.reload_catalog()
+        return self._catalog
+
+    def reload_catalog(self):
+        """Re-read the collectibles table (after seeding new items)"""
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT collectible_id, name, description, rarity, icon, category
-            FROM collectibles
-            ORDER BY 
-                CASE rarity
-                    WHEN 'legendary' THEN 1
-                    WHEN 'epic' THEN 2
-                    WHEN 'rare' THEN 3
-                    WHEN 'uncommon' THEN 4
-                    WHEN 'common' THEN 5
-                END,
-                name
-        ''')
-        
-        collectibles = []
-        for row in cursor.fetchall():
-            collectibles.append({
+        try:
+            rows = conn.execute('''
+                SELECT collectible_id, name, description, rarity, icon, category
+                FROM collectibles
+                ORDER BY name
+            ''').fetchall()
+        finally:
+            conn.close()
+
+        by_rarity = {rarity: [] for rarity in RARITY_ORDER}
+        for row in rows:
+            by_rarity.setdefault(row['rarity'], []).append({
                 "id": row['collectible_id'],
                 "name": row['name'],
                 "description": row['description'],
@@ -69,9 +108,11 @@ class CollectibleService:
                 "category": row['category'],
                 "color": RARITY_COLORS.get(row['rarity'], "#95A5A6")
             })
-        
-        conn.close()
-        return collectibles
+        self._catalog = {rarity: tuple(items) for rarity, items in by_rarity.items()}
+
+    def get_all_collectibles(self) -> List[Dict]:
+        """Get all available collectibles"""
+        return [dict(item) for rarity in RARITY_ORDER for item in self.catalog.get(rarity, ())]
     
     def get_user_collection(self, user_id: int) -> Dict:
         """Get user's collectible collection"""
@@ -142,76 +183,52 @@ class CollectibleService:
         Award a random collectible to user based on rarity drop rates
         Returns: collectible data if dropped, None if no drop
         """
-        # Determine if a collectible drops (80% chance)
-        if random.random() > 0.8:
-            return None
-        
-        # Select rarity based on drop rates
-        rarity = self._select_rarity()
-        
-        # Get a random collectible of that rarity
+        return self.drop_many([user_id], source)[user_id]
+
+    def drop_many(self, user_ids: Iterable[int], source: str = "activity") -> Dict[int, Optional[Dict]]:
+        """
+        Roll a drop for each user (e.g. a classroom-wide reward) in one transaction
+
+        Args:
+            user_ids: Users to roll for
+            source: Where the drop came from (activity, event, ...)
+
+        Returns:
+            Dict of user_id to the dropped collectible (None if nothing dropped)
+        """
+        results = {user_id: self._roll() for user_id in user_ids}
+        dropped = [(user_id, item) for user_id, item in results.items() if item]
+        if not dropped:
+            return results
+
         conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT collectible_id, name, description, rarity, icon, category
-            FROM collectibles
-            WHERE rarity = ?
-            ORDER BY RANDOM()
-            LIMIT 1
-        ''', (rarity,))
-        
-        result = cursor.fetchone()
-        
-        if not result:
+        try:
+            for user_id, item in dropped:
+                quantity = conn.execute('''
+                    INSERT INTO user_collectibles (user_id, collectible_id, quantity)
+                    VALUES (?, ?, 1)
+                    ON CONFLICT(user_id, collectible_id)
+                    DO UPDATE SET quantity = quantity + 1
+                    RETURNING quantity
+                ''', (user_id, item["id"])).fetchone()[0]
+                results[user_id] = dict(item, is_new=quantity == 1, source=source)
+            conn.commit()
+        finally:
             conn.close()
+        return results
+
+    def _roll(self) -> Optional[Dict]:
+        """Pick the collectible for one drop (None if nothing drops)"""
+        if self.rng.random() > DROP_CHANCE:
             return None
-        
-        collectible_id = result['collectible_id']
-        
-        # Check if user already has this collectible
-        cursor.execute('''
-            SELECT quantity FROM user_collectibles
-            WHERE user_id = ? AND collectible_id = ?
-        ''', (user_id, collectible_id))
-        
-        existing = cursor.fetchone()
-        is_new = existing is None
-        
-        # Add to user's collection
-        cursor.execute('''
-            INSERT INTO user_collectibles (user_id, collectible_id, quantity)
-            VALUES (?, ?, 1)
-            ON CONFLICT(user_id, collectible_id)
-            DO UPDATE SET quantity = quantity + 1
-        ''', (user_id, collectible_id))
-        
-        conn.commit()
-        conn.close()
-        
-        return {
-            "id": collectible_id,
-            "name": result['name'],
-            "description": result['description'],
-            "rarity": result['rarity'],
-            "icon": result['icon'],
-            "category": result['category'],
-            "color": RARITY_COLORS.get(result['rarity'], "#95A5A6"),
-            "is_new": is_new,
-            "source": source
-        }
-    
+        items = self.catalog.get(self._select_rarity(), ())
+        if not items:
+            return None
+        return items[self.rng.randrange(len(items))]
+
     def _select_rarity(self) -> str:
         """Select a rarity based on drop rates"""
-        rand = random.random()
-        cumulative = 0.0
-        
-        for rarity, rate in DROP_RATES.items():
-            cumulative += rate
-            if rand <= cumulative:
-                return rarity
-        
-        return "common"  # Fallback
+        return RARITY_SAMPLER.sample(self.rng)
     
     def get_collection_stats(self, user_id: int) -> Dict:
         """Get user's collection statistics"""
@@ -0,0 +1,236 @@
+"""
+Export Service - Streams admin data dumps (CSV or JSONL, optionally gzipped)
+
+Rows are read from a single cursor with fetchmany() and encoded chunk by
+chunk, so an export of any size runs in constant memory and the download
+starts as soon as the first chunk is ready.
+"""
+import csv
+import io
+import json
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+DEFAULT_CHUNK_SIZE = 500
+
+# (column key, CSV header). The first fourteen match the original CSV export.
+USER_EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ('id', 'ID'),
+    ('username', 'Username'),
+    ('email', 'Email'),
+    ('first_name', 'First Name'),
+    ('last_name', 'Last Name'),
+    ('role', 'Role'),
+    ('active', 'Active'),
+    ('created_at', 'Created At'),
+    ('last_login', 'Last Login'),
+    ('total_assessments', 'Total Assessments'),
+    ('best_level', 'Best Level'),
+    ('total_xp', 'Total XP'),
+    ('phase2_steps_completed', 'Phase2 Steps Completed'),
+    ('phase2_steps_attempted', 'Phase2 Steps Attempted'),
+] + [
+    column for phase in range(1, 7) for column in (
+        (f'phase{phase}_completed', f'Phase{phase} Completed'),
+        (f'phase{phase}_score', f'Phase{phase} Score'),
+        (f'phase{phase}_level', f'Phase{phase} Level'),
+    )
+] + [
+    ('phase5_steps_completed', 'Phase5 Steps Completed'),
+    ('phase5_total_score', 'Phase5 Total Score'),
+    ('phase6_steps_completed', 'Phase6 Steps Completed'),
+    ('phase6_total_score', 'Phase6 Total Score'),
+    ('phase2_remedial_attempts', 'Phase2 Remedial Attempts'),
+    ('phase2_remedial_completed', 'Phase2 Remedial Completed'),
+    ('phase5_remedial_attempts', 'Phase5 Remedial Attempts'),
+    ('phase5_remedial_passed', 'Phase5 Remedial Passed'),
+    ('phase6_remedial_attempts', 'Phase6 Remedial Attempts'),
+    ('phase6_remedial_passed', 'Phase6 Remedial Passed'),
+    ('ai_flagged_responses', 'AI Flagged Responses'),
+    ('avg_ai_score', 'Avg AI Score'),
+    ('avg_ai_usage_percentage', 'Avg AI Usage %'),
+]
+
+_PHASE_COMPLETION_COLUMNS = ',\n'.join(
+    f"MAX(CASE WHEN phase_number = {p} THEN completed END) AS phase{p}_completed, "
+    f"MAX(CASE WHEN phase_number = {p} THEN overall_score END) AS phase{p}_score, "
+    f"MAX(CASE WHEN phase_number = {p} THEN final_level END) AS phase{p}_level"
+    for p in range(1, 7)
+)
+
+# Every per-user aggregate is computed by SQLite in one pass per table;
+# Python only ever holds one chunk of the joined result.
+USER_EXPORT_QUERY = f'''
+    SELECT u.id, u.username, u.email, u.first_name, u.last_name, u.is_admin, u.is_active,
+           u.created_at, u.last_login,
+           COALESCE(ar.total_assessments, 0) AS total_assessments,
+           COALESCE(latest.overall_level, 'N/A') AS best_level,
+           COALESCE(ar.total_xp, 0) AS total_xp,
+           COALESCE(ar.avg_ai_usage, 0) AS avg_ai_usage_percentage,
+           COALESCE(p2.steps_completed, 0) AS phase2_steps_completed,
+           COALESCE(p2.steps_attempted, 0) AS phase2_steps_attempted,
+           pc.*,
+           COALESCE(p5.steps_completed, 0) AS phase5_steps_completed,
+           COALESCE(p5.total_score, 0) AS phase5_total_score,
+           COALESCE(p6.steps_completed, 0) AS phase6_steps_completed,
+           COALESCE(p6.total_score, 0) AS phase6_total_score,
+           COALESCE(r2.attempts, 0) AS phase2_remedial_attempts,
+           COALESCE(r2.completed, 0) AS phase2_remedial_completed,
+           COALESCE(r5.attempts, 0) AS phase5_remedial_attempts,
+           COALESCE(r5.passed, 0) AS phase5_remedial_passed,
+           COALESCE(r6.attempts, 0) AS phase6_remedial_attempts,
+           COALESCE(r6.passed, 0) AS phase6_remedial_passed,
+           COALESCE(ai.flagged, 0) AS ai_flagged_responses,
+           ai.avg_score AS avg_ai_score
+    FROM users u
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS total_assessments, SUM(xp_earned) AS total_xp,
+               AVG(ai_usage_percentage) AS avg_ai_usage
+        FROM assessment_results GROUP BY user_id
+    ) ar ON ar.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, overall_level,
+               ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY completed_at DESC) AS rn
+        FROM assessment_results
+    ) latest ON latest.user_id = u.id AND latest.rn = 1
+    LEFT JOIN (
+        SELECT user_id,
+               COUNT(DISTINCT step_id) AS steps_attempted,
+               COUNT(DISTINCT CASE WHEN step_completed = 1 THEN step_id END) AS steps_completed
+        FROM phase2_progress GROUP BY user_id
+    ) p2 ON p2.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id AS pc_user_id,
+               {_PHASE_COMPLETION_COLUMNS}
+        FROM user_phase_completion GROUP BY user_id
+    ) pc ON pc.pc_user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, SUM(completed) AS steps_completed, SUM(total_score) AS total_score
+        FROM phase5_progress GROUP BY user_id
+    ) p5 ON p5.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, SUM(completed) AS steps_completed, SUM(total_score) AS total_score
+        FROM phase6_progress GROUP BY user_id
+    ) p6 ON p6.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS attempts, SUM(completed) AS completed
+        FROM phase2_remedial GROUP BY user_id
+    ) r2 ON r2.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS attempts, SUM(passed) AS passed
+        FROM phase5_remedial GROUP BY user_id
+    ) r5 ON r5.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS attempts, SUM(passed) AS passed
+        FROM phase6_remedial GROUP BY user_id
+    ) r6 ON r6.user_id = u.id
+    LEFT JOIN (
+        SELECT user_id, SUM(ai_detected) AS flagged, AVG(ai_score) AS avg_score
+        FROM phase2_responses GROUP BY user_id
+    ) ai ON ai.user_id = u.id
+'''
+
+
+class ExportService:
+    """Streams admin exports from a fresh connection per export"""
+
+    def __init__(self, connection_factory: Callable[[], Any], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.connection_factory = connection_factory
+        self.chunk_size = chunk_size
+
+    def iter_user_rows(self, search: str = '', role_filter: str = '') -> Iterator[Dict[str, Any]]:
+        """
+        Yield one export row per user, newest accounts first
+
+        Args:
+            search: Substring matched against username, email and names
+            role_filter: Exact role to keep (empty for all)
+        """
+        conditions, params = [], []
+        if search:
+            conditions.append('(u.username LIKE ? OR u.email LIKE ? OR u.first_name LIKE ? OR u.last_name LIKE ?)')
+            params.extend([f'%{search}%'] * 4)
+        if role_filter:
+            conditions.append('u.role = ?')
+            params.append(role_filter)
+        where_clause = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+
+        conn = self.connection_factory()
+        try:
+            cursor = conn.execute(f'{USER_EXPORT_QUERY}{where_clause} ORDER BY u.created_at DESC, u.id DESC', params)
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._user_record(dict(row))
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _user_record(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a joined row into the export columns"""
+        record = {key: row.get(key) for key, _ in USER_EXPORT_COLUMNS}
+        record['role'] = 'Admin' if row.get('is_admin') else 'User'
+        record['active'] = 'Yes' if row.get('is_active') else 'No'
+        if record['avg_ai_score'] is not None:
+            record['avg_ai_score'] = round(record['avg_ai_score'], 4)
+        record['avg_ai_usage_percentage'] = round(record['avg_ai_usage_percentage'] or 0, 2)
+        return record
+
+    def stream_users(self, fmt: str = 'csv', search: str = '', role_filter: str = '',
+                     compress: bool = False) -> Iterator[bytes]:
+        """Encoded (and optionally gzipped) export chunks, ready for a streaming response"""
+        rows = self.iter_user_rows(search=search, role_filter=role_filter)
+        chunks = encode_csv(rows, USER_EXPORT_COLUMNS, self.chunk_size) if fmt == 'csv' \
+            else encode_jsonl(rows, self.chunk_size)
+        return gzip_stream(chunks) if compress else chunks
+
+
+def encode_csv(rows: Iterable[Dict[str, Any]], columns: List[Tuple[str, str]],
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Encode dict rows as CSV, one header line then chunk_size rows per yield"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in columns])
+    pending = 0
+    for row in rows:
+        writer.writerow(['' if row.get(key) is None else row.get(key) for key, _ in columns])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode('utf-8')
+
+
+def encode_jsonl(rows: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Encode dict rows as JSON Lines, chunk_size rows per yield"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) >= chunk_size:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a byte stream on the fly"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def parse_export_format(value: Optional[str]) -> str:
+    """Validate the ?format= argument (defaults to csv)"""
+    fmt = (value or 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {value}")
+    return fmt
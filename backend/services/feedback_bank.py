@@ -0,0 +1,364 @@
+"""
+Feedback Bank - Grade near-copies of known answers without calling Groq
+
+Many student answers closely paraphrase the A1-C1 exemplars quoted in the
+evaluator rubrics or answers that were already graded. The bank keeps, per
+evaluator template, those exemplars plus historically LLM-graded answers
+with their evaluation, vectorized as TF-IDF over hashed character n-grams.
+A lookup is one matrix-vector product; when the best cosine similarity
+reaches the task's calibrated threshold the stored evaluation is returned
+instead of a Groq call.
+
+The bank is built offline from the graded_answers table, which
+AIService.complete_template fills as it grades:
+
+    python -m services.feedback_bank build [--db fardi.db] [--out instance/feedback_bank.json]
+
+The build also calibrates each task's threshold: the lowest similarity at
+which leave-one-out nearest neighbours still agree on the score at
+TARGET_AGREEMENT. Without a built file the bank serves rubric exemplars only,
+at DEFAULT_THRESHOLD.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.model_router import parse_evaluation
+
+logger = logging.getLogger(__name__)
+
+BANK_PATH = os.getenv('FEEDBACK_BANK_PATH', os.path.join('instance', 'feedback_bank.json'))
+
+# Hashed feature space and character n-gram sizes
+DIMENSIONS = 2048
+NGRAM_SIZES = (3, 4, 5)
+
+# Similarity needed for a hit when a task has no calibrated threshold, and
+# the lowest threshold calibration may choose
+DEFAULT_THRESHOLD = 0.9
+MIN_THRESHOLD = 0.8
+
+# Score agreement required above the calibrated threshold, and the pairs needed to trust it
+TARGET_AGREEMENT = 0.95
+MIN_CALIBRATION_PAIRS = 20
+
+# Most recent graded answers kept per task
+MAX_ENTRIES_PER_TASK = 1000
+
+# "- B1 (3 points): description (e.g., "exemplar")"
+_RUBRIC_LINE_RE = re.compile(
+    r'^\s*-\s*(A1|A2|B1|B2|C1|C2)\s*\((\d+)(?:-\d+)?\s*(?:points?|pts?)\)\s*:\s*(.+)$', re.MULTILINE
+)
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+_EXAMPLE_MARKER_RE = re.compile(r'\((?:e\.g\.,?|like)\s*\)|\blike\s*$')
+
+
+def normalize(text: str) -> str:
+    return ' '.join((text or '').lower().split())
+
+
+def answer_text(template, fields: Dict) -> str:
+    """The student's part of a template call: its fields in declaration order"""
+    return '\n'.join(str(fields.get(name, '')) for name in template.fields)
+
+
+def single_answer(template) -> bool:
+    """
+    Whether a template grades one free answer, the only kind the bank compares
+
+    Multi-field tasks (before/after corrections) carry the given text along
+    with the student's edit; vectorized together, a partial correction scores
+    close to a perfect one.
+    """
+    return len(template.fields) == 1
+
+
+def rubric_levels(template) -> Dict[str, Tuple[int, str, List[str]]]:
+    """
+    The scoring lines of a rubric ("- B1 (3 points): description (e.g., "...")")
+
+    Returns:
+        {level: (points, description without examples, quoted example answers)}
+    """
+    levels = {}
+    for level, points, description in _RUBRIC_LINE_RE.findall(template.system):
+        if level in levels:
+            continue
+        quotes = [q for q in _QUOTE_RE.findall(description) if len(q.split()) >= 3]
+        feedback = _EXAMPLE_MARKER_RE.sub('', _QUOTE_RE.sub('', description)).strip(' ,;:()')
+        levels[level] = (int(points), feedback, quotes)
+    return levels
+
+
+def level_evaluation(level: str, points: int, description: str, source: str = 'example') -> Dict:
+    """Evaluation dict for a rubric level, in the evaluator reply format"""
+    return {
+        'score': points,
+        'level': level,
+        'feedback': f'{level}: {description}' if description else f'Close to the {level} {source} answer'
+    }
+
+
+def extract_exemplars(template) -> List[Tuple[str, Dict]]:
+    """
+    Exemplar answers quoted in a rubric, with the grade their line awards
+
+    Returns:
+        List of (exemplar text, evaluation dict) pairs
+    """
+    if not single_answer(template):
+        return []
+
+    exemplars = []
+    for level, (points, description, quotes) in rubric_levels(template).items():
+        evaluation = level_evaluation(level, points, description)
+        exemplars.extend((quote, evaluation) for quote in quotes)
+    return exemplars
+
+
+def _features(text: str) -> Counter:
+    """Hashed character n-gram counts (words padded with spaces, as char_wb does)"""
+    counts = Counter()
+    for word in normalize(text).split():
+        padded = f' {word} '
+        for size in NGRAM_SIZES:
+            for i in range(max(len(padded) - size + 1, 1)):
+                counts[zlib.crc32(padded[i:i + size].encode('utf-8')) % DIMENSIONS] += 1
+    return counts
+
+
+class TaskIndex:
+    """TF-IDF vectors for one task's bank entries, with nearest-neighbour lookup"""
+
+    def __init__(self, entries: List[Dict], threshold: float = DEFAULT_THRESHOLD):
+        self.entries = entries
+        self.threshold = threshold
+        features = [_features(entry['text']) for entry in entries]
+
+        document_frequency = Counter()
+        for counts in features:
+            document_frequency.update(counts.keys())
+        n = len(entries)
+        self.idf = {dim: math.log((1 + n) / (1 + df)) + 1.0 for dim, df in document_frequency.items()}
+        self.default_idf = math.log(1 + n) + 1.0
+
+        self.matrix = np.zeros((n, DIMENSIONS), dtype=np.float32)
+        for row, counts in enumerate(features):
+            for dim, weight in self._weights(counts).items():
+                self.matrix[row, dim] = weight
+
+    def _weights(self, counts: Counter) -> Dict[int, float]:
+        """Sublinear TF-IDF weights, L2-normalized"""
+        weights = {dim: (1.0 + math.log(count)) * self.idf.get(dim, self.default_idf)
+                   for dim, count in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {dim: w / norm for dim, w in weights.items()}
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of a text to every entry"""
+        vector = np.zeros(DIMENSIONS, dtype=np.float32)
+        for dim, weight in self._weights(_features(text)).items():
+            vector[dim] = weight
+        return self.matrix @ vector
+
+    def nearest(self, text: str, exclude: Optional[int] = None) -> Tuple[Optional[int], float]:
+        similarities = self.similarities(text)
+        if exclude is not None:
+            similarities[exclude] = -np.inf
+        if not len(similarities) or similarities.max() == -np.inf:
+            return None, -1.0
+        best = int(similarities.argmax())
+        return best, float(similarities[best])
+
+
+def calibrate_threshold(index: TaskIndex) -> float:
+    """
+    Lowest similarity at which leave-one-out neighbours agree on the score
+
+    Only graded answers take part (exemplars have no second grading to agree
+    with); with too few pairs the default threshold is kept.
+    """
+    pairs = []
+    for i, entry in enumerate(index.entries):
+        if entry.get('source') != 'graded':
+            continue
+        j, sim = index.nearest(entry['text'], exclude=i)
+        if j is not None:
+            pairs.append((sim, entry['evaluation'].get('score') == index.entries[j]['evaluation'].get('score')))
+    if len(pairs) < MIN_CALIBRATION_PAIRS:
+        return DEFAULT_THRESHOLD
+
+    threshold, agreed = 1.0, 0
+    for count, (sim, agree) in enumerate(sorted(pairs, reverse=True), start=1):
+        agreed += agree
+        if sim < MIN_THRESHOLD:
+            break
+        if agreed / count >= TARGET_AGREEMENT:
+            threshold = sim
+    return round(max(threshold, MIN_THRESHOLD), 4)
+
+
+def build_bank(db_path: str, templates) -> Dict:
+    """
+    Build the bank file contents from rubric exemplars and graded answers
+
+    Returns:
+        {'built_at', 'tasks': {template name: {'threshold', 'entries'}}}
+    """
+    graded: Dict[str, List[Dict]] = {}
+    if db_path and os.path.exists(db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute('''
+                SELECT template_name, answer_text, evaluation FROM graded_answers
+                ORDER BY id DESC
+            ''').fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        finally:
+            conn.close()
+
+        seen = set()
+        for name, text, evaluation in rows:
+            key = (name, normalize(text))
+            if key in seen or len(graded.get(name, [])) >= MAX_ENTRIES_PER_TASK:
+                continue
+            seen.add(key)
+            graded.setdefault(name, []).append(
+                {'text': text, 'evaluation': json.loads(evaluation), 'source': 'graded'}
+            )
+
+    tasks = {}
+    for template in templates:
+        if not single_answer(template):
+            continue
+        entries = [{'text': text, 'evaluation': evaluation, 'source': 'exemplar'}
+                   for text, evaluation in extract_exemplars(template)]
+        entries.extend(graded.get(template.name, []))
+        if entries:
+            tasks[template.name] = {'threshold': calibrate_threshold(TaskIndex(entries)), 'entries': entries}
+    return {'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'tasks': tasks}
+
+
+class FeedbackBank:
+    """
+    Per-task nearest-neighbour cache of graded answers
+
+    Args:
+        db_path: Database holding graded_answers (recorded on every LLM grading)
+        bank_path: Bank file written by the offline build
+    """
+
+    def __init__(self, db_path: str = 'fardi.db', bank_path: str = BANK_PATH):
+        self.db_path = db_path
+        self.bank_path = bank_path
+        self._indexes: Optional[Dict[str, TaskIndex]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, TaskIndex]:
+        from services import prompt_templates
+
+        tasks = {}
+        if self.bank_path and os.path.exists(self.bank_path):
+            try:
+                with open(self.bank_path) as f:
+                    tasks = json.load(f).get('tasks', {})
+            except (OSError, ValueError) as e:
+                logger.error(f"Error loading feedback bank {self.bank_path}: {str(e)}")
+        for template in prompt_templates.all_templates():
+            if not single_answer(template):
+                # Built before multi-field tasks were left out of the bank
+                tasks.pop(template.name, None)
+            elif template.name not in tasks:
+                entries = [{'text': text, 'evaluation': evaluation, 'source': 'exemplar'}
+                           for text, evaluation in extract_exemplars(template)]
+                if entries:
+                    tasks[template.name] = {'threshold': DEFAULT_THRESHOLD, 'entries': entries}
+        return {name: TaskIndex(task['entries'], task['threshold']) for name, task in tasks.items()}
+
+    def indexes(self) -> Dict[str, TaskIndex]:
+        if self._indexes is None:
+            with self._lock:
+                if self._indexes is None:
+                    self._indexes = self._load()
+        return self._indexes
+
+    def reload(self):
+        """Pick up a rebuilt bank file (and newly registered templates)"""
+        with self._lock:
+            self._indexes = None
+
+    def lookup(self, template_name: str, text: str) -> Optional[Dict]:
+        """
+        Stored evaluation for a near-copy of a known answer
+
+        Returns:
+            The evaluation dict (marked with 'feedback_source') or None on a miss
+        """
+        index = self.indexes().get(template_name)
+        if index is None or not normalize(text):
+            return None
+        best, sim = index.nearest(text)
+        if best is None or sim < index.threshold:
+            self.misses += 1
+            return None
+        self.hits += 1
+        entry = index.entries[best]
+        return dict(entry['evaluation'], feedback_source=entry.get('source', 'bank'),
+                    similarity=round(sim, 3))
+
+    def record(self, template_name: str, text: str, content: str):
+        """Store an LLM grading for the next offline build (skips replies without a score)"""
+        evaluation = parse_evaluation(content)
+        if evaluation is None or not normalize(text):
+            return
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=1)
+            try:
+                with conn:
+                    conn.execute('''
+                        INSERT INTO graded_answers (template_name, answer_text, evaluation, score)
+                        VALUES (?, ?, ?, ?)
+                    ''', (template_name, text, json.dumps(evaluation), evaluation['score']))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Not recording graded answer for '{template_name}': {str(e)}")
+
+
+def _main():
+    parser = argparse.ArgumentParser(description='Build the evaluator feedback bank')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--db', default='fardi.db', help='database with graded_answers')
+    parser.add_argument('--out', default=BANK_PATH, help='bank file to write')
+    args = parser.parse_args()
+
+    # Importing the route modules registers every evaluator template
+    import routes.phase4_routes  # noqa: F401
+    import routes.phase5_routes  # noqa: F401
+    import routes.phase6_routes  # noqa: F401
+    from services import prompt_templates
+
+    bank = build_bank(args.db, prompt_templates.all_templates())
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(bank, f)
+    entries = sum(len(task['entries']) for task in bank['tasks'].values())
+    print(f"Wrote {len(bank['tasks'])} tasks ({entries} entries) to {args.out}")
+
+
+if __name__ == '__main__':
+    _main()
@@ -0,0 +1,204 @@
+"""
+LLM Hedging - Duplicate slow Groq requests to cut tail latency
+
+A hedged call starts the request, waits for the endpoint's recent p90
+latency and, if no answer has arrived, sends the same request again and
+returns whichever finishes first. Latency is tracked per calling Flask
+endpoint (llm_telemetry.current_endpoint), since one model serves prompts
+of very different lengths. Only requests already slower than 90% of
+their peers are duplicated, and a rolling cap keeps the extra load bounded,
+so p99 latency moves towards p90 for a few percent more calls.
+
+HedgedClient wraps a Groq client and exposes the same
+client.chat.completions.create() call, so every caller of ai_service.client
+is hedged without changes. The slower attempt of a hedged pair still runs
+to completion; its tokens are recorded in llm_telemetry as a discarded attempt.
+
+Environment:
+    LLM_HEDGE_ENABLED     "1" to wrap the Groq client (default off)
+    LLM_HEDGE_MAX_RATE    most requests that may be hedged (default 0.05)
+    LLM_HEDGE_MIN_DELAY   seconds, lower bound on the hedge delay (default 0.25)
+    LLM_HEDGE_MAX_DELAY   seconds, upper bound on the hedge delay (default 10)
+"""
+import contextvars
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from services import llm_telemetry
+from services.llm_telemetry import current_endpoint
+from utils.completions import CompletionsWrapper
+from utils.structured_logging import log_event
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per endpoint, and how many are needed before hedging
+LATENCY_WINDOW = 200
+MIN_SAMPLES = 20
+
+# Requests the hedge-rate cap looks back over
+RATE_WINDOW = 500
+
+
+def hedging_enabled() -> bool:
+    """Whether AIService should wrap its Groq client"""
+    return os.getenv('LLM_HEDGE_ENABLED', '').lower() in ('1', 'true', 'yes')
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency samples with a quantile lookup"""
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def quantile(self, endpoint: str, q: float) -> Optional[float]:
+        """Nearest-rank quantile, or None until min_samples have been seen"""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class HedgedClient(CompletionsWrapper):
+    """
+    Groq client wrapper that hedges chat completions
+
+    Args:
+        client: The groq.Groq client (other attributes are passed through)
+        max_hedge_rate: Fraction of recent requests allowed to send a hedge
+        min_delay, max_delay: Bounds on the p90-based hedge delay (seconds)
+        quantile: Latency quantile used as the hedge delay
+    """
+
+    def __init__(self, client, max_hedge_rate: float = None, min_delay: float = None,
+                 max_delay: float = None, quantile: float = 0.9):
+        super().__init__(client)
+        self.max_hedge_rate = max_hedge_rate if max_hedge_rate is not None else \
+            float(os.getenv('LLM_HEDGE_MAX_RATE', '0.05'))
+        self.min_delay = min_delay if min_delay is not None else \
+            float(os.getenv('LLM_HEDGE_MIN_DELAY', '0.25'))
+        self.max_delay = max_delay if max_delay is not None else \
+            float(os.getenv('LLM_HEDGE_MAX_DELAY', '10'))
+        self.quantile = quantile
+        self.latencies = LatencyTracker()
+
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=RATE_WINDOW)  # one [hedged] slot per request
+        self.metrics = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'primary_wins': 0,
+                        'capped': 0, 'errors': 0}
+
+    def stats(self) -> Dict:
+        """Counters plus the current hedge delay per endpoint"""
+        with self._lock:
+            stats = dict(self.metrics)
+        stats['hedge_win_rate'] = round(stats['hedge_wins'] / stats['hedged'], 3) if stats['hedged'] else 0.0
+        stats['hedge_rate'] = round(stats['hedged'] / stats['requests'], 3) if stats['requests'] else 0.0
+        stats['delays'] = {endpoint: self.hedge_delay(endpoint) for endpoint in list(self.latencies._samples)}
+        return stats
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None while the endpoint has too few samples"""
+        p90 = self.latencies.quantile(endpoint, self.quantile)
+        if p90 is None:
+            return None
+        return min(self.max_delay, max(self.min_delay, p90))
+
+    def _count(self, key: str):
+        with self._lock:
+            self.metrics[key] += 1
+
+    def _may_hedge(self, slot: list) -> bool:
+        """Reserve a hedge if the rolling hedge rate is under the cap"""
+        with self._lock:
+            hedged = sum(1 for s in self._recent if s[0])
+            if hedged + 1 > self.max_hedge_rate * max(len(self._recent), 1):
+                self.metrics['capped'] += 1
+                return False
+            slot[0] = True
+            self.metrics['hedged'] += 1
+            return True
+
+    def _attempt(self, name: str, endpoint: str, kwargs: Dict, results: queue.Queue, finished: list):
+        started = time.monotonic()
+        try:
+            response = self._client.chat.completions.create(**kwargs)
+        except Exception as e:
+            results.put((name, None, e))
+            return
+        self.latencies.record(endpoint, time.monotonic() - started)
+        # The first successful reply is the one create() returns (and telemetry
+        # records); a later one is discarded, but its tokens were still billed
+        with self._lock:
+            discarded = bool(finished)
+            finished.append(name)
+            results.put((name, response, None))
+        if discarded:
+            llm_telemetry.telemetry.record_discarded(endpoint, getattr(response, 'usage', None))
+
+    def create(self, **kwargs):
+        """chat.completions.create with a hedge after the endpoint's p90 latency"""
+        endpoint = current_endpoint()
+        delay = self.hedge_delay(endpoint)
+        slot = [False]
+        with self._lock:
+            self.metrics['requests'] += 1
+            self._recent.append(slot)
+
+        if delay is None or kwargs.get('stream'):
+            # Not enough history yet (or a stream that cannot be raced): plain call
+            started = time.monotonic()
+            response = super().create(**kwargs)
+            if not kwargs.get('stream'):
+                self.latencies.record(endpoint, time.monotonic() - started)
+            return response
+
+        results, finished = queue.Queue(), []
+        self._start('primary', endpoint, kwargs, results, finished)
+        try:
+            name, response, error = results.get(timeout=delay)
+        except queue.Empty:
+            if not self._may_hedge(slot):
+                name, response, error = results.get()
+                return self._finish(name, response, error, hedged=False)
+            self._start('hedge', endpoint, kwargs, results, finished)
+            name, response, error = results.get()
+            if error is not None:
+                # One attempt failed; the other may still succeed
+                name, response, error = results.get()
+            return self._finish(name, response, error, hedged=True)
+
+        return self._finish(name, response, error, hedged=False)
+
+    def _start(self, name: str, endpoint: str, kwargs: Dict, results: queue.Queue, finished: list):
+        # The SDK call cannot be interrupted once sent; a losing attempt runs
+        # to completion on its daemon thread and its response is discarded.
+        # The caller's context goes along so telemetry attributes the attempt.
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(self._attempt, name, endpoint, kwargs, results, finished),
+                         name=f'llm-{name}', daemon=True).start()
+
+    def _finish(self, name: str, response, error, hedged: bool):
+        if hedged and error is None:
+            self._count('hedge_wins' if name == 'hedge' else 'primary_wins')
+            log_event(logger, 'llm.hedge', winner=name)
+        if error is not None:
+            self._count('errors')
+            raise error
+        return response
@@ -0,0 +1,270 @@
+"""
+LLM Telemetry - Per-endpoint cost and latency of Groq calls
+
+InstrumentedClient wraps the Groq client like HedgedClient does, so every
+caller of ai_service.client is measured without changes. Each completion is
+attributed to the Flask endpoint that made it (the thread name outside a
+request) and recorded as:
+
+- calls, errors, timeouts and rate-limited (429) failures
+- prompt and completion tokens from the response's usage
+- a latency histogram (LATENCY_BUCKETS) with the total time
+- parse failures: the prompt asked for JSON and the reply holds none; the
+  phase evaluators fall back to local scoring on these and on errors, so
+  both count as fallbacks
+- local answers: replies served without a call at all (no client, or a
+  stage skipped for the request deadline), recorded by the caller
+- discarded attempts: the slower side of a hedged call (llm_hedging), whose
+  reply is thrown away but whose tokens are still billed and counted
+
+HTTP event hooks on the SDK's client add the attempts behind each call:
+retries and 429 responses, including ones the SDK retried successfully.
+
+Counters are in memory and per process; snapshot() feeds the admin view
+and prometheus() the /api/metrics scrape.
+"""
+import json
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from utils.completions import CompletionsWrapper
+
+# Histogram upper bounds in seconds (a final bucket catches everything slower)
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0)
+
+COUNTERS = ('calls', 'errors', 'timeouts', 'rate_limited', 'prompt_tokens', 'completion_tokens',
+            'json_expected', 'parse_failures', 'fallbacks', 'local_answers', 'retries', 'http_429',
+            'discarded_attempts')
+
+_JSON_RE = re.compile(r'[\[{].*[\]}]', re.DOTALL)
+
+# Endpoint of the completion in progress (read by the HTTP hooks)
+_current: ContextVar[Optional[str]] = ContextVar('llm_endpoint', default=None)
+
+
+def current_endpoint() -> str:
+    """The Flask endpoint of the current request, else the thread name"""
+    label = _current.get()
+    if label:
+        return label
+    from flask import has_request_context, request
+    if has_request_context() and request.endpoint:
+        return request.endpoint
+    return threading.current_thread().name
+
+
+def expects_json(messages) -> bool:
+    """Whether a prompt asks for a JSON reply"""
+    return any('json' in str(m.get('content', '')).lower() for m in messages or () if isinstance(m, dict))
+
+
+def parses_as_json(content: Optional[str]) -> bool:
+    """Whether a reply holds a JSON object or array (code fences and prose around it allowed)"""
+    match = _JSON_RE.search(content or '')
+    if not match:
+        return False
+    try:
+        json.loads(match.group())
+    except ValueError:
+        return False
+    return True
+
+
+def _error_kind(error: Exception) -> str:
+    if getattr(error, 'status_code', None) == 429:
+        return 'rate_limited'
+    if isinstance(error, TimeoutError) or 'Timeout' in type(error).__name__:
+        return 'timeouts'
+    return 'errors'
+
+
+class _EndpointStats:
+    def __init__(self):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.models: Dict[str, int] = {}
+
+
+def _quantile(buckets: List[int], q: float) -> Optional[float]:
+    """Upper bound of the bucket holding the q-th call (None past the last bound)"""
+    total = sum(buckets)
+    if not total:
+        return None
+    rank, seen = q * total, 0
+    for bound, count in zip(LATENCY_BUCKETS, buckets):
+        seen += count
+        if seen >= rank:
+            return bound
+    return None
+
+
+class LlmTelemetry:
+    """Thread-safe per-endpoint counters and latency histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self.started = time.time()
+
+    def _stats(self, endpoint: str) -> _EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def record_call(self, endpoint: str, model: Optional[str], seconds: float, usage=None,
+                    error: Optional[Exception] = None, json_expected: bool = False,
+                    parse_failed: bool = False):
+        """Record one completion (failed calls still count their latency)"""
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+        with self._lock:
+            stats = self._stats(endpoint)
+            counts = stats.counts
+            counts['calls'] += 1
+            stats.buckets[index] += 1
+            stats.latency_sum += seconds
+            stats.models[model or 'default'] = stats.models.get(model or 'default', 0) + 1
+            if usage is not None:
+                counts['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+                counts['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+            counts['json_expected'] += json_expected
+            if error is not None:
+                counts[_error_kind(error)] += 1
+                counts['fallbacks'] += 1
+            elif parse_failed:
+                counts['parse_failures'] += 1
+                counts['fallbacks'] += 1
+
+    def record_local_answer(self, endpoint: Optional[str] = None):
+        """A reply served locally where an LLM call would otherwise have been made"""
+        with self._lock:
+            self._stats(endpoint or current_endpoint()).counts['local_answers'] += 1
+
+    def record_discarded(self, endpoint: str, usage=None):
+        """An extra completion whose reply was not used (the losing side of a hedge)"""
+        with self._lock:
+            counts = self._stats(endpoint).counts
+            counts['discarded_attempts'] += 1
+            if usage is not None:
+                counts['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+                counts['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+
+    def record_http(self, endpoint: str, retry: bool = False, status: Optional[int] = None):
+        with self._lock:
+            counts = self._stats(endpoint).counts
+            counts['retries'] += retry
+            counts['http_429'] += status == 429
+
+    def snapshot(self) -> Dict:
+        """Per-endpoint totals, rates and latency quantiles, costliest (by tokens) first"""
+        with self._lock:
+            endpoints = {name: (dict(s.counts), list(s.buckets), s.latency_sum, dict(s.models))
+                         for name, s in self._endpoints.items()}
+
+        rows = []
+        totals = dict.fromkeys(COUNTERS, 0)
+        for name, (counts, buckets, latency_sum, models) in endpoints.items():
+            calls = counts['calls']
+            for key in COUNTERS:
+                totals[key] += counts[key]
+            rows.append(dict(
+                counts, endpoint=name, models=models,
+                total_tokens=counts['prompt_tokens'] + counts['completion_tokens'],
+                mean_latency=round(latency_sum / calls, 3) if calls else None,
+                p50_latency=_quantile(buckets, 0.5), p95_latency=_quantile(buckets, 0.95),
+                fallback_rate=round(counts['fallbacks'] / calls, 3) if calls else None,
+                parse_failure_rate=(round(counts['parse_failures'] / counts['json_expected'], 3)
+                                    if counts['json_expected'] else None),
+                latency_buckets=dict(zip([*map(str, LATENCY_BUCKETS), '+Inf'], buckets)),
+            ))
+        rows.sort(key=lambda row: (row['total_tokens'], row['calls']), reverse=True)
+        return {
+            'since': self.started,
+            'totals': dict(totals, total_tokens=totals['prompt_tokens'] + totals['completion_tokens']),
+            'endpoints': rows,
+        }
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition of the counters and histograms"""
+        with self._lock:
+            endpoints = {name: (dict(s.counts), list(s.buckets), s.latency_sum)
+                         for name, s in self._endpoints.items()}
+
+        lines: List[str] = []
+        for key in COUNTERS:
+            metric = f'fardi_llm_{key}_total'
+            lines.append(f'# TYPE {metric} counter')
+            lines.extend(f'{metric}{{endpoint="{name}"}} {counts[key]}'
+                         for name, (counts, _, _) in sorted(endpoints.items()))
+
+        metric = 'fardi_llm_latency_seconds'
+        lines.append(f'# TYPE {metric} histogram')
+        for name, (counts, buckets, latency_sum) in sorted(endpoints.items()):
+            cumulative = 0
+            for bound, count in zip([*map(str, LATENCY_BUCKETS), '+Inf'], buckets):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{endpoint="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{endpoint="{name}"}} {round(latency_sum, 6)}')
+            lines.append(f'{metric}_count{{endpoint="{name}"}} {counts["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.started = time.time()
+
+
+telemetry = LlmTelemetry()
+
+
+def http_event_hooks() -> Dict:
+    """httpx event hooks counting the SDK's retries and 429 responses"""
+    def on_request(request):
+        if int(request.headers.get('x-stainless-retry-count', 0) or 0) > 0:
+            telemetry.record_http(current_endpoint(), retry=True)
+
+    def on_response(response):
+        if response.status_code == 429:
+            telemetry.record_http(current_endpoint(), status=429)
+
+    return {'request': [on_request], 'response': [on_response]}
+
+
+class InstrumentedClient(CompletionsWrapper):
+    """
+    Groq client wrapper that records every completion in telemetry
+
+    Args:
+        client: Groq client (or one of its wrappers)
+    """
+
+    def create(self, **kwargs):
+        endpoint = current_endpoint()
+        json_expected = expects_json(kwargs.get('messages'))
+        token = _current.set(endpoint)
+        started = time.monotonic()
+        try:
+            response = super().create(**kwargs)
+        except Exception as e:
+            telemetry.record_call(endpoint, kwargs.get('model'), time.monotonic() - started,
+                                  error=e, json_expected=json_expected)
+            raise
+        finally:
+            _current.reset(token)
+
+        if kwargs.get('stream'):
+            # Streamed replies are consumed by the caller; only the call and its latency are known here
+            telemetry.record_call(endpoint, kwargs.get('model'), time.monotonic() - started)
+            return response
+        try:
+            content = response.choices[0].message.content
+        except (AttributeError, IndexError, TypeError):
+            content = None
+        telemetry.record_call(endpoint, kwargs.get('model'), time.monotonic() - started,
+                              usage=getattr(response, 'usage', None), json_expected=json_expected,
+                              parse_failed=json_expected and not parses_as_json(content))
+        return response
@@ -0,0 +1,164 @@
+"""
+Model Router - Pick a Groq model tier per evaluation
+
+Evaluator templates declare their rubric complexity and expected CEFR band
+(see prompt_templates.register); together with the length of the student's
+answer that decides the tier:
+
+- fast: short answers and simple rubrics (spelling checks, one-line replies)
+- standard: everything in between
+- strong: long-form answers at B2 and above, and complex rubrics
+
+Each tier has its own model and output token budget. A sampled fraction of
+fast/standard evaluations is re-run on the strong tier in the background and
+the two scores are compared, so tier thresholds can be checked against real
+agreement numbers.
+
+Environment:
+    GROQ_FAST_MODEL     model for the fast tier (default GROQ_MODEL)
+    GROQ_STRONG_MODEL   model for the strong tier (default GROQ_MODEL)
+    MODEL_SHADOW_RATE   fraction of lower-tier evaluations shadowed (default 0.02)
+"""
+import json
+import logging
+import os
+import random
+import re
+import threading
+from collections import namedtuple
+from typing import Dict, Optional
+
+from services.prompt_templates import estimate_tokens
+from utils.structured_logging import log_event
+
+logger = logging.getLogger(__name__)
+
+CEFR_ORDER = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2')
+
+# Answer lengths (estimated tokens) that count as short and long-form
+SHORT_ANSWER_TOKENS = 40
+LONG_ANSWER_TOKENS = 150
+
+# tier -> (model environment variable, output token budget)
+TIERS = {
+    'fast': ('GROQ_FAST_MODEL', 300),
+    'standard': ('GROQ_MODEL', 600),
+    'strong': ('GROQ_STRONG_MODEL', 1200),
+}
+
+Route = namedtuple('Route', 'tier model max_tokens')
+
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def band_rank(level: Optional[str]) -> Optional[int]:
+    """Position of a CEFR level in CEFR_ORDER (None if unknown)"""
+    level = (level or '').strip().upper()[:2]
+    return CEFR_ORDER.index(level) if level in CEFR_ORDER else None
+
+
+def choose_tier(complexity: str, band: Optional[str], answer_tokens: int) -> str:
+    """
+    Tier for one evaluation
+
+    Args:
+        complexity: Rubric complexity declared by the template ('simple', 'standard', 'complex')
+        band: Expected CEFR level of the task or student, if known
+        answer_tokens: Estimated tokens in the student's text
+    """
+    rank = band_rank(band)
+    upper_band = rank is not None and rank >= CEFR_ORDER.index('B2')
+
+    # A declared rubric complexity wins over answer length
+    if complexity in ('simple', 'complex'):
+        return 'fast' if complexity == 'simple' else 'strong'
+    # Long answers of unknown level are treated as upper-band long-form work
+    if answer_tokens >= LONG_ANSWER_TOKENS and (upper_band or rank is None):
+        return 'strong'
+    if answer_tokens <= SHORT_ANSWER_TOKENS and not upper_band:
+        return 'fast'
+    return 'standard'
+
+
+def route(template, fields: Dict, default_model: str) -> Route:
+    """
+    Model and token budget for a template call
+
+    The band is the call's own 'level' field when the route passes one,
+    otherwise the band the template declares.
+    """
+    answer_tokens = sum(estimate_tokens(str(value)) for value in fields.values())
+    band = fields.get('level') or getattr(template, 'band', None)
+    tier = choose_tier(getattr(template, 'complexity', 'standard'), band, answer_tokens)
+    return tier_route(tier, default_model)
+
+
+def tier_route(tier: str, default_model: str) -> Route:
+    env_var, budget = TIERS[tier]
+    return Route(tier, os.getenv(env_var) or default_model, budget)
+
+
+def parse_evaluation(text: str) -> Optional[Dict]:
+    """The JSON object in an evaluator's reply, if it has a numeric 'score'"""
+    match = _JSON_RE.search(text or '')
+    if not match:
+        return None
+    try:
+        evaluation = json.loads(match.group())
+    except ValueError:
+        return None
+    if not isinstance(evaluation, dict):
+        return None
+    score = evaluation.get('score')
+    if not isinstance(score, (int, float)) or isinstance(score, bool):
+        return None
+    return evaluation
+
+
+def extract_score(text: str) -> Optional[float]:
+    """The numeric 'score' from an evaluator's JSON reply, if any"""
+    evaluation = parse_evaluation(text)
+    return evaluation['score'] if evaluation is not None else None
+
+
+def should_shadow(route_: Route, default_model: str) -> bool:
+    """Whether to re-run this evaluation on the strong tier for comparison"""
+    if route_.tier == 'strong' or tier_route('strong', default_model).model == route_.model:
+        return False
+    return random.random() < float(os.getenv('MODEL_SHADOW_RATE', '0.02'))
+
+
+class ShadowStats:
+    """Score agreement between a lower tier and the strong tier"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pairs: Dict[str, Dict] = {}
+
+    def record(self, template_name: str, tier: str, score: float, shadow_score: float):
+        diff = abs(score - shadow_score)
+        with self._lock:
+            pair = self._pairs.setdefault(tier, {'samples': 0, 'exact': 0, 'within_one': 0, 'abs_diff': 0.0})
+            pair['samples'] += 1
+            pair['exact'] += diff == 0
+            pair['within_one'] += diff <= 1
+            pair['abs_diff'] += diff
+        log_event(logger, 'llm.shadow', template=template_name, tier=tier,
+                  score=score, shadow_score=shadow_score)
+
+    def summary(self) -> Dict:
+        """Per lower tier: samples, exact/within-one agreement rates and mean absolute difference"""
+        with self._lock:
+            pairs = {tier: dict(pair) for tier, pair in self._pairs.items()}
+        return {
+            tier: {
+                'samples': pair['samples'],
+                'exact_rate': round(pair['exact'] / pair['samples'], 3),
+                'within_one_rate': round(pair['within_one'] / pair['samples'], 3),
+                'mean_abs_diff': round(pair['abs_diff'] / pair['samples'], 3),
+            }
+            for tier, pair in pairs.items()
+        }
+
+
+shadow_stats = ShadowStats()
@@ -5,7 +5,11 @@ Handles power-up purchases, inventory management, and usage
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import logging
 import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
 
 # Power-Up Definitions
 POWERUPS = {
@@ -45,11 +49,26 @@ POWERUPS = {
 }
 
 
+# Effects that last for a while after use (powerup_usage.used_at is UTC)
+TIMED_EFFECTS = {
+    "double_xp": {"name": "Double XP", "multiplier": 2.0},
+}
+TIMED_EFFECT_DURATIONS = {
+    "double_xp": timedelta(hours=1),
+}
+
+# Bounds how stale another worker's use_powerup can look from this process
+EFFECTS_CACHE_TTL = timedelta(seconds=60)
+EFFECTS_CACHE_MAX_USERS = 10000
+
+
 class PowerUpService:
     """Service for managing user power-ups"""
     
     def __init__(self, db_path='instance/fardi.db'):
         self.db_path = db_path
+        self._effects_cache: Dict[int, Dict] = {}
+        self._effects_lock = threading.Lock()
     
     def get_connection(self):
         """Get database connection"""
@@ -192,6 +211,7 @@ class PowerUpService:
             ''', (user_id, powerup_type, activity_id, powerup['effect']))
             
             conn.commit()
+            self.invalidate_effects(user_id)
             
             return {
                 "success": True,
@@ -208,54 +228,78 @@ class PowerUpService:
     
     def _check_daily_limit(self, user_id: int, powerup_type: str) -> bool:
         """Check if user has exceeded daily limit for a power-up"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        today = datetime.now().date()
-        cursor.execute('''
-            SELECT COUNT(*) as count
-            FROM powerup_usage
-            WHERE user_id = ? AND powerup_type = ?
-            AND DATE(used_at) = ?
-        ''', (user_id, powerup_type, today))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
         daily_limit = POWERUPS[powerup_type].get('daily_limit', 999)
-        return result['count'] < daily_limit
-    
+        return self._effects(user_id)["used_today"].get(powerup_type, 0) < daily_limit
+
     def get_active_effects(self, user_id: int) -> List[Dict]:
         """Get currently active power-up effects (e.g., double XP)"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get double XP usage in last hour
-        one_hour_ago = datetime.now() - timedelta(hours=1)
-        cursor.execute('''
-            SELECT powerup_type, used_at, effect_data
-            FROM powerup_usage
-            WHERE user_id = ? AND powerup_type = 'double_xp'
-            AND used_at > ?
-            ORDER BY used_at DESC
-            LIMIT 1
-        ''', (user_id, one_hour_ago))
-        
+        now = datetime.utcnow()
         active_effects = []
-        result = cursor.fetchone()
-        
-        if result:
-            used_at = datetime.fromisoformat(result['used_at'])
-            expires_at = used_at + timedelta(hours=1)
-            
-            if datetime.now() < expires_at:
+        for effect_type, expires_at in self._effects(user_id)["expires"].items():
+            if now < expires_at:
                 active_effects.append({
-                    "type": "double_xp",
-                    "name": "Double XP",
-                    "multiplier": 2.0,
+                    "type": effect_type,
+                    **TIMED_EFFECTS[effect_type],
                     "expires_at": expires_at.isoformat(),
-                    "remaining_seconds": int((expires_at - datetime.now()).total_seconds())
+                    "remaining_seconds": int((expires_at - now).total_seconds())
                 })
-        
-        conn.close()
         return active_effects
+
+    def get_xp_multiplier(self, user_id: int) -> float:
+        """Combined XP multiplier of the user's active effects (1.0 if none)"""
+        now = datetime.utcnow()
+        multiplier = 1.0
+        for effect_type, expires_at in self._effects(user_id)["expires"].items():
+            if now < expires_at:
+                multiplier *= TIMED_EFFECTS[effect_type]["multiplier"]
+        return multiplier
+
+    def invalidate_effects(self, user_id: int):
+        """Drop the cached effects of a user (next read reloads them)"""
+        with self._effects_lock:
+            self._effects_cache.pop(user_id, None)
+
+    def _effects(self, user_id: int) -> Dict:
+        """
+        Cached effect state of a user: expiry time per timed effect and
+        today's (UTC) usage counts. Loaded with one indexed query, then kept
+        until the day changes, EFFECTS_CACHE_TTL passes or use_powerup
+        invalidates it.
+        """
+        now = datetime.utcnow()
+        with self._effects_lock:
+            cached = self._effects_cache.get(user_id)
+        if cached and cached["day"] == now.date() and cached["loaded_at"] > now - EFFECTS_CACHE_TTL:
+            return cached
+
+        day_start = datetime.combine(now.date(), datetime.min.time())
+        window_start = min(day_start, now - max(TIMED_EFFECT_DURATIONS.values(), default=timedelta(0)))
+        state = {"day": now.date(), "loaded_at": now, "expires": {}, "used_today": {}}
+        try:
+            conn = self.get_connection()
+            try:
+                rows = conn.execute('''
+                    SELECT powerup_type, used_at FROM powerup_usage
+                    WHERE user_id = ? AND used_at >= ?
+                ''', (user_id, window_start.strftime('%Y-%m-%d %H:%M:%S'))).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load power-up effects for user {user_id}: {e}")
+            rows = []
+
+        for row in rows:
+            used_at = datetime.fromisoformat(row['used_at'])
+            if used_at >= day_start:
+                state["used_today"][row['powerup_type']] = state["used_today"].get(row['powerup_type'], 0) + 1
+            duration = TIMED_EFFECT_DURATIONS.get(row['powerup_type'])
+            if duration:
+                expires_at = used_at + duration
+                if expires_at > state["expires"].get(row['powerup_type'], datetime.min):
+                    state["expires"][row['powerup_type']] = expires_at
+
+        with self._effects_lock:
+            if len(self._effects_cache) >= EFFECTS_CACHE_MAX_USERS:
+                self._effects_cache.clear()
+            self._effects_cache[user_id] = state
+        return state
@@ -0,0 +1,117 @@
+"""
+Prompt Templates - Evaluator rubrics compiled once at import time
+
+Each evaluator prompt is split into:
+- a static system prefix (preamble + rubric, identical for every student), and
+- a short per-student suffix rendered with str.format on each request.
+
+The prefix is stored as a ready-made system message and sent byte-identical on
+every call, so it is never rebuilt per request and providers that cache prompt
+prefixes (Groq does this automatically on supported models) only bill the
+suffix at the full input rate.
+"""
+import re
+import logging
+import threading
+from string import Formatter
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same framing AIService.get_ai_response uses for its system message
+DEFAULT_PREAMBLE = "You are an AI language learning assistant in a game about planning a cultural event."
+
+# Rubric complexity declared per template (used by services/model_router.py)
+COMPLEXITIES = ('simple', 'standard', 'complex')
+
+# An unescaped {name} left in the static part is almost certainly a forgotten placeholder
+_PLACEHOLDER_RE = re.compile(r'\{[A-Za-z_]\w*\}')
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token for English text)"""
+    if not text:
+        return 0
+    return max(1, (len(text) + 3) // 4)
+
+
+class PromptTemplate:
+    """A compiled evaluator prompt: static system prefix plus a per-student suffix"""
+
+    def __init__(self, name: str, system: str, user: str, preamble: str = DEFAULT_PREAMBLE,
+                 complexity: str = 'standard', band: str = None, source_field: str = None):
+        system = system.strip()
+        if complexity not in COMPLEXITIES:
+            raise ValueError(f"Prompt template '{name}' has unknown complexity '{complexity}'")
+        if _PLACEHOLDER_RE.search(system):
+            raise ValueError(f"Prompt template '{name}' has a placeholder in its static prefix")
+
+        self.name = name
+        self.complexity = complexity
+        self.band = band
+        self.system = f"{preamble}\n\n{system}" if preamble else system
+        self.user = user.strip()
+        self.fields: Tuple[str, ...] = tuple(
+            field for _, field, _, _ in Formatter().parse(self.user) if field
+        )
+        if source_field is not None and source_field not in self.fields:
+            raise ValueError(f"Prompt template '{name}' has no field '{source_field}'")
+        self.source_field = source_field
+        self.prefix_tokens = estimate_tokens(self.system)
+        self.system_message = {"role": "system", "content": self.system}
+
+    def render(self, **values) -> str:
+        """Render the per-student suffix"""
+        missing = [field for field in self.fields if field not in values]
+        if missing:
+            raise KeyError(f"Prompt template '{self.name}' is missing fields: {missing}")
+        return self.user.format(**values)
+
+    def messages(self, **values) -> List[Dict[str, str]]:
+        """Build the chat messages, reusing the precompiled system message"""
+        return [self.system_message, {"role": "user", "content": self.render(**values)}]
+
+    def __repr__(self):
+        return f"<PromptTemplate {self.name} (~{self.prefix_tokens} prefix tokens)>"
+
+
+_templates: Dict[str, PromptTemplate] = {}
+_lock = threading.Lock()
+
+
+def register(name: str, system: str, user: str, preamble: str = DEFAULT_PREAMBLE,
+             complexity: str = 'standard', band: str = None, source_field: str = None) -> PromptTemplate:
+    """
+    Compile and register a prompt template
+
+    Args:
+        name: Unique template name (e.g. 'phase5.step1_interaction2')
+        system: Static rubric text, sent as the system message
+        user: Per-student suffix with {field} placeholders
+        preamble: Framing sentence prepended to the rubric
+        complexity: Rubric complexity ('simple', 'standard' or 'complex')
+        band: Expected CEFR level of the task, if it targets one
+        source_field: Field holding a text the student was given to correct or
+            improve; the answer is then an edit of that text, so two students'
+            answers share most of their words
+
+    Returns:
+        The compiled PromptTemplate
+    """
+    template = PromptTemplate(name, system, user, preamble=preamble, complexity=complexity, band=band,
+                              source_field=source_field)
+    with _lock:
+        if name in _templates:
+            logger.warning(f"Prompt template '{name}' registered twice, replacing it")
+        _templates[name] = template
+    return template
+
+
+def get(name: str) -> PromptTemplate:
+    """Get a registered template by name"""
+    return _templates[name]
+
+
+def all_templates() -> List[PromptTemplate]:
+    """List every registered template"""
+    return list(_templates.values())
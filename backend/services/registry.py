@@ -0,0 +1,151 @@
+"""
+Service Registry - Lazily builds one shared instance per service
+
+Route modules used to construct their own AIService/AssessmentService/etc. at
+import time. They now hold a LazyService proxy instead, so importing the app
+is cheap and every module shares the same instance once it is first used.
+"""
+import threading
+from typing import Any, Callable, Dict
+
+_factories: Dict[str, Callable[[], Any]] = {}
+_instances: Dict[str, Any] = {}
+# Re-entrant: factories build their dependencies through get()
+_lock = threading.RLock()
+
+
+def register(name: str, factory: Callable[[], Any]) -> None:
+    """Register (or replace) the factory used to build a named service"""
+    with _lock:
+        _factories[name] = factory
+        _instances.pop(name, None)
+
+
+def get(name: str) -> Any:
+    """Return the shared instance for a service, building it on first use"""
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _instances.get(name)
+        if instance is None:
+            if name not in _factories:
+                raise KeyError(f"Unknown service: {name}")
+            instance = _factories[name]()
+            _instances[name] = instance
+        return instance
+
+
+def is_built(name: str) -> bool:
+    """Check whether a service has already been constructed"""
+    return name in _instances
+
+
+def reset(name: str = None) -> None:
+    """Drop cached instances (all of them, or one by name) - used by tests"""
+    with _lock:
+        if name is None:
+            _instances.clear()
+        else:
+            _instances.pop(name, None)
+
+
+class LazyService:
+    """Module-level stand-in that resolves to the shared service on attribute access"""
+
+    __slots__ = ('_service_name',)
+
+    def __init__(self, name: str):
+        object.__setattr__(self, '_service_name', name)
+
+    def __getattr__(self, attr):
+        return getattr(get(self._service_name), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(get(self._service_name), attr, value)
+
+    def __repr__(self):
+        state = 'built' if is_built(self._service_name) else 'not built'
+        return f"<LazyService {self._service_name} ({state})>"
+
+
+def lazy(name: str) -> LazyService:
+    """Get a lazy proxy for a registered service"""
+    return LazyService(name)
+
+
+# ============================================================
+# DEFAULT SERVICES
+# ============================================================
+
+def _build_ai_service():
+    from services.ai_service import AIService
+    service = AIService()
+    service.feedback_bank = get('feedback_bank')
+    service.submission_index = get('submission_index')
+    service.cefr_classifier = get('cefr_classifier')
+    return service
+
+
+def _build_feedback_bank():
+    from services.feedback_bank import FeedbackBank
+    return FeedbackBank()
+
+
+def _build_cefr_classifier():
+    from services.cefr_classifier import CefrClassifier
+    return CefrClassifier.load()
+
+
+def _build_submission_index():
+    from services.submission_index import SubmissionIndex
+    return SubmissionIndex()
+
+
+def _build_audio_service():
+    from services.audio_service import AudioService
+    return AudioService()
+
+
+def _build_assessment_service():
+    from services.assessment_service import AssessmentService
+    return AssessmentService(ai_service=get('ai'))
+
+
+def _build_assessment_memo():
+    from services.assessment_memo import AssessmentMemo
+    return AssessmentMemo(get('assessment'))
+
+
+def _build_powerup_service():
+    from services.powerup_service import PowerUpService
+    return PowerUpService()
+
+
+def _build_collectible_service():
+    from services.collectible_service import CollectibleService
+    return CollectibleService()
+
+
+def _build_avatar_service():
+    from services.avatar_service import AvatarService
+    return AvatarService()
+
+
+def _build_adaptive_service():
+    from services.adaptive_service import AdaptiveService
+    return AdaptiveService()
+
+
+register('ai', _build_ai_service)
+register('feedback_bank', _build_feedback_bank)
+register('submission_index', _build_submission_index)
+register('cefr_classifier', _build_cefr_classifier)
+register('audio', _build_audio_service)
+register('assessment', _build_assessment_service)
+register('assessment_memo', _build_assessment_memo)
+register('powerup', _build_powerup_service)
+register('collectible', _build_collectible_service)
+register('avatar', _build_avatar_service)
+register('adaptive', _build_adaptive_service)
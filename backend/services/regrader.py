@@ -0,0 +1,301 @@
+"""
+Regrader - Re-score stored responses after a rubric change
+
+Streams the rows of a source table in id order, grades them again and writes
+the rows whose result changed back in one transaction per batch, together
+with the job's checkpoint (regrade_checkpoints), so an interrupted job picks
+up after the last committed batch. Rows that could not be graded (a Groq
+error, a 429) are recorded in regrade_failures in the same transaction;
+--retry-failed grades only those again.
+
+Graders (each source has one, used unless --grader names it explicitly):
+    local  pure scoring functions fanned out to a process pool
+           (phase5_remedial: the scoring engine's remedial pass marks)
+    llm    the Groq assessment prompt through the assessment service, on a
+           thread pool limited to --rate requests per second
+           (phase2_responses). A row whose call fails or would fall back
+           to the word-count rubric is counted as failed and left as stored.
+
+Only the stored per-row grade is rewritten; anything already derived from it
+(achievements, XP) is left as it is.
+
+    python -m services.regrader run --source phase5_remedial --workers 4
+    python -m services.regrader run --source phase2_responses --rate 2
+    python -m services.regrader run --source phase2_responses --retry-failed
+"""
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from utils.structured_logging import log_event
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+DEFAULT_WORKERS = os.cpu_count() or 2
+# LLM requests per second across all threads
+DEFAULT_RATE = 2.0
+
+Source = namedtuple('Source', 'columns update_sql graders')
+
+
+def regrade_phase2_llm(row) -> Optional[tuple]:
+    """
+    Re-score a phase2_responses row with the Groq assessment prompt
+
+    Returns:
+        UPDATE parameters, or None if the level and points are unchanged
+
+    Raises:
+        AssessmentUnavailable: The service could only produce its rule-based fallback
+    """
+    from services import registry
+    assessment = registry.get('assessment').assess_phase2_response(
+        row['step_id'], row['action_item_id'], row['response_text'], strict=True
+    )
+    if assessment['level'] == row['cefr_level'] and assessment['points'] == row['points_earned']:
+        return None
+    return json.dumps(assessment), assessment['points'], assessment['level'], row['id']
+
+
+def regrade_phase5_remedial(row) -> Optional[tuple]:
+    """
+    Re-score a phase5_remedial row against the current pass mark
+
+    Returns:
+        UPDATE parameters, or None if total, maximum and pass are unchanged
+    """
+    from services.scoring_engine import score_remedial
+    result = score_remedial(5, row['step_id'], row['level'], json.loads(row['task_scores'] or '{}'),
+                            subphase=row['subphase'] or 1)
+    current = (row['total_score'], row['max_score'], bool(row['passed']))
+    if (result['total_score'], result['max_score'], result['passed']) == current:
+        return None
+    return result['total_score'], result['max_score'], result['passed'], row['id']
+
+
+SOURCES = {
+    'phase2_responses': Source(
+        'id, step_id, action_item_id, response_text, cefr_level, points_earned',
+        'UPDATE phase2_responses SET assessment_data = ?, points_earned = ?, cefr_level = ? WHERE id = ?',
+        {'llm': regrade_phase2_llm},
+    ),
+    'phase5_remedial': Source(
+        'id, subphase, step_id, level, task_scores, total_score, max_score, passed',
+        'UPDATE phase5_remedial SET total_score = ?, max_score = ?, passed = ?, '
+        'updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+        {'local': regrade_phase5_remedial},
+    ),
+}
+
+
+def _grade_safely(grade: Callable, row: Dict):
+    """(update or None, error message or None) - one bad row must not stop the job"""
+    try:
+        return grade(row), None
+    except Exception as e:
+        return None, f'{type(e).__name__}: {str(e)}'
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _load_checkpoint(conn, job: str, source: str, grader: str, restart: bool) -> Dict:
+    if restart:
+        conn.execute('DELETE FROM regrade_checkpoints WHERE job = ?', (job,))
+        conn.execute('DELETE FROM regrade_failures WHERE job = ?', (job,))
+    conn.execute('''
+        INSERT INTO regrade_checkpoints (job, source, grader) VALUES (?, ?, ?)
+        ON CONFLICT(job) DO NOTHING
+    ''', (job, source, grader))
+    conn.commit()
+    row = conn.execute('SELECT * FROM regrade_checkpoints WHERE job = ?', (job,)).fetchone()
+    if (row['source'], row['grader']) != (source, grader):
+        raise ValueError(f"Job '{job}' re-grades {row['source']} with the {row['grader']} grader; "
+                         f"use another job name or --restart")
+    return dict(row)
+
+
+def run(db_path: str, source: str, grader: Optional[str] = None, job: Optional[str] = None,
+        workers: int = DEFAULT_WORKERS, batch_size: int = BATCH_SIZE, rate: float = DEFAULT_RATE,
+        restart: bool = False, retry_failed: bool = False,
+        report: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Re-grade every row of a source table past the job's checkpoint
+
+    Args:
+        db_path: Database to re-grade
+        source: Table to re-grade (a key of SOURCES)
+        grader: 'local' (process pool) or 'llm' (rate-limited thread pool);
+            defaults to the source's grader
+        job: Checkpoint name (default '<source>:<grader>')
+        workers: Pool size; 1 grades in this process
+        batch_size: Rows graded and committed together
+        rate: LLM requests per second (llm grader only)
+        restart: Discard the job's checkpoint and failures and start from the first row
+        retry_failed: Grade only the rows the job recorded as failed (the
+            checkpoint stays where it is)
+        report: Called with the running totals after each batch
+
+    Returns:
+        Dict with the job's processed/changed/failed totals, last_id and
+        this run's rows per second
+
+    Raises:
+        ValueError: Unknown source/grader, or a job name used for another source
+    """
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}' (choose from {', '.join(SOURCES)})")
+    spec = SOURCES[source]
+    grader = grader or next(iter(spec.graders))
+    if grader not in spec.graders:
+        raise ValueError(f"No {grader} grader for {source}")
+    job = job or f'{source}:{grader}'
+    grade = partial(_grade_safely, spec.graders[grader])
+
+    if grader == 'llm':
+        limiter = RateLimiter(rate)
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        worker = lambda row: (limiter.acquire(), grade(row))[1]  # noqa: E731
+    elif workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        worker = grade
+    else:
+        executor, worker = None, grade
+
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    started = time.monotonic()
+    run_processed = 0
+    try:
+        state = _load_checkpoint(conn, job, source, grader, restart)
+        if retry_failed:
+            query = (f'SELECT {spec.columns} FROM {source} WHERE id > :cursor AND id IN '
+                     f'(SELECT row_id FROM regrade_failures WHERE job = :job) ORDER BY id LIMIT :limit')
+            cursor = 0
+        else:
+            query = f'SELECT {spec.columns} FROM {source} WHERE id > :cursor ORDER BY id LIMIT :limit'
+            cursor = state['last_id']
+        while True:
+            rows = [dict(row) for row in conn.execute(query, {'cursor': cursor, 'job': job, 'limit': batch_size})]
+            if not rows:
+                break
+
+            if executor is None:
+                results = list(map(worker, rows))
+            elif grader == 'llm':
+                results = list(executor.map(worker, rows))
+            else:
+                results = list(executor.map(worker, rows, chunksize=max(1, len(rows) // (workers * 4))))
+
+            updates, failures, graded = [], [], []
+            for row, (update, error) in zip(rows, results):
+                if error:
+                    failures.append((job, row['id'], error))
+                    logger.warning(f"Re-grading {source} row {row['id']} failed: {error}")
+                else:
+                    graded.append((job, row['id']))
+                    if update is not None:
+                        updates.append(update)
+
+            cursor = rows[-1]['id']
+            if retry_failed:
+                # These rows were counted as processed (and failed) by the run that missed them
+                state['failed'] -= len(graded)
+            else:
+                state['last_id'] = cursor
+                state['processed'] += len(rows)
+                state['failed'] += len(failures)
+            state['changed'] += len(updates)
+            with conn:
+                conn.executemany(spec.update_sql, updates)
+                conn.executemany('''
+                    INSERT INTO regrade_failures (job, row_id, error) VALUES (?, ?, ?)
+                    ON CONFLICT(job, row_id) DO UPDATE SET error = excluded.error, failed_at = CURRENT_TIMESTAMP
+                ''', failures)
+                if retry_failed:
+                    conn.executemany('DELETE FROM regrade_failures WHERE job = ? AND row_id = ?', graded)
+                conn.execute('''
+                    UPDATE regrade_checkpoints
+                    SET last_id = ?, processed = ?, changed = ?, failed = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE job = ?
+                ''', (state['last_id'], state['processed'], state['changed'], state['failed'], job))
+
+            run_processed += len(rows)
+            elapsed = time.monotonic() - started
+            summary = {
+                'job': job, 'last_id': state['last_id'], 'processed': state['processed'],
+                'changed': state['changed'], 'failed': state['failed'],
+                'rows_per_sec': round(run_processed / elapsed, 1) if elapsed else None,
+            }
+            log_event(logger, 'regrade.batch', batch=len(rows), batch_changed=len(updates), **summary)
+            if report:
+                report(summary)
+    finally:
+        conn.close()
+        if executor is not None:
+            executor.shutdown()
+
+    elapsed = time.monotonic() - started
+    return {
+        'job': job, 'last_id': state['last_id'], 'processed': state['processed'],
+        'changed': state['changed'], 'failed': state['failed'],
+        'seconds': round(elapsed, 2),
+        'rows_per_sec': round(run_processed / elapsed, 1) if elapsed and run_processed else 0.0,
+    }
+
+
+def _main():
+    parser = argparse.ArgumentParser(description='Re-score stored responses with the current rubrics')
+    parser.add_argument('command', choices=['run'])
+    parser.add_argument('--source', required=True, choices=sorted(SOURCES))
+    parser.add_argument('--grader', choices=['local', 'llm'], help="default: the source's grader")
+    parser.add_argument('--db', default='fardi.db', help='database to re-grade')
+    parser.add_argument('--job', help="checkpoint name (default '<source>:<grader>')")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='LLM requests per second')
+    parser.add_argument('--restart', action='store_true', help='ignore the saved checkpoint')
+    parser.add_argument('--retry-failed', action='store_true', help='grade only the rows this job failed on')
+    args = parser.parse_args()
+
+    def report(summary):
+        print(f"{summary['job']}: {summary['processed']} rows (last id {summary['last_id']}), "
+              f"{summary['changed']} changed, {summary['failed']} failed, {summary['rows_per_sec']} rows/s")
+
+    try:
+        result = run(args.db, args.source, args.grader, job=args.job, workers=args.workers,
+                     batch_size=args.batch_size, rate=args.rate, restart=args.restart,
+                     retry_failed=args.retry_failed, report=report)
+    except ValueError as e:
+        parser.error(str(e))
+    except sqlite3.Error as e:
+        parser.error(f'{args.db}: {str(e)} (run migrate.py first?)')
+    print(f"Done: {result['processed']} rows, {result['changed']} changed, {result['failed']} failed "
+          f"in {result['seconds']}s ({result['rows_per_sec']} rows/s this run)")
+
+
+if __name__ == '__main__':
+    _main()
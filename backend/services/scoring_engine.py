@@ -0,0 +1,255 @@
+"""
+Scoring Engine
+Declarative step scoring and remedial pass marks for Phases 5 and 6
+
+The rules below are plain data (one row per step, one per remedial step)
+and are compiled once into dicts keyed by (phase, subphase, step), so
+scoring is a lookup, a sum and a bisect. Results for several steps can be
+persisted in one transaction with persist_results().
+"""
+
+import json
+import math
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Dict, Iterable, List
+
+# Remedial level reached by a main score of at least the given value
+CEFR_1_TO_5 = ((1, 'A1'), (2, 'A2'), (3, 'B1'), (4, 'B2'), (5, 'C1'))
+CEFR_2_TO_5 = ((2, 'A2'), (3, 'B1'), (4, 'B2'), (5, 'C1'))
+
+# Level for a main score under the table's first floor (default: the first level).
+# Phase 6 has no A1 remedial tasks, so an empty submission routes to A2.
+BELOW_FLOOR_LEVEL = {6: 'A2'}
+
+# (phase, subphase, step, {input: max points or (min, max)}, routing input, level table, proceed at)
+STEP_RULES = [
+    (5, 1, 1, {'interaction1_score': 1, 'interaction2_score': (1, 5), 'interaction3_score': 1},
+     'interaction2_score', CEFR_1_TO_5, 3),
+    (5, 1, 2, {'interaction1_score': 1, 'interaction1_writing_score': 5, 'interaction2_score': 5,
+               'interaction3_score': 1, 'interaction3_revision_score': 5},
+     'interaction1_writing_score', CEFR_2_TO_5, 3),
+    (5, 1, 3, {'interaction1_score': 1, 'interaction1_definition_score': 5, 'interaction2_score': 5,
+               'interaction3_score': 1, 'interaction3_term_score': 5},
+     'interaction1_definition_score', CEFR_2_TO_5, 3),
+    (5, 1, 4, {'interaction1_score': 5, 'interaction2_score': 5, 'interaction3_score': 1,
+               'interaction3_revision_score': 5},
+     'interaction1_score', CEFR_2_TO_5, 3),
+    (5, 1, 5, {'interaction1_score': 5, 'interaction2_score': 5, 'interaction3_score': 1,
+               'interaction3_enhancement_score': 5},
+     'interaction3_enhancement_score', CEFR_2_TO_5, 3),
+] + [
+    (6, subphase, step, {'interaction1_score': 1, 'interaction2_score': 5, 'interaction3_score': 1},
+     'interaction2_score', CEFR_1_TO_5, 3)
+    for subphase in (1, 2) for step in range(1, 5)
+] + [
+    # Step 5 scores every interaction as a rubric level (up to 5) rather than a completion
+    (6, subphase, 5, {'interaction1_score': 5, 'interaction2_score': 5, 'interaction3_score': 5},
+     'interaction2_score', CEFR_1_TO_5, 3)
+    for subphase in (1, 2)
+]
+
+# (phase, subphase, step, {level: max score}, pass ratio)
+REMEDIAL_RULES = [
+    (5, 1, 2, {'A2': 18, 'B1': 18, 'B2': 28, 'C1': 28}, 0.8),
+    (5, 1, 3, {'A2': 22, 'B1': 22, 'B2': 28, 'C1': 28}, 0.8),
+    (5, 1, 4, {'A2': 22, 'B1': 19, 'B2': 28, 'C1': 28}, 0.8),
+    (5, 1, 5, {'A2': 22, 'B1': 19, 'B2': 24, 'C1': 25}, 0.8),
+] + [
+    (6, subphase, step, {'A2': 24, 'B1': 24, 'B2': 32, 'C1': 32}, 0.8)
+    for subphase in (1, 2) for step in range(1, 6)
+]
+
+# Fallback max score for a level missing from a remedial rule
+DEFAULT_REMEDIAL_MAX = {5: 20, 6: 24}
+
+PROGRESS_TABLES = {5: 'phase5_progress', 6: 'phase6_progress'}
+REMEDIAL_TABLES = {5: 'phase5_remedial', 6: 'phase6_remedial'}
+
+StepRule = namedtuple('StepRule', 'components max_score main floors levels below_floor proceed_at')
+RemedialRule = namedtuple('RemedialRule', 'levels default_max pass_ratio')
+
+
+def compile_rules(step_rules=STEP_RULES, remedial_rules=REMEDIAL_RULES):
+    """
+    Build the lookup tables used by the scorer
+
+    Returns:
+        (step rules, remedial rules), each a dict keyed by (phase, subphase, step)
+    """
+    steps = {}
+    for phase, subphase, step, components, main, table, proceed_at in step_rules:
+        ranges = {name: limits if isinstance(limits, tuple) else (0, limits)
+                  for name, limits in components.items()}
+        steps[(phase, subphase, step)] = StepRule(
+            components=ranges,
+            max_score=sum(high for _, high in ranges.values()),
+            main=main,
+            floors=[floor for floor, _ in table],
+            levels=[level for _, level in table],
+            below_floor=BELOW_FLOOR_LEVEL.get(phase, table[0][1]),
+            proceed_at=proceed_at
+        )
+
+    remedials = {}
+    for phase, subphase, step, levels, pass_ratio in remedial_rules:
+        remedials[(phase, subphase, step)] = RemedialRule(
+            levels=dict(levels),
+            default_max=DEFAULT_REMEDIAL_MAX.get(phase, 20),
+            pass_ratio=pass_ratio
+        )
+    return steps, remedials
+
+
+_STEP_RULES, _REMEDIAL_RULES = compile_rules()
+
+
+def score_step(phase: int, step: int, scores: Dict, subphase: int = 1) -> Dict:
+    """
+    Score one step from its interaction scores
+
+    Args:
+        phase, step, subphase: Which step's rule to apply
+        scores: Interaction scores keyed like the calculate-score payloads
+
+    Returns:
+        Dict with interaction_scores, max_scores (per input), total_score,
+        max_score, remedial_level and should_proceed
+
+    Raises:
+        ValueError: Unknown step or a score outside its range
+    """
+    rule = _STEP_RULES.get((phase, subphase, step))
+    if rule is None:
+        raise ValueError(f'No scoring rule for phase {phase}.{subphase} step {step}')
+
+    interaction_scores = {}
+    for name, (low, high) in rule.components.items():
+        value = scores.get(name, 0) or 0
+        if not isinstance(value, (int, float)) or not low <= value <= high:
+            raise ValueError(f'{name} must be between {low} and {high}')
+        interaction_scores[name] = value
+
+    main_score = interaction_scores[rule.main]
+    position = bisect_right(rule.floors, main_score)
+    remedial_level = rule.levels[position - 1] if position else rule.below_floor
+
+    return {
+        'phase': phase,
+        'subphase': subphase,
+        'step': step,
+        'interaction_scores': interaction_scores,
+        'max_scores': {name: high for name, (_, high) in rule.components.items()},
+        'total_score': sum(interaction_scores.values()),
+        'max_score': rule.max_score,
+        'remedial_level': remedial_level,
+        'should_proceed': rule.proceed_at is not None and main_score >= rule.proceed_at
+    }
+
+
+def score_remedial(phase: int, step: int, level: str, task_scores: Dict,
+                   subphase: int = 1) -> Dict:
+    """
+    Score a finished remedial level against its pass mark
+
+    Returns:
+        Dict with total_score, max_score, threshold and passed
+
+    Raises:
+        ValueError: Unknown step or non-numeric task scores
+    """
+    rule = _REMEDIAL_RULES.get((phase, subphase, step))
+    if rule is None:
+        raise ValueError(f'No remedial rule for phase {phase}.{subphase} step {step}')
+    if any(not isinstance(v, (int, float)) for v in task_scores.values()):
+        raise ValueError('Task scores must be numbers')
+
+    level = level.upper()
+    max_score = rule.levels.get(level, rule.default_max)
+    threshold = math.ceil(max_score * rule.pass_ratio)
+    total_score = sum(task_scores.values())
+
+    return {
+        'phase': phase,
+        'subphase': subphase,
+        'step': step,
+        'level': level,
+        'task_scores': dict(task_scores),
+        'total_score': total_score,
+        'max_score': max_score,
+        'threshold': threshold,
+        'passed': total_score >= threshold
+    }
+
+
+def score_item(item: Dict) -> Dict:
+    """Score one batch item: a remedial result if it names a level, else a step"""
+    if not isinstance(item, dict):
+        raise ValueError('Each item must be an object')
+    phase = int(item.get('phase', 0))
+    step = int(item.get('step', 0))
+    subphase = int(item.get('subphase', 1))
+    if item.get('level'):
+        return score_remedial(phase, step, str(item['level']), item.get('task_scores') or {}, subphase)
+    return score_step(phase, step, item.get('scores') or {}, subphase)
+
+
+def persist_results(conn, user_id: int, results: Iterable[Dict]):
+    """
+    Write scored steps and remedial results (does not commit)
+
+    Step results upsert phaseN_progress; remedial results update the user's
+    phaseN_remedial row for that level, inserting it if the tasks were never logged.
+    """
+    for result in results:
+        phase = result['phase']
+        key = (user_id, result['subphase'], result['step'])
+        if 'level' not in result:
+            conn.execute(f'''
+                INSERT INTO {PROGRESS_TABLES[phase]}
+                    (user_id, subphase, step_id, interaction_scores, total_score, remedial_level, should_proceed)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, subphase, step_id) DO UPDATE SET
+                    interaction_scores = excluded.interaction_scores,
+                    total_score = excluded.total_score,
+                    remedial_level = excluded.remedial_level,
+                    should_proceed = excluded.should_proceed,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', key + (json.dumps(result['interaction_scores']), result['total_score'],
+                        result['remedial_level'], result['should_proceed']))
+            continue
+
+        values = (json.dumps(result['task_scores']), result['total_score'],
+                  result['max_score'], result['passed'])
+        updated = conn.execute(f'''
+            UPDATE {REMEDIAL_TABLES[phase]}
+            SET task_scores = ?, total_score = ?, max_score = ?, passed = ?,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE user_id = ? AND subphase = ? AND step_id = ? AND level = ?
+        ''', values + key + (result['level'],)).rowcount
+        if not updated:
+            conn.execute(f'''
+                INSERT INTO {REMEDIAL_TABLES[phase]}
+                    (user_id, subphase, step_id, level, task_scores, total_score, max_score, passed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', key + (result['level'],) + values)
+
+
+def score_batch(conn, user_id: int, items: List[Dict]) -> List[Dict]:
+    """
+    Score several steps and persist them in one transaction
+
+    Raises:
+        ValueError: If any item is invalid (nothing is written)
+    """
+    results = []
+    for index, item in enumerate(items):
+        try:
+            results.append(score_item(item))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Item {index}: {e}')
+
+    with conn:
+        persist_results(conn, user_id, results)
+    return results
+
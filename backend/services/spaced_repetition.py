@@ -0,0 +1,154 @@
+"""
+Spaced Repetition Scheduler (SM-2)
+Schedules activity reviews and serves the due queue
+
+Each review is recorded with a single upsert that applies the SM-2 update
+in SQL, so there is no read-modify-write and concurrent reviews cannot
+lose an update. Due lookups are range scans on
+spaced_repetition(user_id, next_review_date) for one user and
+spaced_repetition(next_review_date, user_id) for everybody.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+MASTERY_THRESHOLD = 0.95
+REVIEW_LIMIT = 10
+
+
+def quality_from_result(success: bool, score: Optional[float] = None) -> int:
+    """
+    Map an attempt to an SM-2 recall quality (0-5)
+
+    Args:
+        success: Whether the attempt passed
+        score: Optional score as a 0-1 fraction of the maximum
+
+    Raises:
+        ValueError: If score is outside 0-1
+    """
+    if score is None:
+        return 4 if success else 1
+    if not 0 <= score <= 1:
+        raise ValueError(f"score must be a 0-1 fraction, got {score}")
+    quality = int(round(score * 5))
+    # A pass is always a correct recall (>= 3), a fail never is
+    return max(quality, 3) if success else min(quality, 2)
+
+
+def ease_delta(quality: int) -> float:
+    """SM-2 ease factor adjustment for a recall quality"""
+    return 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+
+
+def next_schedule(review_count: int, ease_factor: float, interval_days: int,
+                  quality: int) -> Tuple[int, float, int]:
+    """
+    SM-2 step: (review_count, ease_factor, interval_days) after one review
+
+    This is the reference for the SQL in ReviewScheduler.record_review.
+    """
+    if quality < 3:
+        review_count, interval_days = 0, 1
+    else:
+        if review_count == 0:
+            interval_days = 1
+        elif review_count == 1:
+            interval_days = 6
+        else:
+            interval_days = int(round(interval_days * ease_factor))
+        review_count += 1
+    return review_count, max(MIN_EASE, ease_factor + ease_delta(quality)), interval_days
+
+
+class ReviewScheduler:
+    """SM-2 schedule stored in spaced_repetition, on the caller's connection"""
+
+    def __init__(self, db_connection):
+        self.conn = db_connection
+
+    def record_review(self, user_id: int, activity_id: str, quality: int,
+                      today: Optional[date] = None) -> Dict:
+        """
+        Apply one review to the schedule (does not commit)
+
+        Returns:
+            Dict with the new review_count, ease_factor, interval_days and next_review_date
+        """
+        today = today or date.today()
+        first_count, first_ease, first_interval = next_schedule(0, INITIAL_EASE, 0, quality)
+        # SET expressions see the row as it was before the update
+        interval_sql = '''
+            CASE WHEN :quality < 3 THEN 1
+                 WHEN review_count = 0 THEN 1
+                 WHEN review_count = 1 THEN 6
+                 ELSE CAST(ROUND(interval_days * ease_factor) AS INTEGER)
+            END
+        '''
+        row = self.conn.execute(f'''
+            INSERT INTO spaced_repetition
+                (user_id, activity_id, review_count, ease_factor, interval_days, next_review_date)
+            VALUES (:user_id, :activity_id, :first_count, :first_ease, :first_interval,
+                    DATE(:today, '+' || :first_interval || ' days'))
+            ON CONFLICT(user_id, activity_id) DO UPDATE SET
+                review_count = CASE WHEN :quality < 3 THEN 0 ELSE review_count + 1 END,
+                ease_factor = MAX(:min_ease, ease_factor + :ease_delta),
+                interval_days = {interval_sql},
+                next_review_date = DATE(:today, '+' || ({interval_sql}) || ' days')
+            RETURNING review_count, ease_factor, interval_days, next_review_date
+        ''', {
+            "user_id": user_id, "activity_id": activity_id, "quality": quality,
+            "first_count": first_count, "first_ease": first_ease, "first_interval": first_interval,
+            "min_ease": MIN_EASE, "ease_delta": ease_delta(quality), "today": today.isoformat()
+        }).fetchone()
+
+        return {
+            "review_count": row[0],
+            "ease_factor": round(row[1], 2),
+            "interval_days": row[2],
+            "next_review_date": row[3]
+        }
+
+    def due_for_user(self, user_id: int, on_date: Optional[date] = None,
+                     limit: int = REVIEW_LIMIT) -> List[Dict]:
+        """Activities due for review, oldest first (mastered ones are skipped)"""
+        on_date = on_date or date.today()
+        rows = self.conn.execute('''
+            SELECT sr.activity_id, sr.next_review_date, sr.review_count, sr.interval_days,
+                   pt.mastery_level
+            FROM spaced_repetition sr
+            JOIN performance_tracking pt ON sr.user_id = pt.user_id AND sr.activity_id = pt.activity_id
+            WHERE sr.user_id = ? AND sr.next_review_date <= ?
+              AND pt.mastery_level < ?
+            ORDER BY sr.next_review_date ASC
+            LIMIT ?
+        ''', (user_id, on_date.isoformat(), MASTERY_THRESHOLD, limit)).fetchall()
+
+        return [{
+            "activity_id": row[0],
+            "next_review_date": row[1],
+            "review_count": row[2],
+            "interval_days": row[3],
+            "mastery_level": round(row[4], 2)
+        } for row in rows]
+
+    def due_for_all(self, on_date: Optional[date] = None) -> List[Dict]:
+        """
+        Per-user due counts for everyone (nightly reminder generation)
+
+        Returns:
+            List of {"user_id", "due_count", "oldest_due"} ordered by user
+        """
+        on_date = on_date or date.today()
+        rows = self.conn.execute('''
+            SELECT sr.user_id, COUNT(*), MIN(sr.next_review_date)
+            FROM spaced_repetition sr
+            JOIN performance_tracking pt ON sr.user_id = pt.user_id AND sr.activity_id = pt.activity_id
+            WHERE sr.next_review_date <= ? AND pt.mastery_level < ?
+            GROUP BY sr.user_id
+            ORDER BY sr.user_id
+        ''', (on_date.isoformat(), MASTERY_THRESHOLD)).fetchall()
+
+        return [{"user_id": row[0], "due_count": row[1], "oldest_due": row[2]} for row in rows]
@@ -185,65 +185,120 @@ class StreakService:
             limit: Number of users to return
 
         Returns:
-            List of top streak users
+            List of top streak users (tied streaks share a rank)
         """
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT us.user_id, us.current_streak, us.longest_streak, u.username
-            FROM user_streaks us
-            JOIN users u ON us.user_id = u.id
-            WHERE us.current_streak > 0
-            ORDER BY us.current_streak DESC, us.longest_streak DESC
+            SELECT l.user_id, l.current_streak, l.longest_streak, u.username
+            FROM streak_leaderboard l
+            JOIN users u ON l.user_id = u.id
+            ORDER BY l.current_streak DESC, l.longest_streak DESC, l.user_id
             LIMIT ?
         """, (limit,))
 
         leaderboard = []
-        for row in cursor.fetchall():
+        previous_key = None
+        for position, row in enumerate(cursor.fetchall(), start=1):
+            key = (row[1], row[2])
+            rank = leaderboard[-1]["rank"] if key == previous_key else position
+            previous_key = key
             leaderboard.append({
                 "user_id": row[0],
-                "username": row[1] if len(row) > 3 else f"User {row[0]}",
+                "username": row[3] or f"User {row[0]}",
                 "current_streak": row[1],
-                "longest_streak": row[2]
+                "longest_streak": row[2],
+                "rank": rank
             })
 
         return leaderboard
 
-    def check_broken_streaks(self) -> list:
+    def get_streak_rank(self, user_id: int) -> Dict[str, Any]:
         """
-        Check for streaks that should be broken (daily maintenance task)
+        Get a user's position on the streak leaderboard
+
+        Args:
+            user_id: User ID
 
         Returns:
-            List of user IDs whose streaks were broken
+            Dict with rank (None without an active streak) and total ranked users
         """
         cursor = self.conn.cursor()
-        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        cursor.execute("SELECT COALESCE(SUM(users), 0) FROM streak_rank_buckets")
+        total = cursor.fetchone()[0]
+
+        cursor.execute("""
+            SELECT current_streak, longest_streak FROM streak_leaderboard WHERE user_id = ?
+        """, (user_id,))
+        row = cursor.fetchone()
+        if not row:
+            return {"rank": None, "total_ranked": total, "current_streak": 0}
 
-        # Find users whose last activity was more than 1 day ago and still have active streaks
+        current_streak, longest_streak = row[0], row[1]
         cursor.execute("""
-            SELECT user_id, current_streak, freeze_tokens
-            FROM user_streaks
+            SELECT COALESCE(SUM(users), 0) FROM streak_rank_buckets
+            WHERE current_streak > ? OR (current_streak = ? AND longest_streak > ?)
+        """, (current_streak, current_streak, longest_streak))
+
+        return {
+            "rank": cursor.fetchone()[0] + 1,
+            "total_ranked": total,
+            "current_streak": current_streak,
+            "longest_streak": longest_streak
+        }
+
+    def run_daily_maintenance(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Freeze or break every streak that missed a day (nightly job)
+
+        Each rule is one UPDATE over all affected users. Streaks whose owner
+        has a freeze token for every missed day are carried to yesterday and
+        spend those tokens; the rest are reset to 0.
+
+        Args:
+            today: Day the job runs for (defaults to today)
+
+        Returns:
+            Dict with the number of frozen streaks and the list of broken ones
+        """
+        today = today or date.today()
+        yesterday = (today - timedelta(days=1)).isoformat()
+        now = datetime.now()
+        cursor = self.conn.cursor()
+
+        cursor.execute("""
+            UPDATE user_streaks
+            SET freeze_tokens = freeze_tokens - CAST(julianday(:yesterday) - julianday(last_activity_date) AS INTEGER),
+                last_activity_date = :yesterday,
+                updated_at = :now
             WHERE current_streak > 0
-              AND last_activity_date < ?
+              AND last_activity_date < :yesterday
+              AND freeze_tokens >= CAST(julianday(:yesterday) - julianday(last_activity_date) AS INTEGER)
+        """, {"yesterday": yesterday, "now": now})
+        frozen = cursor.rowcount
+
+        cursor.execute("""
+            SELECT user_id, current_streak FROM user_streaks
+            WHERE current_streak > 0 AND last_activity_date < ?
         """, (yesterday,))
+        broken_streaks = [{"user_id": row[0], "broken_streak": row[1]} for row in cursor.fetchall()]
 
-        broken_streaks = []
-        for row in cursor.fetchall():
-            user_id, current_streak, freeze_tokens = row
+        cursor.execute("""
+            UPDATE user_streaks
+            SET current_streak = 0, updated_at = ?
+            WHERE current_streak > 0 AND last_activity_date < ?
+        """, (now, yesterday))
 
-            # Reset streak to 0
-            cursor.execute("""
-                UPDATE user_streaks
-                SET current_streak = 0, updated_at = ?
-                WHERE user_id = ?
-            """, (datetime.now(), user_id))
+        self.conn.commit()
+        return {"frozen": frozen, "broken": broken_streaks}
 
-            broken_streaks.append({
-                "user_id": user_id,
-                "broken_streak": current_streak
-            })
+    def check_broken_streaks(self) -> list:
+        """
+        Check for streaks that should be broken (daily maintenance task)
 
-        self.conn.commit()
-        return broken_streaks
+        Returns:
+            List of user IDs whose streaks were broken
+        """
+        return self.run_daily_maintenance()["broken"]
 
     @staticmethod
     def _get_next_milestone(current_streak: int) -> Optional[Dict[str, Any]]:
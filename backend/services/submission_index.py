@@ -0,0 +1,277 @@
+"""
+Submission Index - Spot near-duplicate answers across a classroom
+
+Every graded answer is fingerprinted with a MinHash signature over its word
+bigrams and filed in a locality-sensitive hash table per task (BANDS bands
+of ROWS signature values). Checking a new answer only compares it with the
+few submissions that share a band, so it stays fast however many answers
+are indexed. Answers from other students above DUPLICATE_THRESHOLD
+estimated Jaccard similarity are flagged for the admin "similar
+submissions" report, and a grade already given to a near-identical text
+(REUSE_THRESHOLD) is reused instead of calling the LLM again.
+
+The index lives in memory (the MAX_PER_TASK most recent submissions of each
+task, loaded from the database on first use); new fingerprints, grades and
+flags are written in batches every FLUSH_INTERVAL seconds or FLUSH_BATCH
+records. Signatures are kept packed as array('Q') (NUM_PERM * 8 bytes, the
+same bytes stored in the database) rather than as tuples of Python ints.
+"""
+import atexit
+import json
+import logging
+import random
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 8
+ROWS = NUM_PERM // BANDS
+
+# Estimated Jaccard similarity to flag a pair, and to reuse the earlier grade
+DUPLICATE_THRESHOLD = 0.8
+REUSE_THRESHOLD = 0.95
+
+# Answers shorter than this are too generic to call copies ("I agree with you")
+MIN_WORDS = 6
+
+MAX_PER_TASK = 20000
+# Closest matches flagged per submission (a widely shared text would otherwise flag everyone)
+MAX_MATCHES = 10
+FLUSH_INTERVAL = 30
+FLUSH_BATCH = 200
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240611)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_WORD_RE = re.compile(r"[\w']+")
+
+Match = namedtuple('Match', 'submission_id user_id similarity')
+Submission = namedtuple('Submission', 'id matches reusable')
+
+
+def signature(text: str) -> Optional[array]:
+    """MinHash signature of a text's word bigrams (None for answers under MIN_WORDS)"""
+    words = _WORD_RE.findall((text or '').lower())
+    if len(words) < MIN_WORDS:
+        return None
+    shingles = {zlib.crc32(f'{a} {b}'.encode('utf-8')) for a, b in zip(words, words[1:])}
+    return array('Q', (min((a * h + b) % _PRIME for h in shingles) for a, b in _PERMUTATIONS))
+
+
+def similarity(sig_a: array, sig_b: array) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def _band_keys(sig: array) -> List[tuple]:
+    return [(band, hash(sig[band * ROWS:(band + 1) * ROWS].tobytes())) for band in range(BANDS)]
+
+
+class _Entry:
+    __slots__ = ('id', 'user_id', 'signature', 'evaluation')
+
+    def __init__(self, entry_id, user_id, sig, evaluation=None):
+        self.id = entry_id
+        self.user_id = user_id
+        self.signature = sig
+        self.evaluation = evaluation
+
+
+class _TaskShard:
+    """LSH buckets and recent entries for one task"""
+
+    def __init__(self):
+        self.entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self.buckets: Dict[tuple, set] = {}
+
+    def add(self, entry: _Entry):
+        self.entries[entry.id] = entry
+        for key in _band_keys(entry.signature):
+            self.buckets.setdefault(key, set()).add(entry.id)
+        while len(self.entries) > MAX_PER_TASK:
+            _, oldest = self.entries.popitem(last=False)
+            for key in _band_keys(oldest.signature):
+                bucket = self.buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(oldest.id)
+                    if not bucket:
+                        del self.buckets[key]
+
+    def candidates(self, sig: array) -> List[_Entry]:
+        ids = set()
+        for key in _band_keys(sig):
+            ids |= self.buckets.get(key, set())
+        return [self.entries[i] for i in ids if i in self.entries]
+
+
+class SubmissionIndex:
+    """
+    Per-task MinHash/LSH index of recent submissions
+
+    Args:
+        db_path: Database holding submission_fingerprints and similar_submissions
+    """
+
+    def __init__(self, db_path: str = 'fardi.db'):
+        self.db_path = db_path
+        self._shards: Dict[str, _TaskShard] = {}
+        self._lock = threading.Lock()
+        self._pending_fingerprints = []
+        self._pending_flags = []
+        self._pending_grades: Dict[str, str] = {}
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
+    def _shard(self, task: str) -> _TaskShard:
+        shard = self._shards.get(task)
+        if shard is None:
+            shard = self._shards[task] = _TaskShard()
+            for entry in reversed(self._load(task)):
+                shard.add(entry)
+        return shard
+
+    def _load(self, task: str) -> List[_Entry]:
+        if not self.db_path:
+            return []
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=1)
+            try:
+                rows = conn.execute('''
+                    SELECT id, user_id, signature, evaluation FROM submission_fingerprints
+                    WHERE task = ? ORDER BY rowid DESC LIMIT ?
+                ''', (task, MAX_PER_TASK)).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"No stored fingerprints for '{task}': {str(e)}")
+            return []
+        return [_Entry(entry_id, user_id, array('Q', blob),
+                       json.loads(evaluation) if evaluation else None)
+                for entry_id, user_id, blob, evaluation in rows]
+
+    def add(self, task: str, user_id: Optional[int], text: str) -> Optional[Submission]:
+        """
+        Fingerprint a submission and compare it with the task's recent ones
+
+        Returns:
+            Submission with the other students' near-duplicates and, if a
+            near-identical text was already graded, that evaluation; None for
+            answers too short to fingerprint
+        """
+        sig = signature(text)
+        if sig is None:
+            return None
+
+        entry = _Entry(uuid.uuid4().hex, user_id, sig)
+        with self._lock:
+            shard = self._shard(task)
+            scored = [(similarity(sig, other.signature), other) for other in shard.candidates(sig)]
+            shard.add(entry)
+
+            matches, reusable, best = [], None, 0.0
+            for sim, other in scored:
+                if sim >= DUPLICATE_THRESHOLD and other.user_id != user_id:
+                    matches.append(Match(other.id, other.user_id, sim))
+                if sim >= REUSE_THRESHOLD and other.evaluation is not None and sim > best:
+                    reusable, best = other.evaluation, sim
+            matches = sorted(matches, key=lambda m: m.similarity, reverse=True)[:MAX_MATCHES]
+
+            self._pending_fingerprints.append(
+                (entry.id, task, user_id, text, sig.tobytes())
+            )
+            self._pending_flags.extend(
+                (task, entry.id, user_id, m.submission_id, m.user_id, m.similarity) for m in matches
+            )
+
+        if matches:
+            logger.info(f"Submission for '{task}' by user {user_id} matches {len(matches)} "
+                        f"other submission(s), best {matches[0].similarity:.2f}")
+        self._maybe_flush()
+        return Submission(entry.id, matches, dict(reusable) if reusable else None)
+
+    def set_grade(self, task: str, submission_id: str, evaluation: Dict):
+        """Attach the grade a submission received so near-identical copies can reuse it"""
+        with self._lock:
+            entry = self._shard(task).entries.get(submission_id)
+            if entry is not None:
+                entry.evaluation = evaluation
+            self._pending_grades[submission_id] = json.dumps(evaluation)
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        pending = len(self._pending_fingerprints) + len(self._pending_flags) + len(self._pending_grades)
+        if pending >= FLUSH_BATCH or (pending and time.monotonic() - self._last_flush >= FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self):
+        """Write pending fingerprints, grades and flags in one transaction"""
+        with self._lock:
+            fingerprints, self._pending_fingerprints = self._pending_fingerprints, []
+            flags, self._pending_flags = self._pending_flags, []
+            grades, self._pending_grades = self._pending_grades, {}
+            self._last_flush = time.monotonic()
+        if not (fingerprints or flags or grades) or not self.db_path:
+            return
+
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            try:
+                with conn:
+                    conn.executemany('''
+                        INSERT OR IGNORE INTO submission_fingerprints (id, task, user_id, answer_text, signature)
+                        VALUES (?, ?, ?, ?, ?)
+                    ''', fingerprints)
+                    conn.executemany('''
+                        UPDATE submission_fingerprints SET evaluation = ? WHERE id = ?
+                    ''', [(evaluation, submission_id) for submission_id, evaluation in grades.items()])
+                    conn.executemany('''
+                        INSERT INTO similar_submissions
+                            (task, submission_id, user_id, matched_submission_id, matched_user_id, similarity)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', flags)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error persisting submission fingerprints: {str(e)}")
+
+
+def similar_submissions_report(conn, task: Optional[str] = None, min_similarity: float = DUPLICATE_THRESHOLD,
+                               limit: int = 50, offset: int = 0) -> Dict:
+    """
+    Flagged pairs (newest first) and per-task flag counts for the admin report
+
+    Reads only the flags table and primary-key lookups, so the cost follows
+    the number of flags shown, not the number of stored submissions.
+    """
+    pairs = conn.execute('''
+        SELECT s.task, s.similarity, s.created_at,
+               s.user_id, u.username, f.answer_text,
+               s.matched_user_id, mu.username AS matched_username, mf.answer_text AS matched_text
+        FROM similar_submissions s
+        LEFT JOIN submission_fingerprints f ON f.id = s.submission_id
+        LEFT JOIN submission_fingerprints mf ON mf.id = s.matched_submission_id
+        LEFT JOIN users u ON u.id = s.user_id
+        LEFT JOIN users mu ON mu.id = s.matched_user_id
+        WHERE (? IS NULL OR s.task = ?) AND s.similarity >= ?
+        ORDER BY s.id DESC
+        LIMIT ? OFFSET ?
+    ''', (task, task, min_similarity, limit, offset)).fetchall()
+
+    tasks = conn.execute('''
+        SELECT task, COUNT(*) AS flags, COUNT(DISTINCT user_id) AS students, MAX(created_at) AS last_flagged
+        FROM similar_submissions
+        WHERE similarity >= ?
+        GROUP BY task
+        ORDER BY flags DESC
+    ''', (min_similarity,)).fetchall()
+
+    return {'pairs': [dict(row) for row in pairs], 'tasks': [dict(row) for row in tasks]}
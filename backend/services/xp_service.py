@@ -4,15 +4,18 @@ XP Service - Handles all XP-related operations and rewards
 from typing import Dict, Any, Optional
 from models.gamification_models import UserProgression, XPHistory
 from models.gamification_data import XP_REWARDS, PLAYER_LEVELS
+from services import registry
 
 
 class XPService:
     """Service for managing XP rewards and progression"""
 
-    def __init__(self, db_connection):
+    def __init__(self, db_connection, powerups=None):
         self.conn = db_connection
         self.progression_model = UserProgression(db_connection)
         self.history_model = XPHistory(db_connection)
+        # Source of active power-up multipliers (the shared, cached PowerUpService)
+        self.powerups = powerups or registry.lazy('powerup')
 
     def award_xp(self, user_id: int, reason: str, activity_id: Optional[str] = None,
                  activity_type: Optional[str] = None, multiplier: float = 1.0) -> Dict[str, Any]:
@@ -24,7 +27,8 @@ class XPService:
             reason: Reason key from XP_REWARDS
             activity_id: Optional activity identifier
             activity_type: Optional activity type
-            multiplier: XP multiplier for bonuses
+            multiplier: XP multiplier for bonuses (active power-ups such as
+                double XP are applied on top of it)
 
         Returns:
             Dict with XP details and level up info
@@ -37,7 +41,9 @@ class XPService:
                 "error": f"Unknown XP reason: {reason}"
             }
 
-        # Apply multiplier
+        # Apply multiplier (power-up effects only boost earned XP, never costs)
+        if base_xp > 0:
+            multiplier *= self.powerups.get_xp_multiplier(user_id)
         xp_amount = int(base_xp * multiplier)
 
         # Log XP transaction
@@ -55,6 +61,7 @@ class XPService:
         return {
             "success": True,
             "xp_awarded": xp_amount,
+            "multiplier": multiplier,
             "reason": reason,
             "total_xp": progression["total_xp"],
             "current_level": progression["current_level"],
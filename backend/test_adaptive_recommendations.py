@@ -0,0 +1,46 @@
+"""
+Tests for the rolling (EWMA) performance aggregates behind difficulty recommendations
+"""
+import sqlite3
+
+import pytest
+
+from migrations.phase5_migration import migrate_phase5
+from services.adaptive_service import EWMA_ALPHA, AdaptiveService
+
+
+@pytest.fixture
+def service(tmp_path):
+    path = str(tmp_path / 'fardi.db')
+    migrate_phase5(path)
+    return AdaptiveService(path)
+
+
+def test_aggregate_follows_ewma_and_recent_results(service):
+    expected = None
+    for i, success in enumerate([False, False, False, True, True, True, True]):
+        result = service.track_performance(1, f'act{i}', success, 1.0 if success else 0.0, 'vocabulary')
+        outcome = 1.0 if success else 0.0
+        expected = outcome if expected is None else expected + EWMA_ALPHA * (outcome - expected)
+
+    conn = sqlite3.connect(service.db_path)
+    attempts, ewma = conn.execute(
+        "SELECT attempts, ewma_success FROM performance_aggregates WHERE user_id = 1 AND activity_type = 'vocabulary'"
+    ).fetchone()
+    conn.close()
+    assert attempts == 7 and ewma == pytest.approx(expected)
+    # Four recent passes outweigh three early failures
+    assert result['recommendations']['adjustment'] == 'increase_difficulty'
+
+
+def test_recommendations_for_many_types(service):
+    for i in range(3):
+        service.track_performance(1, f'g{i}', False, 0.0, 'grammar')
+    service.track_performance(1, 'w0', True, 1.0, 'writing')
+    service.track_performance(2, 'g0', True, 1.0, 'grammar')
+
+    recommendations = service.get_recommendations(1, ['grammar', 'writing', 'listening'])
+    assert recommendations['grammar']['adjustment'] == 'decrease_difficulty'
+    assert recommendations['writing']['reason'] == 'Insufficient data'
+    assert recommendations['listening']['reason'] == 'Insufficient data'
+    assert set(service.get_recommendations(1)) == {'grammar', 'writing'}
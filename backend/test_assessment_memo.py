@@ -0,0 +1,58 @@
+"""
+Tests for the per-user assessment memo shared by Phase 1 feedback and submission
+"""
+from services.assessment_memo import AssessmentMemo
+
+
+class CountingAssessment:
+    def __init__(self):
+        self.calls = []
+
+    def detect_ai_response(self, text):
+        self.calls.append(('detect', text))
+        return (False, 0.1, []), 'offline' in text
+
+    def assess_response(self, question, answer, question_type=None):
+        self.calls.append(('assess', answer))
+        if 'offline' in answer:
+            return {'level': 'A2', 'assessment_source': 'fallback'}
+        return {'level': 'B1', 'specific_strengths': ['clear']}
+
+
+def test_submit_reuses_feedback_results():
+    service = CountingAssessment()
+    memo = AssessmentMemo(service)
+
+    # Feedback request
+    memo.check_ai_response(1, 'I like  music.')
+    feedback = memo.assess_response(1, 'Q?', 'I like  music.', 'motivation')
+    feedback['level'] = 'C1'  # callers annotate their copy
+
+    # Submit of the same answer (whitespace differs)
+    assert memo.check_ai_response(1, ' I like music. ') == (False, 0.1, [])
+    assert memo.assess_response(1, 'Q?', 'I like music.', 'motivation')['level'] == 'B1'
+    assert len(service.calls) == 2 and memo.hits == 2
+
+
+def test_memo_is_per_user_per_question_and_expires():
+    service = CountingAssessment()
+    memo = AssessmentMemo(service, ttl=0)
+    memo.assess_response(1, 'Q?', 'answer', 'motivation')
+    memo.assess_response(1, 'Q?', 'answer', 'motivation')
+    assert len(service.calls) == 2
+
+    memo = AssessmentMemo(service)
+    memo.assess_response(1, 'Q?', 'answer', 'motivation')
+    memo.assess_response(2, 'Q?', 'answer', 'motivation')
+    memo.assess_response(1, 'Other?', 'answer', 'motivation')
+    memo.assess_response(1, 'Q?', 'Answer', 'motivation')
+    assert memo.hits == 0 and memo.misses == 4
+
+
+def test_fallback_results_are_not_reused():
+    service = CountingAssessment()
+    memo = AssessmentMemo(service)
+    for _ in range(2):
+        memo.check_ai_response(1, 'Groq was offline for this one')
+        assert memo.assess_response(1, 'Q?', 'Groq was offline for this one')['level'] == 'A2'
+    assert len(service.calls) == 4 and memo.hits == 0
@@ -0,0 +1,39 @@
+"""
+Smoke test for the load-test harness (benchmarks/load_test.py)
+
+Runs a tiny benchmark in a subprocess so the harness keeps working as the
+API changes. Real measurements use the defaults: python -m benchmarks.load_test
+"""
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.load_test import compare_to_baseline, percentile
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_percentile_and_regression_check():
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([10, 20], 95) == 19.5
+
+    baseline = {'endpoints': {'dashboard': {'p95_ms': 10.0}, 'me': {'p95_ms': 1.0}}}
+    report = {'endpoints': {'dashboard': {'p95_ms': 20.0}, 'me': {'p95_ms': 2.0}, 'new': {'p95_ms': 50.0}}}
+    # 'me' doubled but only by 1ms, 'new' has no baseline
+    assert compare_to_baseline(report, baseline) == [('dashboard', 10.0, 20.0)]
+
+
+def test_small_benchmark_run(tmp_path):
+    report_path = tmp_path / 'report.json'
+    proc = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.load_test', '--users', '30', '--requests', '60', '--clients', '2',
+         '--baseline', str(tmp_path / 'missing.json'), '--report', str(report_path)],
+        cwd=BACKEND_DIR, capture_output=True, text=True, timeout=300
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    report = json.loads(report_path.read_text())
+    endpoints = report['endpoints']
+    assert 'login' in endpoints and 'dashboard' in endpoints
+    assert sum(entry['errors'] for entry in endpoints.values()) == 0
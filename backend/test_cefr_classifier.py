@@ -0,0 +1,77 @@
+"""
+Tests for the distilled local CEFR classifier
+"""
+import json
+import random
+import sqlite3
+
+from migrate import migrate
+from services import cefr_classifier
+from services.ai_service import AIService
+from services.cefr_classifier import CefrClassifier
+from services.prompt_templates import PromptTemplate
+
+RUBRIC = """
+Expected vocabulary terms: backup, urgent, solution
+- A2 (2 points): Simple solution with one vocabulary term
+- B1 (3 points): Clear solution with reasons
+- C1 (5 points): Sophisticated solution with strategic thinking
+"""
+
+SIMPLE = ['We fix it.', 'Use backup.', 'Find singer.', 'It is ok.', 'Call team now.']
+ADVANCED = ['However, implementing the backup solution immediately, although costly, ensures continuity.',
+            'Consequently, we should negotiate an alternative arrangement, thereby preserving credibility.',
+            'Nevertheless, deploying contingency resources, whereas delays would undermine trust, is essential.']
+
+
+def _rows(count=150, seed=3):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            rows.append((' '.join(rng.sample(SIMPLE, 2)), (), 'A2'))
+        else:
+            rows.append((' '.join(rng.sample(ADVANCED, 2)), (), 'C1'))
+    return rows
+
+
+def test_training_reads_stored_grades_and_separates_levels(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    migrate(db_path)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany('''
+            INSERT INTO phase2_responses (user_id, session_id, step_id, action_item_id, response_text, cefr_level)
+            VALUES (1, 's', 'step1', 'a', ?, ?)
+        ''', [(text, level) for text, _, level in _rows()])
+    conn.close()
+
+    rows = cefr_classifier.load_training_rows(db_path)
+    assert len(rows) >= 150
+    model = cefr_classifier.train(rows)
+    assert model['levels'] == ['A2', 'C1']
+    assert model['holdout']['accuracy'] >= 0.9
+
+    classifier = CefrClassifier(json.loads(json.dumps(model)))
+    assert classifier.predict('Use backup. We fix it.')[0] == 'A2'
+    level, confidence, probabilities = classifier.predict(ADVANCED[0] + ' ' + ADVANCED[1])
+    assert level == 'C1' and round(confidence, 4) == max(probabilities.values())
+
+
+def test_gateway_grades_locally_and_covers_groq_outages():
+    classifier = CefrClassifier(cefr_classifier.train(_rows()), threshold=1.01)
+    template = PromptTemplate('test.classifier', system=RUBRIC, user='{response}')
+    assert cefr_classifier.glossary_terms(template) == ('backup', 'urgent', 'solution')
+
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature, service.client = 'm', 100, 0.0, None
+    service.cefr_classifier = classifier
+
+    # Nothing is confident at threshold > 1, but with Groq down the prediction is still used
+    reply = json.loads(service.complete_template(template, response=ADVANCED[2]))
+    assert (reply['level'], reply['score'], reply['feedback_source']) == ('C1', 5, 'classifier')
+    assert reply['confident'] is False and classifier.deferred == 1
+
+    classifier.threshold = 0.5
+    assert json.loads(service.complete_template(template, response='Use backup.'))['score'] == 2
+    assert classifier.hits == 1
@@ -0,0 +1,42 @@
+"""
+Tests for the in-process chat broker behind /api/chat/stream and /api/chat/poll
+"""
+import threading
+import time
+
+from services.chat_events import ChatBroker
+
+
+def test_publish_reaches_every_subscription_of_the_users():
+    broker = ChatBroker()
+    with broker.subscribe(1) as first_tab, broker.subscribe(1) as second_tab, broker.subscribe(2) as other:
+        assert broker.subscriber_count(1) == 2
+        delivered = broker.publish([1, 3], {'id': 7})
+
+        assert delivered == 2
+        assert first_tab.get(timeout=0) == {'id': 7}
+        assert second_tab.get(timeout=0) == {'id': 7}
+        assert other.get(timeout=0) is None
+
+    assert broker.subscriber_count() == 0
+    assert broker.publish([1], {'id': 8}) == 0
+
+
+def test_waiting_subscriber_wakes_on_publish():
+    broker = ChatBroker()
+    subscription = broker.subscribe(5)
+    threading.Timer(0.05, broker.publish, args=([5], {'id': 1})).start()
+
+    started = time.monotonic()
+    assert subscription.get(timeout=5) == {'id': 1}
+    assert time.monotonic() - started < 1
+    subscription.close()
+
+
+def test_slow_subscriber_is_flagged_instead_of_blocking():
+    broker = ChatBroker(queue_size=2)
+    with broker.subscribe(1) as subscription:
+        results = [broker.publish([1], {'id': i}) for i in range(3)]
+
+        assert results == [1, 1, 0]
+        assert subscription.overflowed
@@ -0,0 +1,60 @@
+"""
+Tests for paginated chat history and the chat_conversations summary table
+"""
+import sqlite3
+
+
+def test_history_pages_backwards_by_id(app_client):
+    admin_id, student_id = app_client.admin_id, app_client.student_id
+    admin = app_client.login(admin_id, True)
+    for i in range(7):
+        assert admin.post('/api/chat/send', json={'receiver_id': student_id, 'message': f'm{i}'}).status_code == 200
+
+    student = app_client.login(student_id, False)
+    seen, before_id = [], None
+    while True:
+        query = {'limit': 3, **({'before_id': before_id} if before_id else {})}
+        page = student.get(f'/api/chat/messages/{admin_id}', query_string=query).get_json()
+        ids = [m['id'] for m in page['data']]
+        assert ids == sorted(ids)
+        seen = ids + seen
+        if not page['has_more']:
+            break
+        before_id = page['next_before_id']
+
+    conn = sqlite3.connect(app_client.db_path)
+    expected = [row[0] for row in conn.execute(
+        'SELECT id FROM chat_messages WHERE ? IN (sender_id, receiver_id) ORDER BY id', (student_id,))]
+    conn.close()
+    assert seen == expected
+    assert student.get(f'/api/chat/messages/{admin_id}', query_string={'limit': 1}).get_json()['data'][0]['message'] == 'm6'
+
+
+def test_summary_tracks_send_and_read(app_client):
+    admin_id, student_id = app_client.admin_id, app_client.student_id
+    admin = app_client.login(admin_id, True)
+    student = app_client.login(student_id, False)
+    # Start from a read conversation
+    student.get(f'/api/chat/messages/{admin_id}')
+    assert student.get('/api/chat/unread-count').get_json()['count'] == 0
+
+    admin.post('/api/chat/send', json={'receiver_id': student_id, 'message': 'first'})
+    admin.post('/api/chat/send', json={'receiver_id': student_id, 'message': 'second'})
+    assert student.get('/api/chat/unread-count').get_json()['count'] == 2
+
+    inbox = student.get('/api/chat/conversations').get_json()['data']
+    assert inbox[0]['user_id'] == admin_id
+    assert inbox[0]['last_message'] == 'second' and inbox[0]['unread_count'] == 2
+
+    student.get(f'/api/chat/messages/{admin_id}')
+    assert student.get('/api/chat/unread-count').get_json()['count'] == 0
+    admin_row = next(c for c in admin.get('/api/chat/conversations').get_json()['data'] if c['user_id'] == student_id)
+    assert admin_row['last_message'] == 'second'
+
+    # The maintained summary matches a rebuild from chat_messages
+    conn = sqlite3.connect(app_client.db_path)
+    maintained = conn.execute('SELECT * FROM chat_conversations ORDER BY user_a, user_b').fetchall()
+    import app as fardi_app
+    fardi_app.rebuild_chat_conversations(conn)
+    assert conn.execute('SELECT * FROM chat_conversations ORDER BY user_a, user_b').fetchall() == maintained
+    conn.close()
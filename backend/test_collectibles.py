@@ -0,0 +1,53 @@
+"""
+Tests for the in-memory collectible catalog and drop engine
+"""
+import random
+import sqlite3
+from collections import Counter
+
+import pytest
+
+from migrations.phase5_migration import migrate_phase5
+from services.collectible_service import AliasSampler, CollectibleService, DROP_RATES
+
+
+@pytest.fixture
+def service(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    migrate_phase5(db_path)
+    return CollectibleService(db_path, rng=random.Random(7))
+
+
+def test_alias_sampler_matches_drop_rates():
+    sampler = AliasSampler(DROP_RATES)
+    rng = random.Random(3)
+    counts = Counter(sampler.sample(rng) for _ in range(50000))
+
+    for rarity, rate in DROP_RATES.items():
+        assert counts[rarity] / 50000 == pytest.approx(rate, abs=0.01)
+
+
+def test_catalog_is_loaded_once(service, monkeypatch):
+    first = service.get_all_collectibles()
+    assert [c['rarity'] for c in first][:2] == ['legendary', 'legendary']
+
+    monkeypatch.setattr(service, 'get_connection', lambda: pytest.fail('catalog re-read'))
+    assert service.get_all_collectibles() == first
+
+
+def test_drop_many_upserts_and_flags_new_items(service):
+    results = service.drop_many(range(1, 201), source='event')
+    dropped = {user_id: item for user_id, item in results.items() if item}
+
+    assert 100 < len(dropped) < 200
+    assert all(item['is_new'] and item['source'] == 'event' for item in dropped.values())
+
+    conn = sqlite3.connect(service.db_path)
+    assert conn.execute('SELECT COUNT(*), SUM(quantity) FROM user_collectibles').fetchone() == (len(dropped), len(dropped))
+    conn.close()
+
+    # Dropping the same item again bumps the quantity instead of inserting
+    user_id, item = next(iter(dropped.items()))
+    service._roll = lambda: item
+    again = service.drop_collectible(user_id)
+    assert again['id'] == item['id'] and not again['is_new']
@@ -0,0 +1,55 @@
+"""
+Tests for the precomputed phase content indexes
+"""
+import json
+import os
+
+from models import content_registry, phase4_loader
+from models.content_registry import ContentIndex, get_index
+
+
+def test_phase2_navigation_matches_json_order():
+    index = get_index(2)
+    items = index.items('step_1')
+    assert items, "phase2.json should provide step_1 action items"
+
+    for position, item in enumerate(items):
+        assert index.index_of('step_1', item['id']) == position
+        assert index.item('step_1', item['id']) is item
+
+    assert index.next_item('step_1', items[0]['id']) is items[1]
+    assert index.next_item('step_1', items[-1]['id']) is None
+    assert index.index_of('step_1', 'missing', 0) == 0
+
+
+def test_phase1_question_lookups():
+    listening = get_index(1).question_for_type('listening')
+    assert listening is not None and listening['type'] == 'listening'
+    assert get_index(1).question_for_step(listening['step']) is listening
+
+
+def test_remedial_lookup():
+    index = ContentIndex({'s': {'action_items': []}}, remedial={'s': {'A1': [{'id': 'x'}]}})
+    assert index.remedial_activities('s', 'A1') == [{'id': 'x'}]
+    assert index.remedial_activities('s', 'B1') == []
+
+
+def test_phase4_reloads_when_file_changes(tmp_path, monkeypatch):
+    json_path = tmp_path / 'phase4.json'
+    monkeypatch.setattr(phase4_loader, 'PHASE4_JSON_PATH', json_path)
+    monkeypatch.setattr(phase4_loader, '_phase4_data', None)
+    monkeypatch.setattr(content_registry, 'RELOAD_CHECK_INTERVAL', 0)
+    content_registry.reset()
+
+    try:
+        assert get_index(4).step(1) is None
+
+        json_path.write_text(json.dumps({'title': 'v1'}))
+        assert get_index(4).step(1) == {'title': 'v1'}
+
+        json_path.write_text(json.dumps({'title': 'v2'}))
+        stat = os.stat(json_path)
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert get_index(4).step(1) == {'title': 'v2'}
+    finally:
+        content_registry.reset()
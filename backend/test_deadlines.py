@@ -0,0 +1,94 @@
+"""
+Tests for per-request deadlines shared by detection, grading and coaching
+"""
+import time
+
+import pytest
+
+from services.ai_service import AIService
+from utils import deadlines
+
+
+class RecordingClient:
+    def __init__(self):
+        self.calls = []
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return 'ok'
+
+
+def test_completion_timeout_follows_the_deadline():
+    inner = RecordingClient()
+    client = deadlines.DeadlineClient(inner, attempts=2)
+
+    client.chat.completions.create(model='m')
+    assert 'timeout' not in inner.calls[-1]
+
+    with deadlines.deadline(4):
+        client.chat.completions.create(model='m')
+        assert 1.5 < inner.calls[-1]['timeout'] <= 2.0
+        assert deadlines.timeout(30) <= 4 and deadlines.timeout(1) == 1
+
+    with deadlines.deadline(0):
+        with pytest.raises(deadlines.DeadlineExceeded):
+            client.chat.completions.create(model='m')
+    assert len(inner.calls) == 2 and deadlines.remaining() is None
+
+
+def test_sapling_call_is_bounded_and_skipped_when_budget_is_spent(monkeypatch):
+    import services.ai_service as ai_module
+    posted = []
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return {'score': 0.1}
+
+    monkeypatch.setattr(ai_module.requests, 'post', lambda url, **kwargs: posted.append(kwargs) or Response())
+    service = AIService()
+    service.sapling_api_key = 'key'
+    text = 'We could organise a music evening with local artists and a small food market.'
+
+    assert service.check_with_sapling_api(text)[1] == 0.1
+    assert posted[-1]['timeout'] == ai_module.SAPLING_TIMEOUT
+
+    with deadlines.deadline(0.5):
+        service.check_with_sapling_api(text)
+    assert len(posted) == 1
+
+
+def test_feedback_skips_coaching_near_the_deadline(app_client, monkeypatch):
+    from routes import api_routes
+
+    class SlowMemo:
+        def check_ai_response(self, user_id, text):
+            return False, 0.0, []
+
+        def assess_response(self, user_id, question, answer, question_type=None):
+            time.sleep(0.2)
+            return {'level': 'A2', 'specific_strengths': ['polite'],
+                    'specific_areas_for_improvement': ['Use full sentences']}
+
+    class CountingAI:
+        calls = 0
+
+        def get_ai_response(self, prompt, speaker=None):
+            CountingAI.calls += 1
+            return 'coached'
+
+    monkeypatch.setattr(api_routes, 'assessment_memo', SlowMemo())
+    monkeypatch.setattr(api_routes, 'ai_service', CountingAI())
+    client = app_client.login(app_client.student_id)
+    payload = {'question': 'Why?', 'response': 'because music'}
+
+    monkeypatch.setitem(deadlines.BUDGETS, 'api.get_ai_feedback', 30.0)
+    assert client.post('/api/get-ai-feedback', json=payload).get_json()['ai_response'] == 'coached'
+
+    monkeypatch.setitem(deadlines.BUDGETS, 'api.get_ai_feedback', api_routes.COACHING_MIN_SECONDS)
+    reply = client.post('/api/get-ai-feedback', json=payload).get_json()
+    assert CountingAI.calls == 1
+    assert 'A2' in reply['ai_response'] and 'Use full sentences' in reply['ai_response']
@@ -0,0 +1,53 @@
+"""
+Tests for the streaming admin export
+"""
+import csv
+import gzip
+import io
+import json
+import sqlite3
+
+import pytest
+
+from benchmarks.seed import seed_population
+from services.export_service import ExportService, USER_EXPORT_COLUMNS, parse_export_format
+
+
+@pytest.fixture
+def export_service(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    seed_population(db_path, users=7)
+
+    def connect():
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    return ExportService(connect, chunk_size=3)
+
+
+def test_csv_export_streams_in_chunks(export_service):
+    chunks = list(export_service.stream_users('csv'))
+    # header + 8 users (7 students and the admin) in chunks of 3
+    assert len(chunks) == 3
+
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode())))
+    assert rows[0] == [header for _, header in USER_EXPORT_COLUMNS]
+    assert len(rows) == 9
+    assert {row[5] for row in rows[1:]} == {'Admin', 'User'}
+
+
+def test_jsonl_export_with_gzip(export_service):
+    data = gzip.decompress(b''.join(export_service.stream_users('jsonl', search='student', compress=True)))
+    records = [json.loads(line) for line in data.decode().splitlines()]
+
+    assert len(records) == 7
+    assert all(record['role'] == 'User' for record in records)
+    assert all(record['phase1_completed'] == 1 for record in records)
+    assert all(record['phase2_steps_attempted'] == 4 for record in records)
+
+
+def test_unknown_format_is_rejected():
+    assert parse_export_format(None) == 'csv'
+    with pytest.raises(ValueError):
+        parse_export_format('xlsx')
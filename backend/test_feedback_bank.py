@@ -0,0 +1,94 @@
+"""
+Tests for the exemplar/graded-answer feedback bank
+"""
+import json
+import sqlite3
+from types import SimpleNamespace
+
+from services import feedback_bank
+from services.ai_service import AIService
+from services.feedback_bank import FeedbackBank, TaskIndex
+from services.prompt_templates import PromptTemplate
+
+RUBRIC = """
+Evaluate this student's solution.
+- A1 (1 point): Basic solution mention (e.g., "Find new singer")
+- B1 (3 points): Clear solution with reasons (e.g., "We can find another singer because it is urgent")
+"""
+
+
+def _graded_db(tmp_path):
+    db_path = str(tmp_path / 'bank.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE graded_answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, template_name TEXT NOT NULL,
+            answer_text TEXT NOT NULL, evaluation TEXT NOT NULL, score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_exemplar_paraphrase_is_graded_without_groq():
+    template = PromptTemplate('test.bank', system=RUBRIC, user='Student Response: "{response}"')
+    assert [e[1]['score'] for e in feedback_bank.extract_exemplars(template)] == [1, 3]
+
+    bank = FeedbackBank(db_path=None, bank_path=None)
+    bank._indexes = {template.name: TaskIndex(
+        [{'text': text, 'evaluation': evaluation, 'source': 'exemplar'}
+         for text, evaluation in feedback_bank.extract_exemplars(template)]
+    )}
+
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature, service.client = 'm', 100, 0.0, None
+    service.feedback_bank = bank
+
+    cached = json.loads(service.complete_template(template, response='We can find  another singer because it is URGENT'))
+    assert cached['score'] == 3 and cached['level'] == 'B1'
+    assert cached['feedback_source'] == 'exemplar'
+
+    assert bank.lookup(template.name, 'The weather is nice today') is None
+    assert (bank.hits, bank.misses) == (1, 1)
+
+
+def test_build_calibrates_threshold_from_graded_answers(tmp_path):
+    db_path = _graded_db(tmp_path)
+    bank = FeedbackBank(db_path=db_path, bank_path=None)
+    topics = ['music', 'lights', 'tickets', 'weather', 'parking', 'food', 'stage', 'volunteers',
+              'sponsors', 'security', 'posters', 'schedule']
+    for i, topic in enumerate(topics):
+        for suffix in ('', '!', '  '):
+            bank.record('test.bank', f'We should fix the {topic} problem quickly{suffix}',
+                        json.dumps({'score': 1 + i % 5, 'feedback': topic}))
+    bank.record('test.bank', 'no json here', 'not an evaluation')
+
+    template = PromptTemplate('test.bank', system=RUBRIC, user='{response}')
+    built = feedback_bank.build_bank(db_path, [template])
+    task = built['tasks']['test.bank']
+
+    assert len(task['entries']) == 2 + 2 * len(topics)  # exemplars + deduplicated answers
+    assert feedback_bank.MIN_THRESHOLD <= task['threshold'] < 1.0
+
+
+def test_multi_field_tasks_stay_out_of_the_bank(tmp_path):
+    db_path = _graded_db(tmp_path)
+    spelling = PromptTemplate('test.spelling', system=RUBRIC,
+                              user='Original: {original_text}\nCorrected: {corrected_text}')
+    original = 'We shoud invit the singr from the musik school befor the festivl starts tonite'
+
+    bank = FeedbackBank(db_path=db_path, bank_path=None)
+    bank._indexes = {}
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature = 'm', 100, 0.0
+    reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"score": 5, "level": "C1"}'))])
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: reply)))
+    service.feedback_bank = bank
+    service.complete_template(spelling, original_text=original, corrected_text=original)
+
+    # Graded rows recorded before the restriction are not built into the bank either
+    bank.record(spelling.name, f'{original}\n{original}', json.dumps({'score': 5}))
+    assert sqlite3.connect(db_path).execute('SELECT COUNT(*) FROM graded_answers').fetchone()[0] == 1
+    assert feedback_bank.build_bank(db_path, [spelling])['tasks'] == {}
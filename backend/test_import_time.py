@@ -0,0 +1,64 @@
+"""
+Import-time budget test for the Flask app
+
+Importing app.py must stay cheap: no service construction, no schema DDL and
+no heavy SDK imports (Groq, Edge TTS). Override the wall-time budget with
+FARDI_IMPORT_BUDGET_MS on slow CI machines.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_BUDGET_MS = int(os.getenv("FARDI_IMPORT_BUDGET_MS", "1500"))
+LAZY_MODULES = ("groq", "edge_tts", "aiohttp")
+
+PROBE = (
+    "import app\n"
+    "from services import registry\n"
+    "built = [name for name in registry._factories if registry.is_built(name)]\n"
+    "assert not built, f'services built at import time: {built}'\n"
+)
+
+
+def _import_app_with_importtime():
+    """Import the app in a clean interpreter from an empty working directory"""
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ, PYTHONPATH=BACKEND_DIR, GROQ_API_KEY="", SAPLING_API_KEY="")
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE],
+            cwd=workdir, env=env, capture_output=True, text=True, timeout=120
+        )
+        created_db = os.path.exists(os.path.join(workdir, "fardi.db"))
+    return proc, created_db
+
+
+def _parse_importtime(stderr):
+    """Map module name -> cumulative import time in microseconds"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            timings[module.strip()] = int(cumulative.strip())
+    return timings
+
+
+def test_app_import_budget():
+    proc, created_db = _import_app_with_importtime()
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    timings = _parse_importtime(proc.stderr)
+    assert "app" in timings
+
+    # Schema setup is an explicit migrate step, never an import side effect
+    assert not created_db
+
+    # Heavy SDKs are imported on first use, not at startup
+    eager = [name for name in LAZY_MODULES if name in timings]
+    assert not eager, f"imported eagerly: {eager}"
+
+    app_ms = timings["app"] / 1000
+    assert app_ms < IMPORT_BUDGET_MS, f"import app took {app_ms:.0f}ms (budget {IMPORT_BUDGET_MS}ms)"
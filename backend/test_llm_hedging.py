@@ -0,0 +1,69 @@
+"""
+Tests for hedged Groq chat completions
+"""
+import threading
+import time
+
+from services.llm_hedging import HedgedClient
+
+
+class SlowFirstClient:
+    """Fake Groq client: the first call after warm-up stalls, later calls are fast"""
+
+    def __init__(self, stall_on=None, stall=1.0):
+        self.calls = 0
+        self.stall_on = stall_on
+        self.stall = stall
+        self.lock = threading.Lock()
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.stall if call == self.stall_on else 0.001)
+        return f"response {call}"
+
+
+def _warm(hedged, count=20):
+    for _ in range(count):
+        hedged.chat.completions.create(model='m', messages=[])
+
+
+def test_slow_request_is_hedged_and_hedge_wins():
+    client = SlowFirstClient(stall_on=21)
+    hedged = HedgedClient(client, max_hedge_rate=0.5, min_delay=0.01, max_delay=0.05)
+    _warm(hedged)
+
+    started = time.monotonic()
+    response = hedged.chat.completions.create(model='m', messages=[])
+    assert time.monotonic() - started < 0.5
+    assert response == "response 22"
+
+    stats = hedged.stats()
+    assert stats['hedged'] == 1 and stats['hedge_wins'] == 1
+    assert stats['delays'] == {'MainThread': 0.01}
+
+    # Another endpoint has no history of its own yet, so its slow call is not hedged
+    responses = []
+    other = threading.Thread(target=lambda: responses.append(hedged.chat.completions.create(model='m', messages=[])),
+                             name='other-endpoint')
+    client.stall_on = client.calls + 1
+    client.stall = 0.1
+    other.start()
+    other.join()
+    assert responses == [f"response {client.stall_on}"]
+    assert hedged.stats()['hedged'] == 1 and hedged.latencies.quantile('other-endpoint', 0.0) is None
+
+
+def test_hedge_rate_cap_and_cold_start():
+    client = SlowFirstClient(stall_on=21, stall=0.1)
+    hedged = HedgedClient(client, max_hedge_rate=0.01, min_delay=0.01, max_delay=0.05)
+    assert hedged.hedge_delay('m') is None
+    _warm(hedged)
+
+    assert hedged.chat.completions.create(model='m', messages=[]) == "response 21"
+    stats = hedged.stats()
+    assert stats['hedged'] == 0 and stats['capped'] == 1
+    assert client.calls == 21
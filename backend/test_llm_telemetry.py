@@ -0,0 +1,118 @@
+"""
+Tests for per-endpoint LLM call telemetry
+"""
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from services import llm_hedging, llm_telemetry
+from services.llm_hedging import HedgedClient
+from services.llm_telemetry import InstrumentedClient, LlmTelemetry
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+
+class ScriptedClient:
+    """Fake Groq client replaying canned replies (an exception is raised instead)"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))], usage=usage)
+
+
+@pytest.fixture
+def telemetry(monkeypatch):
+    fresh = LlmTelemetry()
+    monkeypatch.setattr(llm_telemetry, 'telemetry', fresh)
+    return fresh
+
+
+def test_calls_are_recorded_per_endpoint(telemetry):
+    client = InstrumentedClient(ScriptedClient('```json\n{"score": 3}\n```', 'Great answer!', RateLimited()))
+    ask_json = [{'role': 'user', 'content': 'Return ONLY valid JSON.'}]
+
+    client.chat.completions.create(model='m', messages=ask_json)
+    client.chat.completions.create(model='m', messages=ask_json)
+    with pytest.raises(RateLimited):
+        client.chat.completions.create(model='m', messages=ask_json)
+    telemetry.record_local_answer('other')
+
+    snapshot = telemetry.snapshot()
+    row = snapshot['endpoints'][0]
+    assert row['endpoint'] == 'MainThread'
+    assert (row['calls'], row['prompt_tokens'], row['completion_tokens']) == (3, 200, 40)
+    assert (row['parse_failures'], row['rate_limited'], row['fallbacks']) == (1, 1, 2)
+    assert row['parse_failure_rate'] == 0.333 and row['p50_latency'] == 0.25
+    assert snapshot['totals']['local_answers'] == 1
+
+    text = telemetry.prometheus()
+    assert 'fardi_llm_calls_total{endpoint="MainThread"} 3' in text
+    assert 'fardi_llm_latency_seconds_bucket{endpoint="MainThread",le="+Inf"} 3' in text
+
+
+def test_losing_hedge_attempt_still_counts_its_tokens(telemetry):
+    class StallOnce(ScriptedClient):
+        def create(self, **kwargs):
+            stall = len(self.replies) == 2
+            response = super().create(**kwargs)
+            time.sleep(0.3 if stall else 0)
+            return response
+
+    hedged = HedgedClient(StallOnce('slow', 'fast'), max_hedge_rate=1.0, min_delay=0.01, max_delay=0.01)
+    for _ in range(llm_hedging.MIN_SAMPLES):
+        hedged.latencies.record('MainThread', 0.001)
+    client = InstrumentedClient(hedged)
+
+    assert client.chat.completions.create(model='m', messages=[]).choices[0].message.content == 'fast'
+    time.sleep(0.5)
+
+    row = telemetry.snapshot()['endpoints'][0]
+    assert (row['calls'], row['discarded_attempts']) == (1, 1)
+    assert (row['prompt_tokens'], row['completion_tokens']) == (200, 40)
+
+
+def test_http_hooks_count_retries_and_429s(telemetry):
+    hooks = llm_telemetry.http_event_hooks()
+    request = httpx.Request('POST', 'https://api.groq.com', headers={'x-stainless-retry-count': '0'})
+    retry = httpx.Request('POST', 'https://api.groq.com', headers={'x-stainless-retry-count': '1'})
+    for req in (request, retry):
+        hooks['request'][0](req)
+    hooks['response'][0](httpx.Response(429, request=request))
+    hooks['response'][0](httpx.Response(200, request=retry))
+
+    counts = telemetry.snapshot()['totals']
+    assert (counts['retries'], counts['http_429']) == (1, 1)
+
+
+def test_metrics_endpoints_require_token_or_admin(app_client, monkeypatch, telemetry):
+    import app as fardi_app
+
+    monkeypatch.setattr(fardi_app, 'llm_telemetry', telemetry)
+    monkeypatch.setenv('METRICS_TOKEN', 's3cret')
+    telemetry.record_call('api.get_ai_feedback', 'm', 1.5)
+
+    client = app_client.app.test_client()
+    assert client.get('/api/metrics', headers={'Accept': 'application/json'}).status_code == 401
+    scrape = client.get('/api/metrics', headers={'Authorization': 'Bearer s3cret'})
+    assert 'fardi_llm_calls_total{endpoint="api.get_ai_feedback"} 1' in scrape.get_data(as_text=True)
+
+    with client.session_transaction() as sess:
+        sess['user_id'] = app_client.student_id
+    assert client.get('/api/admin/llm-telemetry', headers={'Accept': 'application/json'}).status_code == 403
+
+    with client.session_transaction() as sess:
+        sess['user_id'] = app_client.admin_id
+    data = client.get('/api/admin/llm-telemetry').get_json()['data']
+    assert data['endpoints'][0]['endpoint'] == 'api.get_ai_feedback' and 'local' in data
@@ -0,0 +1,55 @@
+"""
+Tests for per-evaluation model tier routing
+"""
+from types import SimpleNamespace
+
+from services import model_router
+from services.ai_service import AIService
+from services.prompt_templates import PromptTemplate
+
+
+def test_tier_follows_complexity_band_and_length():
+    simple = PromptTemplate('test.spelling', system="Rubric", user="{text}", complexity='simple')
+    plain = PromptTemplate('test.plain', system="Rubric", user="{text}")
+    report = PromptTemplate('test.report', system="Rubric", user="{text}", complexity='complex', band='C1')
+
+    long_answer = 'word ' * 200
+    assert model_router.route(simple, {'text': long_answer}, 'm').tier == 'fast'
+    assert model_router.route(plain, {'text': 'I agree.'}, 'm').tier == 'fast'
+    assert model_router.route(plain, {'text': 'I agree.', 'level': 'C1'}, 'm').tier == 'standard'
+    assert model_router.route(plain, {'text': 'word ' * 80}, 'm').tier == 'standard'
+    assert model_router.route(plain, {'text': long_answer, 'level': 'A2'}, 'm').tier == 'standard'
+    assert model_router.route(plain, {'text': long_answer}, 'm').tier == 'strong'
+    assert model_router.route(report, {'text': 'short'}, 'm').tier == 'strong'
+
+
+def test_gateway_uses_tier_model_and_records_shadow_agreement(monkeypatch):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        score = 4 if kwargs['model'] == 'big-model' else 3
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f'{{"score": {score}}}'))])
+
+    monkeypatch.setenv('GROQ_FAST_MODEL', 'small-model')
+    monkeypatch.setenv('GROQ_STRONG_MODEL', 'big-model')
+    monkeypatch.setenv('MODEL_SHADOW_RATE', '1')
+    monkeypatch.setattr(model_router, 'shadow_stats', model_router.ShadowStats())
+
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature = 'test-model', 100, 0.0
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    template = PromptTemplate('test.router', system="Rubric", user="{answer}")
+
+    route = model_router.route(template, {'answer': 'hi'}, service.model)
+    assert model_router.should_shadow(route, service.model)
+    service._shadow_evaluate(template, route, template.messages(answer='hi'), '{"score": 3}')
+
+    assert calls[0]['model'] == 'big-model'
+    assert model_router.shadow_stats.summary() == {
+        'fast': {'samples': 1, 'exact_rate': 0.0, 'within_one_rate': 1.0, 'mean_abs_diff': 1.0}
+    }
+
+    monkeypatch.setenv('MODEL_SHADOW_RATE', '0')
+    assert service.complete_template(template, answer='hello') == '{"score": 3}'
+    assert calls[1]['model'] == 'small-model' and calls[1]['max_tokens'] == 300
@@ -0,0 +1,69 @@
+"""
+Tests for the cached power-up effects and the XP multiplier hook
+"""
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from migrations.phase5_migration import migrate_phase5
+from services.powerup_service import PowerUpService
+from services.xp_service import XPService
+
+GAMIFICATION_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations', 'add_gamification_tables.sql')
+
+
+@pytest.fixture
+def powerups(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    migrate_phase5(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany('INSERT INTO user_powerups (user_id, powerup_type, quantity) VALUES (?, ?, 2)',
+                     [(1, 'double_xp'), (1, 'skip_ticket')])
+    conn.commit()
+    conn.close()
+    return PowerUpService(db_path)
+
+
+def test_effects_are_cached_until_use(powerups, monkeypatch):
+    assert powerups.get_active_effects(1) == []
+    assert powerups.get_xp_multiplier(1) == 1.0
+
+    assert powerups.use_powerup(1, 'double_xp')['success']
+    effects = powerups.get_active_effects(1)
+    assert [e['type'] for e in effects] == ['double_xp']
+    assert 3500 < effects[0]['remaining_seconds'] <= 3600
+
+    # Cached: further checks never touch the database
+    monkeypatch.setattr(powerups, 'get_connection', lambda: pytest.fail('effects re-queried'))
+    assert powerups.get_xp_multiplier(1) == 2.0
+    assert powerups._check_daily_limit(1, 'skip_ticket')
+
+
+def test_effect_expires_exactly_one_hour_after_use(powerups):
+    conn = powerups.get_connection()
+    used_at = datetime.utcnow() - timedelta(minutes=59, seconds=50)
+    conn.execute("INSERT INTO powerup_usage (user_id, powerup_type, used_at) VALUES (1, 'double_xp', ?)",
+                 (used_at.strftime('%Y-%m-%d %H:%M:%S'),))
+    conn.commit()
+    conn.close()
+
+    assert powerups.get_xp_multiplier(1) == 2.0
+    assert powerups.get_active_effects(1)[0]['remaining_seconds'] <= 10
+
+    assert powerups.use_powerup(1, 'skip_ticket')['success']
+    assert not powerups.use_powerup(1, 'skip_ticket')['success']
+
+
+def test_award_xp_applies_active_multiplier(powerups):
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    with open(GAMIFICATION_SQL) as f:
+        conn.executescript(f.read())
+    xp = XPService(conn, powerups=powerups)
+
+    assert xp.award_xp(1, 'action_item_completed')['xp_awarded'] == 50
+    powerups.use_powerup(1, 'double_xp')
+    result = xp.award_xp(1, 'action_item_completed')
+    assert result['xp_awarded'] == 100 and result['multiplier'] == 2.0
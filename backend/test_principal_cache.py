@@ -0,0 +1,38 @@
+"""
+Tests for the cached, request-scoped principal behind login_required/admin_required
+"""
+import pytest
+
+from models.auth import PrincipalCache
+
+
+@pytest.fixture
+def auth_app(app_client, monkeypatch):
+    import app as fardi_app
+
+    loads = []
+    original = PrincipalCache._load
+    monkeypatch.setattr(PrincipalCache, '_load', lambda self, *args: loads.append(args[1]) or original(self, *args))
+
+    return app_client.login(is_admin=True), fardi_app.user_manager, app_client.admin_id, loads
+
+
+def test_admin_checks_share_one_cached_lookup(auth_app):
+    client, _, admin_id, loads = auth_app
+    for _ in range(3):
+        assert client.get('/api/admin/users').status_code == 200
+    assert loads == [admin_id]
+
+
+def test_role_change_invalidates_and_overrides_session_flag(auth_app):
+    client, user_manager, admin_id, loads = auth_app
+    assert client.get('/api/admin/users').status_code == 200
+
+    # The session still says is_admin, but the demotion wins immediately
+    assert user_manager.update_user(admin_id, is_admin=0)
+    assert client.get('/api/admin/users').status_code == 403
+    assert client.post('/api/phase5/collectibles/drop-many', json={'user_ids': [admin_id]}).status_code == 403
+
+    user_manager.deactivate_user(admin_id)
+    assert client.get('/api/phase5/adaptive/review').status_code == 401
+    assert loads == [admin_id] * 3
@@ -0,0 +1,62 @@
+"""
+Tests for the compiled evaluator prompt templates
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from services import prompt_templates
+from services.ai_service import AIService
+from services.prompt_templates import PromptTemplate
+
+
+def test_static_prefix_is_compiled_once():
+    template = PromptTemplate('test.echo', system="Rubric: return JSON {\"score\": 1-5}", user='Student Response: "{response}"')
+
+    first = template.messages(response="I like {braces}")
+    second = template.messages(response="another answer")
+
+    assert first[0] is second[0] is template.system_message
+    assert first[1]['content'] == 'Student Response: "I like {braces}"'
+    assert template.fields == ('response',)
+    assert template.prefix_tokens == prompt_templates.estimate_tokens(template.system)
+
+
+def test_placeholder_in_prefix_is_rejected():
+    with pytest.raises(ValueError):
+        PromptTemplate('test.bad', system="Evaluate {response}", user="{response}")
+
+    with pytest.raises(KeyError):
+        PromptTemplate('test.missing', system="Rubric", user="{a} {b}").render(a=1)
+
+
+def test_route_templates_render():
+    import routes.phase4_routes  # noqa: F401  (registers templates)
+    import routes.phase5_routes  # noqa: F401
+    import routes.phase6_routes  # noqa: F401
+
+    templates = prompt_templates.all_templates()
+    assert len(templates) >= 37
+    for template in templates:
+        assert template.fields, template.name
+        assert 'x' in template.render(**{field: 'x' for field in template.fields})
+
+
+def test_gateway_sends_template_messages():
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"score": 3}'))])
+
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature = 'test-model', 100, 0.0
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    template = PromptTemplate('test.gateway', system="Rubric", user="{answer}")
+    assert service.complete_template(template, answer='hello') == '{"score": 3}'
+    assert service.complete_template(template, max_tokens=50, answer='bye') == '{"score": 3}'
+
+    assert calls[0]['messages'][0] is calls[1]['messages'][0] is template.system_message
+    assert calls[1]['messages'][1] == {'role': 'user', 'content': 'bye'}
+    assert calls[1]['max_tokens'] == 50
@@ -0,0 +1,138 @@
+"""
+Tests for the bulk re-grading job
+"""
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from migrate import migrate
+from services import regrader, registry
+from services.assessment_service import AssessmentService
+
+
+class ScriptedGroq:
+    """Fake Groq client grading every answer B2, except GARBLED (prose reply) and OFFLINE (error) ones"""
+
+    def __init__(self):
+        self.offline = True
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        prompt = kwargs['messages'][-1]['content']
+        if 'OFFLINE' in prompt and self.offline:
+            raise ConnectionError('Groq unreachable')
+        content = 'Sorry, I cannot grade this.' if 'GARBLED' in prompt else json.dumps({'level': 'B2'})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(autouse=True)
+def groq_assessment(monkeypatch):
+    ai_service = SimpleNamespace(client=ScriptedGroq(), model='m', max_tokens=100)
+    monkeypatch.setitem(registry._instances, 'assessment', AssessmentService(ai_service=ai_service))
+    return ai_service.client
+
+
+def _db(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    migrate(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO users (id, username, email, password_hash) VALUES (1, 'amira', 'a@x.tn', 'x')")
+    conn.commit()
+    return db_path, conn
+
+
+def test_phase5_remedial_rows_are_rescored_against_current_pass_marks(tmp_path):
+    db_path, conn = _db(tmp_path)
+    # Step 2 B1 is out of 18 (pass mark 15); stored with a stale maximum of 20
+    conn.executemany('''
+        INSERT INTO phase5_remedial (user_id, subphase, step_id, level, task_scores, total_score, max_score, passed)
+        VALUES (1, 1, ?, ?, ?, ?, ?, ?)
+    ''', [
+        (2, 'B1', json.dumps({'taskA': 8, 'taskB': 8}), 16, 20, 0),
+        (2, 'B1', json.dumps({'taskA': 5, 'taskB': 5}), 10, 18, 0),
+        (99, 'B1', json.dumps({'taskA': 5}), 5, 20, 0),
+    ])
+    conn.commit()
+
+    result = regrader.run(db_path, 'phase5_remedial', workers=2, batch_size=2)
+
+    assert (result['processed'], result['changed'], result['failed']) == (3, 1, 1)
+    rows = conn.execute('SELECT max_score, passed FROM phase5_remedial ORDER BY id').fetchall()
+    assert rows == [(18, 1), (18, 0), (20, 0)]
+
+
+def _phase2_rows(conn, *rows):
+    conn.executemany('''
+        INSERT INTO phase2_responses (user_id, session_id, step_id, action_item_id, response_text,
+                                      points_earned, cefr_level)
+        VALUES (1, 's', 'step_1', ?, ?, 1, 'A1')
+    ''', rows)
+    conn.commit()
+
+
+def test_job_resumes_after_its_checkpoint(tmp_path):
+    db_path, conn = _db(tmp_path)
+    _phase2_rows(conn, *[('storytelling_intro', f'Answer {n} about the festival') for n in range(4)])
+
+    batches = []
+    regrader.run(db_path, 'phase2_responses', batch_size=2, rate=0, report=batches.append)
+    assert [b['last_id'] for b in batches] == [2, 4]
+
+    # An interrupted job continues after its last committed batch
+    conn.execute("UPDATE regrade_checkpoints SET last_id = 3, processed = 3, changed = 3 "
+                 "WHERE job = 'phase2_responses:llm'")
+    conn.execute("UPDATE phase2_responses SET cefr_level = 'A1', points_earned = 1")
+    conn.commit()
+    result = regrader.run(db_path, 'phase2_responses', rate=0)
+
+    assert (result['processed'], result['changed']) == (4, 4)
+    levels = [row[0] for row in conn.execute('SELECT cefr_level FROM phase2_responses ORDER BY id')]
+    assert levels == ['A1', 'A1', 'A1', 'B2']
+
+    restarted = regrader.run(db_path, 'phase2_responses', rate=0, restart=True)
+    assert (restarted['processed'], restarted['changed']) == (4, 3)
+
+
+def test_fallback_assessments_are_failures_not_grades(tmp_path):
+    db_path, conn = _db(tmp_path)
+    _phase2_rows(conn,
+                 ('storytelling_intro', 'We can invite a malouf band'),
+                 ('storytelling_intro', 'GARBLED but long enough to look like a B1 answer by word count'),
+                 ('storytelling_intro', 'OFFLINE'),
+                 ('no_such_item', 'We can invite a malouf band'))
+
+    result = regrader.run(db_path, 'phase2_responses', rate=0)
+
+    assert (result['processed'], result['changed'], result['failed']) == (4, 1, 3)
+    rows = conn.execute('SELECT cefr_level, assessment_data FROM phase2_responses ORDER BY id').fetchall()
+    assert rows[0][0] == 'B2'
+    assert rows[1:] == [('A1', None)] * 3
+
+
+def test_failed_rows_are_recorded_and_retried(tmp_path, groq_assessment):
+    db_path, conn = _db(tmp_path)
+    _phase2_rows(conn, *[('storytelling_intro', text) for text in ('We can invite a malouf band', 'OFFLINE',
+                                                                    'GARBLED', 'OFFLINE as well')])
+    regrader.run(db_path, 'phase2_responses', batch_size=2, rate=0)
+    assert [row[0] for row in conn.execute('SELECT row_id FROM regrade_failures ORDER BY row_id')] == [2, 3, 4]
+
+    # Groq is back: only the failed rows are graded again, and the checkpoint stays put
+    groq_assessment.offline = False
+    result = regrader.run(db_path, 'phase2_responses', rate=0, retry_failed=True)
+
+    assert (result['processed'], result['changed'], result['failed'], result['last_id']) == (4, 3, 1, 4)
+    assert [row[0] for row in conn.execute('SELECT row_id FROM regrade_failures')] == [3]
+    levels = [row[0] for row in conn.execute('SELECT cefr_level FROM phase2_responses ORDER BY id')]
+    assert levels == ['B2', 'B2', 'A1', 'B2']
+
+
+def test_llm_grader_is_only_offered_where_one_exists(tmp_path):
+    db_path, _ = _db(tmp_path)
+    with pytest.raises(ValueError):
+        regrader.run(db_path, 'phase5_remedial', grader='llm')
+    # The word-count fallback is not a grader: it would overwrite real LLM levels
+    with pytest.raises(ValueError):
+        regrader.run(db_path, 'phase2_responses', grader='local')
@@ -0,0 +1,71 @@
+"""
+Tests for the declarative scoring rules and the batch scoring endpoint
+"""
+import sqlite3
+
+import pytest
+
+from services import scoring_engine
+
+
+def test_step_rules_route_like_the_step_endpoints():
+    result = scoring_engine.score_step(5, 2, {
+        'interaction1_score': 1, 'interaction1_writing_score': 4, 'interaction2_score': 3,
+        'interaction3_score': 0, 'interaction3_revision_score': 5
+    })
+    assert (result['total_score'], result['max_score']) == (13, 17)
+    assert result['remedial_level'] == 'B2' and result['should_proceed']
+
+    low = scoring_engine.score_step(6, 3, {'interaction2_score': 1}, subphase=2)
+    assert low['remedial_level'] == 'A1' and not low['should_proceed']
+
+    remedial = scoring_engine.score_remedial(5, 4, 'b1', {'task_a': 8, 'task_b': 7})
+    assert (remedial['max_score'], remedial['threshold'], remedial['passed']) == (19, 16, False)
+
+    with pytest.raises(ValueError):
+        scoring_engine.score_step(5, 1, {'interaction2_score': 9})
+
+
+def test_batch_persists_all_items_or_none(app_client):
+    client, db_path, user_id = app_client.login(), app_client.db_path, app_client.admin_id
+    items = [
+        {'phase': 6, 'step': 1, 'scores': {'interaction1_score': 1, 'interaction2_score': 4, 'interaction3_score': 1}},
+        {'phase': 6, 'step': 1, 'level': 'B2', 'task_scores': {'task_a': 16, 'task_b': 10}},
+    ]
+    response = client.post('/api/scoring/batch', json={'items': items})
+    assert response.status_code == 200
+    assert [r.get('passed') for r in response.get_json()['data']] == [None, True]
+
+    # An invalid item rejects the whole batch
+    bad = [dict(items[0], step=2), {'phase': 6, 'step': 9, 'scores': {}}]
+    assert client.post('/api/scoring/batch', json={'items': bad}).status_code == 400
+
+    conn = sqlite3.connect(db_path)
+    progress = conn.execute('SELECT step_id, total_score, remedial_level, should_proceed FROM phase6_progress WHERE user_id = ?',
+                            (user_id,)).fetchall()
+    remedial = conn.execute('SELECT level, total_score, max_score, passed FROM phase6_remedial WHERE user_id = ?',
+                            (user_id,)).fetchall()
+    conn.close()
+    assert progress == [(1, 6, 'B2', 1)]
+    assert remedial == [('B2', 26, 32, 1)]
+
+
+def test_step_endpoints_accept_the_scores_their_pages_send(app_client):
+    client = app_client.login()
+
+    # 6.x step 5 stores rubric levels for all three interactions
+    rubric = {'interaction1_score': 4, 'interaction2_score': 5, 'interaction3_score': 3}
+    for url in ('/api/phase6/step5/calculate-score', '/api/phase6/subphase2/step5/calculate-score'):
+        total = client.post(url, json=rubric).get_json()['data']['total']
+        assert (total['score'], total['max_score'], total['remedial_level']) == (12, 15, 'C1')
+
+    # Phase 6 has no A1 remedial tasks; an empty submission keeps the A2 floor
+    empty = client.post('/api/phase6/step2/calculate-score', json={'interaction2_score': 0}).get_json()
+    assert empty['data']['total']['remedial_level'] == 'A2'
+
+    # The Phase 5 step handlers score through the same rules
+    step4 = client.post('/api/phase5/step4/calculate-score', json={
+        'interaction1_score': 4, 'interaction2_score': 3, 'interaction3_score': 1, 'interaction3_revision_score': 5
+    }).get_json()['data']
+    assert (step4['total_score'], step4['max_score'], step4['remedial_level']) == (13, 16, 'B2')
+    assert client.post('/api/phase5/step1/calculate-score', json={'interaction2_score': 0}).status_code == 400
@@ -0,0 +1,95 @@
+"""
+Tests for the SM-2 review scheduler and the adaptive tracking upserts
+"""
+import sqlite3
+from datetime import date
+
+import pytest
+
+from migrations.phase5_migration import migrate_phase5
+from services.adaptive_service import AdaptiveService
+from services.spaced_repetition import (
+    INITIAL_EASE, ReviewScheduler, next_schedule, quality_from_result
+)
+
+TODAY = date(2026, 5, 1)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'fardi.db')
+    migrate_phase5(path)
+    return path
+
+
+def test_quality_mapping():
+    assert quality_from_result(True) == 4
+    assert quality_from_result(False, 0.9) == 2
+    assert quality_from_result(True, 0.2) == 3
+    assert quality_from_result(True, 1.0) == 5 and quality_from_result(True, 0.6) == 3
+    with pytest.raises(ValueError):
+        quality_from_result(True, 60)
+
+
+def test_sql_upsert_matches_reference_schedule(db_path):
+    conn = sqlite3.connect(db_path)
+    scheduler = ReviewScheduler(conn)
+    expected = (0, INITIAL_EASE, 0)
+
+    for quality in [5, 4, 4, 1, 3, 5, 5]:
+        expected = next_schedule(*expected, quality)
+        review = scheduler.record_review(7, 'act', quality, today=TODAY)
+        assert (review['review_count'], review['interval_days']) == (expected[0], expected[2])
+        assert review['ease_factor'] == pytest.approx(expected[1], abs=0.01)
+
+    assert conn.execute('SELECT COUNT(*) FROM spaced_repetition').fetchone()[0] == 1
+    conn.close()
+
+
+def test_track_performance_and_due_queues(db_path):
+    service = AdaptiveService(db_path)
+    first = service.track_performance(1, 'act_a', True, 1.0)
+    second = service.track_performance(1, 'act_a', False, 0.0)
+    assert (first['attempts'], second['attempts']) == (1, 2)
+    assert second['success_rate'] == 0.5
+
+    service.track_performance(2, 'act_b', False, 0.1)
+    conn = sqlite3.connect(db_path)
+    scheduler = ReviewScheduler(conn)
+    tomorrow = date.fromisoformat(second['next_review_date'])
+
+    assert [a['activity_id'] for a in scheduler.due_for_user(1, on_date=tomorrow)] == ['act_a']
+    assert scheduler.due_for_user(1, on_date=date.today()) == []
+    assert [row['user_id'] for row in scheduler.due_for_all(on_date=tomorrow)] == [1, 2]
+
+    plan = conn.execute(
+        'EXPLAIN QUERY PLAN SELECT * FROM spaced_repetition WHERE user_id = 1 AND next_review_date <= ?',
+        (tomorrow.isoformat(),)).fetchall()
+    assert 'idx_spaced_repetition_user_due' in str(plan)
+
+    # A pass reported without a score is a plain correct recall: ease is unchanged
+    service.track_performance(3, 'act_c', True)
+    service.track_performance(3, 'act_c', True)
+    ease = conn.execute("SELECT ease_factor FROM spaced_repetition WHERE user_id = 3").fetchone()[0]
+    assert ease == pytest.approx(INITIAL_EASE)
+    conn.close()
+
+
+def test_track_endpoint_scales_scores_by_max_score(app_client, db_path, monkeypatch):
+    from services import registry
+    monkeypatch.setitem(registry._instances, 'adaptive', AdaptiveService(db_path))
+    client = app_client.login()
+
+    def track(activity_id, **payload):
+        return client.post('/api/phase5/adaptive/track', json={'activity_id': activity_id, **payload})
+
+    # Rubric score 1 (A1) is the bottom of the scale, below a score of 2 (A2)
+    for activity_id, score in [('a1', 1), ('a2', 2), ('c1', 5)]:
+        assert track(activity_id, success=True, score=score, max_score=5).status_code == 200
+    conn = sqlite3.connect(db_path)
+    ease = dict(conn.execute('SELECT activity_id, ease_factor FROM spaced_repetition').fetchall())
+    conn.close()
+    assert ease['a1'] == ease['a2'] < INITIAL_EASE < ease['c1']
+
+    assert track('pct', success=True, score=3).status_code == 400
+    assert track('pct', success=True, score=3, max_score=100).status_code == 200
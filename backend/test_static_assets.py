@@ -0,0 +1,60 @@
+"""
+Tests for the SPA static asset layer
+"""
+import gzip
+
+import pytest
+from flask import Flask
+
+from utils.static_assets import StaticAssets, IMMUTABLE_CACHE_CONTROL, precompress
+
+BUNDLE = b"console.log('fardi');\n" * 200
+
+
+@pytest.fixture
+def client(tmp_path):
+    (tmp_path / 'assets').mkdir()
+    (tmp_path / 'index.html').write_text('<div id="root"></div>')
+    (tmp_path / 'assets' / 'index-AbC123xy.js').write_bytes(BUNDLE)
+    assert precompress(str(tmp_path)) >= 1
+
+    assets = StaticAssets(str(tmp_path))
+    app = Flask(__name__)
+
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def spa(path):
+        return assets.serve(path or 'index.html')
+
+    return app.test_client()
+
+
+def test_hashed_asset_is_immutable_and_revalidates(client):
+    resp = client.get('/assets/index-AbC123xy.js')
+    assert resp.status_code == 200
+    assert resp.data == BUNDLE
+    assert resp.headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+    assert resp.mimetype == 'application/javascript'
+
+    etag = resp.headers['ETag']
+    assert etag.startswith('"') and not etag.startswith('W/')
+    resp = client.get('/assets/index-AbC123xy.js', headers={'If-None-Match': etag})
+    assert resp.status_code == 304
+    assert resp.data == b''
+
+
+def test_precompressed_sibling_is_negotiated(client):
+    resp = client.get('/assets/index-AbC123xy.js', headers={'Accept-Encoding': 'gzip, br;q=0'})
+    assert resp.headers['Content-Encoding'] == 'gzip'
+    assert resp.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(resp.data) == BUNDLE
+
+    resp = client.get('/assets/index-AbC123xy.js', headers={'Accept-Encoding': 'gzip;q=0'})
+    assert 'Content-Encoding' not in resp.headers
+
+
+def test_spa_routes_fall_back_to_index(client):
+    resp = client.get('/dashboard/phase5')
+    assert resp.status_code == 200
+    assert b'id="root"' in resp.data
+    assert resp.headers['Cache-Control'] == 'no-cache'
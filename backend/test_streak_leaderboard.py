@@ -0,0 +1,79 @@
+"""
+Tests for set-based streak maintenance and the streak leaderboard snapshot
+"""
+import os
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+
+from services.streak_service import StreakService
+
+GAMIFICATION_SQL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations', 'add_gamification_tables.sql')
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT)')
+    with open(GAMIFICATION_SQL) as f:
+        conn.executescript(f.read())
+    conn.executemany('INSERT INTO users (id, username) VALUES (?, ?)', [(i, f'user{i}') for i in range(1, 7)])
+    yield conn
+    conn.close()
+
+
+def _streak(conn, user_id, current, longest, days_ago, tokens=0):
+    conn.execute(
+        'INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_activity_date, freeze_tokens) '
+        'VALUES (?, ?, ?, ?, ?)',
+        (user_id, current, longest, (TODAY - timedelta(days=days_ago)).isoformat(), tokens)
+    )
+
+
+def _snapshot_matches_streaks(conn):
+    expected = conn.execute(
+        'SELECT current_streak, longest_streak, COUNT(*) FROM user_streaks WHERE current_streak > 0 '
+        'GROUP BY 1, 2 ORDER BY 1, 2').fetchall()
+    buckets = conn.execute('SELECT current_streak, longest_streak, users FROM streak_rank_buckets ORDER BY 1, 2').fetchall()
+    rows = conn.execute('SELECT COUNT(*) FROM streak_leaderboard').fetchone()[0]
+    return buckets == expected and rows == sum(count for _, _, count in expected)
+
+
+def test_maintenance_freezes_then_breaks(conn):
+    _streak(conn, 1, 5, 5, days_ago=1)             # still fine
+    _streak(conn, 2, 8, 9, days_ago=2, tokens=1)   # missed one day, one token
+    _streak(conn, 3, 4, 6, days_ago=3, tokens=1)   # missed two days, not enough tokens
+    _streak(conn, 4, 3, 3, days_ago=4)
+    conn.commit()
+
+    result = StreakService(conn).run_daily_maintenance(today=TODAY)
+
+    assert result['frozen'] == 1
+    assert sorted(entry['user_id'] for entry in result['broken']) == [3, 4]
+    rows = {row[0]: row[1:] for row in conn.execute(
+        'SELECT user_id, current_streak, freeze_tokens, last_activity_date FROM user_streaks')}
+    assert rows[2] == (8, 0, (TODAY - timedelta(days=1)).isoformat())
+    assert rows[3][:2] == (0, 1)
+    assert _snapshot_matches_streaks(conn)
+
+
+def test_leaderboard_and_rank_follow_streak_changes(conn):
+    _streak(conn, 1, 5, 5, days_ago=0)
+    _streak(conn, 2, 7, 7, days_ago=0)
+    _streak(conn, 3, 5, 5, days_ago=0)
+    _streak(conn, 4, 0, 2, days_ago=9)
+    conn.commit()
+    service = StreakService(conn)
+
+    board = service.get_streak_leaderboard(10)
+    assert [(e['username'], e['rank']) for e in board] == [('user2', 1), ('user1', 2), ('user3', 2)]
+    assert service.get_streak_rank(3)['rank'] == 2
+    assert service.get_streak_rank(4) == {'rank': None, 'total_ranked': 3, 'current_streak': 0}
+
+    conn.execute('UPDATE user_streaks SET current_streak = 9, longest_streak = 9 WHERE user_id = 3')
+    conn.execute('DELETE FROM user_streaks WHERE user_id = 2')
+    assert service.get_streak_rank(3)['rank'] == 1
+    assert service.get_streak_rank(1) == {'rank': 2, 'total_ranked': 2, 'current_streak': 5, 'longest_streak': 5}
+    assert _snapshot_matches_streaks(conn)
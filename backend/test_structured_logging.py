@@ -0,0 +1,48 @@
+"""
+Tests for the queue-backed, sampled and redacted logging helpers
+"""
+import io
+import logging
+import queue
+
+from utils import structured_logging
+from utils.structured_logging import (
+    DroppingQueueHandler, StructuredFormatter, log_event, redact
+)
+
+
+def test_redact_masks_secrets_and_truncates():
+    safe = redact({'username': 'amel', 'password': 'hunter2', 'Auth_Token': 'x',
+                   'essay': 'a' * 1000, 'items': list(range(50))})
+    assert safe['password'] == safe['Auth_Token'] == '[redacted]'
+    assert safe['essay'].startswith('a' * 200) and safe['essay'].endswith('(+800 chars)')
+    assert len(safe['items']) == 21 and safe['items'][-1] == '+30 items'
+
+
+def test_log_event_is_sampled_and_structured(monkeypatch):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter('json'))
+    logger = logging.getLogger('test.structured')
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    monkeypatch.setitem(structured_logging.SAMPLE_RATES, 'noisy', 0.0)
+    log_event(logger, 'noisy', payload={'a': 1})
+    log_event(logger, 'scored', user_id=3, level='B2', payload={'email': 'x@y.z', 'score': 4})
+    logger.removeHandler(handler)
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert '"message": "scored"' in lines[0] and '"level": "B2"' in lines[0]
+    assert 'x@y.z' not in lines[0]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    record = logging.LogRecord('t', logging.INFO, __file__, 1, 'msg %s', ('x',), None)
+    for _ in range(5):
+        handler.handle(record)
+    assert handler.queue.qsize() == 2 and handler.dropped == 3
+    assert handler.queue.get_nowait().msg == 'msg x'
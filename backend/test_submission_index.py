@@ -0,0 +1,72 @@
+"""
+Tests for MinHash/LSH near-duplicate detection across submissions
+"""
+from benchmarks.seed import seed_population
+from services.submission_index import NUM_PERM, SubmissionIndex, signature
+
+ANSWER = ("We should find a backup singer from the local music school because the festival "
+          "starts tonight and the audience expects live music on the main stage")
+
+
+def test_copies_are_flagged_and_reuse_the_earlier_grade(tmp_path):
+    db_path = str(tmp_path / 'fardi.db')
+    seed_population(db_path, users=2)
+    index = SubmissionIndex(db_path)
+
+    assert index.add('task', 1, 'I agree with you') is None
+    assert signature(ANSWER).itemsize * len(signature(ANSWER)) == NUM_PERM * 8
+    first = index.add('task', 1, ANSWER)
+    assert first.matches == [] and first.reusable is None
+    index.set_grade('task', first.id, {'score': 4, 'level': 'B2'})
+
+    copy = index.add('task', 2, ANSWER.replace('tonight', 'this evening'))
+    assert [m.user_id for m in copy.matches] == [1]
+    assert copy.reusable is None  # similar, but not near-identical
+
+    verbatim = index.add('task', 3, ANSWER.upper())
+    assert verbatim.reusable == {'score': 4, 'level': 'B2'}
+    assert index.add('other-task', 3, ANSWER).matches == []
+
+    # Persisted fingerprints are reloaded by a fresh index
+    index.flush()
+    reloaded = SubmissionIndex(db_path)
+    assert {m.user_id for m in reloaded.add('task', 4, ANSWER).matches} == {1, 2, 3}
+
+
+def test_admin_similar_submissions_report(app_client, monkeypatch):
+    from services import registry
+
+    index = SubmissionIndex(app_client.db_path)
+    monkeypatch.setitem(registry._instances, 'submission_index', index)
+    index.add('phase5.step1_interaction2', 1, ANSWER)
+    index.add('phase5.step1_interaction2', 2, ANSWER)
+
+    client = app_client.login(is_admin=True)
+    data = client.get('/api/admin/similar-submissions?task=phase5.step1_interaction2').get_json()['data']
+    assert len(data['pairs']) == 1
+    assert (data['pairs'][0]['user_id'], data['pairs'][0]['matched_user_id']) == (2, 1)
+    assert data['pairs'][0]['matched_text'] == ANSWER
+    assert data['tasks'][0]['flags'] == 1
+
+
+def test_corrections_of_a_given_text_are_not_fingerprinted(tmp_path):
+    from services.ai_service import AIService
+    from services.prompt_templates import PromptTemplate
+
+    db_path = str(tmp_path / 'fardi.db')
+    seed_population(db_path, users=1)
+    index = SubmissionIndex(db_path)
+    service = AIService.__new__(AIService)
+    service.model, service.max_tokens, service.temperature, service.client = 'm', 100, 0.0, None
+    service.submission_index = index
+
+    spelling = PromptTemplate('test.spelling', system='Grade the corrections.',
+                              user='Original: {original_text}\nCorrected: {corrected_text}',
+                              source_field='original_text')
+    answer = PromptTemplate('test.answer', system='Grade the answer.', user='{response}')
+    for _ in range(2):
+        service.complete_template(spelling, original_text=ANSWER, corrected_text=ANSWER)
+        service.complete_template(answer, response=ANSWER)
+
+    assert 'test.spelling' not in index._shards
+    assert len(index._shards['test.answer'].entries) == 2
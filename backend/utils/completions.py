@@ -0,0 +1,42 @@
+"""
+Chat-completion client wrappers
+
+The Groq client is layered (hedging, deadlines, telemetry), and each layer
+must look like the SDK client to the one above it and to ai_service's
+callers: client.chat.completions.create(**kwargs), with every other
+attribute passed through to the wrapped client. CompletionsWrapper provides
+that shape; a layer subclasses it and overrides create().
+"""
+
+
+class CompletionsWrapper:
+    """
+    Base for Groq client wrappers
+
+    Args:
+        client: Groq client (or another wrapper)
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.chat = _Chat(self)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def create(self, **kwargs):
+        """chat.completions.create on the wrapped client (override to change the call)"""
+        return self._client.chat.completions.create(**kwargs)
+
+
+class _Completions:
+    def __init__(self, wrapper: CompletionsWrapper):
+        self._wrapper = wrapper
+
+    def create(self, **kwargs):
+        return self._wrapper.create(**kwargs)
+
+
+class _Chat:
+    def __init__(self, wrapper: CompletionsWrapper):
+        self.completions = _Completions(wrapper)
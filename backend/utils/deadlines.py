@@ -0,0 +1,160 @@
+"""
+Request deadlines - One latency budget shared by every stage of a request
+
+init_app() starts a deadline when a request for a budgeted endpoint begins
+and clears it when the request ends. Downstream calls consult it instead of
+using fixed timeouts: Sapling, Groq (through DeadlineClient), Edge TTS and
+the SQLite busy-wait size their own timeout to the time left, and routes
+skip optional stages (coaching feedback) once too little is left. Outside a
+budgeted request there is no deadline and callers keep their own defaults.
+
+The deadline lives in a context variable, so it follows the request's
+thread; work handed to other threads must size its timeout first.
+
+Environment:
+    REQUEST_DEADLINES         per-endpoint budgets in seconds, e.g.
+                              "api.get_ai_feedback=8,api.api_generate_audio=20"
+                              (0 turns an endpoint's deadline off)
+    REQUEST_DEADLINE_DEFAULT  budget for endpoints not listed (default 0: none)
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from utils.completions import CompletionsWrapper
+from utils.structured_logging import log_event, parse_settings
+
+logger = logging.getLogger(__name__)
+
+# Default budgets (seconds) for the endpoints that chain external calls
+DEFAULT_BUDGETS = {
+    'api.get_ai_feedback': 15.0,
+    'api.get_phase2_ai_feedback': 15.0,
+    'api.api_submit_response': 15.0,
+    'api.submit_phase2_response': 20.0,
+    'api.check_ai_response': 10.0,
+    'api.api_generate_audio': 20.0,
+    'api.generate_character_audio': 20.0,
+    'submit_response': 15.0,
+    'phase2_submit_response': 20.0,
+}
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's budget ran out before a stage could start"""
+
+
+BUDGETS = dict(DEFAULT_BUDGETS, **parse_settings(os.getenv('REQUEST_DEADLINES', '')))
+DEFAULT_BUDGET = float(os.getenv('REQUEST_DEADLINE_DEFAULT', '0') or 0)
+
+_deadline: ContextVar[Optional[float]] = ContextVar('request_deadline', default=None)
+
+
+def budget_for(endpoint: Optional[str]) -> Optional[float]:
+    """Seconds allowed for an endpoint (None if it has no deadline)"""
+    seconds = BUDGETS.get(endpoint, DEFAULT_BUDGET)
+    return seconds if seconds > 0 else None
+
+
+def start(seconds: Optional[float]):
+    """Set the current deadline seconds from now (None clears it)"""
+    _deadline.set(time.monotonic() + seconds if seconds is not None else None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]):
+    """Run a block under a deadline (outside Flask, e.g. jobs and tests)"""
+    token = _deadline.set(time.monotonic() + seconds if seconds is not None else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline (negative once passed, None without one)"""
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def has_budget(seconds: float) -> bool:
+    """Whether at least this much time is left (always true without a deadline)"""
+    left = remaining()
+    return left is None or left >= seconds
+
+
+def check(stage: str):
+    """
+    Raise DeadlineExceeded if the deadline has passed
+
+    Raises:
+        DeadlineExceeded: No time left to start the stage
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        log_event(logger, 'deadline.exceeded', log_level=logging.WARNING, stage=stage,
+                  overrun=round(-left, 3))
+        raise DeadlineExceeded(f'Request deadline passed before {stage}')
+
+
+def timeout(default: Optional[float] = None, attempts: int = 1, floor: float = 0.0) -> Optional[float]:
+    """
+    Timeout for one downstream call
+
+    Args:
+        default: The call's own timeout (used as is without a deadline)
+        attempts: Tries the client may make (the time left is split between them)
+        floor: Smallest value returned, for calls that should still try briefly
+
+    Returns:
+        The smaller of default and the time left per attempt
+    """
+    left = remaining()
+    if left is None:
+        return default
+    share = max(left, 0.0) / max(attempts, 1)
+    value = share if default is None else min(default, share)
+    return max(value, floor)
+
+
+def init_app(app):
+    """Start each request's deadline from its endpoint budget"""
+    from flask import request
+
+    @app.before_request
+    def _start_deadline():
+        start(budget_for(request.endpoint))
+
+    @app.teardown_request
+    def _clear_deadline(exc=None):
+        left = remaining()
+        if left is not None and left < 0:
+            log_event(logger, 'deadline.overrun', log_level=logging.WARNING,
+                      endpoint=request.endpoint, overrun=round(-left, 3))
+        start(None)
+
+
+class DeadlineClient(CompletionsWrapper):
+    """
+    Groq client wrapper that sizes each completion's timeout to the deadline
+
+    Exposes client.chat.completions.create() like the wrapped client. With
+    no deadline the call is passed through unchanged.
+
+    Args:
+        client: Groq client (or HedgedClient)
+        attempts: Tries the SDK makes per call (max_retries + 1)
+    """
+
+    def __init__(self, client, attempts: int = 1):
+        super().__init__(client)
+        self.attempts = attempts
+
+    def create(self, **kwargs):
+        if remaining() is not None and 'timeout' not in kwargs:
+            check('completion')
+            kwargs['timeout'] = timeout(attempts=self.attempts)
+        return super().create(**kwargs)
@@ -0,0 +1,280 @@
+"""
+Static asset layer for the React build (frontend/dist)
+
+The build directory is scanned once into an in-memory manifest (content
+type, size, strong ETag and pre-compressed siblings per file), so serving
+an asset is a dict lookup instead of stat/mimetype work on every request.
+
+- Vite's content-hashed files (assets/name-<hash>.js) are cached forever
+  (Cache-Control: immutable); everything else, index.html included, must
+  be revalidated and is answered with 304 when the ETag still matches.
+- A pre-built .br or .gz sibling is sent when the client accepts it.
+  `flask --app app precompress-assets` writes them after `npm run build`.
+- Unknown paths fall back to index.html so client-side routes work.
+"""
+import os
+import re
+import gzip
+import time
+import hashlib
+import logging
+import mimetypes
+import threading
+from typing import Dict, Optional
+
+from flask import Response, request
+from werkzeug.wsgi import wrap_file
+
+logger = logging.getLogger(__name__)
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+# Vite emits assets/<name>-<8+ char hash>.<ext>
+HASHED_ASSET_RE = re.compile(r'(^|/)assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$')
+
+# Preferred order when the client accepts several encodings
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# mimetypes depends on the host's tables, so pin the types the SPA relies on
+MIMETYPE_OVERRIDES = {
+    '.js': 'application/javascript',
+    '.mjs': 'application/javascript',
+    '.css': 'text/css',
+    '.html': 'text/html',
+    '.json': 'application/json',
+    '.webmanifest': 'application/manifest+json',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.wasm': 'application/wasm',
+}
+
+COMPRESSIBLE_EXTENSIONS = {'.js', '.mjs', '.css', '.html', '.json', '.svg', '.webmanifest', '.txt', '.map'}
+MIN_COMPRESS_SIZE = 1024  # bytes; smaller files are not worth a sibling
+
+REBUILD_CHECK_INTERVAL = 2.0  # seconds between index.html mtime checks on a miss
+
+
+def _file_etag(file_path: str) -> str:
+    """Strong ETag from the file contents"""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:20]
+
+
+def _mimetype(rel_path: str) -> str:
+    ext = os.path.splitext(rel_path)[1].lower()
+    mimetype = MIMETYPE_OVERRIDES.get(ext) or mimetypes.guess_type(rel_path)[0] or 'application/octet-stream'
+    if mimetype.startswith('text/') or mimetype in ('application/javascript', 'application/json'):
+        mimetype += '; charset=utf-8'
+    return mimetype
+
+
+class Asset:
+    """One file in the build, plus its pre-compressed variants"""
+
+    __slots__ = ('rel_path', 'file_path', 'size', 'etag', 'mimetype', 'cache_control', 'variants')
+
+    def __init__(self, root: str, rel_path: str):
+        self.rel_path = rel_path
+        self.file_path = os.path.join(root, rel_path)
+        self.size = os.path.getsize(self.file_path)
+        self.etag = _file_etag(self.file_path)
+        self.mimetype = _mimetype(rel_path)
+        immutable = HASHED_ASSET_RE.search(rel_path) is not None
+        self.cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        # encoding -> (path, size, etag)
+        self.variants: Dict[str, tuple] = {}
+        for encoding, suffix in ENCODINGS:
+            sibling = self.file_path + suffix
+            if os.path.isfile(sibling):
+                self.variants[encoding] = (sibling, os.path.getsize(sibling), f"{self.etag}-{encoding}")
+
+
+def _accepted_encodings() -> set:
+    """Encodings the client accepts (q=0 means refused)"""
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        token, _, params = part.strip().partition(';')
+        if not token:
+            continue
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for GET)"""
+    if header.strip() == '*':
+        return True
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+class StaticAssets:
+    """In-memory manifest over a build directory, with HTTP caching semantics"""
+
+    def __init__(self, root: str, index: str = 'index.html'):
+        self.root = os.path.abspath(root)
+        self.index = index
+        self._assets: Optional[Dict[str, Asset]] = None
+        self._index_mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root, self.index)
+
+    def _current_index_mtime(self):
+        try:
+            return os.stat(self._index_path()).st_mtime_ns
+        except OSError:
+            return None
+
+    def build(self) -> Dict[str, Asset]:
+        """Scan the build directory into a fresh manifest"""
+        assets = {}
+        suffixes = tuple(suffix for _, suffix in ENCODINGS)
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(suffixes):
+                    continue
+                rel_path = os.path.relpath(os.path.join(dirpath, filename), self.root).replace(os.sep, '/')
+                try:
+                    assets[rel_path] = Asset(self.root, rel_path)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable asset {rel_path}: {e}")
+
+        self._assets = assets
+        self._index_mtime = self._current_index_mtime()
+        self._checked_at = time.monotonic()
+        logger.info(f"Static asset manifest built: {len(assets)} files from {self.root}")
+        return assets
+
+    def manifest(self) -> Dict[str, Asset]:
+        """Get the manifest, building it on first use"""
+        if self._assets is None:
+            with self._lock:
+                if self._assets is None:
+                    self.build()
+        return self._assets
+
+    def available(self) -> bool:
+        """Whether the build exists (index.html is present)"""
+        if self.index in self.manifest():
+            return True
+        # The build may have been created after the manifest was scanned
+        return self._rebuild_if_changed() and self.index in self._assets
+
+    def _rebuild_if_changed(self) -> bool:
+        """Rescan when index.html changed (a new `npm run build`); throttled"""
+        now = time.monotonic()
+        if now - self._checked_at < REBUILD_CHECK_INTERVAL:
+            return False
+        with self._lock:
+            self._checked_at = now
+            if self._current_index_mtime() == self._index_mtime:
+                return False
+            self.build()
+            return True
+
+    def lookup(self, path: str) -> Optional[Asset]:
+        """Find an asset by URL path"""
+        asset = self.manifest().get(path)
+        if asset is None and self._rebuild_if_changed():
+            asset = self._assets.get(path)
+        return asset
+
+    def serve(self, path: str) -> Response:
+        """Serve an asset by URL path, falling back to index.html for SPA routes"""
+        asset = self.lookup(path) or self.manifest().get(self.index)
+        if asset is None:
+            return Response('Not Found', status=404)
+        return self.respond(asset)
+
+    def respond(self, asset: Asset) -> Response:
+        """Build the (possibly 304) response for an asset"""
+        file_path, size, etag, encoding = asset.file_path, asset.size, asset.etag, None
+        if asset.variants:
+            accepted = _accepted_encodings()
+            for candidate, _ in ENCODINGS:
+                if candidate in asset.variants and candidate in accepted:
+                    encoding = candidate
+                    file_path, size, etag = asset.variants[candidate]
+                    break
+
+        headers = {
+            'ETag': f'"{etag}"',
+            'Cache-Control': asset.cache_control,
+        }
+        if asset.variants:
+            headers['Vary'] = 'Accept-Encoding'
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status=304, headers=headers)
+
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        headers['Content-Length'] = str(size)
+
+        # wrap_file hands the file to the server's sendfile support when it has one
+        body = wrap_file(request.environ, open(file_path, 'rb'))
+        return Response(body, mimetype=asset.mimetype, headers=headers, direct_passthrough=True)
+
+
+def precompress(root: str) -> int:
+    """
+    Write .gz (and .br, if the brotli package is installed) siblings next to
+    every compressible file in a build directory
+
+    Returns:
+        Number of sibling files written
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        logger.info("brotli not installed; writing .gz siblings only")
+
+    written = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            file_path = os.path.join(dirpath, filename)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            if len(data) < MIN_COMPRESS_SIZE:
+                continue
+
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                with open(file_path + '.gz', 'wb') as f:
+                    f.write(compressed)
+                written += 1
+
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    with open(file_path + '.br', 'wb') as f:
+                        f.write(compressed)
+                    written += 1
+    return written
@@ -0,0 +1,209 @@
+"""
+Structured logging for the request path
+
+configure_logging() puts a QueueHandler on the root logger and moves
+formatting and stream writes to a QueueListener thread, so a request only
+pays for an enqueue (records are dropped and counted if the queue is full).
+log_event() emits one record per event with key=value fields, sampled per
+event and with secrets masked and long values truncated.
+
+Environment:
+    LOG_LEVEL            root level (default INFO)
+    LOG_FORMAT           "text" or "json" (default text)
+    LOG_SAMPLE_RATES     per-event rates, e.g. "request.payload=0.01,phase2.score=0.5"
+    LOG_MAX_VALUE_CHARS  truncate logged strings to this length (default 200)
+    LOG_QUEUE_SIZE       records buffered before dropping (default 10000)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+# Default per-event sample rates (events not listed are always logged)
+DEFAULT_SAMPLE_RATES = {
+    'request.payload': 0.01,
+}
+
+# Field names containing any of these are masked
+SENSITIVE_KEYS = ('password', 'token', 'secret', 'api_key', 'apikey', 'authorization',
+                  'cookie', 'session', 'email')
+
+REDACTED = '[redacted]'
+MAX_COLLECTION_ITEMS = 20
+MAX_DEPTH = 3
+
+
+def parse_settings(spec: str, low: float = 0.0, high: Optional[float] = None) -> Dict[str, float]:
+    """
+    Parse a "name=value,name=value" environment setting
+
+    Values are clamped to [low, high]; malformed entries are skipped.
+    """
+    settings = {}
+    for part in spec.split(','):
+        name, _, value = part.partition('=')
+        try:
+            number = max(low, float(value))
+        except ValueError:
+            continue
+        settings[name.strip()] = number if high is None else min(high, number)
+    return settings
+
+
+SAMPLE_RATES = dict(DEFAULT_SAMPLE_RATES, **parse_settings(os.getenv('LOG_SAMPLE_RATES', ''), high=1.0))
+MAX_VALUE_CHARS = int(os.getenv('LOG_MAX_VALUE_CHARS', '200'))
+
+
+def truncate(text: str, limit: Optional[int] = None) -> str:
+    """Cut a string to the configured length, noting how much was dropped"""
+    limit = limit or MAX_VALUE_CHARS
+    if len(text) <= limit:
+        return text
+    return f'{text[:limit]}...(+{len(text) - limit} chars)'
+
+
+def redact(value, depth: int = 0):
+    """
+    Copy of a value that is safe to log
+
+    Sensitive keys are masked, strings truncated and collections capped
+    (a summary replaces anything nested deeper than MAX_DEPTH).
+    """
+    if isinstance(value, dict):
+        if depth >= MAX_DEPTH:
+            return f'<dict with {len(value)} keys>'
+        items = list(value.items())
+        out = {
+            str(k): REDACTED if any(s in str(k).lower() for s in SENSITIVE_KEYS) else redact(v, depth + 1)
+            for k, v in items[:MAX_COLLECTION_ITEMS]
+        }
+        if len(items) > MAX_COLLECTION_ITEMS:
+            out['...'] = f'+{len(items) - MAX_COLLECTION_ITEMS} keys'
+        return out
+    if isinstance(value, (list, tuple, set)):
+        if depth >= MAX_DEPTH:
+            return f'<{type(value).__name__} of {len(value)}>'
+        items = list(value)
+        out = [redact(v, depth + 1) for v in items[:MAX_COLLECTION_ITEMS]]
+        if len(items) > MAX_COLLECTION_ITEMS:
+            out.append(f'+{len(items) - MAX_COLLECTION_ITEMS} items')
+        return out
+    if isinstance(value, str):
+        return truncate(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return truncate(repr(value))
+
+
+def should_sample(event: str, rate: Optional[float] = None) -> bool:
+    """Whether this occurrence of an event is logged"""
+    rate = SAMPLE_RATES.get(event, 1.0) if rate is None else rate
+    return rate >= 1.0 or random.random() < rate
+
+
+def log_event(logger: logging.Logger, event: str, log_level: int = logging.INFO,
+              sample: Optional[float] = None, **fields):
+    """
+    Emit one structured record
+
+    Args:
+        logger: Module logger
+        event: Dotted event name (also the sampling key)
+        log_level: Log level ("level" is left free for CEFR-level fields)
+        sample: Sample rate overriding LOG_SAMPLE_RATES for this call
+        **fields: Event data (redacted and truncated before it is queued)
+    """
+    if not logger.isEnabledFor(log_level) or not should_sample(event, sample):
+        return
+    logger.log(log_level, event, extra={'event': event, 'fields': redact(fields)})
+
+
+def banner(logger: logging.Logger, *lines):
+    """Multi-line operator banner as a single DEBUG record (off at the default level)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('\n'.join(str(line) for line in lines))
+
+
+class StructuredFormatter(logging.Formatter):
+    """key=value (or JSON) lines; runs on the listener thread"""
+
+    def __init__(self, fmt_type: str = 'text'):
+        super().__init__('%(asctime)s %(levelname)s %(name)s %(message)s')
+        self.json = fmt_type == 'json'
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, 'fields', None)
+        if self.json:
+            payload = {
+                'ts': self.formatTime(record),
+                'severity': record.levelname,
+                'logger': record.name,
+                'message': truncate(record.getMessage(), MAX_VALUE_CHARS * 10),
+            }
+            if fields:
+                payload.update(fields)
+            if record.exc_info:
+                payload['exc'] = self.formatException(record.exc_info)
+            return json.dumps(payload, default=str)
+
+        line = super().format(record)
+        if fields:
+            line += ' ' + ' '.join(f'{k}={json.dumps(v, default=str)}' for k, v in fields.items())
+        return line
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that never blocks: a full queue drops the record"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Only resolve the message here; formatting happens on the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: Optional[str] = None, fmt_type: Optional[str] = None,
+                      stream=None) -> QueueListener:
+    """
+    Route the root logger through a queue to a background writer (idempotent)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.Queue(int(os.getenv('LOG_QUEUE_SIZE', '10000')))
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(StructuredFormatter(fmt_type or os.getenv('LOG_FORMAT', 'text')))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue))
+    root.setLevel((level or os.getenv('LOG_LEVEL', 'INFO')).upper())
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
@@ -645,6 +645,7 @@ import AdminUserList from './pages/AdminUserList.jsx'
 import AdminUserViewer from './pages/AdminUserViewer.jsx'
 import AdminAnalytics from './pages/AdminAnalytics.jsx'
 import AdminChat from './pages/AdminChat.jsx'
+import AdminLlmTelemetry from './pages/AdminLlmTelemetry.jsx'
 import StudentChat from './pages/StudentChat.jsx'
 import NotFound from './pages/NotFound.jsx'
 import { ApiProvider, useAuth } from './lib/api.jsx'
@@ -1966,6 +1967,7 @@ function App() {
           {/* Admin Routes */}
           <Route path="/admin" element={<AdminDashboard />} />
           <Route path="/admin/analytics" element={<AdminAnalytics />} />
+          <Route path="/admin/llm-telemetry" element={<AdminLlmTelemetry />} />
           <Route path="/admin/users" element={<AdminUserList />} />
           <Route path="/admin/users/:userId" element={<AdminUserViewer />} />
           <Route path="/admin/chat" element={<AdminChat />} />
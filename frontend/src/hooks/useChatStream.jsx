@@ -0,0 +1,33 @@
+import { useEffect, useRef } from 'react'
+
+// Subscribes to /api/chat/stream (server-sent events). The browser reconnects
+// on its own and resumes from the last event id, so no polling is needed.
+// onOpen fires on every (re)connect: reload anything the view shows there.
+export function useChatStream(onMessage, { enabled = true, onOpen } = {}) {
+  const onMessageRef = useRef(onMessage)
+  const onOpenRef = useRef(onOpen)
+  onMessageRef.current = onMessage
+  onOpenRef.current = onOpen
+
+  useEffect(() => {
+    if (!enabled || typeof EventSource === 'undefined') return
+
+    const source = new EventSource('/api/chat/stream', { withCredentials: true })
+    source.onopen = () => onOpenRef.current?.()
+    source.addEventListener('message', (event) => {
+      try {
+        onMessageRef.current?.(JSON.parse(event.data))
+      } catch {}
+    })
+
+    return () => source.close()
+  }, [enabled])
+}
+
+// Append messages that are not already in the list (by id), keeping id order
+export function mergeMessages(current, incoming) {
+  const known = new Set(current.map(m => m.id))
+  const added = incoming.filter(m => !known.has(m.id))
+  if (added.length === 0) return current
+  return [...current, ...added].sort((a, b) => a.id - b.id)
+}
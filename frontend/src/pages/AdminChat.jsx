@@ -7,19 +7,20 @@ import {
 import SendIcon from '@mui/icons-material/Send'
 import SearchIcon from '@mui/icons-material/Search'
 import ChatBubbleOutlineIcon from '@mui/icons-material/ChatBubbleOutline'
+import { useChatStream, mergeMessages } from '../hooks/useChatStream'
 
 export default function AdminChat() {
   const { userId } = useParams()
   const navigate = useNavigate()
   const [conversations, setConversations] = useState([])
   const [messages, setMessages] = useState([])
+  const [olderCursor, setOlderCursor] = useState(undefined)
   const [newMessage, setNewMessage] = useState('')
   const [search, setSearch] = useState('')
   const [loading, setLoading] = useState(true)
   const [sending, setSending] = useState(false)
   const [activeUser, setActiveUser] = useState(null)
   const messagesEndRef = useRef(null)
-  const pollRef = useRef(null)
 
   const loadConversations = async () => {
     try {
@@ -30,11 +31,27 @@ export default function AdminChat() {
     setLoading(false)
   }
 
+  // Latest page; older pages are fetched on demand with the before_id cursor
   const loadMessages = async (uid) => {
     try {
       const res = await fetch(`/api/chat/messages/${uid}`, { credentials: 'include' })
       const data = await res.json()
-      if (data.success) setMessages(data.data)
+      if (data.success) {
+        setMessages(prev => mergeMessages(prev, data.data))
+        setOlderCursor(cursor => (cursor === undefined ? data.next_before_id : cursor))
+      }
+    } catch {}
+  }
+
+  const loadOlderMessages = async (uid) => {
+    if (!olderCursor) return
+    try {
+      const res = await fetch(`/api/chat/messages/${uid}?before_id=${olderCursor}`, { credentials: 'include' })
+      const data = await res.json()
+      if (data.success) {
+        setMessages(prev => mergeMessages(prev, data.data))
+        setOlderCursor(data.next_before_id)
+      }
     } catch {}
   }
 
@@ -42,6 +59,11 @@ export default function AdminChat() {
     loadConversations()
   }, [])
 
+  useEffect(() => {
+    setMessages([])
+    setOlderCursor(undefined)
+  }, [userId])
+
   useEffect(() => {
     if (userId) {
       const user = conversations.find(c => String(c.user_id) === String(userId))
@@ -49,23 +71,30 @@ export default function AdminChat() {
       loadMessages(userId)
     } else {
       setActiveUser(null)
-      setMessages([])
     }
   }, [userId, conversations])
 
-  // Poll for new messages
-  useEffect(() => {
-    if (!userId) return
-    pollRef.current = setInterval(() => {
-      loadMessages(userId)
+  // New messages are pushed over the chat stream
+  useChatStream((message) => {
+    const other = message.is_mine ? message.receiver_id : message.sender_id
+    if (userId && String(other) === String(userId)) {
+      setMessages(prev => mergeMessages(prev, [message]))
+      // Opening the conversation marks incoming messages as read
+      if (!message.is_mine) loadMessages(userId)
+    }
+    loadConversations()
+  }, {
+    onOpen: () => {
       loadConversations()
-    }, 5000)
-    return () => clearInterval(pollRef.current)
-  }, [userId])
+      if (userId) loadMessages(userId)
+    },
+  })
 
+  // Only scroll for new messages, not when an older page is prepended
+  const lastMessageId = messages.length ? messages[messages.length - 1].id : null
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' })
-  }, [messages])
+  }, [lastMessageId])
 
   const handleSend = async () => {
     if (!newMessage.trim() || !userId) return
@@ -80,7 +109,7 @@ export default function AdminChat() {
       const data = await res.json()
       if (data.success) {
         setNewMessage('')
-        loadMessages(userId)
+        setMessages(prev => mergeMessages(prev, [data.data]))
         loadConversations()
       }
     } catch {}
@@ -256,6 +285,11 @@ export default function AdminChat() {
                   </Typography>
                 </Box>
               )}
+              {olderCursor && (
+                <Box sx={{ textAlign: 'center', mb: 1 }}>
+                  <Chip label="Load earlier messages" size="small" clickable onClick={() => loadOlderMessages(userId)} />
+                </Box>
+              )}
               {messages.map((msg, i) => {
                 const showDate = i === 0 || new Date(messages[i-1].created_at).toDateString() !== new Date(msg.created_at).toDateString()
                 return (
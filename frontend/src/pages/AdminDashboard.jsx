@@ -19,6 +19,7 @@ import BarChartIcon from '@mui/icons-material/BarChart'
 import ChatBubbleOutlineIcon from '@mui/icons-material/ChatBubbleOutline'
 import ArrowForwardIcon from '@mui/icons-material/ArrowForward'
 import VisibilityIcon from '@mui/icons-material/Visibility'
+import MemoryIcon from '@mui/icons-material/Memory'
 
 ChartJS.register(
   CategoryScale, LinearScale, BarElement, Title, Tooltip, Legend,
@@ -325,6 +326,7 @@ export default function AdminDashboard() {
                 {[
                   { label: 'View All Students', desc: `${totalStudents} registered`, to: '/admin/users', icon: <PeopleIcon />, color: '#10b981' },
                   { label: 'Full Analytics', desc: 'Charts & reports', to: '/admin/analytics', icon: <BarChartIcon />, color: '#0ea5e9' },
+                  { label: 'LLM Telemetry', desc: 'Groq cost & latency', to: '/admin/llm-telemetry', icon: <MemoryIcon />, color: '#8b5cf6' },
                   { label: 'Messages', desc: 'Chat with students', to: '/admin/chat', icon: <ChatBubbleOutlineIcon />, color: '#f97316' },
                 ].map(({ label, desc, to, icon, color }) => (
                   <Paper
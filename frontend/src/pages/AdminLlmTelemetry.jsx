@@ -0,0 +1,225 @@
+import React, { useState, useEffect } from 'react'
+import {
+  Box, Typography, Grid, Card, CardContent, Alert, Stack, Button, Chip,
+  Table, TableBody, TableCell, TableContainer, TableHead, TableRow,
+  LinearProgress, IconButton
+} from '@mui/material'
+import RefreshIcon from '@mui/icons-material/Refresh'
+
+const headCell = { fontWeight: 600, color: '#64748b', fontSize: '0.75rem', borderColor: '#f1f5f9' }
+const bodyCell = { borderColor: '#f1f5f9', fontSize: '0.8rem' }
+
+const formatNumber = (value) => (value ?? 0).toLocaleString('en')
+const formatSeconds = (value) => (value == null ? '—' : `${value}s`)
+const formatRate = (value) => (value == null ? '—' : `${Math.round(value * 100)}%`)
+// Quantiles are histogram bucket bounds; null means slower than the last bound
+const formatBound = (value) => (value == null ? '>32s' : `≤${value}s`)
+
+export default function AdminLlmTelemetry() {
+  const [loading, setLoading] = useState(true)
+  const [error, setError] = useState('')
+  const [data, setData] = useState(null)
+
+  const loadTelemetry = async () => {
+    setLoading(true)
+    setError('')
+    try {
+      const res = await fetch('/api/admin/llm-telemetry', { credentials: 'include' })
+      if (!res.ok) throw new Error('Failed to load LLM telemetry')
+      const result = await res.json()
+      if (result.success) setData(result.data)
+      else setError(result.error || 'Failed to load LLM telemetry')
+    } catch (err) {
+      setError(err.message)
+    } finally {
+      setLoading(false)
+    }
+  }
+
+  useEffect(() => { loadTelemetry() }, [])
+
+  if (loading) {
+    return (
+      <Box sx={{ p: { xs: 2, md: 4 } }}>
+        <Typography sx={{ fontSize: '1rem', color: '#64748b', mb: 2 }}>Loading LLM telemetry...</Typography>
+        <LinearProgress sx={{ borderRadius: 2 }} />
+      </Box>
+    )
+  }
+
+  if (error) {
+    return (
+      <Box sx={{ p: { xs: 2, md: 4 } }}>
+        <Alert severity="error" sx={{ mb: 2 }}>{error}</Alert>
+        <Button onClick={loadTelemetry} startIcon={<RefreshIcon />}>Retry</Button>
+      </Box>
+    )
+  }
+
+  if (!data) return null
+
+  const { totals, endpoints, local, hedging, shadow } = data
+  const maxTokens = Math.max(1, ...endpoints.map(e => e.total_tokens))
+
+  return (
+    <Box sx={{ p: { xs: 2, md: 4 } }}>
+      {/* Header */}
+      <Stack direction="row" justifyContent="space-between" alignItems="center" sx={{ mb: 4 }}>
+        <Box>
+          <Typography sx={{ fontSize: '1.6rem', fontWeight: 700, color: '#0f172a', lineHeight: 1.2 }}>
+            LLM Telemetry
+          </Typography>
+          <Typography sx={{ fontSize: '0.88rem', color: '#94a3b8', mt: 0.3 }}>
+            Groq calls per endpoint since {new Date(data.since * 1000).toLocaleString('en')} (this server process)
+          </Typography>
+        </Box>
+        <IconButton onClick={loadTelemetry} sx={{ color: '#94a3b8', '&:hover': { color: '#6366f1' } }}>
+          <RefreshIcon />
+        </IconButton>
+      </Stack>
+
+      {/* Totals */}
+      <Grid container spacing={2} sx={{ mb: 4 }}>
+        {[
+          { label: 'Calls', value: formatNumber(totals.calls), color: '#6366f1' },
+          { label: 'Tokens', value: formatNumber(totals.total_tokens), color: '#0ea5e9' },
+          { label: 'Fallbacks', value: formatNumber(totals.fallbacks), color: totals.fallbacks > 0 ? '#f97316' : '#10b981' },
+          { label: 'Parse Failures', value: formatNumber(totals.parse_failures), color: totals.parse_failures > 0 ? '#ef4444' : '#10b981' },
+          { label: 'Retries / 429s', value: `${formatNumber(totals.retries)} / ${formatNumber(totals.http_429)}`, color: '#8b5cf6' },
+        ].map(({ label, value, color }) => (
+          <Grid item xs={6} sm={4} md key={label}>
+            <Card sx={{ border: '1px solid #f1f5f9', borderRadius: 3, boxShadow: 'none', textAlign: 'center' }}>
+              <CardContent sx={{ p: 2, '&:last-child': { pb: 2 } }}>
+                <Typography sx={{ fontSize: '1.5rem', fontWeight: 700, color, lineHeight: 1.1 }}>
+                  {value}
+                </Typography>
+                <Typography sx={{ fontSize: '0.7rem', color: '#94a3b8', fontWeight: 500, mt: 0.3 }}>
+                  {label}
+                </Typography>
+              </CardContent>
+            </Card>
+          </Grid>
+        ))}
+      </Grid>
+
+      {/* Per-endpoint table, costliest first */}
+      <Card sx={{ border: '1px solid #f1f5f9', borderRadius: 3, boxShadow: 'none', mb: 4 }}>
+        <CardContent sx={{ p: 2.5 }}>
+          <Typography sx={{ fontSize: '0.92rem', fontWeight: 600, color: '#0f172a', mb: 2 }}>
+            Endpoints by token use
+          </Typography>
+          {endpoints.length === 0 ? (
+            <Typography sx={{ fontSize: '0.85rem', color: '#94a3b8' }}>No Groq calls recorded yet</Typography>
+          ) : (
+            <TableContainer>
+              <Table size="small">
+                <TableHead>
+                  <TableRow>
+                    <TableCell sx={headCell}>Endpoint</TableCell>
+                    <TableCell sx={headCell} align="right">Calls</TableCell>
+                    <TableCell sx={headCell}>Tokens (prompt / completion)</TableCell>
+                    <TableCell sx={headCell} align="right">Mean</TableCell>
+                    <TableCell sx={headCell} align="right">p50</TableCell>
+                    <TableCell sx={headCell} align="right">p95</TableCell>
+                    <TableCell sx={headCell} align="right">Fallback</TableCell>
+                    <TableCell sx={headCell} align="right">Parse fail</TableCell>
+                    <TableCell sx={headCell} align="right">Errors</TableCell>
+                  </TableRow>
+                </TableHead>
+                <TableBody>
+                  {endpoints.map((row) => (
+                    <TableRow key={row.endpoint} sx={{ '&:last-child td': { border: 0 } }}>
+                      <TableCell sx={bodyCell}>
+                        <Typography sx={{ fontSize: '0.82rem', fontWeight: 600, color: '#0f172a' }}>
+                          {row.endpoint}
+                        </Typography>
+                        <Typography sx={{ fontSize: '0.68rem', color: '#94a3b8' }}>
+                          {Object.keys(row.models).join(', ')}
+                        </Typography>
+                      </TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatNumber(row.calls)}</TableCell>
+                      <TableCell sx={{ ...bodyCell, minWidth: 180 }}>
+                        <Typography sx={{ fontSize: '0.78rem', color: '#334155' }}>
+                          {formatNumber(row.prompt_tokens)} / {formatNumber(row.completion_tokens)}
+                        </Typography>
+                        <LinearProgress
+                          variant="determinate"
+                          value={(row.total_tokens / maxTokens) * 100}
+                          sx={{
+                            mt: 0.5, height: 4, borderRadius: 2, bgcolor: '#f1f5f9',
+                            '& .MuiLinearProgress-bar': { bgcolor: '#0ea5e9', borderRadius: 2 },
+                          }}
+                        />
+                      </TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatSeconds(row.mean_latency)}</TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatBound(row.p50_latency)}</TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatBound(row.p95_latency)}</TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatRate(row.fallback_rate)}</TableCell>
+                      <TableCell sx={bodyCell} align="right">{formatRate(row.parse_failure_rate)}</TableCell>
+                      <TableCell sx={bodyCell} align="right">
+                        {row.errors + row.timeouts + row.rate_limited > 0 ? (
+                          <Chip
+                            size="small"
+                            label={`${row.errors} err · ${row.timeouts} timeout · ${row.rate_limited} 429`}
+                            sx={{ fontSize: '0.65rem', bgcolor: '#fef2f2', color: '#ef4444' }}
+                          />
+                        ) : '—'}
+                      </TableCell>
+                    </TableRow>
+                  ))}
+                </TableBody>
+              </Table>
+            </TableContainer>
+          )}
+        </CardContent>
+      </Card>
+
+      {/* Calls avoided locally, hedging and tier shadowing */}
+      <Grid container spacing={2.5}>
+        {[
+          {
+            title: 'Answered without Groq',
+            rows: [
+              ['Feedback bank', local.feedback_bank && `${local.feedback_bank.hits} hits / ${local.feedback_bank.misses} misses`],
+              ['CEFR classifier', local.cefr_classifier && `${local.cefr_classifier.hits} confident / ${local.cefr_classifier.deferred} deferred`],
+              ['Assessment memo', local.assessment_memo && `${local.assessment_memo.hits} hits / ${local.assessment_memo.misses} misses`],
+              ['Local answers', formatNumber(totals.local_answers)],
+            ],
+          },
+          {
+            title: 'Hedged requests',
+            rows: hedging
+              ? Object.entries(hedging)
+                .filter(([, value]) => typeof value !== 'object')
+                .map(([key, value]) => [key.replace(/_/g, ' '), String(value)])
+              : [['Hedging', 'off']],
+          },
+          {
+            title: 'Strong-tier shadow agreement',
+            rows: Object.keys(shadow).length
+              ? Object.entries(shadow).map(([tier, s]) => [
+                tier, `${s.samples} samples · ${formatRate(s.within_one_rate)} within one point`,
+              ])
+              : [['Shadowing', 'no samples yet']],
+          },
+        ].map(({ title, rows }) => (
+          <Grid item xs={12} md={4} key={title}>
+            <Card sx={{ border: '1px solid #f1f5f9', borderRadius: 3, boxShadow: 'none', height: '100%' }}>
+              <CardContent sx={{ p: 2.5, '&:last-child': { pb: 2.5 } }}>
+                <Typography sx={{ fontSize: '0.92rem', fontWeight: 600, color: '#0f172a', mb: 1.5 }}>
+                  {title}
+                </Typography>
+                {rows.map(([label, value]) => (
+                  <Stack key={label} direction="row" justifyContent="space-between" sx={{ py: 0.5 }}>
+                    <Typography sx={{ fontSize: '0.8rem', color: '#64748b', textTransform: 'capitalize' }}>{label}</Typography>
+                    <Typography sx={{ fontSize: '0.8rem', fontWeight: 600, color: '#0f172a' }}>{value ?? 'not loaded'}</Typography>
+                  </Stack>
+                ))}
+              </CardContent>
+            </Card>
+          </Grid>
+        ))}
+      </Grid>
+    </Box>
+  )
+}
@@ -5,16 +5,17 @@ import {
 } from '@mui/material'
 import SendIcon from '@mui/icons-material/Send'
 import SupportAgentIcon from '@mui/icons-material/SupportAgent'
+import { useChatStream, mergeMessages } from '../hooks/useChatStream'
 
 export default function StudentChat() {
   const [conversations, setConversations] = useState([])
   const [messages, setMessages] = useState([])
+  const [olderCursor, setOlderCursor] = useState(undefined)
   const [newMessage, setNewMessage] = useState('')
   const [loading, setLoading] = useState(true)
   const [sending, setSending] = useState(false)
   const [adminUser, setAdminUser] = useState(null)
   const messagesEndRef = useRef(null)
-  const pollRef = useRef(null)
 
   const loadConversations = async () => {
     try {
@@ -31,11 +32,27 @@ export default function StudentChat() {
     setLoading(false)
   }
 
+  // Latest page; older pages are fetched on demand with the before_id cursor
   const loadMessages = async (uid) => {
     try {
       const res = await fetch(`/api/chat/messages/${uid}`, { credentials: 'include' })
       const data = await res.json()
-      if (data.success) setMessages(data.data)
+      if (data.success) {
+        setMessages(prev => mergeMessages(prev, data.data))
+        setOlderCursor(cursor => (cursor === undefined ? data.next_before_id : cursor))
+      }
+    } catch {}
+  }
+
+  const loadOlderMessages = async (uid) => {
+    if (!olderCursor) return
+    try {
+      const res = await fetch(`/api/chat/messages/${uid}?before_id=${olderCursor}`, { credentials: 'include' })
+      const data = await res.json()
+      if (data.success) {
+        setMessages(prev => mergeMessages(prev, data.data))
+        setOlderCursor(data.next_before_id)
+      }
     } catch {}
   }
 
@@ -49,18 +66,24 @@ export default function StudentChat() {
     }
   }, [adminUser])
 
-  // Poll for new messages
-  useEffect(() => {
+  // New messages are pushed over the chat stream
+  useChatStream((message) => {
     if (!adminUser) return
-    pollRef.current = setInterval(() => {
-      loadMessages(adminUser.user_id)
-    }, 5000)
-    return () => clearInterval(pollRef.current)
-  }, [adminUser])
+    const other = message.is_mine ? message.receiver_id : message.sender_id
+    if (other !== adminUser.user_id) return
+    setMessages(prev => mergeMessages(prev, [message]))
+    // Opening the conversation marks incoming messages as read
+    if (!message.is_mine) loadMessages(adminUser.user_id)
+  }, {
+    enabled: Boolean(adminUser),
+    onOpen: () => adminUser && loadMessages(adminUser.user_id),
+  })
 
+  // Only scroll for new messages, not when an older page is prepended
+  const lastMessageId = messages.length ? messages[messages.length - 1].id : null
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' })
-  }, [messages])
+  }, [lastMessageId])
 
   const handleSend = async () => {
     if (!newMessage.trim() || !adminUser) return
@@ -75,7 +98,7 @@ export default function StudentChat() {
       const data = await res.json()
       if (data.success) {
         setNewMessage('')
-        loadMessages(adminUser.user_id)
+        setMessages(prev => mergeMessages(prev, [data.data]))
       }
     } catch {}
     setSending(false)
@@ -136,6 +159,11 @@ export default function StudentChat() {
             </Typography>
           </Box>
         )}
+        {olderCursor && (
+          <Box sx={{ textAlign: 'center', mb: 1 }}>
+            <Chip label="Load earlier messages" size="small" clickable onClick={() => loadOlderMessages(adminUser.user_id)} />
+          </Box>
+        )}
         {messages.map((msg, i) => {
           const showDate = i === 0 || new Date(messages[i-1].created_at).toDateString() !== new Date(msg.created_at).toDateString()
           return (